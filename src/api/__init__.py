@@ -1,8 +1,36 @@
 """
 API 클래스들을 관리하는 패키지
+
+프로바이더 클래스는 벤더 SDK 임포트를 피하기 위해 처음 접근할 때 로드합니다.
 """
+import importlib
+
+from .base import APIResponse, BaseProvider, TokenUsage
+from .registry import ProviderRegistry, provider_registry
+
+# 지연 로딩 대상 (클래스 이름 → 모듈)
+_LAZY_PROVIDERS = {
+    "ClaudeAPI": ".claude_api",
+    "ClaudeHaikuAPI": ".claude_haiku_api",
+    "OpenAIAPI": ".openai_api",
+    "GeminiAPI": ".gemini_api",
+    "GrokAPI": ".grok_api",
+    "HyperClovaAPI": ".hyperclova_api"
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PROVIDERS:
+        module = importlib.import_module(_LAZY_PROVIDERS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .claude_api import ClaudeAPI
-from .hyperclova_api import HyperClovaAPI
 
-__all__ = ["ClaudeAPI", "HyperClovaAPI"] 
\ No newline at end of file
+__all__ = [
+    "APIResponse",
+    "BaseProvider",
+    "TokenUsage",
+    "ProviderRegistry",
+    "provider_registry",
+    *_LAZY_PROVIDERS
+]
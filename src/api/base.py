@@ -0,0 +1,515 @@
+"""
+프로바이더 공통 기반 클래스
+
+질문/보고서 프롬프트 구성, 캐시 → 요청 병합 → 레이트 리미터 → 재시도 파이프라인,
+토큰/비용 계산과 오류 처리를 한곳에 모읍니다. 각 프로바이더는 클라이언트 초기화와
+API 요청 1회 시도(_send)만 구현합니다.
+"""
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+from typing import AsyncIterator, Callable, List, Dict, Any, Optional, Tuple
+
+from ..utils.config import settings
+from ..utils.prompt_loader import prompt_loader
+from ..utils.timing import PhaseTimer
+from .batch import BATCH_FAILED, BatchEntry, BatchStatus, wait_for_batch
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+from .concurrency_limit import get_concurrency_limiter
+from .hedging import HedgeStats, hedge_policy
+from .rate_limiter import get_rate_limiter
+from .response_cache import response_cache
+from .retry import RetryError, RetryStats, retry_policy
+from .single_flight import single_flight
+from .streaming import StreamTimer
+from .transport import HTTPTiming, transport
+
+
+@dataclass
+class APIResponse:
+    """API 응답 데이터 클래스"""
+    content: str
+    tokens_used: int
+    response_time: float
+    cost: float
+    error: Optional[str] = None
+    
+    # 스트리밍 지표 (스트리밍 모드에서만 기록)
+    streamed: bool = False
+    time_to_first_token: Optional[float] = None  # 첫 토큰까지 시간 (초)
+    inter_token_latencies: List[float] = field(default_factory=list)  # 청크 간 지연 (초)
+    output_tokens_per_second: Optional[float] = None  # 생성 구간 출력 토큰 처리량
+    
+    # 재시도 지표 (response_time은 마지막 시도의 프로바이더 처리 시간)
+    attempts: int = 1
+    backoff_time: float = 0.0  # 백오프 대기 시간 (초)
+    retry_time: float = 0.0    # 마지막 시도 이전에 소비한 시간 (실패한 시도 + 백오프, 초)
+    rate_limit_wait: float = 0.0  # 레이트 리미터 대기 시간 (초, 응답 시간과 별도)
+    concurrency_wait: float = 0.0  # 적응형 동시성 한도 대기 시간 (초, 응답 시간과 별도)
+    cached: bool = False  # 디스크 캐시 적중 여부 (True면 지연 시간 통계에서 제외)
+    coalesced: bool = False  # 진행 중인 동일 요청의 결과를 공유했는지 여부 (지연 시간 통계에서 제외)
+    batched: bool = False  # 배치 API로 처리됨 (response_time은 배치 전체 소요 시간, 지연 시간 통계에서 제외)
+    phases: Dict[str, float] = field(default_factory=dict)  # 구간 이름 → 소요 시간 (초, perf_counter_ns 기준)
+    http_timing: Dict[str, Any] = field(default_factory=dict)  # 공유 전송 계층 요청의 연결/TLS/TTFB/다운로드 (초)
+    
+    # 프롬프트 캐시 지표 (tokens_used에 포함)
+    cache_read_tokens: int = 0   # 캐시에서 읽은 입력 토큰
+    cache_write_tokens: int = 0  # 캐시에 새로 기록한 입력 토큰
+    prompt_cache_savings: float = 0.0  # 캐시가 없었을 때 대비 절감한 비용 (USD, 기록 할증 차감)
+    
+    # 헤지 요청 지표 (cost에는 사용한 응답의 비용만 포함)
+    hedge_requests: int = 0   # 추가로 보낸 중복 요청 수
+    hedge_won: bool = False   # 중복 요청의 응답을 사용했는지 여부
+    hedge_cost: float = 0.0   # 취소된 중복 요청의 추정 비용 (USD, 입력 토큰 기준 하한)
+    
+    circuit_open: bool = False  # 서킷 브레이커가 열려 있어 요청을 보내지 않고 실패함
+
+
+@dataclass
+class TokenUsage:
+    """프로바이더가 보고한 토큰 사용량 (input_tokens는 캐시 읽기/기록 토큰 제외)"""
+    input_tokens: float
+    output_tokens: float
+    cache_read_tokens: float = 0.0
+    cache_write_tokens: float = 0.0
+    
+    @property
+    def total_tokens(self) -> int:
+        """청구 대상 전체 토큰 수"""
+        return int(self.input_tokens + self.cache_read_tokens + self.cache_write_tokens + self.output_tokens)
+
+
+class BaseProvider(ABC):
+    """LLM 프로바이더 기반 클래스"""
+    
+    # 설정 조회용 프로바이더 키 (예: "claude" → CLAUDE_MAX_CONCURRENCY)
+    provider_key: str = ""
+    # get_model_info에 표시할 제공사 이름
+    provider_name: str = ""
+    # 질문 생성 시 간결한 프롬프트 사용 여부
+    simple_question_prompt: bool = False
+    # 응답에 usage가 없을 때 단어 수에 곱하는 토큰 추정 계수
+    token_estimate_ratio: float = 1.3
+    # 배치 API 지원 여부와 실시간 대비 가격 배율
+    supports_batch: bool = False
+    batch_price_ratio: float = 0.5
+    # 프롬프트 캐시 읽기/기록 토큰의 입력 단가 대비 배율 (캐시 미지원 프로바이더는 1.0)
+    cache_read_price_ratio: float = 1.0
+    cache_write_price_ratio: float = 1.0
+    
+    def __init__(self, use_async: Optional[bool] = None, stream: Optional[bool] = None):
+        """
+        공통 실행 옵션 초기화 (하위 클래스는 클라이언트와 모델/가격 정보를 설정)
+        
+        Args:
+            use_async: 네이티브 비동기 클라이언트 사용 여부 (None이면 설정값 사용)
+            stream: 스트리밍 생성 모드 사용 여부 (None이면 설정값 사용)
+        """
+        self.use_async = settings.use_async_clients if use_async is None else use_async
+        self.stream = settings.use_streaming if stream is None else stream
+        self.max_tokens = 2000
+        self.temperature = 0.7
+        self.rate_limiter = get_rate_limiter(self.provider_key)
+        self.circuit_breaker = get_circuit_breaker(self.provider_key)
+        self.concurrency_limiter = get_concurrency_limiter(self.provider_key)
+        
+        # 가격 정보 (1M 토큰당 달러)
+        self.input_price_per_million = 0.0
+        self.output_price_per_million = 0.0
+    
+    @property
+    def model_id(self) -> str:
+        """캐시 키와 모델 정보에 쓰이는 모델 이름"""
+        return self.model
+    
+    async def generate_questions(self, user_response: str, context: str = "") -> APIResponse:
+        """
+        사용자 응답을 기반으로 후속 질문들을 생성합니다
+        
+        Args:
+            user_response: 사용자의 응답
+            context: 이전 대화 맥락
+        
+        Returns:
+            APIResponse: 생성된 질문들과 메타데이터
+        """
+        phases = PhaseTimer()
+        with phases.phase("prompt_build"):
+            prompt = self._build_question_prompt(user_response, context)
+        return await self._make_request(prompt, phases)
+    
+    async def generate_report(self, user_response: str, context: str = "") -> APIResponse:
+        """
+        사용자 응답을 바탕으로 보고서를 생성합니다
+        
+        Args:
+            user_response: 사용자의 응답
+            context: 이전 대화 맥락
+        
+        Returns:
+            APIResponse: 생성된 보고서와 메타데이터
+        """
+        phases = PhaseTimer()
+        with phases.phase("prompt_build"):
+            report_prompt = self._build_report_prompt(user_response, context)
+        return await self._make_request(report_prompt, phases)
+    
+    def render_prompt(self, task_type: str, user_response: str, context: str = "") -> str:
+        """
+        작업 유형에 맞는 프롬프트를 렌더링합니다 (배치 제출용)
+        
+        Args:
+            task_type: "questions" 또는 "reports"
+            user_response: 사용자의 응답
+            context: 이전 대화 맥락
+        
+        Returns:
+            str: 렌더링된 프롬프트
+        """
+        if task_type == "questions":
+            return self._build_question_prompt(user_response, context)
+        return self._build_report_prompt(user_response, context)
+    
+    def _build_question_prompt(self, user_response: str, context: str) -> str:
+        """질문 생성을 위한 프롬프트 구성"""
+        # START 기법 특화 프롬프트
+        use_start = "START" in context or "start" in context.lower()
+        
+        return prompt_loader.get_question_prompt(
+            user_response=user_response,
+            context=context,
+            use_start=use_start,
+            simple=self.simple_question_prompt
+        )
+    
+    def _build_report_prompt(self, user_response: str, context: str) -> str:
+        """보고서 생성을 위한 프롬프트 구성"""
+        return prompt_loader.get_report_prompt(user_response, context)
+    
+    async def _make_request(self, prompt: str, phases: Optional[PhaseTimer] = None) -> APIResponse:
+        """실제 API 요청을 수행합니다 (캐시 → 요청 병합 → 재시도 정책 순)"""
+        phases = phases or PhaseTimer()
+        
+        # 디스크 캐시 적중 시 프로바이더 호출 없이 반환 (cached=True로 표시)
+        with phases.phase("cache_lookup"):
+            cache_key = response_cache.make_key(
+                self.provider_key, self.model_id, prompt, self.max_tokens, self.temperature
+            )
+            cached_response = await response_cache.aget(cache_key)
+        if cached_response is not None:
+            return replace(APIResponse(**cached_response), phases=phases.seconds())
+        
+        # 동일 요청이 진행 중이면 업스트림 호출을 공유 (coalesced=True로 표시)
+        result, shared = await single_flight.do(
+            cache_key, lambda: self._fetch(prompt, cache_key, phases)
+        )
+        return replace(result, coalesced=True) if shared else result
+    
+    async def _fetch(self, prompt: str, cache_key: str, phases: PhaseTimer) -> APIResponse:
+        """업스트림 API 요청을 수행합니다 (캐시 저장 포함)"""
+        # 회로가 열려 있으면 레이트 리미터 대기 없이 즉시 실패
+        try:
+            self.circuit_breaker.check()
+        except CircuitOpenError as e:
+            return APIResponse(
+                content="",
+                tokens_used=0,
+                response_time=0.0,
+                cost=0.0,
+                error=str(e),
+                attempts=0,
+                phases=phases.seconds(),
+                circuit_open=True
+            )
+        
+        # 레이트 리미터: 렌더링된 프롬프트의 추정 토큰 + 최대 출력 토큰으로 TPM 선점
+        estimated_tokens = prompt_loader.estimate_tokens(prompt) + self.max_tokens
+        # 헤지 중복 요청까지 포함한 예약 횟수와 사용한 응답의 실제 토큰 (끝날 때 한 번에 정산)
+        reservations = 0
+        used_tokens = 0
+        
+        async def reserve() -> float:
+            nonlocal reservations
+            # 버킷 예약은 acquire의 첫 대기 전에 끝나므로 취소되더라도 횟수와 예약이 어긋나지 않음
+            reservations += 1
+            return await self.rate_limiter.acquire(estimated_tokens)
+        
+        try:
+            with phases.phase("rate_limit_wait"):
+                rate_limit_wait = await reserve()
+            # 적응형 동시성 한도: 슬롯은 재시도/헤지를 포함한 업스트림 요청 동안 유지
+            with phases.phase("concurrency_wait"):
+                concurrency_wait = await self.concurrency_limiter.acquire()
+            completed_latency: Optional[float] = None
+            
+            start_time = time.time()
+            
+            # 헤지 요청마다 구간 기록/HTTP 구간 시간을 따로 두고, 사용한 응답의 기록만 반영
+            attempt_phases: Dict[int, PhaseTimer] = {}
+            attempt_timings: Dict[int, HTTPTiming] = {}
+            
+            async def attempt(index: int):
+                attempt_phases[index] = PhaseTimer()
+                attempt_timings[index] = HTTPTiming()
+                if index:
+                    # 중복 요청도 레이트 리미터 한도에 반영
+                    await reserve()
+                # 공유 전송 계층을 쓰는 프로바이더는 HTTP 구간별 시간이 함께 기록됨
+                with transport.measure(attempt_timings[index]):
+                    return await retry_policy.execute(lambda: self._attempt(prompt, attempt_phases[index]))
+            
+            try:
+                ((content, usage, timer), retry_stats), hedge = await hedge_policy.execute(
+                    self.provider_key, attempt
+                )
+                phases.merge(attempt_phases[hedge.winner])
+                http_timing = attempt_timings[hedge.winner]
+                
+                end_time = time.time()
+                # 응답 시간은 마지막 시도만 반영 (재시도에 쓴 시간은 별도 기록, 헤지 대기 시간은 포함)
+                response_time = end_time - start_time - retry_stats.retry_time
+                hedge_policy.observe(self.provider_key, response_time)
+                completed_latency = response_time
+                
+                usage = self._token_usage(prompt, content, usage)
+                used_tokens = usage.total_tokens
+                
+                result = APIResponse(
+                    content=content,
+                    tokens_used=usage.total_tokens,
+                    response_time=response_time,
+                    cost=self._calculate_cost(usage),
+                    attempts=retry_stats.attempts,
+                    backoff_time=retry_stats.backoff_time,
+                    retry_time=retry_stats.retry_time,
+                    rate_limit_wait=rate_limit_wait,
+                    concurrency_wait=concurrency_wait,
+                    phases=phases.seconds(),
+                    http_timing=http_timing.as_dict(),
+                    cache_read_tokens=int(usage.cache_read_tokens),
+                    cache_write_tokens=int(usage.cache_write_tokens),
+                    prompt_cache_savings=self._prompt_cache_savings(usage),
+                    hedge_requests=hedge.extra_requests,
+                    hedge_won=hedge.winner > 0,
+                    hedge_cost=self._hedge_cost(usage, hedge)
+                )
+                if self.stream:
+                    timer.apply(result, usage.output_tokens)
+                await response_cache.aset(cache_key, result)
+                return result
+            
+            except Exception as e:
+                end_time = time.time()
+                retry_stats = e.stats if isinstance(e, RetryError) else RetryStats(attempts=1)
+                if 0 in attempt_phases:
+                    phases.merge(attempt_phases[0])
+                http_timing = attempt_timings.get(0, HTTPTiming())
+                return APIResponse(
+                    content="",
+                    tokens_used=0,
+                    response_time=end_time - start_time - retry_stats.retry_time,
+                    cost=0.0,
+                    error=str(e),
+                    attempts=retry_stats.attempts,
+                    backoff_time=retry_stats.backoff_time,
+                    retry_time=retry_stats.retry_time,
+                    rate_limit_wait=rate_limit_wait,
+                    concurrency_wait=concurrency_wait,
+                    phases=phases.seconds(),
+                    http_timing=http_timing.as_dict(),
+                    circuit_open=isinstance(getattr(e, "last_error", e), CircuitOpenError)
+                )
+            
+            finally:
+                # 성공한 요청의 응답 시간만 한도 증가/지연 급증 판단에 사용
+                self.concurrency_limiter.release(completed_latency)
+        
+        finally:
+            # 취소(CancelledError)된 경우를 포함해 모든 예약을 정산: 사용한 응답의 토큰만 남기고
+            # 실패/취소된 요청과 헤지에서 진 중복 요청의 예약분은 돌려줌
+            self.rate_limiter.reconcile(estimated_tokens * reservations, used_tokens)
+    
+    async def _attempt(self, prompt: str, phases: PhaseTimer):
+        """
+        요청 1회 시도 (재시도 정책이 호출)
+        
+        서킷 브레이커를 거치므로 재시도 중 회로가 열리면 CircuitOpenError로 재시도가 중단되고,
+        한도 초과/과부하/타임아웃 오류는 적응형 동시성 한도에 혼잡 신호로 전달됩니다.
+        """
+        try:
+            return await self.circuit_breaker.call(lambda: self._send(prompt, phases))
+        except Exception as e:
+            self.concurrency_limiter.record_error(e)
+            raise
+    
+    @abstractmethod
+    async def _send(self, prompt: str, phases: PhaseTimer) -> Tuple[str, Optional[TokenUsage], StreamTimer]:
+        """
+        API 요청 1회 시도 (재시도 정책이 호출)
+        
+        Args:
+            prompt: 렌더링된 프롬프트
+            phases: 구간 타이머 (SDK 호출은 "sdk_call", 응답 추출은 "response_decode"에 기록)
+        
+        Returns:
+            Tuple: (응답 내용, 토큰 사용량 또는 None, 스트림 타이머)
+        """
+    
+    async def run_batch(self,
+                        prompts: Dict[str, str],
+                        on_poll: Optional[Callable[[BatchStatus], None]] = None) -> Dict[str, APIResponse]:
+        """
+        프롬프트 묶음을 배치 API로 제출하고, 끝날 때까지 폴링한 뒤 결과를 매핑합니다
+        
+        Args:
+            prompts: custom_id → 렌더링된 프롬프트 (custom_id는 영문/숫자/_/- 64자 이내)
+            on_poll: 상태를 조회할 때마다 호출되는 콜백
+        
+        Returns:
+            Dict[str, APIResponse]: custom_id → 응답 (캐시 적중 항목은 제출하지 않음)
+        """
+        if not self.supports_batch:
+            raise NotImplementedError(f"{self.provider_name or type(self).__name__}는 배치 모드를 지원하지 않습니다.")
+        
+        results: Dict[str, APIResponse] = {}
+        cache_keys = {}
+        pending = {}
+        for custom_id, prompt in prompts.items():
+            # 실시간 경로와 캐시 항목을 공유하지 않음 (배치 할인가 응답이 실시간 결과로 섞이지 않도록)
+            cache_keys[custom_id] = response_cache.make_key(
+                self.provider_key, self.model_id, prompt, self.max_tokens, self.temperature, mode="batch"
+            )
+            cached_response = await response_cache.aget(cache_keys[custom_id])
+            if cached_response is not None:
+                results[custom_id] = APIResponse(**cached_response)
+            else:
+                pending[custom_id] = prompt
+        if not pending:
+            return results
+        
+        start_time = time.time()
+        missing_error = "배치 결과에 항목이 없습니다."
+        try:
+            batch_id, _ = await retry_policy.execute(lambda: self._submit_batch(pending))
+            
+            async def check() -> BatchStatus:
+                status, _ = await retry_policy.execute(lambda: self._batch_status(batch_id))
+                return status
+            
+            status = await wait_for_batch(
+                check,
+                interval=settings.batch_poll_interval,
+                max_interval=settings.batch_poll_max_interval,
+                timeout=settings.batch_timeout,
+                on_poll=on_poll
+            )
+            if status.state == BATCH_FAILED:
+                raise RuntimeError(f"배치 처리 실패: {status.error or '원인 미상'}")
+            
+            # 결과 파일을 한 줄씩 읽어 매핑 (응답 시간은 제출부터 종료까지의 배치 소요 시간)
+            elapsed = time.time() - start_time
+            async for entry in self._batch_results(batch_id):
+                prompt = pending.get(entry.custom_id)
+                if prompt is None:
+                    continue
+                results[entry.custom_id] = self._batch_response(entry, prompt, elapsed)
+                await response_cache.aset(cache_keys[entry.custom_id], results[entry.custom_id])
+        
+        except Exception as e:
+            missing_error = str(e)
+        
+        # 제출 실패나 결과 누락 항목은 오류 응답으로 채움
+        elapsed = time.time() - start_time
+        for custom_id in pending:
+            if custom_id not in results:
+                results[custom_id] = APIResponse(
+                    content="", tokens_used=0, response_time=elapsed, cost=0.0, error=missing_error, batched=True
+                )
+        return results
+    
+    def _batch_response(self, entry: BatchEntry, prompt: str, elapsed: float) -> APIResponse:
+        """배치 결과 항목을 APIResponse로 변환합니다 (배치 가격 배율 적용)"""
+        if entry.error:
+            return APIResponse(
+                content="", tokens_used=0, response_time=elapsed, cost=0.0, error=entry.error, batched=True
+            )
+        
+        usage = self._token_usage(prompt, entry.content, entry.usage)
+        return APIResponse(
+            content=entry.content,
+            tokens_used=usage.total_tokens,
+            response_time=elapsed,
+            cost=self._calculate_cost(usage) * self.batch_price_ratio,
+            batched=True,
+            cache_read_tokens=int(usage.cache_read_tokens),
+            cache_write_tokens=int(usage.cache_write_tokens),
+            prompt_cache_savings=self._prompt_cache_savings(usage) * self.batch_price_ratio
+        )
+    
+    async def _submit_batch(self, prompts: Dict[str, str]) -> str:
+        """배치를 제출하고 배치 ID를 반환합니다 (배치 지원 프로바이더가 구현)"""
+        raise NotImplementedError
+    
+    async def _batch_status(self, batch_id: str) -> BatchStatus:
+        """배치 상태를 조회합니다 (배치 지원 프로바이더가 구현)"""
+        raise NotImplementedError
+    
+    def _batch_results(self, batch_id: str) -> AsyncIterator[BatchEntry]:
+        """배치 결과 파일을 항목 단위로 스트리밍합니다 (배치 지원 프로바이더가 구현)"""
+        raise NotImplementedError
+    
+    def _token_usage(self, prompt: str, content: str,
+                     usage: Optional[TokenUsage]) -> TokenUsage:
+        """보고된 토큰 사용량을 반환하고, 없으면 단어 수로 추정합니다"""
+        if usage is not None:
+            return usage
+        
+        input_tokens = len(prompt.split()) * self.token_estimate_ratio
+        output_tokens = len(content.split()) * self.token_estimate_ratio
+        return TokenUsage(input_tokens, output_tokens)
+    
+    def _calculate_cost(self, usage: TokenUsage) -> float:
+        """토큰 수로 요청 비용을 계산합니다 (USD, 캐시 읽기/기록 토큰은 배율 적용)"""
+        cached_input = (usage.cache_read_tokens * self.cache_read_price_ratio
+                        + usage.cache_write_tokens * self.cache_write_price_ratio)
+        input_cost = ((usage.input_tokens + cached_input) / 1_000_000) * self.input_price_per_million
+        output_cost = (usage.output_tokens / 1_000_000) * self.output_price_per_million
+        return input_cost + output_cost
+    
+    def estimate_input_cost(self, prompt: str) -> float:
+        """
+        프롬프트 입력 토큰만의 추정 비용 (취소된 요청의 비용 하한 계산용)
+        
+        Args:
+            prompt: 렌더링된 프롬프트
+        
+        Returns:
+            float: 추정 비용 (USD)
+        """
+        return self._calculate_cost(replace(self._token_usage(prompt, "", None), output_tokens=0))
+    
+    def _hedge_cost(self, usage: TokenUsage, hedge: HedgeStats) -> float:
+        """취소된 중복 요청의 추정 비용 (같은 프롬프트의 입력 토큰만 청구됐다고 보는 하한)"""
+        if not hedge.extra_requests:
+            return 0.0
+        input_usage = replace(usage, output_tokens=0)
+        return self._calculate_cost(input_usage) * hedge.extra_requests
+    
+    def _prompt_cache_savings(self, usage: TokenUsage) -> float:
+        """캐시 토큰을 일반 입력 단가로 청구했을 때 대비 절감액 (USD, 기록 할증이 크면 음수)"""
+        saved_tokens = (usage.cache_read_tokens * (1 - self.cache_read_price_ratio)
+                        + usage.cache_write_tokens * (1 - self.cache_write_price_ratio))
+        return (saved_tokens / 1_000_000) * self.input_price_per_million
+    
+    async def aclose(self):
+        """클라이언트 연결을 정리합니다 (커넥션 풀은 공유 전송 계층에서 정리)"""
+        return None
+    
+    def get_model_info(self) -> Dict[str, Any]:
+        """모델 정보를 반환합니다"""
+        return {
+            "provider": self.provider_name,
+            "model": self.model_id,
+            "input_price_per_million": self.input_price_per_million,
+            "output_price_per_million": self.output_price_per_million
+        }
@@ -0,0 +1,79 @@
+"""
+배치 API 공용 유틸리티
+
+Anthropic Message Batches와 OpenAI Batch API는 실시간 API의 약 절반 가격으로
+요청 묶음을 비동기로 처리합니다. 프로바이더는 제출/상태 조회/결과 스트리밍만 구현하고,
+상태 폴링(점진적 간격 증가)과 결과 매핑은 기반 클래스가 이 모듈로 처리합니다.
+"""
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
+
+if TYPE_CHECKING:
+    from .base import TokenUsage
+
+# 정규화된 배치 상태
+BATCH_IN_PROGRESS = "in_progress"
+BATCH_ENDED = "ended"
+BATCH_FAILED = "failed"
+
+
+@dataclass
+class BatchStatus:
+    """배치 처리 상태 (프로바이더 응답을 정규화)"""
+    state: str                   # BATCH_IN_PROGRESS, BATCH_ENDED, BATCH_FAILED
+    total: int = 0               # 제출한 요청 수
+    completed: int = 0           # 처리가 끝난 요청 수 (성공 + 실패)
+    error: Optional[str] = None  # 배치 전체 실패 사유
+
+
+@dataclass
+class BatchEntry:
+    """배치 결과 파일의 항목 1개"""
+    custom_id: str
+    content: str = ""
+    usage: Optional["TokenUsage"] = None
+    error: Optional[str] = None
+
+
+class BatchTimeoutError(Exception):
+    """제한 시간 안에 배치가 끝나지 않음"""
+
+
+async def wait_for_batch(check: Callable[[], Awaitable[BatchStatus]],
+                         interval: float,
+                         max_interval: float,
+                         timeout: float,
+                         on_poll: Optional[Callable[[BatchStatus], None]] = None) -> BatchStatus:
+    """
+    배치가 끝날 때까지 상태를 폴링합니다 (간격은 1.5배씩 max_interval까지 증가)
+    
+    Args:
+        check: 상태 조회 코루틴 함수
+        interval: 첫 폴링 간격 (초)
+        max_interval: 최대 폴링 간격 (초)
+        timeout: 최대 대기 시간 (초, 0 이하이면 무제한)
+        on_poll: 상태를 조회할 때마다 호출되는 콜백 (진행 상황 출력용)
+    
+    Returns:
+        BatchStatus: 종료 상태 (BATCH_ENDED 또는 BATCH_FAILED)
+    
+    Raises:
+        BatchTimeoutError: timeout 안에 끝나지 않은 경우
+    """
+    started_at = time.time()
+    while True:
+        status = await check()
+        if on_poll:
+            on_poll(status)
+        if status.state != BATCH_IN_PROGRESS:
+            return status
+        
+        elapsed = time.time() - started_at
+        if timeout > 0 and elapsed >= timeout:
+            raise BatchTimeoutError(f"배치가 {timeout:.0f}초 안에 끝나지 않았습니다 ({status.completed}/{status.total})")
+        
+        delay = interval if timeout <= 0 else min(interval, timeout - elapsed)
+        await asyncio.sleep(delay)
+        interval = min(max_interval, interval * 1.5)
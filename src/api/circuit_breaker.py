@@ -0,0 +1,272 @@
+"""
+프로바이더별 서킷 브레이커
+
+최근 호출 결과를 개수 기반 슬라이딩 윈도로 유지하다가 실패율 또는 느린 호출 비율이
+임계값을 넘으면 회로를 열어(open), 대기 시간(cooldown) 동안 해당 프로바이더 요청을
+보내지 않고 즉시 실패시킵니다. 대기 시간이 지나면 반열림(half-open) 상태에서 제한된 수의
+탐침 요청만 보내 회복 여부를 확인하고, 모두 성공하면 다시 닫습니다(closed).
+"""
+import time
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from ..utils.config import settings
+
+T = TypeVar("T")
+
+# 회로 상태
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+CIRCUIT_STATE_LABELS = {
+    CIRCUIT_CLOSED: "닫힘",
+    CIRCUIT_OPEN: "열림",
+    CIRCUIT_HALF_OPEN: "반열림"
+}
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 요청을 보내지 않고 거절함"""
+    
+    def __init__(self, provider_key: str, retry_in: float):
+        super().__init__(
+            f"서킷 브레이커 열림: {provider_key} 요청을 보내지 않습니다 ({retry_in:.1f}초 후 탐침 요청 재개)"
+        )
+        self.provider_key = provider_key
+        self.retry_in = retry_in
+
+
+@dataclass
+class CircuitTransition:
+    """회로 상태 전이 기록"""
+    at: float          # 전이 시각 (time.time)
+    provider_key: str
+    from_state: str
+    to_state: str
+    reason: str
+
+
+class CircuitBreaker:
+    """실패율/느린 호출 비율 기반 서킷 브레이커"""
+    
+    def __init__(self,
+                 provider_key: str,
+                 failure_rate: Optional[float] = None,
+                 slow_call_rate: Optional[float] = None,
+                 slow_call_seconds: Optional[float] = None,
+                 min_calls: Optional[int] = None,
+                 window: Optional[int] = None,
+                 cooldown: Optional[float] = None,
+                 half_open_probes: Optional[int] = None,
+                 enabled: Optional[bool] = None):
+        """
+        서킷 브레이커 초기화
+        
+        Args:
+            provider_key: 프로바이더 키 (전이 기록/오류 메시지용)
+            failure_rate: 회로를 여는 실패율 (%, None이면 설정값 사용)
+            slow_call_rate: 회로를 여는 느린 호출 비율 (%, 100 초과면 사용 안 함)
+            slow_call_seconds: 느린 호출로 보는 응답 시간 (초)
+            min_calls: 비율을 판단하기 위한 최소 호출 수
+            window: 비율 계산에 쓰는 최근 호출 수
+            cooldown: 회로가 열린 뒤 탐침 요청을 보내기까지 대기 시간 (초)
+            half_open_probes: 반열림 상태에서 보내는 탐침 요청 수 (모두 성공하면 닫음)
+            enabled: 사용 여부 (None이면 설정값 사용)
+        """
+        self.provider_key = provider_key
+        self.enabled = settings.use_circuit_breaker if enabled is None else enabled
+        self.failure_rate = settings.circuit_failure_rate if failure_rate is None else failure_rate
+        self.slow_call_rate = settings.circuit_slow_call_rate if slow_call_rate is None else slow_call_rate
+        self.slow_call_seconds = settings.circuit_slow_call_seconds if slow_call_seconds is None else slow_call_seconds
+        self.min_calls = settings.circuit_min_calls if min_calls is None else min_calls
+        self.window = window or settings.circuit_window
+        self.cooldown = settings.circuit_cooldown if cooldown is None else cooldown
+        self.half_open_probes = max(1, settings.circuit_half_open_probes if half_open_probes is None else half_open_probes)
+        
+        self.state = CIRCUIT_CLOSED
+        self.transitions: List[CircuitTransition] = []
+        self.calls = 0
+        self.failures = 0
+        self.slow_calls = 0
+        self.rejected = 0
+        # 최근 호출 결과 (실패 여부, 느린 호출 여부)
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=self.window)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        # 상태 전환마다 증가 (이전 반열림 구간의 탐침 결과가 새 구간에 섞이지 않도록)
+        self._generation = 0
+    
+    def retry_in(self) -> float:
+        """열린 회로가 탐침 요청을 허용하기까지 남은 시간 (초, 열림 상태가 아니면 0)"""
+        if self.state != CIRCUIT_OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.cooldown - time.monotonic())
+    
+    def check(self):
+        """
+        열린 회로면 요청을 보내지 않고 바로 거절합니다 (탐침 슬롯은 차지하지 않음)
+        
+        레이트 리미터 대기 전에 호출해, 열린 회로의 요청이 한도 대기까지 하지 않도록 합니다.
+        
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 반열림 탐침 슬롯이 모두 사용 중인 경우
+        """
+        if not self.enabled:
+            return
+        if self.state == CIRCUIT_OPEN and self.retry_in() > 0:
+            self.rejected += 1
+            raise CircuitOpenError(self.provider_key, self.retry_in())
+        if self.state == CIRCUIT_HALF_OPEN and self._probes_in_flight + self._probe_successes >= self.half_open_probes:
+            self.rejected += 1
+            raise CircuitOpenError(self.provider_key, 0.0)
+    
+    def _acquire(self):
+        """호출 허가 (열림이면 CircuitOpenError, 대기 시간이 지났으면 반열림으로 전환)"""
+        if self.state == CIRCUIT_OPEN:
+            if self.retry_in() > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.provider_key, self.retry_in())
+            self._transition(CIRCUIT_HALF_OPEN, f"대기 시간 {self.cooldown:g}초 경과, 탐침 요청 {self.half_open_probes}건 허용")
+        
+        if self.state == CIRCUIT_HALF_OPEN:
+            if self._probes_in_flight + self._probe_successes >= self.half_open_probes:
+                self.rejected += 1
+                raise CircuitOpenError(self.provider_key, 0.0)
+            self._probes_in_flight += 1
+    
+    def _record(self, failed: bool, seconds: float, probe: Optional[int]):
+        """호출 1건의 결과를 반영하고 필요하면 상태를 전환합니다 (probe: 탐침 요청이면 허가 시점의 세대)"""
+        slow = seconds >= self.slow_call_seconds
+        self.calls += 1
+        self.failures += failed
+        self.slow_calls += slow
+        
+        if probe is not None:
+            if probe != self._generation:
+                return
+            self._probes_in_flight -= 1
+            if failed or slow:
+                reason = "탐침 요청 실패" if failed else f"탐침 요청 {seconds:.1f}초 (느린 호출)"
+                self._open(reason)
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_probes:
+                self._outcomes.clear()
+                self._transition(CIRCUIT_CLOSED, f"탐침 요청 {self._probe_successes}건 성공")
+            return
+        
+        if self.state != CIRCUIT_CLOSED:
+            return
+        self._outcomes.append((failed, slow))
+        if len(self._outcomes) < self.min_calls:
+            return
+        
+        total = len(self._outcomes)
+        failure_rate = 100 * sum(1 for f, _ in self._outcomes if f) / total
+        slow_rate = 100 * sum(1 for _, s in self._outcomes if s) / total
+        if failure_rate >= self.failure_rate:
+            self._open(f"실패율 {failure_rate:.0f}% ≥ {self.failure_rate:g}% (최근 {total}건)")
+        elif slow_rate >= self.slow_call_rate:
+            self._open(
+                f"느린 호출 비율 {slow_rate:.0f}% ≥ {self.slow_call_rate:g}% "
+                f"({self.slow_call_seconds:g}초 이상, 최근 {total}건)"
+            )
+    
+    def _open(self, reason: str):
+        """회로를 열고 대기 시간을 시작합니다"""
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._transition(CIRCUIT_OPEN, reason)
+    
+    def _transition(self, to_state: str, reason: str):
+        """상태 전환을 기록하고 출력합니다"""
+        transition = CircuitTransition(
+            at=time.time(),
+            provider_key=self.provider_key,
+            from_state=self.state,
+            to_state=to_state,
+            reason=reason
+        )
+        self.state = to_state
+        self._generation += 1
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self.transitions.append(transition)
+        print(
+            f"🚧 서킷 브레이커 [{self.provider_key}]: "
+            f"{CIRCUIT_STATE_LABELS[transition.from_state]} → {CIRCUIT_STATE_LABELS[to_state]} ({reason})"
+        )
+    
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        서킷 브레이커를 거쳐 요청 1회를 실행합니다
+        
+        Args:
+            func: 요청 1회를 수행하는 코루틴 함수
+        
+        Returns:
+            T: 요청 결과
+        
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 반열림 탐침 슬롯이 모두 사용 중인 경우
+        """
+        if not self.enabled:
+            return await func()
+        
+        self._acquire()
+        probe = self._generation if self.state == CIRCUIT_HALF_OPEN else None
+        started_at = time.perf_counter()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            # 헤지/레이스로 취소된 요청은 결과에 반영하지 않고 탐침 슬롯만 반환
+            if probe == self._generation:
+                self._probes_in_flight -= 1
+            raise
+        except Exception:
+            self._record(True, time.perf_counter() - started_at, probe)
+            raise
+        self._record(False, time.perf_counter() - started_at, probe)
+        return result
+    
+    def stats(self) -> Dict[str, Any]:
+        """현재 상태와 호출/거절 통계를 반환합니다"""
+        return {
+            "state": self.state,
+            "calls": self.calls,
+            "failures": self.failures,
+            "slow_calls": self.slow_calls,
+            "rejected": self.rejected,
+            "transitions": len(self.transitions)
+        }
+
+
+# 프로바이더 키별 서킷 브레이커 (같은 키의 인스턴스끼리 공유)
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(provider_key: str) -> CircuitBreaker:
+    """
+    프로바이더 키에 해당하는 서킷 브레이커를 반환합니다 (없으면 설정값으로 생성)
+    
+    Args:
+        provider_key: 프로바이더 키 (예: "claude", "hyperclova")
+    
+    Returns:
+        CircuitBreaker: 공유 서킷 브레이커
+    """
+    if provider_key not in _circuit_breakers:
+        _circuit_breakers[provider_key] = CircuitBreaker(provider_key)
+    return _circuit_breakers[provider_key]
+
+
+def circuit_transitions() -> List[CircuitTransition]:
+    """모든 프로바이더의 상태 전이 기록을 시각 순으로 반환합니다"""
+    return sorted(
+        (transition for breaker in _circuit_breakers.values() for transition in breaker.transitions),
+        key=lambda transition: transition.at
+    )
@@ -1,10 +1,7 @@
 """
 Anthropic Claude API 클래스
 """
-import time
-import asyncio
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Any, Optional
 
 try:
     import anthropic
@@ -13,129 +10,187 @@ except ImportError:
 
 from ..utils.config import settings
 from ..utils.prompt_loader import prompt_loader
+from ..utils.timing import PhaseTimer
+from .base import BaseProvider, TokenUsage
+from .batch import BATCH_ENDED, BATCH_IN_PROGRESS, BatchEntry, BatchStatus
+from .streaming import StreamTimer
 
 
-@dataclass
-class APIResponse:
-    """API 응답 데이터 클래스"""
-    content: str
-    tokens_used: int
-    response_time: float
-    cost: float
-    error: Optional[str] = None
-
-
-class ClaudeAPI:
+class ClaudeAPI(BaseProvider):
     """Claude API 클래스"""
     
-    def __init__(self):
-        """Claude API 클라이언트 초기화"""
+    # 설정 조회용 프로바이더 키
+    provider_key = "claude"
+    provider_name = "Anthropic"
+    # Message Batches API (실시간 대비 50% 가격)
+    supports_batch = True
+    # 프롬프트 캐시 단가 배율 (5분 캐시 기준: 읽기 0.1배, 기록 1.25배)
+    cache_read_price_ratio = 0.1
+    cache_write_price_ratio = 1.25
+    
+    def __init__(self, use_async: Optional[bool] = None, stream: Optional[bool] = None):
+        """
+        Claude API 클라이언트 초기화
+        
+        Args:
+            use_async: 네이티브 비동기 클라이언트 사용 여부 (None이면 설정값 사용)
+            stream: 스트리밍 생성 모드 사용 여부 (None이면 설정값 사용)
+        """
         if not anthropic:
             raise ImportError("anthropic 패키지가 설치되지 않았습니다. pip install anthropic")
         
         if not settings.anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY가 설정되지 않았습니다.")
         
-        self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        super().__init__(use_async=use_async, stream=stream)
+        # SDK 내부 재시도는 끄고 공유 재시도 정책(retry_policy)으로 일원화
+        self.client = anthropic.Anthropic(
+            api_key=settings.anthropic_api_key,
+            base_url=settings.anthropic_base_url,
+            max_retries=0
+        )
+        self.async_client = anthropic.AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            base_url=settings.anthropic_base_url,
+            max_retries=0
+        )
         self.model = "claude-3-5-sonnet-20241022"
+        self.max_tokens = 2000
+        self.temperature = 1.0
         
         # 가격 정보 (1M 토큰당 달러)
         self.input_price_per_million = 3.0  # $3/1M input tokens
         self.output_price_per_million = 15.0  # $15/1M output tokens
     
-    async def generate_questions(self, user_response: str, context: str = "") -> APIResponse:
-        """
-        사용자 응답을 기반으로 후속 질문들을 생성합니다
-        
-        Args:
-            user_response: 사용자의 응답
-            context: 이전 대화 맥락
-            
-        Returns:
-            APIResponse: 생성된 질문들과 메타데이터
-        """
-        prompt = self._build_question_prompt(user_response, context)
-        return await self._make_request(prompt)
+    def _request_kwargs(self, prompt: str) -> Dict[str, Any]:
+        """Messages API 요청 파라미터 구성"""
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "messages": [
+                {"role": "user", "content": self._message_content(prompt)}
+            ]
+        }
     
-    async def generate_report(self, user_response: str, context: str = "") -> APIResponse:
+    @staticmethod
+    def _message_content(prompt: str):
         """
-        사용자 응답을 바탕으로 보고서를 생성합니다
+        사용자 메시지 내용 구성
         
-        Args:
-            user_response: 사용자의 응답
-            context: 이전 대화 맥락
-            
-        Returns:
-            APIResponse: 생성된 보고서와 메타데이터
+        템플릿의 정적 접두부가 있으면 별도 텍스트 블록에 cache_control 마커를 붙여
+        다음 요청부터 접두부를 캐시에서 읽도록 합니다. 모델별 최소 캐시 길이보다
+        짧은 접두부는 API가 캐시하지 않고 일반 입력으로 처리합니다.
         """
-        report_prompt = self._build_report_prompt(user_response, context)
-        return await self._make_request(report_prompt)
+        prefix, rest = prompt_loader.split_cached_prefix(prompt) if settings.use_prompt_cache else ("", prompt)
+        if not prefix:
+            return prompt
+        return [
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": rest}
+        ]
     
-    def _build_question_prompt(self, user_response: str, context: str) -> str:
-        """질문 생성을 위한 프롬프트 구성"""
-        # START 기법 특화 프롬프트
-        use_start = "START" in context or "start" in context.lower()
-        
-        return prompt_loader.get_question_prompt(
-            user_response=user_response,
-            context=context,
-            use_start=use_start,
-            simple=False
+    @staticmethod
+    def _usage(usage) -> TokenUsage:
+        """Messages API usage 변환 (input_tokens는 캐시 읽기/기록 토큰을 제외한 값)"""
+        return TokenUsage(
+            usage.input_tokens,
+            usage.output_tokens,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0
         )
     
-    def _build_report_prompt(self, user_response: str, context: str) -> str:
-        """보고서 생성을 위한 프롬프트 구성"""
-        return prompt_loader.get_report_prompt(user_response, context)
+    async def _send(self, prompt: str, phases: PhaseTimer):
+        """API 요청 1회 시도 - (응답 내용, 토큰 사용량, 스트림 타이머) 반환"""
+        request_kwargs = self._request_kwargs(prompt)
+        timer = StreamTimer()
+        if self.stream:
+            if self.use_async:
+                with phases.phase("sdk_call"):
+                    content_text, usage = await self._stream_async(request_kwargs, timer)
+            else:
+                # 동기 SDK 경로 (벤치마크 비교용)
+                content_text, usage = await phases.run_in_thread(
+                    "sdk_call",
+                    self._stream_sync,
+                    request_kwargs,
+                    timer
+                )
+        else:
+            if self.use_async:
+                with phases.phase("sdk_call"):
+                    response = await self.async_client.messages.create(**request_kwargs)
+            else:
+                # 동기 SDK 경로 (벤치마크 비교용)
+                response = await phases.run_in_thread(
+                    "sdk_call",
+                    self.client.messages.create,
+                    **request_kwargs
+                )
+            with phases.phase("response_decode"):
+                content_text, usage = self._extract_text(response), response.usage
+        return content_text, self._usage(usage), timer
     
-    async def _make_request(self, prompt: str) -> APIResponse:
-        """실제 API 요청을 수행합니다"""
-        start_time = time.time()
-        
-        try:
-            response = await asyncio.to_thread(
-                self.client.messages.create,
-                model=self.model,
-                max_tokens=2000,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            
-            end_time = time.time()
-            response_time = end_time - start_time
-            
-            # 토큰 사용량 계산
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            total_tokens = input_tokens + output_tokens
-            
-            # 비용 계산
-            input_cost = (input_tokens / 1_000_000) * self.input_price_per_million
-            output_cost = (output_tokens / 1_000_000) * self.output_price_per_million
-            total_cost = input_cost + output_cost
-            
-            return APIResponse(
-                content=response.content[0].text,
-                tokens_used=total_tokens,
-                response_time=response_time,
-                cost=total_cost
-            )
-            
-        except Exception as e:
-            end_time = time.time()
-            return APIResponse(
-                content="",
-                tokens_used=0,
-                response_time=end_time - start_time,
-                cost=0.0,
-                error=str(e)
+    @staticmethod
+    def _extract_text(response) -> str:
+        """응답 메시지에서 텍스트 추출"""
+        return response.content[0].text
+    
+    async def _stream_async(self, request_kwargs: Dict[str, Any], timer: StreamTimer):
+        """비동기 스트리밍 요청 - 텍스트 청크마다 도착 시각 기록"""
+        chunks = []
+        async with self.async_client.messages.stream(**request_kwargs) as stream:
+            async for text in stream.text_stream:
+                timer.mark()
+                chunks.append(text)
+            final_message = await stream.get_final_message()
+        return "".join(chunks), final_message.usage
+    
+    def _stream_sync(self, request_kwargs: Dict[str, Any], timer: StreamTimer):
+        """동기 스트리밍 요청 - 텍스트 청크마다 도착 시각 기록"""
+        chunks = []
+        with self.client.messages.stream(**request_kwargs) as stream:
+            for text in stream.text_stream:
+                timer.mark()
+                chunks.append(text)
+            final_message = stream.get_final_message()
+        return "".join(chunks), final_message.usage
+    
+    async def _submit_batch(self, prompts: Dict[str, str]) -> str:
+        """Message Batches API로 요청 묶음 제출"""
+        batch = await self.async_client.messages.batches.create(requests=[
+            {"custom_id": custom_id, "params": self._request_kwargs(prompt)}
+            for custom_id, prompt in prompts.items()
+        ])
+        return batch.id
+    
+    async def _batch_status(self, batch_id: str) -> BatchStatus:
+        """배치 처리 상태 조회 (processing_status가 ended이면 종료)"""
+        batch = await self.async_client.messages.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        completed = counts.succeeded + counts.errored + counts.canceled + counts.expired
+        return BatchStatus(
+            state=BATCH_ENDED if batch.processing_status == "ended" else BATCH_IN_PROGRESS,
+            total=completed + counts.processing,
+            completed=completed
+        )
+    
+    async def _batch_results(self, batch_id: str) -> AsyncIterator[BatchEntry]:
+        """결과 JSONL을 한 줄씩 읽어 항목으로 변환"""
+        async for item in await self.async_client.messages.batches.results(batch_id):
+            result = item.result
+            if result.type != "succeeded":
+                error = getattr(result, "error", None)
+                yield BatchEntry(custom_id=item.custom_id, error=f"배치 항목 {result.type}: {error or ''}".strip())
+                continue
+            message = result.message
+            yield BatchEntry(
+                custom_id=item.custom_id,
+                content=self._extract_text(message),
+                usage=self._usage(message.usage)
             )
     
-    def get_model_info(self) -> Dict[str, Any]:
-        """모델 정보를 반환합니다"""
-        return {
-            "provider": "Anthropic",
-            "model": self.model,
-            "input_price_per_million": self.input_price_per_million,
-            "output_price_per_million": self.output_price_per_million
-        } 
\ No newline at end of file
+    async def aclose(self):
+        """클라이언트 연결을 정리합니다"""
+        await self.async_client.close()
+        self.client.close()
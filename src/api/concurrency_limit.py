@@ -0,0 +1,207 @@
+"""
+프로바이더별 적응형 동시성 한도 (AIMD)
+
+TCP 혼잡 제어처럼 응답이 건강하면 동시 요청 한도를 가산적으로 올리고(요청 1건 완료마다 +1/한도,
+한도만큼 완료되면 약 +1), 429/503/529·타임아웃이나 지연 급증을 만나면 곱셈적으로 줄입니다.
+연속된 혼잡 신호에 한도가 여러 번 깎이지 않도록, 감소는 기준 응답 시간(왕복 1회)에 한 번만 적용합니다.
+"""
+import time
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from ..utils.config import settings
+from .retry import RetryPolicy
+
+# 혼잡 신호로 보는 HTTP 상태 코드 (429: 한도 초과, 503/529: 과부하)
+CONGESTION_STATUS_CODES = {429, 503, 529}
+
+# 한도 추이 표시용 블록 문자 (낮음 → 높음)
+_SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 방식 동시 요청 한도"""
+    
+    def __init__(self,
+                 initial_limit: Optional[float] = None,
+                 min_limit: Optional[float] = None,
+                 max_limit: Optional[float] = None,
+                 backoff_ratio: Optional[float] = None,
+                 latency_tolerance: Optional[float] = None,
+                 enabled: Optional[bool] = None):
+        """
+        동시성 한도 초기화
+        
+        Args:
+            initial_limit: 시작 한도 (None이면 설정값 사용)
+            min_limit: 최소 한도
+            max_limit: 최대 한도
+            backoff_ratio: 혼잡 신호 시 한도에 곱하는 비율 (0~1)
+            latency_tolerance: 기준 응답 시간 대비 이 배수를 넘으면 지연 급증으로 판단
+            enabled: 사용 여부 (None이면 설정값 사용)
+        """
+        self.enabled = settings.use_adaptive_concurrency if enabled is None else enabled
+        self.min_limit = max(1.0, settings.adaptive_min_limit if min_limit is None else min_limit)
+        self.max_limit = max(self.min_limit, settings.adaptive_max_limit if max_limit is None else max_limit)
+        initial = settings.adaptive_initial_limit if initial_limit is None else initial_limit
+        self.limit = float(min(self.max_limit, max(self.min_limit, initial)))
+        self.backoff_ratio = settings.adaptive_backoff_ratio if backoff_ratio is None else backoff_ratio
+        self.latency_tolerance = settings.adaptive_latency_tolerance if latency_tolerance is None else latency_tolerance
+        
+        self.in_flight = 0
+        self.total_wait = 0.0
+        self.decreases = 0
+        # 성공 응답 시간의 지수 이동 평균 (지연 급증 판단과 감소 간격 기준)
+        self.baseline: Optional[float] = None
+        self._started_at = time.monotonic()
+        self._last_decrease_at: Optional[float] = None
+        self._waiters: Deque[asyncio.Future] = deque()
+        # (시작 후 경과 초, 한도) 변화 기록
+        self.history: List[Tuple[float, float]] = [(0.0, self.limit)]
+    
+    async def acquire(self) -> float:
+        """
+        요청 슬롯을 확보합니다 (한도만큼 진행 중이면 먼저 온 순서대로 대기)
+        
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        if not self.enabled:
+            return 0.0
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return 0.0
+        
+        started_at = time.perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 받은 직후 취소되면 반납
+                self.in_flight -= 1
+                self._wake()
+            raise
+        wait = time.perf_counter() - started_at
+        self.total_wait += wait
+        return wait
+    
+    def release(self, latency: Optional[float] = None):
+        """
+        슬롯을 반납하고 결과를 한도에 반영합니다
+        
+        Args:
+            latency: 성공한 요청의 응답 시간 (초, 실패/취소면 None - 한도 증가 없음)
+        """
+        if not self.enabled:
+            return
+        utilized = self.in_flight * 2 >= int(self.limit)
+        self.in_flight -= 1
+        
+        if latency is not None:
+            if self.baseline is not None and latency > self.baseline * self.latency_tolerance:
+                self._decrease()
+            elif utilized:
+                # 한도를 절반 이상 쓰고 있을 때만 증가 (유휴 상태에서 한도가 부풀지 않도록)
+                self._set_limit(self.limit + 1.0 / self.limit)
+            self.baseline = latency if self.baseline is None else 0.9 * self.baseline + 0.1 * latency
+        self._wake()
+    
+    def record_error(self, error: Exception):
+        """시도 1회의 실패를 반영합니다 (혼잡 신호면 한도 감소)"""
+        if self.enabled and self.is_congestion(error):
+            self._decrease()
+            self._wake()
+    
+    @staticmethod
+    def is_congestion(error: Exception) -> bool:
+        """한도 초과/과부하/타임아웃 계열 오류인지 판단합니다"""
+        status_code = RetryPolicy.status_code_of(error)
+        if status_code is not None:
+            return status_code in CONGESTION_STATUS_CODES
+        return isinstance(error, (asyncio.TimeoutError, TimeoutError)) or "Timeout" in type(error).__name__
+    
+    def _decrease(self):
+        """한도를 곱셈적으로 줄입니다 (기준 응답 시간 안에 반복된 신호는 무시)"""
+        now = time.monotonic()
+        if self._last_decrease_at is not None and now - self._last_decrease_at < (self.baseline or 0.0):
+            return
+        self._last_decrease_at = now
+        self.decreases += 1
+        self._set_limit(self.limit * self.backoff_ratio)
+    
+    def _set_limit(self, limit: float):
+        """한도를 범위 안으로 조정하고 정수 단위가 바뀌면 기록합니다"""
+        previous = int(self.limit)
+        self.limit = min(self.max_limit, max(self.min_limit, limit))
+        if int(self.limit) != previous:
+            self.history.append((time.monotonic() - self._started_at, self.limit))
+    
+    def _wake(self):
+        """한도 안에서 대기 중인 요청을 깨웁니다"""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+    
+    def timeline(self, points: int = 24) -> List[float]:
+        """
+        시작부터 지금까지의 한도 추이를 같은 간격으로 샘플링합니다
+        
+        Args:
+            points: 샘플 수
+        
+        Returns:
+            List[float]: 시각 순 한도 값
+        """
+        elapsed = time.monotonic() - self._started_at
+        samples = []
+        index = 0
+        for i in range(points):
+            at = elapsed * i / max(1, points - 1)
+            while index + 1 < len(self.history) and self.history[index + 1][0] <= at:
+                index += 1
+            samples.append(self.history[index][1])
+        return samples
+    
+    def sparkline(self, points: int = 24) -> str:
+        """한도 추이를 블록 문자열로 표시합니다 (최대 한도 기준 높이)"""
+        top = max(limit for _, limit in self.history)
+        return "".join(
+            _SPARK_BLOCKS[min(len(_SPARK_BLOCKS) - 1, int(limit / top * (len(_SPARK_BLOCKS) - 1)))]
+            for limit in self.timeline(points)
+        )
+    
+    def stats(self) -> Dict[str, Any]:
+        """현재/최소/최대 한도와 대기 통계를 반환합니다"""
+        limits = [limit for _, limit in self.history]
+        return {
+            "limit": int(self.limit),
+            "initial": int(limits[0]),
+            "min": int(min(limits)),
+            "max": int(max(limits)),
+            "decreases": self.decreases,
+            "total_wait": self.total_wait
+        }
+
+
+# 프로바이더 키별 동시성 한도 (같은 키의 인스턴스끼리 공유)
+_concurrency_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_concurrency_limiter(provider_key: str) -> AdaptiveConcurrencyLimiter:
+    """
+    프로바이더 키에 해당하는 적응형 동시성 한도를 반환합니다 (없으면 설정값으로 생성)
+    
+    Args:
+        provider_key: 프로바이더 키 (예: "claude", "hyperclova")
+    
+    Returns:
+        AdaptiveConcurrencyLimiter: 공유 동시성 한도
+    """
+    if provider_key not in _concurrency_limiters:
+        _concurrency_limiters[provider_key] = AdaptiveConcurrencyLimiter()
+    return _concurrency_limiters[provider_key]
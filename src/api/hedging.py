@@ -0,0 +1,142 @@
+"""
+헤지 요청 정책 (tail latency 제어)
+
+프로바이더별 최근 응답 시간 분포를 유지하다가, 요청이 그 분위수(기본 p95)를 넘도록
+끝나지 않으면 같은 요청을 한 번 더 보내고 먼저 성공한 응답을 사용합니다.
+늦게 끝나는 쪽은 취소하며, 중복 요청 수와 승패는 응답 지표로 남깁니다.
+"""
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from ..metrics.histogram import LatencyHistogram
+from ..utils.config import settings
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgeStats:
+    """요청 1건의 헤지 통계"""
+    extra_requests: int = 0         # 추가로 보낸 중복 요청 수
+    winner: int = 0                 # 응답을 사용한 요청 순번 (0이면 원 요청)
+    delay: Optional[float] = None   # 중복 요청을 보내기까지 기다린 시간 (초, None이면 헤지 미적용)
+
+
+class HedgePolicy:
+    """프로바이더별 응답 시간 분위수 기반 헤지 정책"""
+    
+    def __init__(self,
+                 enabled: Optional[bool] = None,
+                 percentile: Optional[float] = None,
+                 min_samples: Optional[int] = None,
+                 max_extra: Optional[int] = None,
+                 window: Optional[int] = None):
+        """
+        헤지 정책 초기화
+        
+        Args:
+            enabled: 헤지 사용 여부 (None이면 설정값 사용)
+            percentile: 중복 요청을 보낼 응답 시간 분위수 (None이면 설정값 사용)
+            min_samples: 분위수를 신뢰하기 위한 최소 표본 수 (그 전에는 헤지하지 않음)
+            max_extra: 요청 1건당 최대 중복 요청 수
+            window: 프로바이더별로 유지할 최근 응답 시간 개수
+        """
+        self.enabled = settings.use_hedging if enabled is None else enabled
+        self.percentile = settings.hedge_percentile if percentile is None else percentile
+        self.min_samples = settings.hedge_min_samples if min_samples is None else min_samples
+        self.max_extra = settings.hedge_max_extra if max_extra is None else max_extra
+        self.window = window or settings.hedge_window
+        
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies: Dict[str, Deque[float]] = {}
+    
+    def observe(self, key: str, seconds: float):
+        """성공한 요청의 응답 시간을 기록합니다"""
+        self._latencies.setdefault(key, deque(maxlen=self.window)).append(seconds)
+    
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """
+        중복 요청을 보내기 전 기다릴 시간
+        
+        Args:
+            key: 프로바이더 키
+        
+        Returns:
+            Optional[float]: 최근 응답 시간의 분위수 (초, 헤지 비활성/표본 부족이면 None)
+        """
+        samples = self._latencies.get(key)
+        if not self.enabled or self.max_extra <= 0 or not samples or len(samples) < self.min_samples:
+            return None
+        return LatencyHistogram(samples).percentile(self.percentile)
+    
+    async def execute(self, key: str, func: Callable[[int], Awaitable[T]]) -> Tuple[T, HedgeStats]:
+        """
+        헤지 정책을 적용해 요청을 실행합니다
+        
+        원 요청이 분위수 시간 안에 끝나지 않으면 중복 요청을 보내고, 먼저 성공한 결과를 반환합니다.
+        어느 한쪽이 실패해도 남은 요청이 있으면 그 결과를 기다리며, 반환 전 남은 요청은 취소합니다.
+        
+        Args:
+            key: 프로바이더 키
+            func: 요청 순번(0부터)을 받아 요청 1건을 수행하는 코루틴 함수
+        
+        Returns:
+            Tuple[T, HedgeStats]: 먼저 성공한 결과와 헤지 통계
+        
+        Raises:
+            Exception: 모든 요청이 실패한 경우 가장 먼저 실패한 요청의 예외
+        """
+        self.requests += 1
+        delay = self.hedge_delay(key)
+        if delay is None:
+            return await func(0), HedgeStats()
+        
+        tasks = [asyncio.ensure_future(func(0))]
+        first_error: Optional[BaseException] = None
+        try:
+            while True:
+                pending = [task for task in tasks if not task.done()]
+                if not pending:
+                    raise first_error
+                
+                can_hedge = len(tasks) <= self.max_extra
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # 분위수 시간이 지나도록 응답이 없으면 중복 요청 전송
+                    self.hedged += 1
+                    tasks.append(asyncio.ensure_future(func(len(tasks))))
+                    continue
+                
+                for task in sorted(done, key=tasks.index):
+                    if task.exception() is None:
+                        winner = tasks.index(task)
+                        if winner:
+                            self.hedge_wins += 1
+                        return task.result(), HedgeStats(extra_requests=len(tasks) - 1, winner=winner, delay=delay)
+                    first_error = first_error or task.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def stats(self) -> Dict[str, Any]:
+        """헤지 적용 통계를 반환합니다"""
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": self.hedged / self.requests if self.requests else 0.0
+        }
+
+
+# 전역 헤지 정책 인스턴스
+hedge_policy = HedgePolicy()
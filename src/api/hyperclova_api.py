@@ -1,32 +1,48 @@
 """
 Naver HyperClovaX API 클래스
 """
-import time
-import asyncio
 import json
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
 
 try:
-    import requests
+    import httpx
 except ImportError:
-    requests = None
+    httpx = None
 
 from ..utils.config import settings
-from ..utils.prompt_loader import prompt_loader
-from .claude_api import APIResponse  # APIResponse 클래스 재사용
+from ..utils.timing import PhaseTimer
+from .base import BaseProvider
+from .retry import ProviderHTTPError
+from .streaming import SSEParser, StreamTimer
+from .transport import transport
 
 
-class HyperClovaAPI:
+class HyperClovaAPI(BaseProvider):
     """HyperClovaX API 클래스"""
     
-    def __init__(self):
-        """HyperClovaX API 클라이언트 초기화"""
-        if not requests:
-            raise ImportError("requests 패키지가 설치되지 않았습니다. pip install requests")
+    # 설정 조회용 프로바이더 키
+    provider_key = "hyperclova"
+    provider_name = "Naver"
+    # 토큰 사용량 추정 (한국어 특성 반영)
+    # 한국어는 조사, 어미, 종성 등으로 인해 영어 대비 3배 정도 토큰 사용
+    token_estimate_ratio = 3.0
+    
+    def __init__(self, use_async: Optional[bool] = None, stream: Optional[bool] = None):
+        """
+        HyperClovaX API 클라이언트 초기화
+        
+        Args:
+            use_async: 네이티브 비동기 HTTP 클라이언트 사용 여부 (None이면 설정값 사용)
+            stream: 스트리밍(SSE) 생성 모드 사용 여부 (None이면 설정값 사용)
+        """
+        if not httpx:
+            raise ImportError("httpx 패키지가 설치되지 않았습니다. pip install httpx")
         
         if not settings.hyperclova_api_key:
             raise ValueError("HYPERCLOVA_API_KEY가 설정되지 않았습니다.")
         
+        super().__init__(use_async=use_async, stream=stream)
+        
         self.api_key = settings.hyperclova_api_key
         self.api_gateway_url = settings.hyperclova_api_gateway_url
         
@@ -51,56 +67,14 @@ class HyperClovaAPI:
             "Content-Type": "application/json",
             "X-NCP-CLOVASTUDIO-REQUEST-ID": self.request_id
         }
-    
-    async def generate_questions(self, user_response: str, context: str = "") -> APIResponse:
-        """
-        사용자 응답을 기반으로 후속 질문들을 생성합니다
-        
-        Args:
-            user_response: 사용자의 응답
-            context: 이전 대화 맥락
-            
-        Returns:
-            APIResponse: 생성된 질문들과 메타데이터
-        """
-        prompt = self._build_question_prompt(user_response, context)
-        return await self._make_request(prompt)
-    
-    async def generate_report(self, user_response: str, context: str = "") -> APIResponse:
-        """
-        사용자 응답을 바탕으로 보고서를 생성합니다
-        
-        Args:
-            user_response: 사용자의 응답
-            context: 이전 대화 맥락
-            
-        Returns:
-            APIResponse: 생성된 보고서와 메타데이터
-        """
-        report_prompt = self._build_report_prompt(user_response, context)
-        return await self._make_request(report_prompt)
-    
-    def _build_question_prompt(self, user_response: str, context: str) -> str:
-        """질문 생성을 위한 프롬프트 구성"""
-        use_start = "START" in context or "start" in context.lower()
         
-        return prompt_loader.get_question_prompt(
-            user_response=user_response,
-            context=context,
-            use_start=use_start,
-            simple=False
-        )
-    
-    def _build_report_prompt(self, user_response: str, context: str) -> str:
-        """보고서 생성을 위한 프롬프트 구성"""
-        return prompt_loader.get_report_prompt(user_response, context)
+        # 공유 전송 계층의 keep-alive 커넥션 풀 사용
+        self.client = transport.get_client(self.api_gateway_url)
+        self.async_client = transport.get_async_client(self.api_gateway_url) if self.use_async else None
     
-    async def _make_request(self, prompt: str) -> APIResponse:
-        """실제 API 요청을 수행합니다"""
-        start_time = time.time()
-        
-        # HyperClovaX API 요청 데이터 구성
-        request_data = {
+    def _request_data(self, prompt: str) -> Dict[str, Any]:
+        """HyperClovaX API 요청 데이터 구성"""
+        return {
             "messages": [
                 {
                     "role": "system",
@@ -113,83 +87,103 @@ class HyperClovaAPI:
             ],
             "topP": 0.8,
             "topK": 0,
-            "maxTokens": 2000,
-            "temperature": 0.7,
+            "maxTokens": self.max_tokens,
+            "temperature": self.temperature,
             "repeatPenalty": 1.2,
             "stopBefore": [],
             "includeAiFilters": True
         }
-        
-        try:
-            # 비동기 HTTP 요청 (새로운 API 엔드포인트)
-            api_url = f"{self.api_gateway_url}/testapp/v1/chat-completions/HCX-003"
-            response = await asyncio.to_thread(
-                self._sync_post_request,
-                api_url,
-                request_data
-            )
-            
-            end_time = time.time()
-            response_time = end_time - start_time
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                # 응답 내용 추출
-                content = result.get("result", {}).get("message", {}).get("content", "")
-                
-                # 토큰 사용량 계산 (한국어 특성 반영)
-                # 한국어는 조사, 어미, 종성 등으로 인해 영어 대비 3배 정도 토큰 사용
-                input_tokens = len(prompt.split()) * 3.0  # 한국어 토큰 추정 (보수적)
-                output_tokens = len(content.split()) * 3.0
-                total_tokens = int(input_tokens + output_tokens)
-                
-                # 비용 계산
-                input_cost = (input_tokens / 1_000_000) * self.input_price_per_million
-                output_cost = (output_tokens / 1_000_000) * self.output_price_per_million
-                total_cost = input_cost + output_cost
-                
-                return APIResponse(
-                    content=content,
-                    tokens_used=total_tokens,
-                    response_time=response_time,
-                    cost=total_cost
+    
+    async def _send(self, prompt: str, phases: PhaseTimer):
+        """API 요청 1회 시도 - (응답 내용, 토큰 사용량(추정), 스트림 타이머) 반환"""
+        # HTTP 요청 (새로운 API 엔드포인트)
+        api_url = f"{self.api_gateway_url}/testapp/v1/chat-completions/HCX-003"
+        request_data = self._request_data(prompt)
+        timer = StreamTimer()
+        if self.stream:
+            if self.use_async:
+                with phases.phase("sdk_call"):
+                    content = await self._stream_async(api_url, request_data, timer)
+            else:
+                # 동기 HTTP 경로 (벤치마크 비교용)
+                content = await phases.run_in_thread(
+                    "sdk_call",
+                    self._stream_sync,
+                    api_url,
+                    request_data,
+                    timer
                 )
+        else:
+            if self.use_async:
+                with phases.phase("sdk_call"):
+                    response = await self.async_client.post(api_url, headers=self.headers, json=request_data)
             else:
-                error_msg = f"HTTP {response.status_code}: {response.text}"
-                return APIResponse(
-                    content="",
-                    tokens_used=0,
-                    response_time=response_time,
-                    cost=0.0,
-                    error=error_msg
+                # 동기 HTTP 경로 (벤치마크 비교용)
+                response = await phases.run_in_thread(
+                    "sdk_call",
+                    self._sync_post_request,
+                    api_url,
+                    request_data
                 )
-                
-        except Exception as e:
-            end_time = time.time()
-            return APIResponse(
-                content="",
-                tokens_used=0,
-                response_time=end_time - start_time,
-                cost=0.0,
-                error=str(e)
-            )
+            if response.status_code != 200:
+                # 재시도 정책이 상태 코드와 Retry-After를 볼 수 있도록 예외로 전달
+                raise ProviderHTTPError(response.status_code, response.text, response.headers)
+            
+            # 응답 내용 추출
+            with phases.phase("response_decode"):
+                result = response.json()
+                content = result.get("result", {}).get("message", {}).get("content", "")
+        return content, None, timer
     
     def _sync_post_request(self, url: str, data: Dict) -> Any:
-        """동기 HTTP POST 요청"""
-        assert requests is not None, "requests 모듈이 초기화되지 않았습니다"
-        return requests.post(
+        """동기 HTTP POST 요청 (공유 커넥션 풀 사용)"""
+        return self.client.post(
             url,
             headers=self.headers,
             json=data,
             timeout=settings.request_timeout
         )
     
-    def get_model_info(self) -> Dict[str, Any]:
-        """모델 정보를 반환합니다"""
-        return {
-            "provider": "Naver",
-            "model": self.model,
-            "input_price_per_million": self.input_price_per_million,
-            "output_price_per_million": self.output_price_per_million
-        } 
\ No newline at end of file
+    def _stream_headers(self) -> Dict[str, str]:
+        """SSE 스트리밍 요청 헤더"""
+        return {**self.headers, "Accept": "text/event-stream"}
+    
+    @staticmethod
+    def _token_text(event: Optional[str], data: str) -> str:
+        """SSE token 이벤트에서 증분 텍스트 추출"""
+        if event != "token":
+            return ""
+        payload = SSEParser.load_json(data)
+        return payload.get("message", {}).get("content", "")
+    
+    async def _stream_async(self, url: str, data: Dict, timer: StreamTimer):
+        """비동기 SSE 스트리밍 요청 - token 이벤트마다 도착 시각 기록"""
+        parser = SSEParser()
+        chunks = []
+        async with self.async_client.stream("POST", url, json=data, headers=self._stream_headers()) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise ProviderHTTPError(response.status_code, response.text, response.headers)
+            async for line in response.aiter_lines():
+                event = parser.feed(line)
+                text = self._token_text(*event) if event else ""
+                if text:
+                    timer.mark()
+                    chunks.append(text)
+        return "".join(chunks)
+    
+    def _stream_sync(self, url: str, data: Dict, timer: StreamTimer):
+        """동기 SSE 스트리밍 요청 - token 이벤트마다 도착 시각 기록"""
+        parser = SSEParser()
+        chunks = []
+        with self.client.stream("POST", url, json=data, headers=self._stream_headers()) as response:
+            if response.status_code != 200:
+                response.read()
+                raise ProviderHTTPError(response.status_code, response.text, response.headers)
+            for line in response.iter_lines():
+                event = parser.feed(line)
+                text = self._token_text(*event) if event else ""
+                if text:
+                    timer.mark()
+                    chunks.append(text)
+        return "".join(chunks)
@@ -1,9 +1,8 @@
 """
 OpenAI API 클래스 (ChatGPT)
 """
-import time
-import asyncio
-from typing import List, Dict, Any, Optional
+import json
+from typing import AsyncIterator, Dict, Any, Optional
 
 try:
     import openai
@@ -11,142 +10,238 @@ except ImportError:
     openai = None
 
 from ..utils.config import settings
-from ..utils.prompt_loader import prompt_loader
-from .claude_api import APIResponse  # APIResponse 클래스 재사용
+from ..utils.timing import PhaseTimer
+from .base import BaseProvider, TokenUsage
+from .batch import BATCH_ENDED, BATCH_FAILED, BATCH_IN_PROGRESS, BatchEntry, BatchStatus
+from .streaming import StreamTimer
+from .transport import transport
 
 
-class OpenAIAPI:
-    """OpenAI API 클래스 (ChatGPT)"""
+class OpenAIAPI(BaseProvider):
+    """OpenAI API 클래스 (ChatGPT) - OpenAI 호환 프로바이더의 기반 클래스"""
     
-    def __init__(self):
-        """OpenAI API 클라이언트 초기화"""
+    # 설정 조회용 프로바이더 키
+    provider_key = "openai"
+    provider_name = "OpenAI"
+    
+    # OpenAI 호환 프로바이더는 아래 설정 이름만 바꿔 재사용 (settings 필드 이름)
+    api_key_setting = "openai_api_key"
+    base_url_setting = "openai_base_url"
+    model_setting = "openai_model"
+    
+    # Batch API (실시간 대비 50% 가격, OpenAI 호환 프로바이더는 지원 여부를 따로 지정)
+    supports_batch = True
+    batch_endpoint = "/v1/chat/completions"
+    
+    # 자동 프롬프트 캐시 (1024토큰 이상 동일 접두부, 읽기 토큰은 입력 단가의 50%, 기록 할증 없음)
+    cache_read_price_ratio = 0.5
+    
+    # 가격 정보 (2024년 기준, USD/1M tokens)
+    model_pricing = {
+        "gpt-4o": {"input": 5.0, "output": 15.0},
+        "gpt-4o-mini": {"input": 0.15, "output": 0.6},
+        "gpt-4-turbo": {"input": 10.0, "output": 30.0},
+        "gpt-3.5-turbo": {"input": 0.5, "output": 1.5}
+    }
+    
+    def __init__(self, use_async: Optional[bool] = None, stream: Optional[bool] = None):
+        """
+        OpenAI API 클라이언트 초기화
+        
+        Args:
+            use_async: 네이티브 비동기 클라이언트 사용 여부 (None이면 설정값 사용)
+            stream: 스트리밍 생성 모드 사용 여부 (None이면 설정값 사용)
+        """
         if not openai:
             raise ImportError("openai 패키지가 설치되지 않았습니다. pip install openai")
         
-        if not settings.openai_api_key:
-            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
+        api_key = getattr(settings, self.api_key_setting)
+        if not api_key:
+            raise ValueError(f"{self.api_key_setting.upper()}가 설정되지 않았습니다.")
         
-        # OpenAI 클라이언트 초기화
-        self.client = openai.OpenAI(api_key=settings.openai_api_key)
-        self.model = settings.openai_model
-        
-        # 가격 정보 (2024년 기준, USD/1M tokens)
-        self.model_pricing = {
-            "gpt-4o": {"input": 5.0, "output": 15.0},
-            "gpt-4o-mini": {"input": 0.15, "output": 0.6},
-            "gpt-4-turbo": {"input": 10.0, "output": 30.0},
-            "gpt-3.5-turbo": {"input": 0.5, "output": 1.5}
-        }
+        super().__init__(use_async=use_async, stream=stream)
+        base_url = getattr(settings, self.base_url_setting)
+        # 커넥션 풀은 공유 전송 계층에서 가져오고, SDK 내부 재시도는 끔 (retry_policy로 일원화)
+        self.client = openai.OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=transport.get_client(base_url),
+            max_retries=0
+        )
+        self.async_client = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=transport.get_async_client(base_url),
+            max_retries=0
+        )
+        self.model = getattr(settings, self.model_setting)
         
         self.input_price_per_million = self.model_pricing.get(self.model, {"input": 5.0})["input"]
         self.output_price_per_million = self.model_pricing.get(self.model, {"output": 15.0})["output"]
     
-    async def generate_questions(self, user_response: str, context: str = "") -> APIResponse:
-        """
-        사용자 응답을 기반으로 후속 질문들을 생성합니다
+    async def _send(self, prompt: str, phases: PhaseTimer):
+        """API 요청 1회 시도 - (응답 내용, 토큰 사용량, 스트림 타이머) 반환"""
+        timer = StreamTimer()
+        if self.stream:
+            if self.use_async:
+                with phases.phase("sdk_call"):
+                    content, usage = await self._stream_async(prompt, timer)
+            else:
+                # 동기 SDK 경로 (벤치마크 비교용)
+                content, usage = await phases.run_in_thread("sdk_call", self._stream_sync, prompt, timer)
+        else:
+            if self.use_async:
+                with phases.phase("sdk_call"):
+                    response = await self.async_client.chat.completions.create(
+                        **self._request_kwargs(prompt)
+                    )
+            else:
+                # 동기 SDK 경로 (벤치마크 비교용)
+                response = await phases.run_in_thread(
+                    "sdk_call",
+                    self._sync_request,
+                    prompt
+                )
+            # 응답 내용 추출
+            with phases.phase("response_decode"):
+                content = response.choices[0].message.content
+                usage = getattr(response, 'usage', None)
         
-        Args:
-            user_response: 사용자의 응답
-            context: 이전 대화 맥락
-            
-        Returns:
-            APIResponse: 생성된 질문들과 메타데이터
-        """
-        prompt = self._build_question_prompt(user_response, context)
-        return await self._make_request(prompt)
+        # usage가 없으면 (일부 호환 API) 기반 클래스에서 단어 수로 추정
+        token_usage = None
+        if usage:
+            details = getattr(usage, "prompt_tokens_details", None)
+            token_usage = self._usage(usage.prompt_tokens, usage.completion_tokens,
+                                      getattr(details, "cached_tokens", None))
+        return content, token_usage, timer
     
-    async def generate_report(self, user_response: str, context: str = "") -> APIResponse:
+    @staticmethod
+    def _usage(prompt_tokens: int, completion_tokens: int, cached_tokens: Optional[int]) -> TokenUsage:
+        """Chat Completions usage 변환 (prompt_tokens에 포함된 캐시 적중 토큰을 분리)"""
+        cached_tokens = cached_tokens or 0
+        return TokenUsage(prompt_tokens - cached_tokens, completion_tokens, cache_read_tokens=cached_tokens)
+    
+    def _request_kwargs(self, prompt: str) -> Dict[str, Any]:
         """
-        사용자 응답을 바탕으로 보고서를 생성합니다
+        Chat Completions 요청 파라미터 구성
         
-        Args:
-            user_response: 사용자의 응답
-            context: 이전 대화 맥락
-            
-        Returns:
-            APIResponse: 생성된 보고서와 메타데이터
+        자동 프롬프트 캐시는 요청 앞부분이 바이트 단위로 같아야 적중하므로, 고정 시스템
+        메시지 → 템플릿 정적 접두부 → 사용자 응답 순서를 유지합니다.
         """
-        report_prompt = self._build_report_prompt(user_response, context)
-        return await self._make_request(report_prompt)
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "당신은 도움이 되는 AI 어시스턴트입니다."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "timeout": settings.request_timeout
+        }
     
-    def _build_question_prompt(self, user_response: str, context: str) -> str:
-        """질문 생성을 위한 프롬프트 구성"""
-        use_start = "START" in context or "start" in context.lower()
-        
-        return prompt_loader.get_question_prompt(
-            user_response=user_response,
-            context=context,
-            use_start=use_start,
-            simple=False
+    def _sync_request(self, prompt: str):
+        """동기 Chat Completions 요청"""
+        return self.client.chat.completions.create(**self._request_kwargs(prompt))
+    
+    def _stream_kwargs(self, prompt: str) -> Dict[str, Any]:
+        """스트리밍 요청 파라미터 구성 (마지막 청크에 usage 포함)"""
+        return {
+            **self._request_kwargs(prompt),
+            "stream": True,
+            "stream_options": {"include_usage": True}
+        }
+    
+    async def _stream_async(self, prompt: str, timer: StreamTimer):
+        """비동기 스트리밍 요청 - 텍스트 청크마다 도착 시각 기록"""
+        chunks = []
+        usage = None
+        stream = await self.async_client.chat.completions.create(**self._stream_kwargs(prompt))
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                timer.mark()
+                chunks.append(chunk.choices[0].delta.content)
+            if getattr(chunk, 'usage', None):
+                usage = chunk.usage
+        return "".join(chunks), usage
+    
+    def _stream_sync(self, prompt: str, timer: StreamTimer):
+        """동기 스트리밍 요청 - 텍스트 청크마다 도착 시각 기록"""
+        chunks = []
+        usage = None
+        for chunk in self.client.chat.completions.create(**self._stream_kwargs(prompt)):
+            if chunk.choices and chunk.choices[0].delta.content:
+                timer.mark()
+                chunks.append(chunk.choices[0].delta.content)
+            if getattr(chunk, 'usage', None):
+                usage = chunk.usage
+        return "".join(chunks), usage
+    
+    def _batch_line(self, custom_id: str, prompt: str) -> str:
+        """배치 입력 파일(JSONL)의 요청 1줄 (타임아웃은 배치 본문에서 제외)"""
+        body = {key: value for key, value in self._request_kwargs(prompt).items() if key != "timeout"}
+        return json.dumps(
+            {"custom_id": custom_id, "method": "POST", "url": self.batch_endpoint, "body": body},
+            ensure_ascii=False
+        )
+    
+    async def _submit_batch(self, prompts: Dict[str, str]) -> str:
+        """배치 입력 파일을 업로드하고 배치 생성"""
+        batch_file = "\n".join(self._batch_line(custom_id, prompt) for custom_id, prompt in prompts.items())
+        uploaded = await self.async_client.files.create(
+            file=("start_batch.jsonl", batch_file.encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.async_client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=self.batch_endpoint,
+            completion_window="24h"
         )
+        return batch.id
+    
+    async def _batch_status(self, batch_id: str) -> BatchStatus:
+        """배치 상태 조회 (completed → 종료, failed/expired/cancelled → 실패)"""
+        batch = await self.async_client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        total = counts.total if counts else 0
+        completed = (counts.completed + counts.failed) if counts else 0
+        
+        if batch.status == "completed":
+            return BatchStatus(state=BATCH_ENDED, total=total, completed=completed)
+        if batch.status in ("failed", "expired", "cancelled"):
+            errors = getattr(batch, "errors", None)
+            messages = [e.message for e in (errors.data or [])] if errors else []
+            return BatchStatus(state=BATCH_FAILED, total=total, completed=completed,
+                               error="; ".join(messages) or batch.status)
+        return BatchStatus(state=BATCH_IN_PROGRESS, total=total, completed=completed)
     
-    def _build_report_prompt(self, user_response: str, context: str) -> str:
-        """보고서 생성을 위한 프롬프트 구성"""
-        return prompt_loader.get_report_prompt(user_response, context)
+    async def _batch_results(self, batch_id: str) -> AsyncIterator[BatchEntry]:
+        """출력/오류 파일을 스트리밍으로 읽어 항목으로 변환"""
+        batch = await self.async_client.batches.retrieve(batch_id)
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            async with self.async_client.files.with_streaming_response.content(file_id) as response:
+                async for line in response.iter_lines():
+                    if line.strip():
+                        yield self._batch_entry(json.loads(line))
     
-    async def _make_request(self, prompt: str) -> APIResponse:
-        """실제 API 요청을 수행합니다"""
-        start_time = time.time()
+    @staticmethod
+    def _batch_entry(record: Dict[str, Any]) -> BatchEntry:
+        """배치 출력 파일의 1줄을 항목으로 변환"""
+        custom_id = record.get("custom_id", "")
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            error = record.get("error") or response.get("body", {}).get("error") or {}
+            return BatchEntry(custom_id=custom_id, error=f"배치 항목 실패: {error.get('message', error)}")
         
-        try:
-            # 비동기로 OpenAI API 호출
-            response = await asyncio.to_thread(
-                self._sync_openai_request,
-                prompt
-            )
-            
-            end_time = time.time()
-            response_time = end_time - start_time
-            
-            # 응답 내용 추출
-            content = response.choices[0].message.content
-            
-            # 토큰 사용량 정보
-            usage = response.usage
-            input_tokens = usage.prompt_tokens
-            output_tokens = usage.completion_tokens
-            total_tokens = usage.total_tokens
-            
-            # 비용 계산
-            input_cost = (input_tokens / 1_000_000) * self.input_price_per_million
-            output_cost = (output_tokens / 1_000_000) * self.output_price_per_million
-            total_cost = input_cost + output_cost
-            
-            return APIResponse(
-                content=content,
-                tokens_used=total_tokens,
-                response_time=response_time,
-                cost=total_cost
-            )
-            
-        except Exception as e:
-            end_time = time.time()
-            return APIResponse(
-                content="",
-                tokens_used=0,
-                response_time=end_time - start_time,
-                cost=0.0,
-                error=str(e)
-            )
-    
-    def _sync_openai_request(self, prompt: str):
-        """동기 OpenAI API 요청"""
-        return self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "당신은 도움이 되는 AI 어시스턴트입니다."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=2000,
-            temperature=0.7,
-            timeout=settings.request_timeout
+        body = response.get("body", {})
+        usage = body.get("usage")
+        return BatchEntry(
+            custom_id=custom_id,
+            content=body["choices"][0]["message"]["content"],
+            usage=OpenAIAPI._usage(
+                usage["prompt_tokens"],
+                usage["completion_tokens"],
+                (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+            ) if usage else None
         )
-    
-    def get_model_info(self) -> Dict[str, Any]:
-        """모델 정보를 반환합니다"""
-        return {
-            "provider": "OpenAI",
-            "model": self.model,
-            "input_price_per_million": self.input_price_per_million,
-            "output_price_per_million": self.output_price_per_million
-        } 
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+프로바이더 레이스 모드
+
+같은 요청을 여러 프로바이더에 동시에 보내고, 유효한 START JSON으로 파싱되는 응답을
+가장 먼저 돌려준 프로바이더를 승자로 사용합니다. 나머지 요청은 즉시 취소하며,
+완료된 패자 응답은 실제 비용, 취소된 요청은 입력 토큰 기준 추정 비용을 추가 비용으로 집계합니다.
+"""
+import re
+import json
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from .base import APIResponse, BaseProvider
+
+# 참가 요청 결과 상태
+RACE_WON = "won"
+RACE_LOST = "lost"            # 유효한 응답이었지만 늦게 도착
+RACE_INVALID = "invalid"      # START JSON 형식이 아님
+RACE_ERROR = "error"
+RACE_CANCELLED = "cancelled"  # 승자가 정해져 취소됨
+
+# 작업 유형별 필수 JSON 키
+_REQUIRED_KEYS = {
+    "questions": ("S", "T", "A", "R"),
+    "reports": ("START_분석", "핵심_역량")
+}
+
+
+@dataclass
+class RaceResult:
+    """레이스 1회 결과"""
+    winner: Optional[str]                 # 승자 프로바이더 이름 (없으면 None)
+    response: Optional[APIResponse]       # 승자 응답
+    elapsed: float                        # 시작부터 승자 확정(또는 전원 실패)까지 시간 (초)
+    extra_cost: float = 0.0               # 승자 외 요청의 비용 (USD, 취소된 요청은 추정 하한)
+    outcomes: Dict[str, str] = field(default_factory=dict)  # 프로바이더 이름 → 결과 상태
+
+
+def parse_start_json(content: str, task_type: str = "questions") -> Optional[Dict[str, Any]]:
+    """
+    응답에서 START JSON을 추출하고 필수 키를 확인합니다
+    
+    Args:
+        content: 모델 응답 (```json 블록 또는 JSON 본문)
+        task_type: "questions" 또는 "reports"
+    
+    Returns:
+        Optional[Dict[str, Any]]: 파싱된 JSON (형식이 맞지 않으면 None)
+    """
+    match = re.search(r'```json\s*\n(.*?)\n```', content, re.DOTALL)
+    text = match.group(1) if match else content.strip()
+    try:
+        data = json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    
+    if not isinstance(data, dict) or not all(key in data for key in _REQUIRED_KEYS[task_type]):
+        return None
+    if task_type == "questions" and not all(
+        isinstance(data[key], dict) and "꼬리질문" in data[key] for key in _REQUIRED_KEYS[task_type]
+    ):
+        return None
+    return data
+
+
+async def race(entrants: Dict[str, BaseProvider],
+               task_type: str,
+               user_response: str,
+               context: str = "") -> RaceResult:
+    """
+    여러 프로바이더에 같은 요청을 보내 유효한 START JSON을 먼저 돌려준 응답을 사용합니다
+    
+    Args:
+        entrants: 프로바이더 이름 → 인스턴스
+        task_type: "questions" 또는 "reports"
+        user_response: 사용자의 응답
+        context: 이전 대화 맥락
+    
+    Returns:
+        RaceResult: 승자, 승자 응답, 소요 시간, 추가 비용, 참가자별 결과
+    """
+    async def request(api_instance: BaseProvider) -> APIResponse:
+        if task_type == "questions":
+            return await api_instance.generate_questions(user_response, context)
+        return await api_instance.generate_report(user_response, context)
+    
+    start_time = time.time()
+    tasks = {asyncio.ensure_future(request(api_instance)): name for name, api_instance in entrants.items()}
+    result = RaceResult(winner=None, response=None, elapsed=0.0)
+    
+    try:
+        pending = set(tasks)
+        while pending and result.winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = tasks[task]
+                response = task.result()
+                if response.error:
+                    result.outcomes[name] = RACE_ERROR
+                elif parse_start_json(response.content, task_type) is None:
+                    result.outcomes[name] = RACE_INVALID
+                    result.extra_cost += response.cost
+                elif result.winner is None:
+                    result.outcomes[name] = RACE_WON
+                    result.winner, result.response = name, response
+                else:
+                    # 같은 순간에 끝난 유효 응답은 패자로 처리
+                    result.outcomes[name] = RACE_LOST
+                    result.extra_cost += response.cost
+        result.elapsed = time.time() - start_time
+    finally:
+        for task, name in tasks.items():
+            if not task.done():
+                task.cancel()
+                result.outcomes[name] = RACE_CANCELLED
+                result.extra_cost += _input_cost(entrants[name], task_type, user_response, context)
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    return result
+
+
+def _input_cost(api_instance: BaseProvider, task_type: str, user_response: str, context: str) -> float:
+    """취소된 요청의 추정 비용 (프롬프트 입력 토큰만 청구됐다고 보는 하한)"""
+    return api_instance.estimate_input_cost(api_instance.render_prompt(task_type, user_response, context))
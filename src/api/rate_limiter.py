@@ -0,0 +1,138 @@
+"""
+프로바이더별 레이트 리미터
+
+요청 수(RPM)와 토큰 수(TPM) 각각에 토큰 버킷을 두어, 프로바이더 한도를 넘는 요청을
+보내기 전에 대기시킵니다. TPM은 렌더링된 프롬프트의 추정 토큰 수로 먼저 예약하고,
+응답의 실제 usage로 사후 정산합니다.
+"""
+import time
+import asyncio
+from typing import Dict
+
+from ..utils.config import settings
+
+
+class TokenBucket:
+    """예약(reservation) 방식 토큰 버킷"""
+    
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        토큰 버킷 초기화
+        
+        Args:
+            capacity: 버킷 최대 용량
+            refill_per_second: 초당 보충량
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+    
+    def _refill(self):
+        """경과 시간만큼 토큰 보충"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+    
+    def reserve(self, amount: float) -> float:
+        """
+        토큰을 예약하고 사용 가능해질 때까지의 대기 시간을 반환합니다
+        
+        잔량이 부족하면 음수(부채)로 예약해 두므로, 먼저 예약한 요청이 먼저 통과합니다.
+        
+        Args:
+            amount: 예약할 토큰 양
+        
+        Returns:
+            float: 대기해야 하는 시간 (초)
+        """
+        self._refill()
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.refill_per_second
+    
+    def adjust(self, delta: float):
+        """
+        예약량을 사후 정산합니다
+        
+        Args:
+            delta: 추가로 차감할 양 (음수면 환불)
+        """
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class ProviderRateLimiter:
+    """RPM/TPM 토큰 버킷을 묶은 프로바이더 레이트 리미터"""
+    
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        """
+        레이트 리미터 초기화
+        
+        Args:
+            rpm: 분당 요청 수 한도 (0 이하이면 제한 없음)
+            tpm: 분당 토큰 수 한도 (0 이하이면 제한 없음)
+        """
+        self.request_bucket = TokenBucket(rpm, rpm / 60) if rpm > 0 else None
+        self.token_bucket = TokenBucket(tpm, tpm / 60) if tpm > 0 else None
+        self.total_wait = 0.0
+    
+    @property
+    def enabled(self) -> bool:
+        """한도가 하나라도 설정되어 있는지 여부"""
+        return self.request_bucket is not None or self.token_bucket is not None
+    
+    async def acquire(self, estimated_tokens: float) -> float:
+        """
+        요청 1건과 추정 토큰을 예약하고 필요한 만큼 대기합니다
+        
+        Args:
+            estimated_tokens: 이 요청이 사용할 것으로 예상되는 토큰 수
+        
+        Returns:
+            float: 레이트 리미터 대기 시간 (초)
+        """
+        wait = 0.0
+        if self.request_bucket is not None:
+            wait = max(wait, self.request_bucket.reserve(1))
+        if self.token_bucket is not None:
+            wait = max(wait, self.token_bucket.reserve(estimated_tokens))
+        
+        if wait > 0:
+            await asyncio.sleep(wait)
+            self.total_wait += wait
+        return wait
+    
+    def reconcile(self, estimated_tokens: float, actual_tokens: float):
+        """
+        실제 사용 토큰으로 TPM 예약량을 정산합니다
+        
+        Args:
+            estimated_tokens: acquire 시 예약한 토큰 수
+            actual_tokens: 응답 usage 기준 실제 토큰 수 (실패 시 0)
+        """
+        if self.token_bucket is not None:
+            self.token_bucket.adjust(actual_tokens - estimated_tokens)
+
+
+# 프로바이더 키별 레이트 리미터 (같은 키의 인스턴스끼리 공유)
+_rate_limiters: Dict[str, ProviderRateLimiter] = {}
+
+
+def get_rate_limiter(provider_key: str) -> ProviderRateLimiter:
+    """
+    프로바이더 키에 해당하는 레이트 리미터를 반환합니다 (없으면 설정값으로 생성)
+    
+    Args:
+        provider_key: 프로바이더 키 (예: "claude", "hyperclova")
+    
+    Returns:
+        ProviderRateLimiter: 공유 레이트 리미터
+    """
+    if provider_key not in _rate_limiters:
+        _rate_limiters[provider_key] = ProviderRateLimiter(
+            rpm=settings.provider_setting(provider_key, "rpm_limit", 0),
+            tpm=settings.provider_setting(provider_key, "tpm_limit", 0)
+        )
+    return _rate_limiters[provider_key]
@@ -0,0 +1,146 @@
+"""
+프로바이더 레지스트리
+
+프로바이더 클래스는 "모듈:클래스" 경로로만 등록해 두고, 실행에 선택된 경우에만
+임포트·생성합니다. 내장 프로바이더 외에 패키지 엔트리 포인트(start_llm.providers 그룹)나
+EXTRA_PROVIDERS 설정("이름=패키지.모듈:클래스", 쉼표 구분)으로 프로바이더를 추가할 수 있습니다.
+"""
+import importlib
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Dict, Iterable, List, Optional, Type
+
+from ..utils.config import settings
+from .base import BaseProvider
+
+# 엔트리 포인트 그룹 이름
+ENTRY_POINT_GROUP = "start_llm.providers"
+
+# 내장 프로바이더 (표시 이름 → 모듈:클래스, 이 패키지 기준 상대 경로)
+BUILTIN_PROVIDERS = {
+    "Claude": ".claude_api:ClaudeAPI",
+    "Claude Haiku": ".claude_haiku_api:ClaudeHaikuAPI",
+    "ChatGPT": ".openai_api:OpenAIAPI",
+    "Gemini": ".gemini_api:GeminiAPI",
+    "Grok": ".grok_api:GrokAPI",
+    "HyperClovaX": ".hyperclova_api:HyperClovaAPI"
+}
+
+
+@dataclass
+class ProviderSpec:
+    """지연 로딩용 프로바이더 등록 정보"""
+    name: str
+    target: str  # "모듈:클래스" (모듈이 "."으로 시작하면 src.api 기준 상대 경로)
+    
+    def load(self) -> Type[BaseProvider]:
+        """프로바이더 클래스를 임포트합니다"""
+        module_name, _, class_name = self.target.partition(":")
+        if not class_name:
+            raise ValueError(f"프로바이더 경로 형식이 잘못되었습니다 (모듈:클래스): {self.target}")
+        
+        module = importlib.import_module(module_name, package=__package__)
+        provider_class = getattr(module, class_name)
+        if not (isinstance(provider_class, type) and issubclass(provider_class, BaseProvider)):
+            raise TypeError(f"{self.target}는 BaseProvider 하위 클래스가 아닙니다.")
+        return provider_class
+
+
+class ProviderRegistry:
+    """표시 이름 → 프로바이더 등록 정보"""
+    
+    def __init__(self):
+        """레지스트리 초기화 (엔트리 포인트/설정은 첫 조회 시 읽음)"""
+        self._specs: Dict[str, ProviderSpec] = {}
+        self._discovered = False
+    
+    def register(self, name: str, target: str):
+        """
+        프로바이더를 등록합니다 (같은 이름이면 덮어씀)
+        
+        Args:
+            name: 표시 이름 (결과 표와 보고서에 쓰임)
+            target: "모듈:클래스" 경로
+        """
+        self._specs[name] = ProviderSpec(name=name, target=target)
+    
+    def _discover(self):
+        """내장 목록, 엔트리 포인트, EXTRA_PROVIDERS 설정 순으로 등록합니다"""
+        if self._discovered:
+            return
+        self._discovered = True
+        
+        for name, target in BUILTIN_PROVIDERS.items():
+            self._specs.setdefault(name, ProviderSpec(name=name, target=target))
+        
+        for entry_point in self._entry_points():
+            self.register(entry_point.name, entry_point.value)
+        
+        for item in settings.extra_providers.split(","):
+            name, _, target = item.partition("=")
+            if name.strip() and target.strip():
+                self.register(name.strip(), target.strip())
+    
+    @staticmethod
+    def _entry_points() -> List[metadata.EntryPoint]:
+        """start_llm.providers 그룹의 엔트리 포인트 목록"""
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            return list(entry_points.select(group=ENTRY_POINT_GROUP))
+        return list(entry_points.get(ENTRY_POINT_GROUP, []))  # Python 3.9 이하
+    
+    def names(self) -> List[str]:
+        """등록된 프로바이더 이름 목록"""
+        self._discover()
+        return list(self._specs.keys())
+    
+    def select(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        실행할 프로바이더 이름을 고릅니다 (대소문자·공백 무시)
+        
+        Args:
+            names: 선택할 이름 목록 (None이거나 비어 있으면 PROVIDERS 설정, 그것도 없으면 전체)
+        
+        Returns:
+            List[str]: 등록된 표시 이름 목록 (등록 순서 유지)
+        """
+        self._discover()
+        requested = [n for n in (names or settings.providers.split(",")) if n.strip()]
+        if not requested:
+            return self.names()
+        
+        def normalize(name: str) -> str:
+            return name.replace(" ", "").lower()
+        
+        wanted = {normalize(n) for n in requested}
+        unknown = wanted - {normalize(n) for n in self._specs}
+        if unknown:
+            raise ValueError(
+                f"알 수 없는 프로바이더: {', '.join(sorted(unknown))} "
+                f"(사용 가능: {', '.join(self._specs)})"
+            )
+        return [name for name in self._specs if normalize(name) in wanted]
+    
+    def load_class(self, name: str) -> Type[BaseProvider]:
+        """이름에 해당하는 프로바이더 클래스를 임포트합니다"""
+        self._discover()
+        if name not in self._specs:
+            raise KeyError(f"등록되지 않은 프로바이더: {name}")
+        return self._specs[name].load()
+    
+    def create(self, name: str, **kwargs) -> BaseProvider:
+        """
+        프로바이더를 임포트하고 인스턴스를 생성합니다
+        
+        Args:
+            name: 표시 이름
+            **kwargs: 생성자 인자 (use_async, stream)
+        
+        Returns:
+            BaseProvider: 프로바이더 인스턴스
+        """
+        return self.load_class(name)(**kwargs)
+
+
+# 전역 프로바이더 레지스트리
+provider_registry = ProviderRegistry()
@@ -0,0 +1,216 @@
+"""
+디스크 응답 캐시
+
+(프로바이더, 모델, 렌더링된 프롬프트 해시, 샘플링 파라미터)를 키로 성공한 응답을
+SQLite 파일에 저장합니다. TTL 만료와 용량 기준 LRU 퇴출을 지원하며,
+캐시 적중 응답은 cached=True로 표시되어 지연 시간 통계에서 제외됩니다.
+비동기 요청 경로는 aget/aset으로 SQLite 입출력을 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+"""
+import os
+import json
+import time
+import asyncio
+import sqlite3
+import hashlib
+import threading
+from dataclasses import asdict
+from typing import Any, Dict, Optional
+
+from ..utils.config import settings
+
+
+class ResponseCache:
+    """TTL + LRU 디스크 응답 캐시"""
+    
+    def __init__(self,
+                 path: Optional[str] = None,
+                 ttl_seconds: Optional[float] = None,
+                 max_bytes: Optional[int] = None,
+                 enabled: Optional[bool] = None):
+        """
+        응답 캐시 초기화 (DB 파일은 첫 사용 시 생성)
+        
+        Args:
+            path: SQLite 파일 경로 (None이면 설정값 사용)
+            ttl_seconds: 항목 유효 시간 (초, None이면 설정값 사용)
+            max_bytes: 캐시 최대 크기 (바이트, None이면 설정값 사용)
+            enabled: 캐시 사용 여부 (None이면 설정값 사용)
+        """
+        self.path = path or os.path.join(settings.cache_dir, "responses.sqlite3")
+        self.ttl_seconds = settings.cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.max_bytes = max_bytes or settings.cache_max_mb * 1024 * 1024
+        self.enabled = settings.use_response_cache if enabled is None else enabled
+        self.refresh = False  # True면 읽기는 건너뛰고 새 응답으로 덮어씀
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        # 여러 스레드(aget/aset)가 연결 1개를 공유하므로 조회/기록을 직렬화
+        self._lock = threading.Lock()
+    
+    def configure(self, enabled: Optional[bool] = None, refresh: Optional[bool] = None):
+        """
+        실행 옵션(--no-cache, --refresh)을 반영합니다
+        
+        Args:
+            enabled: 캐시 사용 여부
+            refresh: 캐시를 읽지 않고 새로 받아 덮어쓸지 여부
+        """
+        if enabled is not None:
+            self.enabled = enabled
+        if refresh is not None:
+            self.refresh = refresh
+    
+    def _connection(self) -> sqlite3.Connection:
+        """SQLite 연결을 가져오거나 생성합니다"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed_at)")
+            self._conn.commit()
+        return self._conn
+    
+    @staticmethod
+    def make_key(provider_key: str,
+                 model: str,
+                 prompt: str,
+                 max_tokens: int,
+                 temperature: Optional[float],
+                 mode: str = "realtime") -> str:
+        """
+        캐시 키를 생성합니다
+        
+        배치 응답은 비용(할인가)과 응답 시간의 의미가 실시간 응답과 다르므로 실행 방식을 키에 포함해
+        두 경로의 캐시 항목이 섞이지 않도록 합니다.
+        
+        Args:
+            provider_key: 프로바이더 키
+            model: 모델명
+            prompt: 렌더링된 프롬프트
+            max_tokens: 최대 출력 토큰
+            temperature: 샘플링 온도
+            mode: 실행 방식 ("realtime" 또는 "batch")
+        
+        Returns:
+            str: SHA-256 캐시 키
+        """
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        raw = json.dumps(
+            [provider_key, model, prompt_hash, max_tokens, temperature, mode],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답을 조회합니다
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            Optional[Dict[str, Any]]: cached=True가 표시된 응답 필드 (없거나 만료되면 None)
+        """
+        if not self.enabled or self.refresh:
+            return None
+        
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            
+            if row is None or (self.ttl_seconds > 0 and now - row[1] > self.ttl_seconds):
+                if row is not None:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                self.misses += 1
+                return None
+            
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+        return {**json.loads(row[0]), "cached": True}
+    
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """get의 비동기 버전 (캐시가 꺼져 있으면 스레드로 넘기지 않고 바로 None)"""
+        if not self.enabled or self.refresh:
+            return None
+        return await asyncio.to_thread(self.get, key)
+    
+    def set(self, key: str, response: Any):
+        """
+        성공한 응답을 저장하고 용량을 넘으면 LRU 항목을 퇴출합니다
+        
+        Args:
+            key: 캐시 키
+            response: 저장할 APIResponse (오류 응답은 저장하지 않음)
+        """
+        if not self.enabled or getattr(response, "error", None):
+            return
+        
+        value = json.dumps(asdict(response), ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now)
+            )
+            self._evict(conn)
+            conn.commit()
+    
+    async def aset(self, key: str, response: Any):
+        """set의 비동기 버전 (저장하지 않을 응답은 스레드로 넘기지 않음)"""
+        if not self.enabled or getattr(response, "error", None):
+            return
+        await asyncio.to_thread(self.set, key, response)
+    
+    def _evict(self, conn: sqlite3.Connection):
+        """총 크기가 상한을 넘으면 가장 오래 사용되지 않은 항목부터 삭제"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 통계를 반환합니다"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+    
+    def close(self):
+        """SQLite 연결을 닫습니다"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# 전역 응답 캐시 인스턴스
+response_cache = ResponseCache()
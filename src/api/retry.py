@@ -0,0 +1,179 @@
+"""
+재시도 정책 모듈
+
+지수 백오프 + full jitter, Retry-After 헤더 존중, 재시도 가능/불가 오류 분류를 제공합니다.
+SDK 내부 재시도는 끄고 이 정책으로 일원화해, 재시도에 쓴 시간을 응답 시간과 분리해 기록합니다.
+"""
+import time
+import random
+import asyncio
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+from dataclasses import dataclass
+
+from ..utils.config import settings
+
+T = TypeVar("T")
+
+# 재시도 가능한 HTTP 상태 코드 (529: Anthropic overloaded)
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# 상태 코드가 없는 네트워크/타임아웃 계열 예외 이름 패턴
+RETRYABLE_ERROR_NAMES = ("Timeout", "Connection", "Connect", "RemoteProtocol", "ReadError", "WriteError")
+
+
+class ProviderHTTPError(Exception):
+    """원시 HTTP 프로바이더의 비정상 응답"""
+    
+    def __init__(self, status_code: int, body: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(f"HTTP {status_code}: {body}")
+        self.status_code = status_code
+        self.body = body
+        self.headers = dict(headers or {})
+
+
+@dataclass
+class RetryStats:
+    """재시도 통계"""
+    attempts: int = 0           # 총 시도 횟수
+    backoff_time: float = 0.0   # 백오프 대기에 쓴 시간 (초)
+    retry_time: float = 0.0     # 마지막 시도 이전에 소비한 시간 (실패한 시도 + 백오프, 초)
+
+
+class RetryError(Exception):
+    """재시도 후에도 실패한 요청"""
+    
+    def __init__(self, last_error: Exception, stats: RetryStats):
+        super().__init__(str(last_error))
+        self.last_error = last_error
+        self.stats = stats
+
+
+class RetryPolicy:
+    """지수 백오프 재시도 정책"""
+    
+    def __init__(self,
+                 max_retries: Optional[int] = None,
+                 base_delay: Optional[float] = None,
+                 max_delay: Optional[float] = None):
+        """
+        재시도 정책 초기화
+        
+        Args:
+            max_retries: 최대 재시도 횟수 (None이면 settings.max_retries)
+            base_delay: 첫 백오프 상한 (초, None이면 설정값 사용)
+            max_delay: 백오프 최대값 (초, None이면 설정값 사용)
+        """
+        self.max_retries = settings.max_retries if max_retries is None else max_retries
+        self.base_delay = settings.retry_base_delay if base_delay is None else base_delay
+        self.max_delay = settings.retry_max_delay if max_delay is None else max_delay
+    
+    @staticmethod
+    def status_code_of(error: Exception) -> Optional[int]:
+        """예외에서 HTTP 상태 코드 추출 (SDK별 속성 차이 흡수)"""
+        status_code = getattr(error, "status_code", None)
+        if isinstance(status_code, int):
+            return status_code
+        
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+        if isinstance(status_code, int):
+            return status_code
+        
+        # google.api_core 예외는 code 속성에 HTTP 상태 코드를 담음
+        code = getattr(error, "code", None)
+        if isinstance(code, int):
+            return code
+        return None
+    
+    @staticmethod
+    def retry_after_of(error: Exception) -> Optional[float]:
+        """예외의 응답 헤더에서 Retry-After 값(초) 추출"""
+        headers = getattr(error, "headers", None)
+        if headers is None:
+            headers = getattr(getattr(error, "response", None), "headers", None)
+        if not headers:
+            return None
+        
+        try:
+            retry_after_ms = headers.get("retry-after-ms")
+            if retry_after_ms is not None:
+                return max(0.0, float(retry_after_ms) / 1000)
+            
+            retry_after = headers.get("retry-after") or headers.get("Retry-After")
+            if retry_after is None:
+                return None
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                # HTTP-date 형식
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError, AttributeError):
+            return None
+    
+    def is_retryable(self, error: Exception) -> bool:
+        """재시도 가능한 오류인지 분류합니다"""
+        status_code = self.status_code_of(error)
+        if status_code is not None:
+            return status_code in RETRYABLE_STATUS_CODES
+        
+        if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+            return True
+        return any(name in type(error).__name__ for name in RETRYABLE_ERROR_NAMES)
+    
+    def backoff_delay(self, retry_number: int, retry_after: Optional[float] = None) -> float:
+        """
+        다음 시도 전 대기 시간을 계산합니다
+        
+        Args:
+            retry_number: 몇 번째 재시도인지 (0부터 시작)
+            retry_after: 서버가 지정한 Retry-After (초)
+        
+        Returns:
+            float: 대기 시간 (초)
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        # full jitter: [0, min(max_delay, base * 2^n)] 구간에서 균등 추출
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry_number)))
+    
+    async def execute(self, func: Callable[[], Awaitable[T]]) -> Tuple[T, RetryStats]:
+        """
+        재시도 정책을 적용해 요청을 실행합니다
+        
+        Args:
+            func: 시도 1회를 수행하는 코루틴 함수
+        
+        Returns:
+            Tuple[T, RetryStats]: 마지막 시도의 결과와 재시도 통계
+        
+        Raises:
+            RetryError: 재시도 불가 오류이거나 재시도 횟수를 모두 소진한 경우
+        """
+        stats = RetryStats()
+        started_at = time.time()
+        
+        while True:
+            attempt_started_at = time.time()
+            stats.attempts += 1
+            try:
+                result = await func()
+                stats.retry_time = attempt_started_at - started_at
+                return result, stats
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                retries_done = stats.attempts - 1
+                if not self.is_retryable(e) or retries_done >= self.max_retries:
+                    stats.retry_time = attempt_started_at - started_at
+                    raise RetryError(e, stats) from e
+                
+                delay = self.backoff_delay(retries_done, self.retry_after_of(e))
+                stats.backoff_time += delay
+                await asyncio.sleep(delay)
+
+
+# 전역 재시도 정책 인스턴스
+retry_policy = RetryPolicy()
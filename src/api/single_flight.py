@@ -0,0 +1,85 @@
+"""
+진행 중 요청 병합 (single-flight)
+
+같은 키(프로바이더, 모델, 프롬프트 해시, 샘플링 파라미터)로 동시에 들어온 요청은
+업스트림 호출 하나를 공유하고, 먼저 시작한 요청(리더)의 결과를 모든 대기자에게 나눠줍니다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..utils.config import settings
+
+
+class SingleFlight:
+    """키 단위 진행 중 요청 병합기"""
+    
+    def __init__(self, enabled: Optional[bool] = None):
+        """
+        병합기 초기화
+        
+        Args:
+            enabled: 병합 사용 여부 (None이면 설정값 사용)
+        """
+        self.enabled = settings.use_single_flight if enabled is None else enabled
+        self.requests = 0
+        self.coalesced = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        같은 키의 요청이 진행 중이면 그 결과를 기다리고, 아니면 func를 실행합니다
+        
+        Args:
+            key: 요청 병합 키
+            func: 업스트림 요청을 수행하는 비동기 함수
+        
+        Returns:
+            Tuple[Any, bool]: (결과, 다른 요청의 결과를 공유했는지 여부)
+        """
+        self.requests += 1
+        if not self.enabled:
+            return await func(), False
+        
+        future = self._inflight.get(key)
+        if future is not None:
+            try:
+                result = await asyncio.shield(future)
+                self.coalesced += 1
+                return result, True
+            except asyncio.CancelledError:
+                # 대기자 자신이 취소된 경우는 그대로 전파, 리더가 취소된 경우만 직접 실행
+                if not future.cancelled():
+                    raise
+                self.requests -= 1
+                return await self.do(key, func)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없어도 경고가 남지 않도록 조회 처리
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+    
+    def stats(self) -> Dict[str, Any]:
+        """병합 적중률 통계를 반환합니다"""
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "upstream": self.requests - self.coalesced,
+            "hit_rate": self.coalesced / self.requests if self.requests else 0.0
+        }
+
+
+# 전역 요청 병합기 (모든 프로바이더 공유, 키에 프로바이더가 포함됨)
+single_flight = SingleFlight()
@@ -0,0 +1,146 @@
+"""
+스트리밍 응답 측정 유틸리티
+
+스트림 청크 도착 시각을 기록해 첫 토큰까지의 시간(TTFT),
+토큰 간 지연(ITL) 분포, 출력 토큰 처리량을 계산합니다.
+"""
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class StreamTimer:
+    """스트림 청크 도착 시각 기록기"""
+    
+    def __init__(self):
+        """요청 시작 시각을 기준점으로 기록"""
+        self.start = time.perf_counter()
+        self.first_chunk_at: Optional[float] = None
+        self.last_chunk_at: Optional[float] = None
+        self.inter_token_latencies: List[float] = []
+    
+    def mark(self):
+        """텍스트 청크 1개가 도착했음을 기록합니다"""
+        now = time.perf_counter()
+        if self.first_chunk_at is None:
+            self.first_chunk_at = now
+        else:
+            self.inter_token_latencies.append(now - self.last_chunk_at)
+        self.last_chunk_at = now
+    
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """첫 텍스트 청크까지 걸린 시간 (초)"""
+        if self.first_chunk_at is None:
+            return None
+        return self.first_chunk_at - self.start
+    
+    def tokens_per_second(self, output_tokens: float) -> Optional[float]:
+        """
+        첫 토큰 이후 생성 구간의 출력 토큰 처리량을 계산합니다
+        
+        Args:
+            output_tokens: 출력 토큰 수 (실측 또는 추정)
+        
+        Returns:
+            Optional[float]: 초당 출력 토큰 수 (청크가 2개 미만이면 None)
+        """
+        if self.first_chunk_at is None or self.last_chunk_at is None:
+            return None
+        generation_time = self.last_chunk_at - self.first_chunk_at
+        if generation_time <= 0 or not output_tokens:
+            return None
+        return output_tokens / generation_time
+    
+    def apply(self, response: Any, output_tokens: float) -> Any:
+        """
+        측정값을 APIResponse에 기록합니다
+        
+        Args:
+            response: 측정값을 기록할 APIResponse
+            output_tokens: 출력 토큰 수
+        
+        Returns:
+            Any: 같은 APIResponse 객체
+        """
+        response.streamed = True
+        response.time_to_first_token = self.time_to_first_token
+        response.inter_token_latencies = list(self.inter_token_latencies)
+        response.output_tokens_per_second = self.tokens_per_second(output_tokens)
+        return response
+
+
+def summarize_latencies(values: List[float]) -> Dict[str, float]:
+    """
+    지연 시간 목록의 요약 통계를 계산합니다
+    
+    Args:
+        values: 지연 시간 목록 (초)
+    
+    Returns:
+        Dict[str, float]: mean/p50/p95 (값이 없으면 빈 딕셔너리)
+    """
+    if not values:
+        return {}
+    
+    ordered = sorted(values)
+    
+    def pick(q: float) -> float:
+        index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[index]
+    
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p50": pick(0.50),
+        "p95": pick(0.95)
+    }
+
+
+class SSEParser:
+    """Server-Sent Events 라인 파서"""
+    
+    def __init__(self):
+        self.event: Optional[str] = None
+        self.data_lines: List[str] = []
+    
+    def feed(self, line: str) -> Optional[Tuple[Optional[str], str]]:
+        """
+        SSE 라인 1개를 처리합니다
+        
+        Args:
+            line: 개행이 제거된 SSE 라인
+        
+        Returns:
+            Optional[Tuple[Optional[str], str]]: 이벤트가 완성되면 (event, data), 아니면 None
+        """
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        
+        if line == "":
+            # 빈 줄은 이벤트 종료를 의미
+            if not self.data_lines:
+                self.event = None
+                return None
+            completed = (self.event, "\n".join(self.data_lines))
+            self.event = None
+            self.data_lines = []
+            return completed
+        
+        if line.startswith(":"):
+            return None
+        
+        field, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "event":
+            self.event = value
+        elif field == "data":
+            self.data_lines.append(value)
+        return None
+    
+    @staticmethod
+    def load_json(data: str) -> Dict[str, Any]:
+        """이벤트 데이터를 JSON으로 파싱합니다 (실패 시 빈 딕셔너리)"""
+        try:
+            return json.loads(data)
+        except (json.JSONDecodeError, TypeError):
+            return {}
@@ -0,0 +1,293 @@
+"""
+공유 HTTP 전송 계층
+
+호스트별 커넥션 풀(keep-alive)을 한 곳에서 관리하고, 연결 재사용 통계를 수집합니다.
+HyperClovaAPI와 OpenAI 호환 클라이언트(OpenAIAPI, GrokAPI)가 같은 풀을 사용하므로
+요청마다 TCP/TLS 핸드셰이크를 반복하지 않습니다.
+
+httpcore trace 확장으로 요청별 TCP 연결(이름 해석 포함), TLS 핸드셰이크, 요청 전송,
+첫 바이트까지의 시간(TTFB), 본문 다운로드 시간과 연결 재사용 여부도 기록합니다.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from dataclasses import dataclass, asdict
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from ..utils.config import settings
+
+
+@dataclass
+class ConnectionStats:
+    """호스트별 연결 통계"""
+    requests: int = 0            # 전송한 요청 수
+    new_connections: int = 0     # 새로 연 TCP 연결 수
+    reused: int = 0              # 연결 없이 바로 요청을 보낸 (기존 연결을 재사용한) 요청 수
+    failed_connections: int = 0  # TCP 연결에 실패한 요청 수 (재사용률에서 제외)
+    
+    @property
+    def reuse_rate(self) -> float:
+        """연결 재사용률 (0~1, 실제로 요청을 보낸 연결 기준)"""
+        connections = self.new_connections + self.reused
+        return self.reused / connections if connections else 0.0
+
+
+@dataclass
+class HTTPTiming:
+    """HTTP 요청 1건의 전송 구간별 시간 (초, 재시도 시 마지막 요청 기준)"""
+    connect: float = 0.0        # 이름 해석 + TCP 연결 (새 연결에서만, httpcore가 연결 중에 해석)
+    tls: float = 0.0            # TLS 핸드셰이크 (새 연결에서만)
+    request_write: float = 0.0  # 요청 헤더/본문 전송
+    ttfb: float = 0.0           # 요청 전송 완료 → 응답 헤더 수신 (서버 처리 + 네트워크 왕복)
+    download: float = 0.0       # 응답 본문 수신 (스트리밍이면 생성 구간 포함)
+    reused: Optional[bool] = None  # 기존 연결 재사용 여부 (None이면 측정되지 않음)
+    requests: int = 0           # 측정한 HTTP 요청 수 (재시도 포함)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """APIResponse 저장용 딕셔너리 (측정된 요청이 없으면 빈 딕셔너리)"""
+        return asdict(self) if self.requests else {}
+
+
+# httpcore trace 구간 이름 → HTTPTiming 필드
+_TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "request_write",
+    "send_request_body": "request_write",
+    "receive_response_headers": "ttfb",
+    "receive_response_body": "download"
+}
+
+# 현재 요청 경로의 측정 대상 (전송 계층 이벤트 훅이 조회)
+_current_timing: ContextVar[Optional[HTTPTiming]] = ContextVar("http_timing", default=None)
+# 현재 측정 블록에서 시작한 요청의 tracer (블록을 나갈 때 마지막 요청의 진행 중 구간을 마감)
+_current_tracers: ContextVar[Optional[List["_RequestTracer"]]] = ContextVar("http_tracers", default=None)
+
+
+class _RequestTracer:
+    """요청 1건의 httpcore trace 이벤트를 HTTPTiming에 기록"""
+    
+    def __init__(self, stats: ConnectionStats, timing: Optional[HTTPTiming]):
+        self.stats = stats
+        self.timing = timing
+        self.started_ns: Dict[str, int] = {}
+        self.phase_ns: Dict[str, int] = {}
+        self.connected = False
+        # 요청 헤더 전송을 시작할 때 결정 (연결 단계에서 실패하면 None)
+        self.reused: Optional[bool] = None
+        
+        if timing is not None:
+            timing.requests += 1
+            tracers = _current_tracers.get()
+            if tracers is not None:
+                tracers.append(self)
+    
+    def on_event(self, event_name: str, info: Dict[str, Any]):
+        """trace 이벤트 1개 처리 ("connection.connect_tcp.started" 형식)"""
+        _, _, event = event_name.partition(".")
+        name, _, stage = event.rpartition(".")
+        if name == "connect_tcp" and stage == "complete":
+            self.stats.new_connections += 1
+            self.connected = True
+        elif name == "connect_tcp" and stage == "failed":
+            self.stats.failed_connections += 1
+        elif name == "send_request_headers" and stage == "started" and self.reused is None:
+            # 새 연결을 열지 않고 요청을 보내기 시작했으면 풀의 기존 연결을 재사용한 것
+            self.reused = not self.connected
+            if self.reused:
+                self.stats.reused += 1
+        if self.timing is None:
+            return
+        if name == "response_closed":
+            # 스트리밍 응답을 끝까지 읽지 않고 닫아도 그때까지의 본문 수신 시간을 기록
+            self.finish()
+            return
+        if name not in _TRACE_PHASES:
+            return
+        
+        now = time.perf_counter_ns()
+        if stage == "started":
+            # SDK가 스트리밍 본문을 읽다 말고 나머지를 다시 읽으면 started가 두 번 오므로 처음 시점을 유지
+            self.started_ns.setdefault(name, now)
+        elif stage in ("complete", "failed") and name in self.started_ns:
+            field_name = _TRACE_PHASES[name]
+            self.phase_ns[field_name] = self.phase_ns.get(field_name, 0) + now - self.started_ns.pop(name)
+            if name == "receive_response_headers":
+                self._flush()
+        if name == "receive_response_body" and stage in ("complete", "failed"):
+            self._flush()
+    
+    def _flush(self):
+        """지금까지의 구간 시간을 HTTPTiming에 반영 (마지막 요청 기준으로 덮어씀)"""
+        timing = self.timing
+        for field_name in set(_TRACE_PHASES.values()):
+            setattr(timing, field_name, self.phase_ns.get(field_name, 0) / 1_000_000_000)
+        timing.reused = self.reused
+    
+    def finish(self):
+        """진행 중인 구간을 지금 시점으로 마감하고 HTTPTiming에 반영합니다"""
+        if self.timing is None or not (self.started_ns or self.phase_ns):
+            return
+        now = time.perf_counter_ns()
+        for name, started_ns in self.started_ns.items():
+            field_name = _TRACE_PHASES[name]
+            self.phase_ns[field_name] = self.phase_ns.get(field_name, 0) + now - started_ns
+        self.started_ns.clear()
+        self._flush()
+    
+    async def async_trace(self, event_name: str, info: Dict[str, Any]):
+        """httpx.AsyncClient용 trace 콜백 (httpcore가 코루틴으로 호출)"""
+        self.on_event(event_name, info)
+
+
+class HTTPTransport:
+    """호스트별 커넥션 풀을 관리하는 공유 HTTP 전송 계층"""
+    
+    def __init__(self,
+                 pool_size: Optional[int] = None,
+                 keepalive_expiry: Optional[float] = None,
+                 timeout: Optional[float] = None):
+        """
+        전송 계층 초기화
+        
+        Args:
+            pool_size: 호스트별 최대 연결 수 (None이면 설정값 사용)
+            keepalive_expiry: 유휴 연결 유지 시간 (초, None이면 설정값 사용)
+            timeout: 요청 타임아웃 (초, None이면 설정값 사용)
+        """
+        self.pool_size = pool_size or settings.http_pool_size
+        self.keepalive_expiry = keepalive_expiry if keepalive_expiry is not None else settings.http_keepalive_expiry
+        self.timeout = timeout or settings.request_timeout
+        
+        self._clients: Dict[str, Any] = {}
+        self._async_clients: Dict[str, Any] = {}
+        self._stats: Dict[str, ConnectionStats] = {}
+    
+    @staticmethod
+    def _host_key(base_url: str) -> str:
+        """URL에서 풀 구분용 호스트 키 (scheme://host:port) 추출"""
+        parts = urlsplit(base_url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        return f"{parts.scheme}://{parts.hostname}:{port}"
+    
+    def _limits(self):
+        """httpx 커넥션 풀 한도"""
+        return httpx.Limits(
+            max_connections=self.pool_size,
+            max_keepalive_connections=self.pool_size,
+            keepalive_expiry=self.keepalive_expiry
+        )
+    
+    def _require_httpx(self):
+        if not httpx:
+            raise ImportError("httpx 패키지가 설치되지 않았습니다. pip install httpx")
+    
+    def get_client(self, base_url: str):
+        """
+        호스트별 동기 클라이언트를 반환합니다 (없으면 생성)
+        
+        Args:
+            base_url: 요청 대상 URL
+        
+        Returns:
+            httpx.Client: 커넥션 풀을 공유하는 동기 클라이언트
+        """
+        self._require_httpx()
+        host = self._host_key(base_url)
+        if host not in self._clients:
+            stats = self._stats.setdefault(host, ConnectionStats())
+            
+            def on_request(request):
+                stats.requests += 1
+                request.extensions["trace"] = _RequestTracer(stats, _current_timing.get()).on_event
+            
+            self._clients[host] = httpx.Client(
+                limits=self._limits(),
+                timeout=self.timeout,
+                event_hooks={"request": [on_request]}
+            )
+        return self._clients[host]
+    
+    def get_async_client(self, base_url: str):
+        """
+        호스트별 비동기 클라이언트를 반환합니다 (없으면 생성)
+        
+        Args:
+            base_url: 요청 대상 URL
+        
+        Returns:
+            httpx.AsyncClient: 커넥션 풀을 공유하는 비동기 클라이언트
+        """
+        self._require_httpx()
+        host = self._host_key(base_url)
+        if host not in self._async_clients:
+            stats = self._stats.setdefault(host, ConnectionStats())
+            
+            async def on_request(request):
+                stats.requests += 1
+                request.extensions["trace"] = _RequestTracer(stats, _current_timing.get()).async_trace
+            
+            self._async_clients[host] = httpx.AsyncClient(
+                limits=self._limits(),
+                timeout=self.timeout,
+                event_hooks={"request": [on_request]}
+            )
+        return self._async_clients[host]
+    
+    @staticmethod
+    @contextmanager
+    def measure(timing: HTTPTiming) -> Iterator[HTTPTiming]:
+        """
+        블록 안에서 이 전송 계층으로 보낸 요청의 구간별 시간을 timing에 기록합니다
+        
+        asyncio.to_thread와 태스크는 컨텍스트를 복사하므로 동기 SDK 경로의 요청도 함께 측정됩니다.
+        블록을 나갈 때 마지막 요청의 진행 중 구간(읽다 만 스트리밍 본문 등)을 마감해 반영합니다.
+        
+        Args:
+            timing: 측정값을 기록할 HTTPTiming
+        """
+        token = _current_timing.set(timing)
+        tracers: List[_RequestTracer] = []
+        tracers_token = _current_tracers.set(tracers)
+        try:
+            yield timing
+        finally:
+            if tracers:
+                tracers[-1].finish()
+            _current_tracers.reset(tracers_token)
+            _current_timing.reset(token)
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        호스트별 연결 재사용 통계를 반환합니다
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: 호스트 → 요청 수/신규 연결/재사용 수/연결 실패 수/재사용률
+        """
+        return {
+            host: {
+                **asdict(stats),
+                "reuse_rate": stats.reuse_rate
+            }
+            for host, stats in self._stats.items()
+            if stats.requests
+        }
+    
+    async def aclose(self):
+        """모든 커넥션 풀을 닫습니다"""
+        for client in self._async_clients.values():
+            await client.aclose()
+        for client in self._clients.values():
+            client.close()
+        self._async_clients.clear()
+        self._clients.clear()
+
+
+# 전역 전송 계층 인스턴스
+transport = HTTPTransport()
@@ -7,7 +7,7 @@ import sys
 import json
 import re
 import argparse
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from datetime import datetime
 
 try:
@@ -15,37 +15,76 @@ try:
 except ImportError:
     click = None
 
-from ..api.claude_api import ClaudeAPI
-from ..api.claude_haiku_api import ClaudeHaikuAPI
-from ..api.hyperclova_api import HyperClovaAPI
-from ..api.openai_api import OpenAIAPI
-from ..api.gemini_api import GeminiAPI
-from ..api.grok_api import GrokAPI
+from ..api.circuit_breaker import CIRCUIT_STATE_LABELS, circuit_transitions
+from ..api.hedging import hedge_policy
+from ..api.race import RACE_CANCELLED, RACE_ERROR, RACE_INVALID, RACE_LOST, RACE_WON, RaceResult, race
+from ..api.registry import provider_registry
+from ..engine.budget import BUDGET_LABELS, CostEstimate, RunBudget
+from ..engine.executor import ConcurrentExecutor, ExecutionJob, ExecutionOutcome
+from ..engine.load import ArrivalSchedule, LoadGenerator, RateStep, StepReport, summarize_load
+from ..engine.result_sink import ResultSink, StoredResults
+from ..engine.run_log import RunLog
+from ..api.response_cache import response_cache
+from ..api.single_flight import single_flight
+from ..api.transport import transport
+from ..metrics.bootstrap import (
+    NUMPY_AVAILABLE, REPETITION_METRICS, RepetitionSamples, bootstrap_ci, compare_samples, effect_size_label
+)
 from ..metrics.evaluator import MetricsEvaluator
+from ..metrics.histogram import LatencyHistogram
+from ..mock.server import MockConfig, MockLLMServer
+from ..tests.catalog import scenario_catalog
+from ..tests.workload import Workload, to_scenario
 from ..utils.config import settings
+from ..utils.timing import PHASE_LABELS, PhaseTimer, dominant_phases
 
 
 class STARTTester:
     """START 기법 테스트 도구"""
     
-    def __init__(self):
-        """테스트 도구 초기화"""
+    def __init__(self,
+                 use_async: Optional[bool] = None,
+                 max_concurrency: Optional[int] = None,
+                 stream: Optional[bool] = None,
+                 providers: Optional[List[str]] = None,
+                 resume: Optional[str] = None,
+                 workload: Optional[Workload] = None,
+                 scenario_query: Optional[Dict[str, Any]] = None,
+                 repeat: int = 1):
+        """
+        테스트 도구 초기화
+        
+        Args:
+            use_async: 네이티브 비동기 클라이언트 사용 여부 (None이면 설정값 사용)
+            max_concurrency: 전체 동시 요청 상한 (None이면 설정값 사용)
+            stream: 스트리밍 생성 모드 사용 여부 (None이면 설정값 사용)
+            providers: 실행할 프로바이더 이름 목록 (None이면 PROVIDERS 설정 또는 전체)
+            resume: 이어서 실행할 실행 로그 ID (None이면 새 실행 로그 생성)
+            workload: 고정 시나리오 대신 실행할 JSONL 워크로드 (None이면 고정 시나리오)
+            scenario_query: 부하/배치/레이스 시나리오를 고를 카탈로그 조건 (category/language/tags, None이면 기본 스위트)
+            repeat: 매트릭스의 (프로바이더, 시나리오)마다 반복 실행할 횟수 (2 이상이면 반복 통계 출력)
+        """
         self.apis = {}
+        self.max_concurrency = max_concurrency
         self.evaluator = MetricsEvaluator()
+        # 마지막 매트릭스 실행의 예산 (보고서 출력용, 예산이 없으면 None)
+        self.budget: Optional[RunBudget] = None
+        self.resume = resume
+        self.workload = workload
+        self.scenario_query = scenario_query
+        self.repeat = max(1, repeat)
+        # 마지막 매트릭스 실행의 실행 로그
+        self.run_log: Optional[RunLog] = None
         
-        # 모든 API 초기화 시도
-        api_classes = {
-            "Claude": ClaudeAPI,
-            "Claude Haiku": ClaudeHaikuAPI,
-            "ChatGPT": OpenAIAPI,
-            "Gemini": GeminiAPI,
-            "Grok": GrokAPI,
-            "HyperClovaX": HyperClovaAPI
-        }
-        
-        for name, api_class in api_classes.items():
+        # 선택된 프로바이더만 임포트·초기화 (레지스트리에서 지연 로딩)
+        try:
+            selected = provider_registry.select(providers)
+        except ValueError as e:
+            print(f"❌ {e}")
+            selected = []
+        for name in selected:
             try:
-                self.apis[name] = api_class()
+                self.apis[name] = provider_registry.create(name, use_async=use_async, stream=stream)
                 print(f"✅ {name} API 초기화 완료")
             except Exception as e:
                 print(f"❌ {name} API 초기화 실패: {e}")
@@ -74,6 +113,68 @@ class STARTTester:
         if not os.path.exists(self.reports_dir):
             os.makedirs(self.reports_dir)
     
+    async def aclose(self):
+        """모든 API 클라이언트 연결을 정리합니다"""
+        for api_instance in self.apis.values():
+            try:
+                await api_instance.aclose()
+            except Exception:
+                pass
+        await transport.aclose()
+        response_cache.close()
+        if self.run_log:
+            self.run_log.close()
+    
+    def _print_cache_stats(self):
+        """응답 캐시 적중/미스 통계 출력"""
+        if not response_cache.enabled:
+            return
+        
+        stats = response_cache.stats()
+        print(
+            f"💾 응답 캐시: 적중 {stats['hits']} / 미스 {stats['misses']} "
+            f"(적중률 {stats['hit_rate']:.0%}, 퇴출 {stats['evictions']})\n"
+        )
+    
+    def _print_single_flight_stats(self):
+        """진행 중 요청 병합 통계 출력"""
+        stats = single_flight.stats()
+        if not single_flight.enabled or not stats["coalesced"]:
+            return
+        
+        print(
+            f"🔗 요청 병합: {stats['requests']}건 중 {stats['coalesced']}건 공유 "
+            f"(업스트림 {stats['upstream']}건, 병합률 {stats['hit_rate']:.0%})\n"
+        )
+    
+    def _print_hedge_stats(self):
+        """헤지 요청 통계 출력"""
+        stats = hedge_policy.stats()
+        if not hedge_policy.enabled or not stats["requests"]:
+            return
+        
+        print(
+            f"🪁 헤지 요청: {stats['requests']}건 중 {stats['hedged']}건 중복 전송 "
+            f"(헤지율 {stats['hedge_rate']:.0%}, 중복 요청 승리 {stats['hedge_wins']}건, "
+            f"p{hedge_policy.percentile:g} 기준·표본 {hedge_policy.min_samples}개 이상)\n"
+        )
+    
+    def _print_connection_stats(self):
+        """공유 커넥션 풀의 연결 재사용 통계 출력"""
+        stats = transport.stats()
+        if not stats:
+            return
+        
+        print("## 🔌 HTTP 연결 재사용 통계\n")
+        print("| 호스트 | 요청 수 | 신규 연결 | 재사용 | 연결 실패 | 재사용률 |")
+        print("|--------|--------|----------|-------|----------|---------|")
+        for host, host_stats in stats.items():
+            print(
+                f"| {host} | {host_stats['requests']} | {host_stats['new_connections']} | "
+                f"{host_stats['reused']} | {host_stats['failed_connections']} | {host_stats['reuse_rate']:.0%} |"
+            )
+        print()
+    
     def _get_start_scenarios(self):
         """START 기법 시나리오 1개 반환 (start_method_01)"""
         return [self.question_scenario]
@@ -82,95 +183,942 @@ class STARTTester:
         """보고서 생성 시나리오 1개 반환 (report_05)"""
         return [self.report_scenario]
     
+    def _build_executor(self) -> ConcurrentExecutor:
+        """설정값으로 동시 실행 엔진을 구성합니다"""
+        # 적응형 동시성 한도를 쓰면 고정 상한 대신 한도의 최대값까지 실행 슬롯을 열어 둠
+        provider_limits = {
+            api_name: (
+                int(api_instance.concurrency_limiter.max_limit) if api_instance.concurrency_limiter.enabled
+                else settings.provider_setting(api_instance.provider_key, "max_concurrency", 0)
+            )
+            for api_name, api_instance in self.apis.items()
+        }
+        max_concurrency = self.max_concurrency if self.max_concurrency is not None else settings.max_concurrency
+        return ConcurrentExecutor(max_concurrency=max_concurrency, provider_limits=provider_limits)
+    
+    def _build_budget(self) -> RunBudget:
+        """설정값으로 실행 예산을 구성합니다 (프로바이더별 상한은 *_BUDGET_USD)"""
+        return RunBudget(
+            max_usd=settings.budget_max_usd,
+            provider_caps={
+                api_name: settings.provider_setting(api_instance.provider_key, "budget_usd", 0.0)
+                for api_name, api_instance in self.apis.items()
+            },
+            deadline=settings.budget_deadline_seconds
+        )
+    
+    def _open_run_log(self, task_type: str) -> RunLog:
+        """실행 로그를 새로 만들거나 --resume으로 지정한 로그를 엽니다"""
+        if self.resume:
+            run_log = RunLog.resume(self.resume, task_type)
+            print(f"♻️ 실행 로그 이어서 실행: {run_log.path}")
+        else:
+            run_log = RunLog.create(task_type)
+            print(f"📒 실행 로그: {run_log.path} (중단되면 --resume {run_log.run_id} 로 이어서 실행)")
+        return run_log
+    
+    async def _run_matrix(self, scenarios: Iterable[Dict[str, Any]], task_type: str) -> StoredResults:
+        """
+        시나리오 × 프로바이더 매트릭스를 동시에 실행합니다
+        
+        완료된 요청은 결과 싱크를 거쳐 끝나는 즉시 실행 로그에 기록하고 집계만 메모리에 남깁니다.
+        이어서 실행하는 경우 로그에 있는 요청은 보내지 않고 기록된 결과를 그대로 사용합니다.
+        시나리오가 목록이 아니면(워크로드) 프로바이더마다 시나리오를 따로 순회하며 스트리밍으로 실행합니다.
+        
+        Args:
+            scenarios: 실행할 시나리오 목록 또는 재순회 가능한 시나리오 스트림
+            task_type: "questions" 또는 "reports"
+        
+        Returns:
+            StoredResults: 실행 로그에 저장된 프로바이더별 결과 (기록된 결과 포함)
+        """
+        self.run_log = self._open_run_log(task_type)
+        results = StoredResults(self.run_log, self.apis.keys())
+        for (api_name, scenario_name, repetition), offset, entry in self.run_log.entries():
+            results.add(api_name, scenario_name, entry, offset, repetition)
+        if len(results):
+            print(f"♻️ 실행 로그에 기록된 {len(results)}건은 다시 보내지 않습니다")
+        
+        def provider_jobs(api_name: str) -> Iterator[ExecutionJob]:
+            for i, scenario in enumerate(scenarios):
+                for repetition in range(self.repeat):
+                    if (api_name, _scenario_key(scenario), repetition) not in results:
+                        yield ExecutionJob(api_name=api_name, scenario_index=i, scenario=scenario, repetition=repetition)
+        
+        async def handler(job: ExecutionJob):
+            api_instance = self.apis[job.api_name]
+            if task_type == "questions":
+                # START 기법 질문 생성
+                return await api_instance.generate_questions(
+                    job.scenario['user_response'],
+                    job.scenario['context']
+                )
+            return await api_instance.generate_report(
+                job.scenario['user_response'],
+                job.scenario['context']
+            )
+        
+        budget = self._build_budget()
+        self.budget = budget if budget.enabled else None
+        
+        def estimate(job: ExecutionJob) -> CostEstimate:
+            api_instance = self.apis[job.api_name]
+            prompt = api_instance.render_prompt(task_type, job.scenario['user_response'], job.scenario['context'])
+            return budget.estimate(api_instance, prompt)
+        
+        sink = ResultSink(results)
+        
+        async def on_complete(outcome: ExecutionOutcome):
+            job = outcome.job
+            if not (outcome.skipped or outcome.error or outcome.response.error):
+                # 보고서용 항목으로 바로 변환해 싱크로 넘김 (응답은 보관하지 않음, 이후 중단되어도 로그에 유지)
+                entry = self._result_entry(task_type, job.scenario, outcome.response, outcome.queue_wait)
+                await sink.put(job.api_name, _scenario_key(job.scenario), entry, job.repetition)
+            label = f"시나리오 {job.scenario_index + 1}" + (f" #{job.repetition + 1}" if self.repeat > 1 else "")
+            if outcome.skipped:
+                print(f"  ⏭ {job.api_name} · {label} (건너뜀: {BUDGET_LABELS[outcome.skipped]})")
+            elif outcome.error:
+                print(f"❌ {job.api_name}: 예외 발생 - {outcome.error}")
+            elif outcome.response.circuit_open:
+                print(f"  🚧 {job.api_name} · {label} (서킷 브레이커 열림, 즉시 실패)")
+            elif outcome.response.error:
+                print(f"❌ {job.api_name}: API 오류 - {outcome.response.error}")
+            elif outcome.response.cached:
+                print(f"  💾 {job.api_name} · {label} (캐시 적중)")
+            elif outcome.response.coalesced:
+                print(f"  🔗 {job.api_name} · {label} (진행 중 요청 공유)")
+            else:
+                response = outcome.response
+                ttft_text = f", TTFT {response.time_to_first_token:.2f}초" if response.time_to_first_token is not None else ""
+                retry_text = (
+                    f", 재시도 {response.attempts - 1}회 (+{response.retry_time:.2f}초)"
+                    if response.attempts > 1 else ""
+                )
+                print(f"  ✔ {job.api_name} · {label} ({response.response_time:.2f}초{ttft_text}{retry_text})")
+        
+        executor = self._build_executor()
+        limit_text = executor.max_concurrency or '무제한'
+        try:
+            if isinstance(scenarios, list):
+                jobs = [
+                    ExecutionJob(api_name=api_name, scenario_index=i, scenario=scenario, repetition=repetition)
+                    for i, scenario in enumerate(scenarios)
+                    for repetition in range(self.repeat)
+                    for api_name in self.apis.keys()
+                    if (api_name, _scenario_key(scenario), repetition) not in results
+                ]
+                repeat_text = f", 시나리오마다 {self.repeat}회 반복" if self.repeat > 1 else ""
+                print(f"⚡ {len(jobs)}개 요청을 동시에 실행합니다 (전체 상한: {limit_text}{repeat_text})")
+                if self.budget:
+                    print(f"💰 실행 예산: {self._budget_description()} (예상 작업량이 큰 요청부터 실행)")
+                await executor.run(
+                    jobs,
+                    handler,
+                    on_complete=on_complete,
+                    budget=self.budget,
+                    estimate=estimate if self.budget else None,
+                    collect=False
+                )
+            else:
+                print(f"⚡ 워크로드를 프로바이더별로 스트리밍 실행합니다 (전체 상한: {limit_text})")
+                if self.budget:
+                    print(f"💰 실행 예산: {self._budget_description()} (도착 순서대로 실행)")
+                await executor.stream(
+                    {api_name: provider_jobs(api_name) for api_name in self.apis.keys()},
+                    handler,
+                    on_complete=on_complete,
+                    budget=self.budget,
+                    estimate=estimate if self.budget else None
+                )
+        finally:
+            await sink.close()
+        return results
+    
+    def _result_entry(self,
+                      task_type: str,
+                      scenario: Dict[str, Any],
+                      result: Any,
+                      queue_wait: float = 0.0) -> Dict[str, Any]:
+        """응답 1개를 보고서용 결과 항목으로 변환합니다 (실시간/배치 공용)"""
+        phases = PhaseTimer()
+        phases.add_seconds("executor_wait", queue_wait)
+        
+        # 응답 JSON 디코딩과 품질 평가도 요청별 구간으로 기록 (요약은 보고서 출력에 재사용)
+        with phases.phase("content_decode"):
+            summary = self._clean_and_summarize_content(result.content)
+        with phases.phase("evaluation"):
+            quality = self._evaluate_quality(task_type, scenario, result.content)
+        
+        return {
+            "scenario": scenario['name'],
+            "content": result.content,
+            "summary": summary,
+            "quality": quality,
+            "response_time": result.response_time,
+            "tokens": result.tokens_used,
+            "cost": result.cost,
+            "ttft": result.time_to_first_token,
+            "itl": result.inter_token_latencies,
+            "tokens_per_second": result.output_tokens_per_second,
+            "attempts": result.attempts,
+            "retry_time": result.retry_time,
+            "rate_limit_wait": result.rate_limit_wait,
+            "concurrency_wait": result.concurrency_wait,
+            "queue_wait": queue_wait,
+            "cached": result.cached,
+            "coalesced": result.coalesced,
+            "batched": result.batched,
+            "phases": {**result.phases, **phases.seconds()},
+            "http_timing": result.http_timing,
+            "cache_read_tokens": result.cache_read_tokens,
+            "cache_write_tokens": result.cache_write_tokens,
+            "prompt_cache_savings": result.prompt_cache_savings,
+            "hedge_requests": result.hedge_requests,
+            "hedge_won": result.hedge_won,
+            "hedge_cost": result.hedge_cost
+        }
+    
+    def _evaluate_quality(self, task_type: str, scenario: Dict[str, Any], content: str) -> float:
+        """생성 결과의 종합 품질 점수 (1-5)"""
+        if task_type == "questions":
+            metrics = self.evaluator.evaluate_question_quality(
+                content, scenario['user_response'], scenario['context']
+            )
+        else:
+            metrics = self.evaluator.evaluate_report_quality(
+                content, [{"role": "user", "content": scenario['user_response']}], scenario['context'],
+                expected_sections=scenario.get('expected_sections')
+            )
+        return metrics.overall_score
+    
     async def test_start_questions(self):
         """START 질문 생성 테스트"""
         print("\n🤔 START 질문 생성 테스트를 시작합니다...\n")
         
-        scenarios = self._get_start_scenarios()
-        results = {api_name.lower(): [] for api_name in self.apis.keys()}
+        scenarios = self._matrix_scenarios(self._get_start_scenarios(), "📝")
+        results = await self._run_matrix(scenarios, "questions")
+        self._warn_invalid_workload_lines()
         
-        for i, scenario in enumerate(scenarios):
-            print(f"📝 시나리오 {i+1}: {scenario['name']}")
-            
-            for api_name, api_instance in self.apis.items():
-                try:
-                    # START 기법 질문 생성
-                    result = await api_instance.generate_questions(
-                        scenario['user_response'], 
-                        scenario['context']
-                    )
-                    
-                    if not result.error:
-                        results[api_name.lower()].append({
-                            "scenario": scenario['name'],
-                            "content": result.content,
-                            "response_time": result.response_time,
-                            "tokens": result.tokens_used,
-                            "cost": result.cost
-                        })
-                    else:
-                        print(f"❌ {api_name}: API 오류 - {result.error}")
-                        
-                except Exception as e:
-                    print(f"❌ {api_name}: 예외 발생 - {str(e)}")
-        
-        self._print_question_results(results)
+        self._print_question_results(results, scenarios)
+        self._print_connection_stats()
+        self._print_cache_stats()
+        self._print_single_flight_stats()
+        self._print_hedge_stats()
         return results
     
     async def test_reports(self):
         """보고서 생성 테스트"""
         print("\n📋 보고서 생성 테스트를 시작합니다...\n")
         
-        scenarios = self._get_report_scenarios()
-        results = {api_name.lower(): [] for api_name in self.apis.keys()}
+        scenarios = self._matrix_scenarios(self._get_report_scenarios(), "📄")
+        results = await self._run_matrix(scenarios, "reports")
+        self._warn_invalid_workload_lines()
         
-        for i, scenario in enumerate(scenarios):
-            print(f"📄 시나리오 {i+1}: {scenario['name']}")
+        self._print_report_results(results, scenarios)
+        self._print_connection_stats()
+        self._print_cache_stats()
+        self._print_single_flight_stats()
+        self._print_hedge_stats()
+        return results
+    
+    def _matrix_scenarios(self, default: List[Dict[str, Any]], icon: str) -> Iterable[Dict[str, Any]]:
+        """매트릭스 실행 시나리오 (워크로드가 있으면 파일에서 지연 순회, 없으면 고정 시나리오 목록)"""
+        if self.workload is not None:
+            print(f"📂 워크로드: {self.workload.describe()}")
+            return self.workload.scenarios()
+        for i, scenario in enumerate(default):
+            print(f"{icon} 시나리오 {i+1}: {scenario['name']}")
+        return default
+    
+    def _warn_invalid_workload_lines(self):
+        """워크로드에서 읽지 못한 줄이 있으면 알림"""
+        if self.workload is not None and self.workload.invalid_lines:
+            print(f"⚠️ 워크로드에서 JSON으로 읽을 수 없는 줄 {self.workload.invalid_lines}개를 건너뛰었습니다")
+    
+    def _catalog_cases(self, task_type: str, default_suites: List[str]) -> List[Any]:
+        """시나리오 카탈로그에서 테스트 케이스 선택 (scenario_query가 없으면 기본 스위트)"""
+        if self.scenario_query:
+            cases = scenario_catalog.query(task_type=task_type, **self.scenario_query)
+            print(f"🗂️ 시나리오 카탈로그: {len(cases)}개 선택 ({_describe_query(self.scenario_query)})")
+            return cases
+        return [case for suite in default_suites for case in scenario_catalog.query(task_type=task_type, suite=suite)]
+    
+    def _get_load_prompts(self, task_type: str) -> List[Dict[str, str]]:
+        """부하 테스트용 입력 목록 (시나리오 카탈로그에서 추출)"""
+        suites = ["questions", "performance"] if task_type == "questions" else ["reports"]
+        return [
+            {"user_response": scenario["user_response"], "context": scenario["context"]}
+            for scenario in map(to_scenario, self._catalog_cases(task_type, suites))
+        ]
+    
+    def _get_batch_scenarios(self, task_type: str) -> List[Dict[str, Any]]:
+        """배치 평가용 시나리오 목록 (시나리오 카탈로그의 기본 스위트, 보고서 출력과 같은 형식)"""
+        return [to_scenario(case) for case in self._catalog_cases(task_type, [task_type])]
+    
+    async def run_batch(self, task_type: str = "questions") -> Optional[StoredResults]:
+        """
+        배치 API 모드 (프롬프트를 묶어 제출하고 결과를 시나리오에 매핑, 실시간 대비 할인 가격)
+        
+        Args:
+            task_type: "questions" 또는 "reports"
+        
+        Returns:
+            Optional[StoredResults]: 실시간 경로와 같은 형식의 저장 결과 (배치 지원 프로바이더가 없으면 None)
+        """
+        batch_apis = {name: api for name, api in self.apis.items() if api.supports_batch}
+        skipped = [name for name in self.apis if name not in batch_apis]
+        if skipped:
+            print(f"⏭️ 배치 모드 미지원으로 제외: {', '.join(skipped)}")
+        if not batch_apis:
+            print("❌ 배치 모드를 지원하는 프로바이더가 없습니다.")
+            return None
+        
+        scenarios = self._get_batch_scenarios(task_type)
+        if not scenarios:
+            print("❌ 조건에 맞는 시나리오가 없습니다.")
+            return None
+        
+        def custom_id(index: int) -> str:
+            return f"{task_type}_{index:05d}"
+        
+        async def submit(api_name: str, api_instance):
+            prompts = {
+                custom_id(i): api_instance.render_prompt(task_type, scenario['user_response'], scenario['context'])
+                for i, scenario in enumerate(scenarios)
+            }
+            print(f"📦 {api_name}: {len(prompts)}개 요청을 배치로 제출합니다")
             
-            for api_name, api_instance in self.apis.items():
-                try:
-                    result = await api_instance.generate_report(
-                        scenario['user_response'], 
-                        scenario['context']
-                    )
-                    
-                    if not result.error:
-                        results[api_name.lower()].append({
-                            "scenario": scenario['name'],
-                            "content": result.content,
-                            "response_time": result.response_time,
-                            "tokens": result.tokens_used,
-                            "cost": result.cost
-                        })
-                    else:
-                        print(f"❌ {api_name}: API 오류 - {result.error}")
-                        
-                except Exception as e:
-                    print(f"❌ {api_name}: 예외 발생 - {str(e)}")
-        
-        self._print_report_results(results)
+            def on_poll(status):
+                print(f"  ⏳ {api_name}: {status.completed}/{status.total} 처리됨")
+            
+            responses = await api_instance.run_batch(prompts, on_poll=on_poll)
+            turnaround = max((r.response_time for r in responses.values() if r.batched), default=0.0)
+            print(f"  ✔ {api_name}: 배치 완료 ({turnaround:.1f}초)")
+            return api_name, responses
+        
+        outcomes = await asyncio.gather(*(submit(name, api) for name, api in batch_apis.items()))
+        
+        # 실시간 경로와 같이 결과 싱크를 거쳐 실행 로그에 기록 (보고서는 로그에서 다시 읽음)
+        self.run_log = RunLog.create(f"batch_{task_type}")
+        results = StoredResults(self.run_log, self.apis.keys())
+        sink = ResultSink(results)
+        try:
+            for api_name, responses in outcomes:
+                for i, scenario in enumerate(scenarios):
+                    response = responses.pop(custom_id(i))
+                    if response.error:
+                        print(f"❌ {api_name} · {scenario['name']}: {response.error}")
+                        continue
+                    await sink.put(api_name, _scenario_key(scenario), self._result_entry(task_type, scenario, response))
+        finally:
+            await sink.close()
+        
+        if task_type == "questions":
+            self._print_question_results(results, scenarios)
+        else:
+            self._print_report_results(results, scenarios)
+        self._print_cache_stats()
         return results
     
-    def _print_question_results(self, results: Dict[str, Any]):
-        """질문 생성 결과 출력 (단순 표 형식)"""
-        print("\n# 📊 START 질문 생성 결과\n")
+    async def run_race(self, task_type: str = "questions") -> List[RaceResult]:
+        """
+        레이스 모드 (시나리오마다 모든 프로바이더에 동시에 요청하고 유효한 START JSON을 먼저 받은 응답 사용)
         
-        # 성능 테이블
-        print("## 🏆 모델별 성능 비교\n")
-        print("| 모델 | 평균 응답시간 (초) | 평균 비용 ($) | 평균 토큰 수 |")
-        print("|------|------------------|-------------|-------------|")
+        Args:
+            task_type: "questions" 또는 "reports"
+        
+        Returns:
+            List[RaceResult]: 시나리오별 레이스 결과
+        """
+        if len(self.apis) < 2:
+            print("❌ 레이스 모드에는 프로바이더가 2개 이상 필요합니다.")
+            return []
+        
+        scenarios = self._get_batch_scenarios(task_type)
+        if not scenarios:
+            print("❌ 조건에 맞는 시나리오가 없습니다.")
+            return []
+        print(f"🏁 {len(scenarios)}개 시나리오 × {', '.join(self.apis.keys())}")
+        
+        races = []
+        for scenario in scenarios:
+            result = await race(self.apis, task_type, scenario['user_response'], scenario['context'])
+            races.append(result)
+            winner_text = (
+                f"{result.winner} ({result.elapsed:.2f}초)" if result.winner else "유효한 응답 없음"
+            )
+            print(f"  🏁 {scenario['name']}: {winner_text}, 추가 비용 ${result.extra_cost:.4f}")
+        
+        self._print_race_results(races, scenarios, task_type)
+        self._print_cache_stats()
+        return races
+    
+    def _race_table_lines(self, races: List[RaceResult], scenarios: List[Dict[str, Any]]) -> List[str]:
+        """레이스 결과 요약/프로바이더별/시나리오별 테이블 라인 생성"""
+        won = [r for r in races if r.winner]
+        latency = LatencyHistogram(r.elapsed for r in won)
+        winner_cost = sum(r.response.cost for r in won)
+        extra_cost = sum(r.extra_cost for r in races)
+        
+        lines = [
+            "## 📋 요약\n",
+            "| 레이스 | 승자 확정 | 소요 시간 p50/p95 (초) | 승자 비용 ($) | 추가 비용 ($) | 추가 비용 비율 |",
+            "|--------|----------|----------------------|-------------|-------------|--------------|",
+            f"| {len(races)} | {len(won)} | "
+            + (f"{latency.percentile(50):.2f} / {latency.percentile(95):.2f}" if won else "-")
+            + f" | ${winner_cost:.4f} | ${extra_cost:.4f} | "
+            + (f"{extra_cost / winner_cost:.0%}" if winner_cost else "-") + " |",
+            "",
+            "## 🏆 프로바이더별 결과\n",
+            "| 모델 | 승리 | 늦은 유효 응답 | 형식 오류 | 오류 | 취소 |",
+            "|------|------|--------------|----------|------|------|"
+        ]
+        for api_name in self.apis.keys():
+            counts = [
+                sum(1 for r in races if r.outcomes.get(api_name) == state)
+                for state in (RACE_WON, RACE_LOST, RACE_INVALID, RACE_ERROR, RACE_CANCELLED)
+            ]
+            lines.append(f"| {api_name} | " + " | ".join(str(count) for count in counts) + " |")
+        
+        lines.extend([
+            "",
+            "## 🔍 시나리오별 결과\n",
+            "| 시나리오 | 승자 | 소요 시간 (초) | 승자 비용 ($) | 추가 비용 ($) |",
+            "|----------|------|--------------|-------------|-------------|"
+        ])
+        for scenario, result in zip(scenarios, races):
+            cost_text = f"${result.response.cost:.4f}" if result.response else "-"
+            lines.append(
+                f"| {scenario['name']} | {result.winner or '-'} | {result.elapsed:.2f} | "
+                f"{cost_text} | ${result.extra_cost:.4f} |"
+            )
+        lines.append("")
+        return lines
+    
+    def _print_race_results(self, races: List[RaceResult], scenarios: List[Dict[str, Any]], task_type: str):
+        """레이스 결과 출력 및 저장"""
+        from datetime import datetime
+        
+        print("\n# 🏁 레이스 모드 결과\n")
+        lines = self._race_table_lines(races, scenarios)
+        for line in lines:
+            print(line)
+        
+        os.makedirs(self.reports_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{self.reports_dir}/race_{task_type}_{timestamp}.md"
+        content = [
+            "# 🏁 레이스 모드 결과\n",
+            f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"- 작업: {task_type}",
+            f"- 참가: {', '.join(self.apis.keys())}",
+            "- 승자: 유효한 START JSON을 가장 먼저 돌려준 응답 (나머지 요청은 취소)",
+            "- 추가 비용: 늦게 끝난 응답은 실제 비용, 취소된 요청은 입력 토큰 기준 추정 하한\n",
+            *lines
+        ]
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("\n".join(content))
+        
+        print(f"📄 레이스 모드 보고서가 저장되었습니다: {filename}")
+    
+    async def run_load(self,
+                       schedule: ArrivalSchedule,
+                       task_type: str = "questions",
+                       max_in_flight: int = 0) -> List[StepReport]:
+        """
+        오픈 루프 부하 테스트 (도착률 구간별 처리량/오류율/지연 분위수)
+        
+        Args:
+            schedule: 도착 스케줄
+            task_type: "questions" 또는 "reports"
+            max_in_flight: 프로바이더별 동시 요청 상한 (0 이하이면 제한 없음)
+        """
+        prompts = self._get_load_prompts(task_type)
+        if not prompts:
+            print("❌ 조건에 맞는 시나리오가 없습니다.")
+            return []
+        
+        async def request(api_instance, sequence: int):
+            prompt = prompts[sequence % len(prompts)]
+            if task_type == "questions":
+                return await api_instance.generate_questions(prompt["user_response"], prompt["context"])
+            return await api_instance.generate_report(prompt["user_response"], prompt["context"])
+        
+        def on_step(step: RateStep):
+            print(f"  ▶ 구간 {step.index + 1}: {step.rate:.2f} req/s × {step.duration:.0f}초")
+        
+        generator = LoadGenerator(self.apis, schedule, request, max_in_flight=max_in_flight)
+        samples = await generator.run(on_step=on_step)
+        reports = summarize_load(samples, schedule)
+        
+        self._print_load_results(reports, schedule, task_type)
+        self._print_connection_stats()
+        return reports
+    
+    def _load_table_lines(self, reports: List[StepReport]) -> List[str]:
+        """부하 테스트 결과 표 (지연 시간은 예정 전송 시각 기준)"""
+        lines = [
+            "| 모델 | 구간 | 목표 (req/s) | 달성 (req/s) | 전송 | 오류율 | p50 (초) | p90 (초) | p95 (초) | p99 (초) | 최대 (초) |",
+            "|------|------|-------------|-------------|------|--------|---------|---------|---------|---------|----------|"
+        ]
+        for report in reports:
+            latency = report.latency
+            percentiles = " | ".join(
+                f"{latency[key]:.2f}" if latency else "-" for key in ("p50", "p90", "p95", "p99", "max")
+            )
+            lines.append(
+                f"| {report.api_name} | {report.step.index + 1} | {report.step.rate:.2f} | "
+                f"{report.throughput:.2f} | {report.sent} | {report.error_rate:.1%} | {percentiles} |"
+            )
+        return lines
+    
+    def _print_load_results(self, reports: List[StepReport], schedule: ArrivalSchedule, task_type: str):
+        """부하 테스트 결과 출력 및 저장"""
+        print("\n# 📈 부하 테스트 결과\n")
+        for line in self._load_table_lines(reports):
+            print(line)
+        print()
+        for line in self._circuit_table_lines():
+            print(line)
+        for line in self._concurrency_table_lines():
+            print(line)
+        
+        self._save_load_report(reports, schedule, task_type)
+    
+    def _save_load_report(self, reports: List[StepReport], schedule: ArrivalSchedule, task_type: str):
+        """부하 테스트 마크다운 보고서를 파일로 저장"""
+        from datetime import datetime
+        
+        os.makedirs("reports", exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"reports/load_test_{timestamp}.md"
         
+        content = [
+            "# 📈 부하 테스트 결과\n",
+            f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"- 작업: {task_type}",
+            f"- 도착 패턴: {schedule.pattern} ({schedule.duration:.0f}초, 구간 {len(schedule.steps())}개)",
+            "- 지연 시간: 예정 전송 시각부터 완료까지 (coordinated omission 보정)\n",
+            *self._load_table_lines(reports),
+            "",
+            *self._circuit_table_lines(),
+            *self._concurrency_table_lines()
+        ]
+        
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("\n".join(content))
+        
+        print(f"📄 부하 테스트 보고서가 저장되었습니다: {filename}")
+    
+    @staticmethod
+    def _scenario_entry(results: StoredResults, api_key: str, scenario: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """시나리오에 해당하는 결과 항목을 실행 로그에서 읽음 (오류/건너뜀으로 빠진 시나리오가 있어도 키로 매칭)"""
+        return results.entry(api_key, _scenario_key(scenario))
+    
+    def _latency_distribution_lines(self, results: StoredResults) -> List[str]:
+        """모델별 응답 시간 분포 (로그 버킷 히스토그램 분위수 + ASCII 히스토그램, 콘솔/마크다운 공용)"""
+        lines = [
+            "## ⏱️ 응답 시간 분포\n",
+            "| 모델 | 표본 수 | 평균 (초) | 표준편차 (초) | p50 (초) | p90 (초) | p95 (초) | p99 (초) | 최대 (초) |",
+            "|------|--------|----------|-------------|---------|---------|---------|---------|----------|"
+        ]
+        
+        histograms = {}
         for api_name in self.apis.keys():
+            aggregate = results.aggregate(api_name.lower())
+            if aggregate and aggregate.live:
+                histogram = aggregate.latency
+                histograms[api_name] = histogram
+                stats = histogram.summary()
+                lines.append(
+                    f"| {api_name} | {stats['count']} | {stats['mean']:.2f} | {stats['stddev']:.2f} | "
+                    f"{stats['p50']:.2f} | {stats['p90']:.2f} | {stats['p95']:.2f} | "
+                    f"{stats['p99']:.2f} | {stats['max']:.2f} |"
+                )
+        
+        lines.append("")
+        for api_name, histogram in histograms.items():
+            lines.append("```")
+            lines.append(api_name)
+            lines.extend(histogram.ascii_lines())
+            lines.append("```")
+        lines.append("")
+        return lines
+    
+    def _repetition_table_lines(self, results: StoredResults) -> List[str]:
+        """반복 실행 통계 (--repeat, 부트스트랩 신뢰구간과 프로바이더 쌍 비교, 콘솔/마크다운 공용)"""
+        samples = RepetitionSamples()
+        for (api_key, scenario, _), entry in results.iter_entries():
+            samples.add(api_key, scenario, entry)
+        if samples.max_repetitions < 2:
+            return []
+        
+        lines = ["## 🔁 반복 실행 통계\n"]
+        if not NUMPY_AVAILABLE:
+            lines.extend(["⚠️ numpy 패키지가 설치되지 않아 신뢰구간을 계산하지 않습니다. pip install numpy", ""])
+            return lines
+        
+        confidence = settings.bootstrap_confidence
+        lines.extend([
+            f"부트스트랩 재표본 {settings.bootstrap_resamples:,}회, {confidence:.0%} 백분위 신뢰구간 "
+            "(실제 호출만, 캐시 적중/병합 응답 제외)\n",
+            "| 모델 | 표본 수 | 평균 응답 (초) | p95 응답 (초) | 평균 비용 ($) | 평균 토큰 |",
+            "|------|--------|---------------|--------------|--------------|----------|"
+        ])
+        
+        def interval_text(ci, digits: int) -> str:
+            if ci is None:
+                return "-"
+            return f"{ci.estimate:.{digits}f} [{ci.low:.{digits}f}, {ci.high:.{digits}f}]"
+        
+        api_names = [api_name for api_name in self.apis.keys() if len(samples.provider(api_name.lower(), "response_time"))]
+        for api_name in api_names:
             api_key = api_name.lower()
-            if api_key in results and results[api_key]:
-                avg_time = sum(r["response_time"] for r in results[api_key]) / len(results[api_key])
-                avg_cost = sum(r["cost"] for r in results[api_key]) / len(results[api_key])
-                avg_tokens = sum(r["tokens"] for r in results[api_key]) / len(results[api_key])
-                print(f"| {api_name} | {avg_time:.2f} | ${avg_cost:.4f} | {avg_tokens:.0f} |")
+            latency = samples.provider(api_key, "response_time")
+            lines.append(
+                f"| {api_name} | {len(latency)} | {interval_text(bootstrap_ci(latency), 2)} | "
+                f"{interval_text(bootstrap_ci(latency, 'p95'), 2)} | "
+                f"{interval_text(bootstrap_ci(samples.provider(api_key, 'cost')), 4)} | "
+                f"{interval_text(bootstrap_ci(samples.provider(api_key, 'tokens')), 0)} |"
+            )
+        lines.append("")
+        
+        # 프로바이더 쌍 비교 (평균 차이 = 왼쪽 - 오른쪽)
+        comparisons = []
+        for i, a_name in enumerate(api_names):
+            for b_name in api_names[i + 1:]:
+                for metric in REPETITION_METRICS:
+                    comparison = compare_samples(
+                        metric,
+                        a_name, samples.provider(a_name.lower(), metric),
+                        b_name, samples.provider(b_name.lower(), metric)
+                    )
+                    if comparison is not None:
+                        comparisons.append(comparison)
+        if comparisons:
+            lines.extend([
+                f"### 프로바이더 간 비교 (평균 차이의 {confidence:.0%} 신뢰구간이 0을 포함하지 않으면 유의미)\n",
+                "| 비교 | 지표 | 평균 차이 [신뢰구간] | Hedges' g | Cliff's δ | 효과 크기 | 판정 |",
+                "|------|------|--------------------|-----------|-----------|----------|------|"
+            ])
+            for comparison in comparisons:
+                digits = 4 if comparison.metric == "cost" else 2
+                verdict = "✅ 유의미한 차이" if comparison.significant else "차이 불확실"
+                if comparison.hedges_g is None:
+                    g_text, size_text = "-", "-"
+                else:
+                    g_text, size_text = f"{comparison.hedges_g:+.2f}", effect_size_label(comparison.hedges_g)
+                lines.append(
+                    f"| {comparison.a} vs {comparison.b} | {REPETITION_METRICS[comparison.metric]} | "
+                    f"{interval_text(comparison.difference, digits)} | {g_text} | "
+                    f"{comparison.cliffs_delta:+.2f} | {size_text} | {verdict} |"
+                )
+            lines.append("")
+        
+        # 시나리오별 평균 응답 시간 (시나리오가 많으면 생략)
+        scenarios = samples.scenarios()
+        if len(scenarios) > _MAX_REPETITION_SCENARIO_ROWS:
+            lines.extend([f"(시나리오 {len(scenarios):,}개 - 시나리오별 표는 {_MAX_REPETITION_SCENARIO_ROWS}개 이하일 때만 출력)", ""])
+            return lines
+        lines.extend([
+            "### 시나리오별 평균 응답 시간 (초)\n",
+            "| 시나리오 | " + " | ".join(api_names) + " |",
+            "|---------|" + "|".join("-" * (len(api_name) + 2) for api_name in api_names) + "|"
+        ])
+        for scenario in scenarios:
+            cells = [interval_text(bootstrap_ci(samples.scenario(api_name.lower(), scenario)), 2) for api_name in api_names]
+            lines.append(f"| {scenario} | " + " | ".join(cells) + " |")
+        lines.append("")
+        return lines
+    
+    def _performance_table_lines(self, results: StoredResults) -> List[str]:
+        """모델별 성능 비교 테이블 라인 생성 (콘솔/마크다운 공용)"""
+        lines = [
+            "| 모델 | 응답시간 p50/p95 (초) | 평균 비용 ($) | 평균 토큰 수 | TTFT p50 (초) | 토큰 간 지연 p50/p95 (ms) | 출력 토큰/초 | 품질 점수 | 캐시 적중 |",
+            "|------|---------------------|-------------|-------------|--------------|--------------------------|-------------|----------|----------|"
+        ]
+        
+        for api_name in self.apis.keys():
+            aggregate = results.aggregate(api_name.lower())
+            if aggregate:
+                # 지연 시간 지표는 실제 호출만 집계 (캐시 적중/병합 응답 제외)
+                latency = aggregate.latency
+                time_text = f"{latency.percentile(50):.2f} / {latency.percentile(95):.2f}" if aggregate.live else "-"
+                
+                # 스트리밍 지표 (스트리밍 모드가 아니면 "-")
+                itl = aggregate.itl
+                rate = aggregate.tokens_per_second()
+                ttft_text = f"{aggregate.ttft.percentile(50):.2f}" if aggregate.ttft.count else "-"
+                itl_text = f"{itl.percentile(50) * 1000:.0f} / {itl.percentile(95) * 1000:.0f}" if itl.count else "-"
+                rate_text = f"{rate:.1f}" if rate is not None else "-"
+                lines.append(
+                    f"| {api_name} | {time_text} | ${aggregate.average('cost'):.4f} | {aggregate.average('tokens'):.0f} | "
+                    f"{ttft_text} | {itl_text} | {rate_text} | {aggregate.average('quality'):.2f} | "
+                    f"{aggregate.cached}/{aggregate.count} |"
+                )
+        
+        return lines
+    
+    def _wait_table_lines(self, results: StoredResults) -> List[str]:
+        """응답 시간과 분리된 대기 시간 분석 테이블 라인 생성 (콘솔/마크다운 공용)"""
+        lines = [
+            "## ⏳ 대기 시간 분석 (응답 시간에 미포함)\n",
+            "| 모델 | 평균 동시실행 대기 (초) | 평균 레이트 리미터 대기 (초) | 평균 동시성 한도 대기 (초) | 평균 재시도 시간 (초) | 평균 시도 횟수 |",
+            "|------|----------------------|---------------------------|-------------------------|---------------------|--------------|"
+        ]
+        
+        for api_name in self.apis.keys():
+            aggregate = results.aggregate(api_name.lower())
+            if aggregate and aggregate.live:
+                lines.append(
+                    f"| {api_name} | {aggregate.live_average('queue_wait'):.2f} | "
+                    f"{aggregate.live_average('rate_limit_wait'):.2f} | {aggregate.live_average('concurrency_wait'):.2f} | "
+                    f"{aggregate.live_average('retry_time'):.2f} | {aggregate.live_average('attempts'):.1f} |"
+                )
+        
+        lines.append("")
+        return lines
+    
+    def _hedge_table_lines(self, results: StoredResults) -> List[str]:
+        """헤지 요청 횟수와 추가 비용 테이블 라인 생성 (헤지가 일어난 경우만, 콘솔/마크다운 공용)"""
+        lines = [
+            "## 🪁 헤지 요청\n",
+            "| 모델 | 헤지 적용 | 중복 요청 승리 | 추가 비용 ($) | 추가 비용 비율 |",
+            "|------|----------|--------------|-------------|--------------|"
+        ]
+        
+        for api_name in self.apis.keys():
+            aggregate = results.aggregate(api_name.lower())
+            if not aggregate or not aggregate.hedged:
+                continue
+            extra_cost = aggregate.live_totals.get("hedge_cost", 0.0)
+            total_cost = aggregate.live_totals.get("cost", 0.0)
+            ratio_text = f"{extra_cost / total_cost:.1%}" if total_cost else "-"
+            lines.append(
+                f"| {api_name} | {aggregate.hedged}/{aggregate.live} | {aggregate.hedge_wins} | "
+                f"${extra_cost:.4f} | {ratio_text} |"
+            )
+        
+        if len(lines) == 3:
+            return []
+        lines.append("")
+        return lines
+    
+    def _circuit_table_lines(self) -> List[str]:
+        """서킷 브레이커 최종 상태와 상태 전이 기록 테이블 라인 생성 (전이가 있었던 경우만, 콘솔/마크다운 공용)"""
+        names = {api_instance.provider_key: api_name for api_name, api_instance in self.apis.items()}
+        transitions = [t for t in circuit_transitions() if t.provider_key in names]
+        if not transitions:
+            return []
+        
+        lines = [
+            "## 🚧 서킷 브레이커\n",
+            "| 모델 | 최종 상태 | 호출 수 | 실패 | 느린 호출 | 즉시 실패 | 상태 전이 |",
+            "|------|----------|--------|------|----------|----------|----------|"
+        ]
+        for provider_key, api_name in names.items():
+            stats = self.apis[api_name].circuit_breaker.stats()
+            if not stats["transitions"]:
+                continue
+            lines.append(
+                f"| {api_name} | {CIRCUIT_STATE_LABELS[stats['state']]} | {stats['calls']} | {stats['failures']} | "
+                f"{stats['slow_calls']} | {stats['rejected']} | {stats['transitions']} |"
+            )
+        
+        lines.extend([
+            "",
+            "| 시각 | 모델 | 전이 | 사유 |",
+            "|------|------|------|------|"
+        ])
+        for transition in transitions:
+            lines.append(
+                f"| {datetime.fromtimestamp(transition.at).strftime('%H:%M:%S')} | {names[transition.provider_key]} | "
+                f"{CIRCUIT_STATE_LABELS[transition.from_state]} → {CIRCUIT_STATE_LABELS[transition.to_state]} | "
+                f"{transition.reason} |"
+            )
+        lines.append("")
+        return lines
+    
+    def _concurrency_table_lines(self) -> List[str]:
+        """프로바이더별 적응형 동시성 한도 추이 테이블 라인 생성 (사용 시에만, 콘솔/마크다운 공용)"""
+        limiters = {
+            api_name: api_instance.concurrency_limiter
+            for api_name, api_instance in self.apis.items()
+            if api_instance.concurrency_limiter.enabled
+        }
+        if not limiters:
+            return []
+        
+        lines = [
+            "## 🎚️ 적응형 동시성 한도 (AIMD)\n",
+            "| 모델 | 시작 | 최종 | 최소 | 최대 | 감소 횟수 | 한도 대기 합계 (초) | 추이 |",
+            "|------|-----|-----|-----|-----|----------|------------------|------|"
+        ]
+        for api_name, limiter in limiters.items():
+            stats = limiter.stats()
+            lines.append(
+                f"| {api_name} | {stats['initial']} | {stats['limit']} | {stats['min']} | {stats['max']} | "
+                f"{stats['decreases']} | {stats['total_wait']:.2f} | `{limiter.sparkline()}` |"
+            )
+        lines.append("")
+        return lines
+    
+    def _budget_description(self) -> str:
+        """설정된 예산 한도 설명"""
+        limits = []
+        if self.budget.max_usd > 0:
+            limits.append(f"전체 ${self.budget.max_usd:g}")
+        limits.extend(f"{api_name} ${cap:g}" for api_name, cap in self.budget.provider_caps.items())
+        if self.budget.deadline > 0:
+            limits.append(f"마감 {self.budget.deadline:g}초")
+        return ", ".join(limits)
+    
+    def _budget_table_lines(self) -> List[str]:
+        """예산 대비 지출과 건너뛴 작업 테이블 라인 생성 (예산 사용 시에만, 콘솔/마크다운 공용)"""
+        if self.budget is None:
+            return []
+        
+        stats = self.budget.stats()
+        lines = [
+            "## 💰 실행 예산\n",
+            f"- 한도: {self._budget_description()}",
+            f"- 실제 지출: ${stats['spent']:.4f}",
+        ]
+        if stats["skipped"]:
+            skipped = ", ".join(f"{BUDGET_LABELS[reason]} {count}건" for reason, count in stats["skipped"].items())
+            lines.append(f"- 건너뛴 요청: {skipped} (부분 결과)")
+        lines.extend([
+            "",
+            "| 모델 | 지출 ($) | 상한 ($) | 상태 |",
+            "|------|---------|---------|------|"
+        ])
+        for api_name in self.apis.keys():
+            cap = self.budget.provider_caps.get(api_name)
+            reason = stats["stopped"].get(api_name) or stats["stopped"].get("*")
+            lines.append(
+                f"| {api_name} | ${stats['spent_by_provider'].get(api_name, 0.0):.4f} | "
+                f"{f'${cap:g}' if cap else '-'} | {BUDGET_LABELS[reason] if reason else '정상'} |"
+            )
+        lines.append("")
+        return lines
+    
+    def _phase_table_lines(self, results: StoredResults) -> List[str]:
+        """요청 경로 구간별 평균 소요 시간과 비중이 큰 구간 테이블 라인 생성 (콘솔/마크다운 공용)"""
+        averages = {}
+        for api_name in self.apis.keys():
+            aggregate = results.aggregate(api_name.lower())
+            if aggregate and aggregate.live:
+                averages[api_name] = aggregate.phase_averages()
+        
+        phases = [phase for phase in PHASE_LABELS if any(avg.get(phase) for avg in averages.values())]
+        if not phases:
+            return []
+        
+        lines = [
+            "## 🧭 구간별 소요 시간 (평균, ms)\n",
+            "| 모델 | 주요 구간 (비중) | " + " | ".join(PHASE_LABELS[phase] for phase in phases) + " |",
+            "|------|----------------|" + "|".join("-" * (len(PHASE_LABELS[phase]) + 2) for phase in phases) + "|"
+        ]
+        for api_name, avg in averages.items():
+            dominant = " · ".join(
+                f"{PHASE_LABELS.get(phase, phase)} {share:.0%}" for phase, share in dominant_phases(avg).items()
+            )
+            cells = " | ".join(f"{avg.get(phase, 0.0) * 1000:.1f}" for phase in phases)
+            lines.append(f"| {api_name} | {dominant or '-'} | {cells} |")
+        
+        lines.append("")
+        return lines
+    
+    def _http_timing_table_lines(self, results: StoredResults) -> List[str]:
+        """HTTP 전송 구간별 평균 시간 테이블 라인 생성 (공유 전송 계층 프로바이더만, 콘솔/마크다운 공용)"""
+        lines = [
+            "## 🌐 HTTP 전송 구간 (평균, ms)\n",
+            "| 모델 | 연결 (DNS+TCP) | TLS | 요청 전송 | TTFB | 다운로드 | 연결 재사용 |",
+            "|------|---------------|-----|----------|------|---------|------------|"
+        ]
+        
+        for api_name in self.apis.keys():
+            aggregate = results.aggregate(api_name.lower())
+            if not aggregate or not aggregate.http_count:
+                continue
+            cells = " | ".join(f"{seconds * 1000:.1f}" for seconds in aggregate.http_averages().values())
+            lines.append(f"| {api_name} | {cells} | {aggregate.http_reused}/{aggregate.http_count} |")
+        
+        if len(lines) == 3:
+            return []
+        lines.append("")
+        return lines
+    
+    def _prompt_cache_table_lines(self, results: StoredResults) -> List[str]:
+        """프롬프트 접두부 캐시 토큰과 절감 비용/시간 테이블 라인 생성 (콘솔/마크다운 공용)"""
+        lines = [
+            "## 💾 프롬프트 캐시\n",
+            "| 모델 | 캐시 읽기 요청 | 읽기 토큰 | 기록 토큰 | 절감 비용 ($) | 평균 응답시간 적중/미적중 (초) | 절감 시간 (초/요청) |",
+            "|------|--------------|----------|----------|-------------|------------------------------|-------------------|"
+        ]
+        
+        for api_name in self.apis.keys():
+            # 디스크 캐시 적중/병합 응답은 업스트림 호출이 없었으므로 집계에서 제외됨
+            aggregate = results.aggregate(api_name.lower())
+            if not aggregate:
+                continue
+            read_tokens = int(aggregate.upstream_totals.get("cache_read_tokens", 0))
+            write_tokens = int(aggregate.upstream_totals.get("cache_write_tokens", 0))
+            if not read_tokens and not write_tokens:
+                continue
+            
+            savings = aggregate.upstream_totals.get("prompt_cache_savings", 0.0)
+            
+            # 지연 시간 절감은 실제 호출 중 캐시 읽기 적중/미적중 요청의 평균 응답 시간 차이
+            hit_times, miss_times = aggregate.prompt_cache_hit_time, aggregate.prompt_cache_miss_time
+            hit_avg = hit_times.mean if hit_times.count else None
+            miss_avg = miss_times.mean if miss_times.count else None
+            time_text = " / ".join(f"{avg:.2f}" if avg is not None else "-" for avg in (hit_avg, miss_avg))
+            saved_text = f"{miss_avg - hit_avg:+.2f}" if hit_avg is not None and miss_avg is not None else "-"
+            
+            lines.append(
+                f"| {api_name} | {aggregate.prompt_cache_hits}/{aggregate.upstream} | {read_tokens:,} | {write_tokens:,} | "
+                f"${savings:.4f} | {time_text} | {saved_text} |"
+            )
+        
+        if len(lines) == 3:
+            return []
+        lines.append("")
+        return lines
+    
+    def _print_question_results(self, results: StoredResults, scenarios: Optional[Iterable[Dict[str, Any]]] = None):
+        """질문 생성 결과 출력 (단순 표 형식, scenarios가 없으면 고정 시나리오)"""
+        print("\n# 📊 START 질문 생성 결과\n")
+        
+        # 성능 테이블
+        print("## 🏆 모델별 성능 비교\n")
+        for line in self._performance_table_lines(results):
+            print(line)
+        print()
+        for line in self._budget_table_lines():
+            print(line)
+        for line in self._wait_table_lines(results):
+            print(line)
+        for line in self._hedge_table_lines(results):
+            print(line)
+        for line in self._circuit_table_lines():
+            print(line)
+        for line in self._concurrency_table_lines():
+            print(line)
+        for line in self._phase_table_lines(results):
+            print(line)
+        for line in self._http_timing_table_lines(results):
+            print(line)
+        for line in self._prompt_cache_table_lines(results):
+            print(line)
+        for line in self._latency_distribution_lines(results):
+            print(line)
+        for line in self._repetition_table_lines(results):
+            print(line)
         
         # 응답 내용 비교
         print("\n## 🔍 모델별 응답 내용 비교\n")
-        scenarios = self._get_start_scenarios()
+        scenarios = scenarios or self._get_start_scenarios()
         
         for i, scenario in enumerate(scenarios):
             print(f"### 시나리오 {i+1}: {scenario['name']}\n")
@@ -179,15 +1127,16 @@ class STARTTester:
             
             for api_name in self.apis.keys():
                 api_key = api_name.lower()
-                if api_key in results and results[api_key] and len(results[api_key]) > i:
-                    content = self._clean_and_summarize_content(results[api_key][i]["content"])
+                entry = self._scenario_entry(results, api_key, scenario)
+                if entry:
+                    content = entry["summary"]
                     print(f"| {api_name} | {content} |")
             print()
         
         # 마크다운 파일 저장
-        self._save_question_report(results)
+        self._save_question_report(results, scenarios)
     
-    def _save_question_report(self, results: Dict[str, Any]):
+    def _save_question_report(self, results: StoredResults, scenarios: Optional[Iterable[Dict[str, Any]]] = None):
         """질문 생성 마크다운 보고서를 파일로 저장"""
         from datetime import datetime
         import os
@@ -199,79 +1148,94 @@ class STARTTester:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"reports/START_questions_{timestamp}.md"
         
-        # 마크다운 내용 생성
-        markdown_content = self._generate_question_markdown_content(results)
-        
-        # 파일 저장
+        # 마크다운 내용을 줄 단위로 생성하며 파일에 저장 (응답 내용을 한꺼번에 메모리에 올리지 않음)
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+            for i, line in enumerate(self._generate_question_markdown_content(results, scenarios)):
+                f.write(line if i == 0 else "\n" + line)
         
         print(f"📄 질문 생성 보고서가 저장되었습니다: {filename}")
     
-    def _generate_question_markdown_content(self, results: Dict[str, Any]) -> str:
-        """질문 생성 마크다운 내용 생성 (단순 형식)"""
+    def _generate_question_markdown_content(self, results: StoredResults,
+                                            scenarios: Optional[Iterable[Dict[str, Any]]] = None) -> Iterator[str]:
+        """질문 생성 마크다운 내용을 줄 단위로 생성 (단순 형식, 응답 내용은 시나리오별로 실행 로그에서 읽음)"""
         from datetime import datetime
         
         content = [
             "# 📊 START 질문 생성 결과\n",
             f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
-            "## 🏆 모델별 성능 비교\n",
-            "| 모델 | 평균 응답시간 (초) | 평균 비용 ($) | 평균 토큰 수 |",
-            "|------|------------------|-------------|-------------|"
+            "## 🏆 모델별 성능 비교\n"
         ]
         
         # 성능 테이블
-        for api_name in self.apis.keys():
-            api_key = api_name.lower()
-            if api_key in results and results[api_key]:
-                avg_time = sum(r["response_time"] for r in results[api_key]) / len(results[api_key])
-                avg_cost = sum(r["cost"] for r in results[api_key]) / len(results[api_key])
-                avg_tokens = sum(r["tokens"] for r in results[api_key]) / len(results[api_key])
-                content.append(f"| {api_name} | {avg_time:.2f} | ${avg_cost:.4f} | {avg_tokens:.0f} |")
+        content.extend(self._performance_table_lines(results))
+        content.append("")
+        content.extend(self._budget_table_lines())
+        content.extend(self._wait_table_lines(results))
+        content.extend(self._hedge_table_lines(results))
+        content.extend(self._circuit_table_lines())
+        content.extend(self._concurrency_table_lines())
+        content.extend(self._phase_table_lines(results))
+        content.extend(self._http_timing_table_lines(results))
+        content.extend(self._prompt_cache_table_lines(results))
+        content.extend(self._latency_distribution_lines(results))
+        content.extend(self._repetition_table_lines(results))
         
         content.extend([
             "\n## 🔍 모델별 응답 내용 비교\n"
         ])
+        yield from content
         
         # 응답 내용 비교
-        scenarios = self._get_start_scenarios()
+        scenarios = scenarios or self._get_start_scenarios()
         for i, scenario in enumerate(scenarios):
-            content.extend([
+            yield from [
                 f"### 시나리오 {i+1}: {scenario['name']}\n",
                 "| 모델 | 생성된 질문 내용 |",
                 "|------|---------------------|"
-            ])
+            ]
             
             for api_name in self.apis.keys():
                 api_key = api_name.lower()
-                if api_key in results and results[api_key] and len(results[api_key]) > i:
-                    clean_content = self._clean_and_summarize_content(results[api_key][i]["content"])
-                    content.append(f"| {api_name} | {clean_content} |")
+                entry = self._scenario_entry(results, api_key, scenario)
+                if entry:
+                    clean_content = entry["summary"]
+                    yield f"| {api_name} | {clean_content} |"
             
-            content.append("")
-        
-        return "\n".join(content)
+            yield ""
     
-    def _print_report_results(self, results: Dict[str, Any]):
-        """보고서 생성 결과 출력 (단순 표 형식)"""
+    def _print_report_results(self, results: StoredResults, scenarios: Optional[Iterable[Dict[str, Any]]] = None):
+        """보고서 생성 결과 출력 (단순 표 형식, scenarios가 없으면 고정 시나리오)"""
         print("\n# 📊 보고서 생성 결과\n")
         
         # 성능 테이블
         print("## 🏆 모델별 성능 비교\n")
-        print("| 모델 | 평균 응답시간 (초) | 평균 비용 ($) | 평균 토큰 수 |")
-        print("|------|------------------|-------------|-------------|")
-        
-        for api_name in self.apis.keys():
-            api_key = api_name.lower()
-            if api_key in results and results[api_key]:
-                avg_time = sum(r["response_time"] for r in results[api_key]) / len(results[api_key])
-                avg_cost = sum(r["cost"] for r in results[api_key]) / len(results[api_key])
-                avg_tokens = sum(r["tokens"] for r in results[api_key]) / len(results[api_key])
-                print(f"| {api_name} | {avg_time:.2f} | ${avg_cost:.4f} | {avg_tokens:.0f} |")
+        for line in self._performance_table_lines(results):
+            print(line)
+        print()
+        for line in self._budget_table_lines():
+            print(line)
+        for line in self._wait_table_lines(results):
+            print(line)
+        for line in self._hedge_table_lines(results):
+            print(line)
+        for line in self._circuit_table_lines():
+            print(line)
+        for line in self._concurrency_table_lines():
+            print(line)
+        for line in self._phase_table_lines(results):
+            print(line)
+        for line in self._http_timing_table_lines(results):
+            print(line)
+        for line in self._prompt_cache_table_lines(results):
+            print(line)
+        for line in self._latency_distribution_lines(results):
+            print(line)
+        for line in self._repetition_table_lines(results):
+            print(line)
         
         # 응답 내용 비교
         print("\n## 🔍 모델별 응답 내용 비교\n")
-        scenarios = self._get_report_scenarios()
+        scenarios = scenarios or self._get_report_scenarios()
         
         for i, scenario in enumerate(scenarios):
             print(f"### 시나리오 {i+1}: {scenario['name']}\n")
@@ -280,15 +1244,16 @@ class STARTTester:
             
             for api_name in self.apis.keys():
                 api_key = api_name.lower()
-                if api_key in results and results[api_key] and len(results[api_key]) > i:
-                    content = self._clean_and_summarize_content(results[api_key][i]["content"])
+                entry = self._scenario_entry(results, api_key, scenario)
+                if entry:
+                    content = entry["summary"]
                     print(f"| {api_name} | {content} |")
             print()
         
         # 마크다운 파일 저장
-        self._save_markdown_report(results)
+        self._save_markdown_report(results, scenarios)
     
-    def _save_markdown_report(self, results: Dict[str, Any]):
+    def _save_markdown_report(self, results: StoredResults, scenarios: Optional[Iterable[Dict[str, Any]]] = None):
         """마크다운 보고서를 파일로 저장"""
         from datetime import datetime
         import os
@@ -300,58 +1265,60 @@ class STARTTester:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"reports/START_report_{timestamp}.md"
         
-        # 마크다운 내용 생성
-        markdown_content = self._generate_markdown_content(results)
-        
-        # 파일 저장
+        # 마크다운 내용을 줄 단위로 생성하며 파일에 저장 (응답 내용을 한꺼번에 메모리에 올리지 않음)
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+            for i, line in enumerate(self._generate_markdown_content(results, scenarios)):
+                f.write(line if i == 0 else "\n" + line)
         
         print(f"📄 보고서가 저장되었습니다: {filename}")
     
-    def _generate_markdown_content(self, results: Dict[str, Any]) -> str:
-        """마크다운 내용 생성 (단순 형식)"""
+    def _generate_markdown_content(self, results: StoredResults,
+                                   scenarios: Optional[Iterable[Dict[str, Any]]] = None) -> Iterator[str]:
+        """마크다운 내용을 줄 단위로 생성 (단순 형식, 응답 내용은 시나리오별로 실행 로그에서 읽음)"""
         from datetime import datetime
         
         content = [
             "# 📊 START 기법 보고서 생성 결과\n",
             f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
-            "## 🏆 모델별 성능 비교\n",
-            "| 모델 | 평균 응답시간 (초) | 평균 비용 ($) | 평균 토큰 수 |",
-            "|------|------------------|-------------|-------------|"
+            "## 🏆 모델별 성능 비교\n"
         ]
         
         # 성능 테이블
-        for api_name in self.apis.keys():
-            api_key = api_name.lower()
-            if api_key in results and results[api_key]:
-                avg_time = sum(r["response_time"] for r in results[api_key]) / len(results[api_key])
-                avg_cost = sum(r["cost"] for r in results[api_key]) / len(results[api_key])
-                avg_tokens = sum(r["tokens"] for r in results[api_key]) / len(results[api_key])
-                content.append(f"| {api_name} | {avg_time:.2f} | ${avg_cost:.4f} | {avg_tokens:.0f} |")
+        content.extend(self._performance_table_lines(results))
+        content.append("")
+        content.extend(self._budget_table_lines())
+        content.extend(self._wait_table_lines(results))
+        content.extend(self._hedge_table_lines(results))
+        content.extend(self._circuit_table_lines())
+        content.extend(self._concurrency_table_lines())
+        content.extend(self._phase_table_lines(results))
+        content.extend(self._http_timing_table_lines(results))
+        content.extend(self._prompt_cache_table_lines(results))
+        content.extend(self._latency_distribution_lines(results))
+        content.extend(self._repetition_table_lines(results))
         
         content.extend([
             "\n## 🔍 모델별 응답 내용 비교\n"
         ])
+        yield from content
         
         # 응답 내용 비교
-        scenarios = self._get_report_scenarios()
+        scenarios = scenarios or self._get_report_scenarios()
         for i, scenario in enumerate(scenarios):
-            content.extend([
+            yield from [
                 f"### 시나리오 {i+1}: {scenario['name']}\n",
                 "| 모델 | 생성된 보고서 내용 |",
                 "|------|---------------------|"
-            ])
+            ]
             
             for api_name in self.apis.keys():
                 api_key = api_name.lower()
-                if api_key in results and results[api_key] and len(results[api_key]) > i:
-                    clean_content = self._clean_and_summarize_content(results[api_key][i]["content"])
-                    content.append(f"| {api_name} | {clean_content} |")
+                entry = self._scenario_entry(results, api_key, scenario)
+                if entry:
+                    clean_content = entry["summary"]
+                    yield f"| {api_name} | {clean_content} |"
             
-            content.append("")
-        
-        return "\n".join(content)
+            yield ""
     
     def _clean_and_summarize_content(self, content: str) -> str:
         """JSON에서 내용 추출하여 읽기 쉽게 정리"""
@@ -411,7 +1378,7 @@ class STARTTester:
             content = re.sub(r'\n+', ' ', content)
             content = re.sub(r'\s+', ' ', content)
             return content.strip()
-            
+        
         except (json.JSONDecodeError, KeyError, AttributeError):
             # JSON 파싱 실패시 원본 반환
             content = re.sub(r'#+\s*', '', content)
@@ -423,36 +1390,220 @@ class STARTTester:
             return content.strip()
 
 
-async def run_start_questions():
+# 반복 통계의 시나리오별 표를 출력하는 최대 시나리오 수
+_MAX_REPETITION_SCENARIO_ROWS = 20
+
+
+def _scenario_key(scenario: Dict[str, Any]) -> str:
+    """실행 로그/저장 결과에서 시나리오를 식별하는 키 (id, 없으면 이름)"""
+    return str(scenario.get("id") or scenario["name"])
+
+
+def _describe_query(query: Dict[str, Any]) -> str:
+    """카탈로그 조건 표시용 문자열"""
+    return ", ".join(
+        f"{key}={','.join(value) if isinstance(value, (list, tuple)) else value}"
+        for key, value in query.items()
+    )
+
+
+def _client_mode_label(use_async: Optional[bool]) -> str:
+    """클라이언트 실행 방식 표시용 문자열"""
+    is_async = settings.use_async_clients if use_async is None else use_async
+    return "네이티브 비동기" if is_async else "동기 SDK + 스레드"
+
+
+async def run_start_questions(use_async: Optional[bool] = None,
+                              max_concurrency: Optional[int] = None,
+                              stream: Optional[bool] = None,
+                              providers: Optional[List[str]] = None,
+                              resume: Optional[str] = None,
+                              workload: Optional[Workload] = None,
+                              repeat: int = 1):
     """START 질문 생성 테스트 실행"""
     print("🚀 START 질문 생성 테스트를 시작합니다...")
+    print(f"⚙️ 클라이언트 모드: {_client_mode_label(use_async)}")
     
     # 설정 검증
     if not settings.validate_api_keys():
         print("❌ API 키 설정을 확인해주세요.")
         return
+    if resume and not os.path.exists(RunLog.path_for(resume)):
+        print(f"❌ 실행 로그를 찾을 수 없습니다: {RunLog.path_for(resume)}")
+        return
+    if workload and not os.path.exists(workload.path):
+        print(f"❌ 워크로드 파일을 찾을 수 없습니다: {workload.path}")
+        return
+    if repeat > 1:
+        # 반복 실행은 매 요청이 업스트림에 도달해야 하므로 캐시와 요청 병합을 끔
+        print(f"🔁 시나리오마다 {repeat}회 반복 실행합니다 (응답 캐시/요청 병합 끔)")
+        response_cache.configure(enabled=False)
+        single_flight.enabled = False
     
-    tester = STARTTester()
-    await tester.test_start_questions()
+    tester = STARTTester(
+        use_async=use_async,
+        max_concurrency=max_concurrency,
+        stream=stream,
+        providers=providers,
+        resume=resume,
+        workload=workload,
+        repeat=repeat
+    )
+    try:
+        await tester.test_start_questions()
+    finally:
+        await tester.aclose()
     
     print("\n✅ START 질문 생성 테스트가 완료되었습니다!")
 
 
-async def run_reports():
+async def run_reports(use_async: Optional[bool] = None,
+                      max_concurrency: Optional[int] = None,
+                      stream: Optional[bool] = None,
+                      providers: Optional[List[str]] = None,
+                      resume: Optional[str] = None,
+                      workload: Optional[Workload] = None,
+                      repeat: int = 1):
     """보고서 생성 테스트 실행"""
     print("🚀 보고서 생성 테스트를 시작합니다...")
+    print(f"⚙️ 클라이언트 모드: {_client_mode_label(use_async)}")
     
     # 설정 검증
     if not settings.validate_api_keys():
         print("❌ API 키 설정을 확인해주세요.")
         return
+    if resume and not os.path.exists(RunLog.path_for(resume)):
+        print(f"❌ 실행 로그를 찾을 수 없습니다: {RunLog.path_for(resume)}")
+        return
+    if workload and not os.path.exists(workload.path):
+        print(f"❌ 워크로드 파일을 찾을 수 없습니다: {workload.path}")
+        return
+    if repeat > 1:
+        # 반복 실행은 매 요청이 업스트림에 도달해야 하므로 캐시와 요청 병합을 끔
+        print(f"🔁 시나리오마다 {repeat}회 반복 실행합니다 (응답 캐시/요청 병합 끔)")
+        response_cache.configure(enabled=False)
+        single_flight.enabled = False
     
-    tester = STARTTester()
-    await tester.test_reports()
+    tester = STARTTester(
+        use_async=use_async,
+        max_concurrency=max_concurrency,
+        stream=stream,
+        providers=providers,
+        resume=resume,
+        workload=workload,
+        repeat=repeat
+    )
+    try:
+        await tester.test_reports()
+    finally:
+        await tester.aclose()
     
     print("\n✅ 보고서 생성 테스트가 완료되었습니다!")
 
 
+async def run_load(schedule: ArrivalSchedule,
+                   task_type: str = "questions",
+                   max_in_flight: int = 0,
+                   use_async: Optional[bool] = None,
+                   stream: Optional[bool] = None,
+                   providers: Optional[List[str]] = None,
+                   scenario_query: Optional[Dict[str, Any]] = None):
+    """오픈 루프 부하 테스트 실행"""
+    print("🚀 오픈 루프 부하 테스트를 시작합니다...")
+    print(f"⚙️ 클라이언트 모드: {_client_mode_label(use_async)}")
+    print(f"⚙️ 도착 패턴: {schedule.pattern}, 총 {schedule.duration:.0f}초")
+    
+    # 부하 테스트는 매 요청이 업스트림에 도달해야 하므로 캐시와 요청 병합을 끔
+    response_cache.configure(enabled=False)
+    single_flight.enabled = False
+    
+    tester = STARTTester(use_async=use_async, stream=stream, providers=providers, scenario_query=scenario_query)
+    try:
+        await tester.run_load(schedule, task_type=task_type, max_in_flight=max_in_flight)
+    finally:
+        await tester.aclose()
+    
+    print("\n✅ 부하 테스트가 완료되었습니다!")
+
+
+async def run_batch(task_type: str = "questions",
+                    providers: Optional[List[str]] = None,
+                    scenario_query: Optional[Dict[str, Any]] = None):
+    """배치 API 모드 실행 (Claude, Claude Haiku, ChatGPT)"""
+    print("🚀 배치 평가를 시작합니다...")
+    print(
+        f"⚙️ 상태 폴링: {settings.batch_poll_interval:g}초부터 최대 {settings.batch_poll_max_interval:g}초 간격, "
+        f"제한 시간 {settings.batch_timeout:.0f}초"
+    )
+    
+    if not settings.validate_api_keys():
+        print("❌ API 키 설정을 확인해주세요.")
+        return
+    
+    tester = STARTTester(providers=providers, scenario_query=scenario_query)
+    try:
+        await tester.run_batch(task_type=task_type)
+    finally:
+        await tester.aclose()
+    
+    print("\n✅ 배치 평가가 완료되었습니다!")
+
+
+async def run_race(task_type: str = "questions",
+                   providers: Optional[List[str]] = None,
+                   scenario_query: Optional[Dict[str, Any]] = None):
+    """레이스 모드 실행 (기본 참가자: RACE_PROVIDERS)"""
+    print("🚀 레이스 모드를 시작합니다...")
+    
+    if not settings.validate_api_keys():
+        print("❌ API 키 설정을 확인해주세요.")
+        return
+    
+    # 레이스에서는 헤지 중복 요청을 보내지 않음 (참가자 간 경쟁만 측정)
+    hedge_policy.enabled = False
+    # 캐시 적중/병합 응답이 0초로 이기지 않도록 매 참가자가 업스트림에 도달해야 하므로 캐시와 요청 병합을 끔
+    response_cache.configure(enabled=False)
+    single_flight.enabled = False
+    tester = STARTTester(
+        providers=providers or [name.strip() for name in settings.race_providers.split(",")],
+        scenario_query=scenario_query
+    )
+    try:
+        await tester.run_race(task_type=task_type)
+    finally:
+        await tester.aclose()
+    
+    print("\n✅ 레이스 모드가 완료되었습니다!")
+
+
+def run_mock_server(host: str = "127.0.0.1",
+                    port: int = 8787,
+                    config_path: Optional[str] = None,
+                    verbose: bool = False):
+    """모의 LLM 서버 실행 (Ctrl+C로 종료)"""
+    config = MockConfig.from_file(config_path) if config_path else MockConfig()
+    server = MockLLMServer(host=host, port=port, config=config, verbose=verbose)
+    
+    print(f"🧪 모의 LLM 서버 실행 중: {server.base_url}")
+    for name, profile in config.endpoints.items():
+        print(
+            f"  - {name}: 지연 {profile.latency.describe()}, "
+            f"{profile.tokens_per_second:g} 토큰/초, 오류율 {profile.error_rate:.0%}"
+            + (f", 동시 처리 상한 {profile.max_concurrency}" if profile.max_concurrency > 0 else "")
+        )
+    print("\n프로바이더를 모의 서버로 연결하려면 .env에 다음을 설정하세요:")
+    for name, value in server.provider_env().items():
+        print(f"  {name}={value}")
+    
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n🛑 모의 서버 종료 (요청 수: {server.request_counts})")
+
+
 def main():
     """메인 함수"""
     if not click:
@@ -464,15 +1615,241 @@ def main():
         """START 기법 특화 테스트 도구"""
         pass
     
+    def build_workload(task_type, path, filters, sample, shard, limit, sample_seed) -> Optional[Workload]:
+        """워크로드 옵션으로 Workload를 만듭니다 (--workload가 없으면 None)"""
+        if not path:
+            if filters or sample is not None or shard or limit is not None:
+                raise click.UsageError("--filter/--sample/--shard/--limit는 --workload와 함께 사용하세요")
+            return None
+        parsed_filters = {}
+        for item in filters:
+            key, sep, value = item.partition("=")
+            if not sep or not key:
+                raise click.BadParameter(f"KEY=VALUE 형식이어야 합니다: {item}", param_hint="--filter")
+            parsed_filters[key] = value
+        parsed_shard = None
+        if shard:
+            index, sep, count = shard.partition("/")
+            if not sep or not index.isdigit() or not count.isdigit():
+                raise click.BadParameter(f"I/N 형식이어야 합니다: {shard}", param_hint="--shard")
+            parsed_shard = (int(index), int(count))
+        try:
+            return Workload(
+                path,
+                task_type=task_type,
+                filters=parsed_filters,
+                sample=sample,
+                shard=parsed_shard,
+                limit=limit,
+                seed=sample_seed
+            )
+        except ValueError as e:
+            raise click.BadParameter(str(e))
+    
+    def catalog_options(command):
+        """시나리오 카탈로그 선택 옵션 (load/batch/race 공용)"""
+        options = [
+            click.option("--category", default=None, help="시나리오 카탈로그에서 고를 카테고리"),
+            click.option("--language", default=None, help="시나리오 카탈로그에서 고를 언어 (예: ko, en)"),
+            click.option("--tag", "tags", multiple=True, help="시나리오 카탈로그 태그 (여러 번 지정하면 모두 가진 시나리오)")
+        ]
+        for option in reversed(options):
+            command = option(command)
+        return command
+    
+    def build_query(category, language, tags) -> Optional[Dict[str, Any]]:
+        """카탈로그 옵션으로 조회 조건을 만듭니다 (옵션이 없으면 None - 기본 스위트)"""
+        query = {"category": category, "language": language, "tags": list(tags)}
+        query = {key: value for key, value in query.items() if value}
+        return query or None
+    
+    def parse_providers(ctx, param, value) -> Optional[List[str]]:
+        """--providers 값을 이름 목록으로 나누고 등록된 프로바이더인지 확인합니다 (click 콜백)"""
+        if not value:
+            return None
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        try:
+            provider_registry.select(names)
+        except ValueError:
+            raise click.BadParameter(f"알 수 없는 프로바이더입니다 (사용 가능: {', '.join(provider_registry.names())})")
+        return names
+    
+    def workload_options(command):
+        """--workload 관련 옵션 (questions/reports 공용)"""
+        options = [
+            click.option("--workload", "workload_path", default=None, metavar="PATH",
+                         help="고정 시나리오 대신 실행할 JSONL(.gz) 워크로드 (한 줄씩 스트리밍)"),
+            click.option("--filter", "filters", multiple=True, metavar="KEY=VALUE",
+                         help="워크로드 레코드 필터 (여러 번 지정 가능)"),
+            click.option("--sample", type=float, default=None, help="워크로드에서 사용할 레코드 비율 (0~1)"),
+            click.option("--sample-seed", type=int, default=0, help="샘플링 해시 시드"),
+            click.option("--shard", default=None, metavar="I/N", help="워크로드를 N개로 나눈 중 I번째만 실행 (0부터)"),
+            click.option("--limit", type=int, default=None, help="워크로드 최대 레코드 수")
+        ]
+        for option in reversed(options):
+            command = option(command)
+        return command
+    
     @cli.command()
-    def questions():
+    @click.option("--sync-clients", is_flag=True, help="동기 SDK + 스레드 경로 사용 (비동기 경로와 비교용)")
+    @click.option("--max-concurrency", type=int, default=None, help="전체 동시 요청 상한 (기본값: MAX_CONCURRENCY)")
+    @click.option("--stream", is_flag=True, help="스트리밍 모드로 TTFT/토큰 간 지연 측정")
+    @click.option("--no-cache", is_flag=True, help="응답 캐시를 읽지도 쓰지도 않음")
+    @click.option("--refresh", is_flag=True, help="캐시를 읽지 않고 새 응답으로 덮어씀")
+    @click.option("--hedge", is_flag=True, help="최근 응답 시간 분위수를 넘기면 중복 요청 (기본값: USE_HEDGING)")
+    @click.option("--adaptive", is_flag=True, help="프로바이더별 동시 요청 한도를 AIMD로 자동 조정 (기본값: USE_ADAPTIVE_CONCURRENCY)")
+    @click.option("--max-usd", type=float, default=None, help="실행 1회 전체 비용 상한 USD (기본값: BUDGET_MAX_USD)")
+    @click.option("--deadline", type=float, default=None, help="실행 마감 시간 초 (기본값: BUDGET_DEADLINE_SECONDS)")
+    @click.option("--resume", "resume", default=None, metavar="RUN_ID", help="실행 로그를 이어서 실행 (완료된 요청은 건너뜀)")
+    @click.option("--providers", default=None, callback=parse_providers, help="실행할 프로바이더 (쉼표 구분, 기본값: PROVIDERS 또는 전체)")
+    @click.option("--repeat", type=click.IntRange(min=1), default=1,
+                  help="(프로바이더, 시나리오)마다 반복 실행할 횟수 (2 이상이면 부트스트랩 신뢰구간 보고)")
+    @workload_options
+    def questions(sync_clients, max_concurrency, stream, no_cache, refresh, hedge, adaptive, max_usd, deadline, resume, providers,
+               repeat, workload_path, filters, sample, sample_seed, shard, limit):
         """START 질문 생성 테스트"""
-        asyncio.run(run_start_questions())
+        response_cache.configure(enabled=False if no_cache else None, refresh=refresh)
+        hedge_policy.enabled = hedge_policy.enabled or hedge
+        settings.use_adaptive_concurrency = settings.use_adaptive_concurrency or adaptive
+        if max_usd is not None:
+            settings.budget_max_usd = max_usd
+        if deadline is not None:
+            settings.budget_deadline_seconds = deadline
+        workload = build_workload("questions", workload_path, filters, sample, shard, limit, sample_seed)
+        asyncio.run(run_start_questions(
+            use_async=False if sync_clients else None,
+            max_concurrency=max_concurrency,
+            stream=True if stream else None,
+            providers=providers,
+            resume=resume,
+            workload=workload,
+            repeat=repeat
+        ))
     
     @cli.command()
-    def reports():
+    @click.option("--sync-clients", is_flag=True, help="동기 SDK + 스레드 경로 사용 (비동기 경로와 비교용)")
+    @click.option("--max-concurrency", type=int, default=None, help="전체 동시 요청 상한 (기본값: MAX_CONCURRENCY)")
+    @click.option("--stream", is_flag=True, help="스트리밍 모드로 TTFT/토큰 간 지연 측정")
+    @click.option("--no-cache", is_flag=True, help="응답 캐시를 읽지도 쓰지도 않음")
+    @click.option("--refresh", is_flag=True, help="캐시를 읽지 않고 새 응답으로 덮어씀")
+    @click.option("--hedge", is_flag=True, help="최근 응답 시간 분위수를 넘기면 중복 요청 (기본값: USE_HEDGING)")
+    @click.option("--adaptive", is_flag=True, help="프로바이더별 동시 요청 한도를 AIMD로 자동 조정 (기본값: USE_ADAPTIVE_CONCURRENCY)")
+    @click.option("--max-usd", type=float, default=None, help="실행 1회 전체 비용 상한 USD (기본값: BUDGET_MAX_USD)")
+    @click.option("--deadline", type=float, default=None, help="실행 마감 시간 초 (기본값: BUDGET_DEADLINE_SECONDS)")
+    @click.option("--resume", "resume", default=None, metavar="RUN_ID", help="실행 로그를 이어서 실행 (완료된 요청은 건너뜀)")
+    @click.option("--providers", default=None, callback=parse_providers, help="실행할 프로바이더 (쉼표 구분, 기본값: PROVIDERS 또는 전체)")
+    @click.option("--repeat", type=click.IntRange(min=1), default=1,
+                  help="(프로바이더, 시나리오)마다 반복 실행할 횟수 (2 이상이면 부트스트랩 신뢰구간 보고)")
+    @workload_options
+    def reports(sync_clients, max_concurrency, stream, no_cache, refresh, hedge, adaptive, max_usd, deadline, resume, providers,
+                repeat, workload_path, filters, sample, sample_seed, shard, limit):
         """보고서 생성 테스트"""
-        asyncio.run(run_reports())
+        response_cache.configure(enabled=False if no_cache else None, refresh=refresh)
+        hedge_policy.enabled = hedge_policy.enabled or hedge
+        settings.use_adaptive_concurrency = settings.use_adaptive_concurrency or adaptive
+        if max_usd is not None:
+            settings.budget_max_usd = max_usd
+        if deadline is not None:
+            settings.budget_deadline_seconds = deadline
+        workload = build_workload("reports", workload_path, filters, sample, shard, limit, sample_seed)
+        asyncio.run(run_reports(
+            use_async=False if sync_clients else None,
+            max_concurrency=max_concurrency,
+            stream=True if stream else None,
+            providers=providers,
+            resume=resume,
+            workload=workload,
+            repeat=repeat
+        ))
+    
+    @cli.command()
+    @click.option("--pattern", type=click.Choice(["constant", "poisson", "ramp"]), default="poisson",
+                  help="도착 패턴")
+    @click.option("--rate", type=float, default=1.0, help="프로바이더별 목표 도착률 (req/s, ramp는 시작값)")
+    @click.option("--duration", type=float, default=60.0, help="전체 실행 시간 (초)")
+    @click.option("--ramp-to", type=float, default=None, help="ramp 최종 도착률 (req/s)")
+    @click.option("--steps", type=int, default=5, help="ramp 단계 수")
+    @click.option("--task", type=click.Choice(["questions", "reports"]), default="questions", help="요청 종류")
+    @click.option("--max-in-flight", type=int, default=0, help="프로바이더별 동시 요청 상한 (초과 도착은 실패로 집계)")
+    @click.option("--seed", type=int, default=None, help="포아송 도착 난수 시드")
+    @click.option("--sync-clients", is_flag=True, help="동기 SDK + 스레드 경로 사용 (비동기 경로와 비교용)")
+    @click.option("--stream", is_flag=True, help="스트리밍 모드 사용")
+    @click.option("--hedge", is_flag=True, help="최근 응답 시간 분위수를 넘기면 중복 요청 (기본값: USE_HEDGING)")
+    @click.option("--adaptive", is_flag=True, help="프로바이더별 동시 요청 한도를 AIMD로 자동 조정 (기본값: USE_ADAPTIVE_CONCURRENCY)")
+    @click.option("--providers", default=None, callback=parse_providers, help="실행할 프로바이더 (쉼표 구분, 기본값: PROVIDERS 또는 전체)")
+    @catalog_options
+    def load(pattern, rate, duration, ramp_to, steps, task, max_in_flight, seed, sync_clients, stream, hedge, adaptive, providers,
+             category, language, tags):
+        """오픈 루프 부하 테스트 (고정/포아송/단계별 증가 도착률)"""
+        hedge_policy.enabled = hedge_policy.enabled or hedge
+        settings.use_adaptive_concurrency = settings.use_adaptive_concurrency or adaptive
+        schedule = ArrivalSchedule(
+            pattern=pattern,
+            rate=rate,
+            duration=duration,
+            ramp_to=ramp_to,
+            steps=steps,
+            seed=seed
+        )
+        asyncio.run(run_load(
+            schedule,
+            task_type=task,
+            max_in_flight=max_in_flight,
+            use_async=False if sync_clients else None,
+            stream=True if stream else None,
+            providers=providers,
+            scenario_query=build_query(category, language, tags)
+        ))
+    
+    @cli.command()
+    @click.option("--task", type=click.Choice(["questions", "reports"]), default="questions", help="요청 종류")
+    @click.option("--no-cache", is_flag=True, help="응답 캐시를 읽지도 쓰지도 않음")
+    @click.option("--refresh", is_flag=True, help="캐시를 읽지 않고 새 응답으로 덮어씀")
+    @click.option("--providers", default=None, callback=parse_providers, help="실행할 프로바이더 (쉼표 구분, 기본값: PROVIDERS 또는 전체)")
+    @catalog_options
+    def batch(task, no_cache, refresh, providers, category, language, tags):
+        """배치 API 평가 (전체 시나리오를 묶어 제출, 실시간 대비 약 50% 가격)"""
+        response_cache.configure(enabled=False if no_cache else None, refresh=refresh)
+        asyncio.run(run_batch(
+            task_type=task,
+            providers=providers,
+            scenario_query=build_query(category, language, tags)
+        ))
+    
+    @cli.command(name="race")
+    @click.option("--task", type=click.Choice(["questions", "reports"]), default="questions", help="요청 종류")
+    @click.option("--providers", default=None, callback=parse_providers, help="참가 프로바이더 (쉼표 구분, 기본값: RACE_PROVIDERS)")
+    @catalog_options
+    def race_mode(task, providers, category, language, tags):
+        """레이스 모드 (유효한 START JSON을 먼저 돌려준 프로바이더 응답 사용, 나머지는 취소, 캐시 사용 안 함)"""
+        asyncio.run(run_race(
+            task_type=task,
+            providers=providers,
+            scenario_query=build_query(category, language, tags)
+        ))
+    
+    @cli.command(name="mock-server")
+    @click.option("--host", default="127.0.0.1", help="바인드 주소")
+    @click.option("--port", type=int, default=8787, help="포트")
+    @click.option("--config", "config_path", default=None, help="엔드포인트 지연/처리량 설정 JSON 파일")
+    @click.option("--verbose", is_flag=True, help="요청 로그 출력")
+    def mock_server(host, port, config_path, verbose):
+        """오프라인 모의 LLM 서버 실행 (Anthropic/OpenAI/HyperClovaX 형식)"""
+        run_mock_server(host=host, port=port, config_path=config_path, verbose=verbose)
+    
+    @cli.command(name="providers")
+    def list_providers():
+        """등록된 프로바이더 목록"""
+        for name in provider_registry.names():
+            print(f"- {name}")
+    
+    @cli.command(name="scenarios")
+    def list_scenarios():
+        """시나리오 카탈로그의 스위트/카테고리/언어/태그별 시나리오 수"""
+        print(f"🗂️ 시나리오 {len(scenario_catalog)}개")
+        for field, label in (("suite", "스위트"), ("category", "카테고리"), ("language", "언어"), ("tag", "태그")):
+            counts = scenario_catalog.counts(field)
+            print(f"- {label}: " + ", ".join(f"{value} ({count})" for value, count in counts.items()))
     
     cli()
 
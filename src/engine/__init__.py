@@ -0,0 +1,25 @@
+"""
+실행 엔진 패키지
+"""
+
+from .budget import CostEstimate, RunBudget
+from .executor import ConcurrentExecutor, ExecutionJob, ExecutionOutcome
+from .load import ArrivalSchedule, LoadGenerator, LoadSample, StepReport, summarize_load
+from .result_sink import ResultSink, StoredResults
+from .run_log import RunLog
+
+__all__ = [
+    "CostEstimate",
+    "RunBudget",
+    "ConcurrentExecutor",
+    "ExecutionJob",
+    "ExecutionOutcome",
+    "ArrivalSchedule",
+    "LoadGenerator",
+    "LoadSample",
+    "StepReport",
+    "summarize_load",
+    "RunLog",
+    "ResultSink",
+    "StoredResults"
+]
@@ -0,0 +1,225 @@
+"""
+비용/시간 예산
+
+벤치마크 실행의 전체 비용 상한(USD), 프로바이더별 비용 상한, 실행 마감 시간을 관리합니다.
+요청마다 렌더링된 프롬프트 길이와 프로바이더 단가로 비용 상한(최대 출력 토큰까지 생성한다고 가정)을
+계산해 보내기 전에 예약하고, 응답의 실제 비용으로 정산하므로 진행 중인 요청이 예산을 넘기지 않습니다.
+예산에 닿으면 이후 작업은 보내지 않고 건너뛴 것으로 기록합니다.
+"""
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils.prompt_loader import prompt_loader
+
+# 작업을 건너뛴 이유
+BUDGET_TOTAL = "total_usd"
+BUDGET_PROVIDER = "provider_usd"
+BUDGET_DEADLINE = "deadline"
+
+BUDGET_LABELS = {
+    BUDGET_TOTAL: "전체 예산 소진",
+    BUDGET_PROVIDER: "프로바이더 예산 소진",
+    BUDGET_DEADLINE: "마감 시간 도달"
+}
+
+# 전체 예산 범위를 나타내는 키
+_ALL = "*"
+
+
+@dataclass
+class CostEstimate:
+    """요청 1건의 예상 비용 구성"""
+    input_tokens: int            # 렌더링된 프롬프트의 추정 토큰 수
+    input_cost: float            # 입력 비용 (USD)
+    output_price: float          # 출력 토큰 1개당 단가 (USD)
+    max_output_tokens: int       # 최대 출력 토큰
+    reserved: float = 0.0        # 예약 중인 비용 (USD, 정산 시 해제)
+    
+    @property
+    def max_cost(self) -> float:
+        """비용 상한 (최대 출력 토큰까지 생성한다고 가정, USD)"""
+        return self.input_cost + self.max_output_tokens * self.output_price
+    
+    @property
+    def expected_work(self) -> int:
+        """예상 처리량 (입력 + 최대 출력 토큰, 작업 순서를 정하는 소요 시간 대리 지표)"""
+        return self.input_tokens + self.max_output_tokens
+
+
+def spent_cost(response: Any) -> float:
+    """응답이 실제로 지출한 비용 (캐시 적중/병합 응답은 0, 헤지 중복 요청 추정 비용 포함)"""
+    if response is None or getattr(response, "cached", False) or getattr(response, "coalesced", False):
+        return 0.0
+    return getattr(response, "cost", 0.0) + getattr(response, "hedge_cost", 0.0)
+
+
+class RunBudget:
+    """실행 1회의 비용/시간 예산"""
+    
+    def __init__(self,
+                 max_usd: float = 0.0,
+                 provider_caps: Optional[Dict[str, float]] = None,
+                 deadline: float = 0.0):
+        """
+        예산 초기화
+        
+        Args:
+            max_usd: 전체 비용 상한 (USD, 0 이하이면 제한 없음)
+            provider_caps: 프로바이더 이름별 비용 상한 (USD, 0 이하이면 제한 없음)
+            deadline: 실행 시작부터 마감까지 시간 (초, 0 이하이면 제한 없음)
+        """
+        self.max_usd = max_usd
+        self.provider_caps = {name: cap for name, cap in (provider_caps or {}).items() if cap > 0}
+        self.deadline = deadline
+        
+        self.spent: Dict[str, float] = {}
+        self.skipped: Dict[str, int] = {}
+        # 예산에 닿아 더 이상 보내지 않는 범위 (_ALL 또는 프로바이더 이름) → 이유
+        self.stopped: Dict[str, str] = {}
+        self._reserved: Dict[str, float] = {}
+        self._started_at: Optional[float] = None
+        self._changed = asyncio.Condition()
+    
+    @property
+    def enabled(self) -> bool:
+        """제한이 하나라도 설정되어 있는지 여부"""
+        return self.max_usd > 0 or bool(self.provider_caps) or self.deadline > 0
+    
+    @property
+    def total_spent(self) -> float:
+        """실제 지출 합계 (USD)"""
+        return sum(self.spent.values())
+    
+    def start(self):
+        """마감 시간 측정을 시작합니다"""
+        self._started_at = time.monotonic()
+    
+    def remaining(self) -> Optional[float]:
+        """마감까지 남은 시간 (초, 마감이 없으면 None)"""
+        if self.deadline <= 0:
+            return None
+        if self._started_at is None:
+            self.start()
+        return max(0.0, self._started_at + self.deadline - time.monotonic())
+    
+    def estimate(self, api_instance: Any, prompt: str) -> CostEstimate:
+        """
+        렌더링된 프롬프트와 프로바이더 단가로 요청 1건의 비용 구성을 계산합니다
+        
+        Args:
+            api_instance: 프로바이더 인스턴스 (input/output_price_per_million, max_tokens 사용)
+            prompt: 렌더링된 프롬프트
+        
+        Returns:
+            CostEstimate: 예상 비용 구성
+        """
+        return CostEstimate(
+            input_tokens=prompt_loader.estimate_tokens(prompt),
+            input_cost=api_instance.estimate_input_cost(prompt),
+            output_price=api_instance.output_price_per_million / 1_000_000,
+            max_output_tokens=api_instance.max_tokens
+        )
+    
+    async def reserve(self, api_name: str, estimate: CostEstimate) -> Optional[str]:
+        """
+        요청 1건의 비용 상한을 예약합니다
+        
+        실제 지출만으로는 여유가 있지만 진행 중인 요청의 예약 때문에 넘치면, 그 요청들이 정산될 때까지
+        기다렸다가 다시 확인합니다 (보수적인 예약 때문에 실행이 일찍 멈추지 않도록).
+        
+        Args:
+            api_name: 프로바이더 이름
+            estimate: 예상 비용 구성
+        
+        Returns:
+            Optional[str]: 예산에 닿아 보내지 않아야 하면 그 이유 (BUDGET_*), 보내도 되면 None
+        """
+        cost = estimate.max_cost
+        async with self._changed:
+            while True:
+                reason, wait = self._check(api_name, cost)
+                if reason is not None:
+                    self.record_skip(reason)
+                    return reason
+                if not wait:
+                    break
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=self.remaining())
+                except asyncio.TimeoutError:
+                    pass
+            
+            estimate.reserved = cost
+            self._reserved[api_name] = self._reserved.get(api_name, 0.0) + cost
+            return None
+    
+    def _check(self, api_name: str, cost: float) -> Tuple[Optional[str], bool]:
+        """
+        예약 가능 여부 확인 (한 번 닿은 예산은 이후 작업도 모두 건너뜀)
+        
+        Returns:
+            Tuple[Optional[str], bool]: (건너뛸 이유, 진행 중 요청의 정산을 기다려야 하는지)
+        """
+        for scope in (_ALL, api_name):
+            if scope in self.stopped:
+                return self.stopped[scope], False
+        
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            return self._stop(_ALL, BUDGET_DEADLINE), False
+        
+        limits = [(_ALL, BUDGET_TOTAL, self.max_usd, self.total_spent, sum(self._reserved.values()))]
+        if api_name in self.provider_caps:
+            limits.append((
+                api_name, BUDGET_PROVIDER, self.provider_caps[api_name],
+                self.spent.get(api_name, 0.0), self._reserved.get(api_name, 0.0)
+            ))
+        
+        wait = False
+        for scope, reason, cap, spent, reserved in limits:
+            if cap <= 0:
+                continue
+            if spent + cost > cap:
+                return self._stop(scope, reason), False
+            wait = wait or spent + reserved + cost > cap
+        return None, wait
+    
+    def record_skip(self, reason: str):
+        """건너뛴 작업 수를 이유별로 집계합니다"""
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+    
+    def _stop(self, scope: str, reason: str) -> str:
+        """예산 범위를 닫고 한 번만 알립니다"""
+        self.stopped[scope] = reason
+        target = "전체" if scope == _ALL else scope
+        print(f"💸 {target}: {BUDGET_LABELS[reason]} - 남은 작업은 보내지 않고 건너뜁니다")
+        return reason
+    
+    async def settle(self, api_name: str, estimate: CostEstimate, response: Any, cancelled: bool = False):
+        """
+        예약한 비용을 실제 비용으로 정산하고, 예약 여유를 기다리는 작업을 깨웁니다
+        
+        진행 중에 취소된 요청은 업스트림이 이미 토큰을 생성했을 수 있으므로 예약한 비용 상한으로 정산합니다.
+        
+        Args:
+            api_name: 프로바이더 이름
+            estimate: reserve에 사용한 예상 비용 구성
+            response: 응답 (예외로 없으면 None - 예약만 해제)
+            cancelled: 마감 시간 등으로 진행 중에 취소되었는지 여부
+        """
+        async with self._changed:
+            cost = estimate.reserved if cancelled else spent_cost(response)
+            self._reserved[api_name] = max(0.0, self._reserved.get(api_name, 0.0) - estimate.reserved)
+            estimate.reserved = 0.0
+            self.spent[api_name] = self.spent.get(api_name, 0.0) + cost
+            self._changed.notify_all()
+    
+    def stats(self) -> Dict[str, Any]:
+        """지출/건너뜀 통계를 반환합니다"""
+        return {
+            "spent": self.total_spent,
+            "spent_by_provider": dict(self.spent),
+            "skipped": dict(self.skipped),
+            "stopped": dict(self.stopped)
+        }
@@ -0,0 +1,269 @@
+"""
+동시 실행 엔진
+
+시나리오 × 프로바이더 매트릭스 전체를 한 번에 스케줄링하고,
+전역 동시 실행 상한과 프로바이더별 상한을 함께 적용합니다.
+예산이 주어지면 예상 작업량이 큰 작업부터 배치하고(LPT, 전체 소요 시간 단축),
+보내기 전에 비용을 예약해 예산이나 마감 시간에 닿은 작업은 건너뜁니다.
+결과를 모으지 않는 모드와 스트리밍 모드(stream)에서는 프로바이더별로 진행 중인 작업 수만큼만
+작업을 만들어, 완료 결과가 결과 싱크로 빠져나가는 속도에 맞춰 다음 작업을 시작합니다 (메모리 일정).
+"""
+import time
+import inspect
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
+
+from .budget import BUDGET_DEADLINE, CostEstimate, RunBudget
+
+
+@dataclass
+class ExecutionJob:
+    """실행 단위 (시나리오 1개 × 프로바이더 1개)"""
+    api_name: str
+    scenario_index: int
+    scenario: Dict[str, Any]
+    repetition: int = 0  # 반복 순번 (--repeat)
+
+
+@dataclass
+class ExecutionOutcome:
+    """실행 결과"""
+    job: ExecutionJob
+    response: Any = None
+    error: Optional[str] = None
+    queue_wait: float = 0.0  # 동시 실행 슬롯을 기다린 시간 (초)
+    skipped: Optional[str] = None  # 예산/마감 시간 때문에 보내지 않은 이유 (BUDGET_*)
+
+
+# 동시 실행 상한이 없을 때 스트리밍 모드에서 프로바이더별로 만들어 둘 작업 수
+_DEFAULT_STREAM_WINDOW = 256
+
+
+class ConcurrentExecutor:
+    """전역/프로바이더별 동시 실행 상한을 가진 비동기 실행 엔진"""
+    
+    def __init__(self,
+                 max_concurrency: int = 0,
+                 provider_limits: Optional[Dict[str, int]] = None):
+        """
+        실행 엔진 초기화
+        
+        Args:
+            max_concurrency: 전체 동시 실행 상한 (0 이하이면 제한 없음)
+            provider_limits: 프로바이더 이름별 동시 실행 상한 (0 이하이면 제한 없음)
+        """
+        self.max_concurrency = max_concurrency
+        self.provider_limits = provider_limits or {}
+        self._global_semaphore: Optional[asyncio.Semaphore] = None
+        self._provider_semaphores: Dict[str, Optional[asyncio.Semaphore]] = {}
+    
+    def _get_provider_semaphore(self, api_name: str) -> Optional[asyncio.Semaphore]:
+        """프로바이더별 세마포어를 가져오거나 생성합니다"""
+        if api_name not in self._provider_semaphores:
+            limit = self.provider_limits.get(api_name, 0)
+            self._provider_semaphores[api_name] = asyncio.Semaphore(limit) if limit > 0 else None
+        return self._provider_semaphores[api_name]
+    
+    async def run(self,
+                  jobs: Iterable[ExecutionJob],
+                  handler: Callable[[ExecutionJob], Awaitable[Any]],
+                  on_complete: Optional[Callable[[ExecutionOutcome], Optional[Awaitable[None]]]] = None,
+                  budget: Optional[RunBudget] = None,
+                  estimate: Optional[Callable[[ExecutionJob], CostEstimate]] = None,
+                  collect: bool = True) -> List[ExecutionOutcome]:
+        """
+        모든 작업을 동시에 스케줄링하고 결과를 모읍니다
+        
+        Args:
+            jobs: 실행할 작업 목록
+            handler: 작업 1개를 실행하는 코루틴 함수
+            on_complete: 작업 완료 시 호출되는 콜백 (진행 상황 출력/결과 싱크용, 코루틴이면 완료될 때까지 대기)
+            budget: 비용/시간 예산 (None이면 제한 없음)
+            estimate: 작업 1개의 예상 비용 구성을 계산하는 함수 (budget과 함께 사용)
+            collect: 실행 결과를 모아 반환할지 여부 (False면 on_complete에 넘긴 뒤 버리고 빈 목록 반환)
+        
+        Returns:
+            List[ExecutionOutcome]: 입력 순서대로 정렬된 실행 결과
+        """
+        self._reset()
+        
+        jobs = list(jobs)
+        estimates: List[Optional[CostEstimate]] = [None] * len(jobs)
+        order = list(range(len(jobs)))
+        if budget is not None and estimate is not None:
+            estimates = [estimate(job) for job in jobs]
+            # 세마포어는 먼저 기다린 순서로 슬롯을 주므로, 예상 작업량이 큰 작업부터 생성
+            order.sort(key=lambda i: estimates[i].expected_work, reverse=True)
+            budget.start()
+        
+        if not collect:
+            by_provider: Dict[str, List[Tuple[ExecutionJob, Optional[CostEstimate]]]] = {}
+            for i in order:
+                by_provider.setdefault(jobs[i].api_name, []).append((jobs[i], estimates[i]))
+            await asyncio.gather(*(
+                self._feed(items, handler, on_complete, budget, self._window(api_name, len(items)))
+                for api_name, items in by_provider.items()
+            ))
+            return []
+        
+        tasks = {
+            i: asyncio.create_task(self._run_job(jobs[i], handler, on_complete, budget, estimates[i]))
+            for i in order
+        }
+        await asyncio.gather(*tasks.values())
+        return [tasks[i].result() for i in range(len(jobs))]
+    
+    async def stream(self,
+                     job_streams: Dict[str, Iterable[ExecutionJob]],
+                     handler: Callable[[ExecutionJob], Awaitable[Any]],
+                     on_complete: Optional[Callable[[ExecutionOutcome], Optional[Awaitable[None]]]] = None,
+                     budget: Optional[RunBudget] = None,
+                     estimate: Optional[Callable[[ExecutionJob], CostEstimate]] = None):
+        """
+        프로바이더별 작업 스트림을 끝까지 읽으며 실행합니다 (작업 목록을 메모리에 올리지 않음)
+        
+        프로바이더마다 자기 스트림을 따로 읽으므로 느린 프로바이더가 다른 프로바이더의 작업 시작을
+        막지 않습니다. 작업 순서를 알 수 없어 예산이 있어도 LPT 정렬은 하지 않습니다.
+        
+        Args:
+            job_streams: 프로바이더 이름 → 작업 스트림 (지연 생성 가능)
+            handler: 작업 1개를 실행하는 코루틴 함수
+            on_complete: 작업 완료 시 호출되는 콜백 (결과는 이 콜백으로만 전달)
+            budget: 비용/시간 예산 (None이면 제한 없음)
+            estimate: 작업 1개의 예상 비용 구성을 계산하는 함수 (budget과 함께 사용)
+        """
+        self._reset()
+        budgeted = budget is not None and estimate is not None
+        if budgeted:
+            budget.start()
+        
+        def items(jobs: Iterable[ExecutionJob]):
+            for job in jobs:
+                yield job, estimate(job) if budgeted else None
+        
+        await asyncio.gather(*(
+            self._feed(items(jobs), handler, on_complete, budget, self._window(api_name))
+            for api_name, jobs in job_streams.items()
+        ))
+    
+    def _reset(self):
+        """실행마다 전역/프로바이더별 세마포어를 새로 만듭니다"""
+        if self.max_concurrency > 0:
+            self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        else:
+            self._global_semaphore = None
+        self._provider_semaphores = {}
+    
+    def _window(self, api_name: str, job_count: Optional[int] = None) -> int:
+        """결과를 모으지 않을 때 프로바이더별로 동시에 만들어 둘 작업 수 (슬롯 상한의 2배)"""
+        limits = [limit for limit in (self.provider_limits.get(api_name, 0), self.max_concurrency) if limit > 0]
+        if limits:
+            return min(limits) * 2
+        # 상한이 없으면 작업 전체 (스트림이라 개수를 모르면 기본 창 크기)
+        return job_count if job_count is not None else _DEFAULT_STREAM_WINDOW
+    
+    async def _feed(self,
+                    items: Iterable[Tuple[ExecutionJob, Optional[CostEstimate]]],
+                    handler: Callable[[ExecutionJob], Awaitable[Any]],
+                    on_complete: Optional[Callable[[ExecutionOutcome], Optional[Awaitable[None]]]],
+                    budget: Optional[RunBudget],
+                    window: int):
+        """작업을 순서대로 시작하되 끝나지 않은 작업이 window개를 넘지 않도록 합니다"""
+        slots = asyncio.Semaphore(window)
+        running = set()
+        errors: List[BaseException] = []
+        
+        def done(task: asyncio.Task):
+            running.discard(task)
+            slots.release()
+            if not task.cancelled() and task.exception() is not None:
+                errors.append(task.exception())
+        
+        for job, estimate in items:
+            await slots.acquire()
+            if errors:
+                break
+            task = asyncio.create_task(self._run_job(job, handler, on_complete, budget, estimate))
+            running.add(task)
+            task.add_done_callback(done)
+        await asyncio.gather(*running)
+        if errors:
+            raise errors[0]
+    
+    async def _run_job(self,
+                       job: ExecutionJob,
+                       handler: Callable[[ExecutionJob], Awaitable[Any]],
+                       on_complete: Optional[Callable[[ExecutionOutcome], Optional[Awaitable[None]]]],
+                       budget: Optional[RunBudget] = None,
+                       estimate: Optional[CostEstimate] = None) -> ExecutionOutcome:
+        """슬롯을 확보한 뒤 작업 1개를 실행합니다 (예산이 있으면 비용 예약 후 마감 시간 안에서 실행)"""
+        queued_at_ns = time.perf_counter_ns()
+        provider_semaphore = self._get_provider_semaphore(job.api_name)
+        
+        # 프로바이더 슬롯을 먼저 확보해야 전역 슬롯이 대기 중인 작업에 묶이지 않음
+        async with _optional(provider_semaphore):
+            async with _optional(self._global_semaphore):
+                queue_wait = (time.perf_counter_ns() - queued_at_ns) / 1_000_000_000
+                if budget is not None and estimate is not None:
+                    outcome = await self._run_budgeted(job, handler, budget, estimate, queue_wait)
+                else:
+                    try:
+                        response = await handler(job)
+                        outcome = ExecutionOutcome(job=job, response=response, queue_wait=queue_wait)
+                    except Exception as e:
+                        outcome = ExecutionOutcome(job=job, error=str(e), queue_wait=queue_wait)
+        
+        if on_complete:
+            completed = on_complete(outcome)
+            if inspect.isawaitable(completed):
+                # 결과 싱크가 가득 차 있으면 여기서 기다려 다음 작업 시작을 늦춤 (역압)
+                await completed
+        return outcome
+    
+    async def _run_budgeted(self,
+                            job: ExecutionJob,
+                            handler: Callable[[ExecutionJob], Awaitable[Any]],
+                            budget: RunBudget,
+                            estimate: CostEstimate,
+                            queue_wait: float) -> ExecutionOutcome:
+        """비용을 예약하고 마감 시간 안에서 작업 1개를 실행한 뒤 실제 비용으로 정산합니다"""
+        reason = await budget.reserve(job.api_name, estimate)
+        if reason is not None:
+            return ExecutionOutcome(job=job, skipped=reason, queue_wait=queue_wait)
+        
+        response = None
+        # 진행 중에 취소된 요청은 예약한 비용으로 정산 (업스트림은 이미 과금했을 수 있음)
+        cancelled = False
+        try:
+            response = await asyncio.wait_for(handler(job), timeout=budget.remaining())
+            return ExecutionOutcome(job=job, response=response, queue_wait=queue_wait)
+        except asyncio.TimeoutError:
+            # 마감 시간에 끝나지 않은 요청은 취소하고 건너뛴 것으로 기록
+            cancelled = True
+            budget.record_skip(BUDGET_DEADLINE)
+            return ExecutionOutcome(job=job, skipped=BUDGET_DEADLINE, queue_wait=queue_wait)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except Exception as e:
+            return ExecutionOutcome(job=job, error=str(e), queue_wait=queue_wait)
+        finally:
+            await budget.settle(job.api_name, estimate, response, cancelled=cancelled)
+
+
+class _optional:
+    """세마포어가 없으면 아무것도 하지 않는 비동기 컨텍스트 매니저"""
+    
+    def __init__(self, semaphore: Optional[asyncio.Semaphore]):
+        self.semaphore = semaphore
+    
+    async def __aenter__(self):
+        if self.semaphore is not None:
+            await self.semaphore.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.semaphore is not None:
+            self.semaphore.release()
+        return False
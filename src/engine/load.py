@@ -0,0 +1,237 @@
+"""
+오픈 루프 부하 생성기
+
+이전 요청의 완료를 기다리지 않고 목표 도착률(고정, 포아송, 단계별 증가)에 맞춰 요청을 보냅니다.
+지연 시간은 실제 전송 시각이 아니라 "보내기로 예정된 시각"부터 측정하므로
+큐잉과 coordinated omission 효과가 결과에 그대로 드러납니다.
+"""
+import math
+import time
+import random
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..metrics.histogram import latency_summary
+
+# 지원하는 도착 패턴
+ARRIVAL_PATTERNS = ("constant", "poisson", "ramp")
+
+
+@dataclass
+class RateStep:
+    """목표 도착률 구간"""
+    index: int
+    rate: float       # 초당 요청 수 (프로바이더별)
+    start: float      # 실행 시작 기준 오프셋 (초)
+    duration: float   # 구간 길이 (초)
+
+
+class ArrivalSchedule:
+    """도착 시각 생성기"""
+    
+    def __init__(self,
+                 pattern: str = "constant",
+                 rate: float = 1.0,
+                 duration: float = 30.0,
+                 ramp_to: Optional[float] = None,
+                 steps: int = 5,
+                 seed: Optional[int] = None):
+        """
+        도착 스케줄 초기화
+        
+        Args:
+            pattern: 도착 패턴 ("constant", "poisson", "ramp")
+            rate: 목표 도착률 (초당 요청 수, ramp에서는 시작 도착률)
+            duration: 전체 실행 시간 (초, ramp에서는 단계들이 나눠 가짐)
+            ramp_to: ramp 최종 도착률 (None이면 rate의 steps배)
+            steps: ramp 단계 수
+            seed: 포아송 도착 난수 시드
+        """
+        if pattern not in ARRIVAL_PATTERNS:
+            raise ValueError(f"지원하지 않는 도착 패턴입니다: {pattern} ({', '.join(ARRIVAL_PATTERNS)})")
+        if rate <= 0 or duration <= 0:
+            raise ValueError("도착률과 실행 시간은 0보다 커야 합니다.")
+        
+        self.pattern = pattern
+        self.rate = rate
+        self.duration = duration
+        self.ramp_to = ramp_to if ramp_to is not None else rate * steps
+        self.step_count = max(1, steps) if pattern == "ramp" else 1
+        self.rng = random.Random(seed)
+    
+    def steps(self) -> List[RateStep]:
+        """도착률 구간 목록 (ramp는 시작값에서 최종값까지 선형으로 증가)"""
+        step_duration = self.duration / self.step_count
+        if self.step_count == 1:
+            return [RateStep(index=0, rate=self.rate, start=0.0, duration=self.duration)]
+        
+        increment = (self.ramp_to - self.rate) / (self.step_count - 1)
+        return [
+            RateStep(index=i, rate=self.rate + increment * i, start=step_duration * i, duration=step_duration)
+            for i in range(self.step_count)
+        ]
+    
+    def arrivals(self) -> Iterator[Tuple[float, RateStep]]:
+        """(예정 전송 오프셋, 구간) 순서대로 생성"""
+        for step in self.steps():
+            if self.pattern == "poisson":
+                offset = self.rng.expovariate(step.rate)
+                while offset < step.duration:
+                    yield step.start + offset, step
+                    offset += self.rng.expovariate(step.rate)
+            else:
+                for k in range(math.ceil(step.duration * step.rate)):
+                    yield step.start + k / step.rate, step
+
+
+@dataclass
+class LoadSample:
+    """요청 1건의 측정값"""
+    api_name: str
+    step: int
+    intended_offset: float            # 예정 전송 시각 (실행 시작 기준, 초)
+    send_lag: float = 0.0             # 예정 시각 대비 실제 전송 지연 (초)
+    latency: float = 0.0              # 예정 시각부터 완료까지 (초)
+    service_time: float = 0.0         # 실제 전송부터 완료까지 (초)
+    error: Optional[str] = None
+    dropped: bool = False             # 동시 요청 상한 초과로 보내지 못함
+
+
+@dataclass
+class StepReport:
+    """프로바이더 × 도착률 구간 집계"""
+    api_name: str
+    step: RateStep
+    sent: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    dropped: int = 0
+    latency: Dict[str, float] = field(default_factory=dict)
+    
+    @property
+    def throughput(self) -> float:
+        """달성 처리량 (성공 건수 / 구간 길이, 초당)"""
+        return self.succeeded / self.step.duration if self.step.duration else 0.0
+    
+    @property
+    def error_rate(self) -> float:
+        """오류율 (실패 + 미전송) / 도착 건수"""
+        arrived = self.sent + self.dropped
+        return (self.failed + self.dropped) / arrived if arrived else 0.0
+
+
+class LoadGenerator:
+    """오픈 루프 부하 생성기 (도착마다 선택된 모든 프로바이더에 요청 1건씩)"""
+    
+    def __init__(self,
+                 apis: Dict[str, Any],
+                 schedule: ArrivalSchedule,
+                 request_factory: Callable[[Any, int], Any],
+                 max_in_flight: int = 0):
+        """
+        부하 생성기 초기화
+        
+        Args:
+            apis: 프로바이더 이름 → 인스턴스
+            schedule: 도착 스케줄
+            request_factory: (프로바이더 인스턴스, 요청 번호) → APIResponse 코루틴
+            max_in_flight: 프로바이더별 동시 요청 상한 (0 이하이면 제한 없음, 초과 도착은 dropped로 기록)
+        """
+        self.apis = apis
+        self.schedule = schedule
+        self.request_factory = request_factory
+        self.max_in_flight = max_in_flight
+        self._in_flight: Dict[str, int] = {}
+    
+    async def run(self, on_step: Optional[Callable[[RateStep], None]] = None) -> List[LoadSample]:
+        """
+        스케줄이 끝날 때까지 요청을 보내고 모든 응답을 기다립니다
+        
+        Args:
+            on_step: 새 도착률 구간에 들어설 때 호출되는 콜백 (진행 상황 출력용)
+        
+        Returns:
+            List[LoadSample]: 요청별 측정값
+        """
+        self._in_flight = {name: 0 for name in self.apis}
+        samples: List[LoadSample] = []
+        tasks = []
+        current_step = -1
+        started_at = time.perf_counter()
+        
+        for sequence, (offset, step) in enumerate(self.schedule.arrivals()):
+            if step.index != current_step:
+                current_step = step.index
+                if on_step:
+                    on_step(step)
+            
+            # 예정 시각까지 대기 (이전 요청 완료와 무관하게 전송)
+            delay = started_at + offset - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            for api_name, api_instance in self.apis.items():
+                sample = LoadSample(api_name=api_name, step=step.index, intended_offset=offset)
+                samples.append(sample)
+                if 0 < self.max_in_flight <= self._in_flight[api_name]:
+                    sample.dropped = True
+                    continue
+                self._in_flight[api_name] += 1
+                tasks.append(asyncio.create_task(
+                    self._fire(api_instance, sample, started_at + offset, sequence)
+                ))
+        
+        await asyncio.gather(*tasks)
+        return samples
+    
+    async def _fire(self, api_instance: Any, sample: LoadSample, intended_at: float, sequence: int):
+        """요청 1건 전송 및 측정 (동시 요청 수는 스케줄링 시점에 이미 증가)"""
+        sent_at = time.perf_counter()
+        sample.send_lag = sent_at - intended_at
+        try:
+            response = await self.request_factory(api_instance, sequence)
+            if getattr(response, "error", None):
+                sample.error = response.error
+        except Exception as e:
+            sample.error = str(e)
+        finally:
+            finished_at = time.perf_counter()
+            self._in_flight[sample.api_name] -= 1
+        
+        sample.latency = finished_at - intended_at
+        sample.service_time = finished_at - sent_at
+
+
+def summarize_load(samples: List[LoadSample], schedule: ArrivalSchedule) -> List[StepReport]:
+    """
+    프로바이더 × 도착률 구간별로 처리량, 오류율, 지연 분위수를 집계합니다
+    
+    Args:
+        samples: 요청별 측정값
+        schedule: 실행에 사용한 도착 스케줄
+    
+    Returns:
+        List[StepReport]: 프로바이더 순서 → 구간 순서로 정렬된 집계
+    """
+    steps = {step.index: step for step in schedule.steps()}
+    grouped: Dict[Tuple[str, int], List[LoadSample]] = {}
+    for sample in samples:
+        grouped.setdefault((sample.api_name, sample.step), []).append(sample)
+    
+    api_order = {name: i for i, name in enumerate(dict.fromkeys(s.api_name for s in samples))}
+    reports = []
+    for (api_name, step_index), group in sorted(grouped.items(),
+                                                key=lambda item: (api_order[item[0][0]], item[0][1])):
+        sent = [s for s in group if not s.dropped]
+        succeeded = [s for s in sent if s.error is None]
+        reports.append(StepReport(
+            api_name=api_name,
+            step=steps[step_index],
+            sent=len(sent),
+            succeeded=len(succeeded),
+            failed=len(sent) - len(succeeded),
+            dropped=len(group) - len(sent),
+            latency=latency_summary([s.latency for s in succeeded])
+        ))
+    return reports
@@ -0,0 +1,163 @@
+"""
+스트리밍 결과 싱크
+
+완료된 결과 항목을 제한 크기 큐로 받아 별도 작업에서 실행 로그(NDJSON)에 기록하고,
+보고서 표에 필요한 통계는 프로바이더별로 증분 집계합니다. 메모리에는 집계와 항목별 바이트 위치만
+남기고 응답 내용은 보고서를 쓸 때 디스크에서 1건씩 다시 읽으므로, 호출 수가 수만 건이어도
+메모리 사용량이 거의 일정합니다. 큐가 가득 차면 결과를 넘기는 쪽이 기다립니다 (역압).
+"""
+import asyncio
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..metrics.aggregate import ResultAggregate
+from ..utils.config import settings
+from .run_log import RunLog
+
+# 결과 항목 식별 키 (프로바이더 키(소문자), 시나리오 키(id 또는 이름), 반복 순번)
+StoredKey = Tuple[str, str, int]
+
+
+class StoredResults:
+    """실행 로그에 저장된 결과 (프로바이더별 증분 집계 + 항목별 바이트 위치)"""
+    
+    def __init__(self, run_log: RunLog, api_names: Iterable[str]):
+        """
+        저장 결과 초기화
+        
+        Args:
+            run_log: 결과 항목이 기록되는 실행 로그
+            api_names: 프로바이더 이름 목록 (보고서 출력 순서)
+        """
+        self.run_log = run_log
+        self.aggregates: Dict[str, ResultAggregate] = {api_name.lower(): ResultAggregate() for api_name in api_names}
+        self._offsets: Dict[StoredKey, int] = {}
+    
+    def __contains__(self, key: Tuple[str, str, int]) -> bool:
+        """(프로바이더 이름, 시나리오 이름, 반복 순번) 결과가 저장되어 있는지 여부"""
+        api_name, scenario, repetition = key
+        return (api_name.lower(), scenario, repetition) in self._offsets
+    
+    def __len__(self) -> int:
+        """저장된 결과 항목 수"""
+        return len(self._offsets)
+    
+    def add(self, api_name: str, scenario: str, entry: Dict[str, Any], offset: int, repetition: int = 0):
+        """
+        실행 로그에 기록된 항목 1개를 집계에 반영합니다 (같은 키가 다시 들어오면 무시)
+        
+        Args:
+            api_name: 프로바이더 이름
+            scenario: 시나리오 이름
+            entry: 결과 항목
+            offset: 실행 로그에서 항목의 바이트 위치
+            repetition: 반복 순번
+        """
+        key = (api_name.lower(), scenario, repetition)
+        if key in self._offsets:
+            return
+        self._offsets[key] = offset
+        self.aggregates.setdefault(key[0], ResultAggregate()).add(entry)
+    
+    def aggregate(self, api_key: str) -> Optional[ResultAggregate]:
+        """프로바이더 키(소문자)의 집계 (결과가 없으면 None)"""
+        aggregate = self.aggregates.get(api_key)
+        return aggregate if aggregate is not None and aggregate.count else None
+    
+    def entry(self, api_key: str, scenario: str, repetition: int = 0) -> Optional[Dict[str, Any]]:
+        """시나리오 결과 항목 1개를 실행 로그에서 읽습니다 (없으면 None)"""
+        offset = self._offsets.get((api_key, scenario, repetition))
+        return None if offset is None else self.run_log.read_entry(offset)
+    
+    def iter_entries(self) -> Iterator[Tuple[StoredKey, Dict[str, Any]]]:
+        """저장된 결과 항목을 실행 로그 기록 순서대로 1건씩 읽습니다 (반복 통계용)"""
+        for key, offset in sorted(self._offsets.items(), key=lambda item: item[1]):
+            yield key, self.run_log.read_entry(offset)
+    
+    def counts(self) -> Dict[str, int]:
+        """프로바이더 키별 결과 항목 수"""
+        return {api_key: aggregate.count for api_key, aggregate in self.aggregates.items()}
+
+
+class ResultSink:
+    """결과 항목을 제한 크기 큐로 받아 디스크에 기록하는 비동기 싱크"""
+    
+    def __init__(self, results: StoredResults, queue_size: Optional[int] = None):
+        """
+        결과 싱크 초기화
+        
+        Args:
+            results: 기록한 항목을 반영할 저장 결과 (실행 로그 포함)
+            queue_size: 기록 대기 큐 크기 (None이면 RESULT_QUEUE_SIZE)
+        """
+        self.results = results
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size or settings.result_queue_size))
+        self._writer: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """기록 작업을 시작합니다"""
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._drain())
+    
+    async def put(self, api_name: str, scenario: str, entry: Dict[str, Any], repetition: int = 0):
+        """
+        결과 항목 1개를 기록 대기 큐에 넣습니다 (큐가 가득 차면 자리가 날 때까지 대기)
+        
+        Args:
+            api_name: 프로바이더 이름
+            scenario: 시나리오 이름
+            entry: 결과 항목
+            repetition: 반복 순번
+        """
+        self.start()
+        await self._enqueue((api_name, scenario, entry, repetition))
+    
+    async def _enqueue(self, item: Optional[Tuple[str, str, Dict[str, Any], int]]):
+        """
+        큐에 항목을 넣습니다 (가득 차 있으면 자리가 나거나 기록 작업이 끝날 때까지 대기)
+        
+        기록 작업이 예외로 끝나면 큐가 비워지지 않으므로 기다리지 않고 그 예외를 전달합니다.
+        """
+        self._check_writer()
+        if not self._queue.full():
+            self._queue.put_nowait(item)
+            return
+        put = asyncio.ensure_future(self._queue.put(item))
+        try:
+            await asyncio.wait((put, self._writer), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not put.done():
+                put.cancel()
+        if put.cancelled():
+            self._check_writer()
+    
+    def _check_writer(self):
+        """기록 작업이 끝났으면 그 예외(없으면 RuntimeError)를 전달합니다"""
+        if self._writer.done():
+            self._writer.result()
+            raise RuntimeError("결과 싱크의 기록 작업이 이미 종료되었습니다")
+    
+    async def _drain(self):
+        """큐의 항목을 순서대로 실행 로그에 기록하고 집계에 반영합니다 (fsync는 스레드에서 실행)"""
+        run_log = self.results.run_log
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is None:
+                    return
+                api_name, scenario, entry, repetition = item
+                offset = await asyncio.to_thread(run_log.append, api_name, scenario, entry, repetition)
+                self.results.add(api_name, scenario, entry, offset, repetition)
+            finally:
+                self._queue.task_done()
+    
+    async def close(self):
+        """남은 항목을 모두 기록하고 기록 작업을 종료합니다 (기록 작업이 실패했으면 그 예외를 전달)"""
+        if self._writer is None:
+            return
+        try:
+            if not self._writer.done():
+                await self._enqueue(None)
+            # 기록 작업이 예외로 끝났으면 그 예외를 전달
+            await self._writer
+        finally:
+            self._writer = None
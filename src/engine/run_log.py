@@ -0,0 +1,191 @@
+"""
+추가 전용(append-only) 실행 로그
+
+매트릭스 실행에서 완료된 (프로바이더, 시나리오, 반복) 결과를 끝나는 즉시 JSONL 한 줄로 덧붙이고
+fsync까지 마쳐, 실행이 중간에 죽어도(Ctrl-C, 크래시, 프로바이더 장애) 완료분이 남도록 합니다.
+같은 실행 ID로 다시 열면 기록된 작업은 건너뛰고, 최종 보고서는 로그의 결과로 작성합니다.
+결과를 메모리에 모아 두지 않도록 각 레코드의 바이트 위치로 항목 1개만 다시 읽을 수 있습니다.
+
+형식:
+    {"type": "run", "run_id": "...", "task_type": "questions", "created_at": "..."}
+    {"type": "result", "api_name": "Claude", "scenario": "...", "repetition": 0, "entry": {...}}
+"""
+import os
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ..utils.config import settings
+
+# 완료 결과 식별 키 (프로바이더 이름, 시나리오 키(id 또는 이름), 반복 순번)
+ResultKey = Tuple[str, str, int]
+
+
+class RunLog:
+    """실행 1회의 추가 전용 결과 로그"""
+    
+    def __init__(self, path: str, run_id: str, task_type: str):
+        """
+        실행 로그 초기화 (create/resume 사용)
+        
+        Args:
+            path: 로그 파일 경로
+            run_id: 실행 ID
+            task_type: "questions" 또는 "reports"
+        """
+        self.path = path
+        self.run_id = run_id
+        self.task_type = task_type
+        self._file = None
+        self._reader = None
+    
+    @staticmethod
+    def path_for(run_id: str, log_dir: Optional[str] = None) -> str:
+        """실행 ID의 로그 파일 경로"""
+        return os.path.join(log_dir or settings.run_log_dir, f"{run_id}.jsonl")
+    
+    @classmethod
+    def create(cls, task_type: str, log_dir: Optional[str] = None) -> "RunLog":
+        """
+        새 실행 로그를 만듭니다
+        
+        Args:
+            task_type: "questions" 또는 "reports"
+            log_dir: 로그 디렉토리 (None이면 RUN_LOG_DIR)
+        
+        Returns:
+            RunLog: 헤더가 기록된 실행 로그
+        """
+        run_id = f"{task_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        run_log = cls(cls.path_for(run_id, log_dir), run_id, task_type)
+        os.makedirs(os.path.dirname(run_log.path) or ".", exist_ok=True)
+        run_log._write({
+            "type": "run",
+            "run_id": run_id,
+            "task_type": task_type,
+            "created_at": datetime.now().isoformat(timespec="seconds")
+        })
+        return run_log
+    
+    @classmethod
+    def resume(cls, run_id: str, task_type: str, log_dir: Optional[str] = None) -> "RunLog":
+        """
+        기존 실행 로그를 이어서 씁니다
+        
+        Args:
+            run_id: 실행 ID (로그 파일 이름, .jsonl 제외)
+            task_type: 이번 실행의 작업 유형 (로그와 다르면 오류)
+            log_dir: 로그 디렉토리 (None이면 RUN_LOG_DIR)
+        
+        Returns:
+            RunLog: 이어 쓸 실행 로그
+        
+        Raises:
+            FileNotFoundError: 로그 파일이 없는 경우
+            ValueError: 로그의 작업 유형이 다른 경우
+        """
+        path = cls.path_for(run_id, log_dir)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"실행 로그를 찾을 수 없습니다: {path}")
+        
+        header = next((record for _, record in _read_records(path) if record.get("type") == "run"), {})
+        logged_task_type = header.get("task_type", task_type)
+        if logged_task_type != task_type:
+            raise ValueError(f"실행 로그 {run_id}는 {logged_task_type} 작업입니다 (요청: {task_type})")
+        
+        run_log = cls(path, run_id, task_type)
+        if _ends_torn(path):
+            # 쓰다 만 마지막 줄을 끝내 두어 이어 쓰는 레코드가 붙지 않도록 함
+            run_log._open()
+            run_log._file.write(b"\n")
+            run_log._file.flush()
+        return run_log
+    
+    def entries(self) -> Iterator[Tuple[ResultKey, int, Dict[str, Any]]]:
+        """
+        로그에 기록된 완료 결과를 순서대로 읽습니다 (마지막 줄이 쓰다 만 상태여도 앞부분은 사용)
+        
+        Yields:
+            Tuple[ResultKey, int, Dict[str, Any]]: ((프로바이더, 시나리오, 반복), 바이트 위치, 결과 항목)
+        """
+        for offset, record in _read_records(self.path):
+            if record.get("type") == "result":
+                key = (record["api_name"], record["scenario"], record.get("repetition", 0))
+                yield key, offset, record["entry"]
+    
+    def read_entry(self, offset: int) -> Dict[str, Any]:
+        """바이트 위치의 결과 항목 1개를 읽습니다 (append가 반환한 위치)"""
+        if self._reader is None:
+            self._reader = open(self.path, "rb")
+        self._reader.seek(offset)
+        return json.loads(self._reader.readline())["entry"]
+    
+    def append(self, api_name: str, scenario: str, entry: Dict[str, Any], repetition: int = 0) -> int:
+        """
+        완료된 결과 1건을 덧붙입니다 (fsync 후 반환)
+        
+        Args:
+            api_name: 프로바이더 이름
+            scenario: 시나리오 이름
+            entry: 보고서용 결과 항목
+            repetition: 반복 순번
+        
+        Returns:
+            int: 기록한 레코드의 바이트 위치 (read_entry에 사용)
+        """
+        return self._write({
+            "type": "result",
+            "api_name": api_name,
+            "scenario": scenario,
+            "repetition": repetition,
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+            "entry": entry
+        })
+    
+    def _write(self, record: Dict[str, Any]) -> int:
+        """레코드 1줄 기록 후 바이트 위치 반환 (한 줄씩 flush + fsync)"""
+        self._open()
+        offset = self._file.tell()
+        self._file.write((json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return offset
+    
+    def _open(self):
+        """추가 모드로 로그 파일을 엽니다 (이미 열려 있으면 그대로 사용)"""
+        if self._file is None:
+            self._file = open(self.path, "ab")
+    
+    def close(self):
+        """로그 파일을 닫습니다"""
+        for handle in (self._file, self._reader):
+            if handle is not None:
+                handle.close()
+        self._file = None
+        self._reader = None
+
+
+def _read_records(path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """JSONL 레코드를 바이트 위치와 함께 순서대로 읽습니다 (깨진 줄은 건너뜀)"""
+    with open(path, "rb") as f:
+        offset = 0
+        for line in f:
+            start, offset = offset, offset + len(line)
+            if not line.strip():
+                continue
+            try:
+                yield start, json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # 크래시로 마지막 줄이 잘린 경우
+                continue
+
+
+def _ends_torn(path: str) -> bool:
+    """파일이 줄바꿈 없이 끝나는지 (마지막 레코드를 쓰다가 중단됨) 확인합니다"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
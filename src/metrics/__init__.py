@@ -2,6 +2,17 @@
 성능 메트릭 평가 시스템
 """
 
+from .aggregate import ResultAggregate
+from .bootstrap import RepetitionSamples, bootstrap_ci, compare_samples
 from .evaluator import MetricsEvaluator
+from .histogram import LatencyHistogram, latency_summary
 
-__all__ = ["MetricsEvaluator"] 
\ No newline at end of file
+__all__ = [
+    "MetricsEvaluator",
+    "LatencyHistogram",
+    "latency_summary",
+    "ResultAggregate",
+    "RepetitionSamples",
+    "bootstrap_ci",
+    "compare_samples"
+] 
\ No newline at end of file
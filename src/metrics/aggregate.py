@@ -0,0 +1,127 @@
+"""
+결과 항목 증분 집계
+
+보고서 표에 필요한 합계/개수/지연 시간 히스토그램만 프로바이더별로 누적하고 항목 자체
+(응답 내용, 토큰 간 지연 목록 등)는 보관하지 않으므로, 호출 수와 무관하게 메모리 사용량이 일정합니다.
+"""
+from typing import Any, Dict, Optional
+
+from .histogram import LatencyHistogram
+
+# 대기 시간 분석 표의 항목 (실제 호출만 집계)
+WAIT_FIELDS = ("queue_wait", "rate_limit_wait", "concurrency_wait", "retry_time", "attempts")
+
+# HTTP 전송 구간 표의 항목
+HTTP_TIMING_FIELDS = ("connect", "tls", "request_write", "ttfb", "download")
+
+
+def is_live(entry: Dict[str, Any]) -> bool:
+    """실제 호출 결과인지 (캐시 적중/병합/배치 응답 제외, 지연 시간 집계용)"""
+    return not entry.get("cached") and not entry.get("coalesced") and not entry.get("batched")
+
+
+def _add(totals: Dict[str, float], key: str, value: float):
+    """합계 딕셔너리에 값을 더합니다"""
+    totals[key] = totals.get(key, 0.0) + value
+
+
+class ResultAggregate:
+    """프로바이더 1개의 결과 항목 증분 집계"""
+    
+    def __init__(self):
+        """집계 초기화"""
+        # 전체 항목 (캐시 적중/병합 포함)
+        self.count = 0
+        self.cached = 0
+        self.totals: Dict[str, float] = {}
+        
+        # 실제 호출 (is_live)
+        self.live = 0
+        self.live_totals: Dict[str, float] = {}
+        self.latency = LatencyHistogram()
+        self.ttft = LatencyHistogram()
+        self.itl = LatencyHistogram()
+        self.rate_count = 0
+        self.phase_totals: Dict[str, float] = {}
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.http_count = 0
+        self.http_reused = 0
+        self.http_totals: Dict[str, float] = {}
+        
+        # 업스트림 호출 (디스크 캐시 적중/병합 제외, 프롬프트 캐시 집계용)
+        self.upstream = 0
+        self.upstream_totals: Dict[str, float] = {}
+        self.prompt_cache_hits = 0
+        self.prompt_cache_hit_time = LatencyHistogram()
+        self.prompt_cache_miss_time = LatencyHistogram()
+    
+    def add(self, entry: Dict[str, Any]):
+        """결과 항목 1개를 집계에 반영합니다"""
+        self.count += 1
+        self.cached += bool(entry.get("cached"))
+        _add(self.totals, "cost", entry["cost"])
+        _add(self.totals, "tokens", entry["tokens"])
+        _add(self.totals, "quality", entry.get("quality", 0.0))
+        
+        if not entry.get("cached") and not entry.get("coalesced"):
+            self.upstream += 1
+            for key in ("cache_read_tokens", "cache_write_tokens", "prompt_cache_savings"):
+                _add(self.upstream_totals, key, entry.get(key, 0) or 0)
+            self.prompt_cache_hits += bool(entry.get("cache_read_tokens"))
+        
+        if not is_live(entry):
+            return
+        
+        self.live += 1
+        self.latency.record(entry["response_time"])
+        if entry.get("ttft") is not None:
+            self.ttft.record(entry["ttft"])
+        for itl in entry.get("itl") or []:
+            self.itl.record(itl)
+        if entry.get("tokens_per_second"):
+            self.rate_count += 1
+            _add(self.live_totals, "tokens_per_second", entry["tokens_per_second"])
+        
+        _add(self.live_totals, "cost", entry["cost"])
+        for key in WAIT_FIELDS:
+            _add(self.live_totals, key, entry.get(key, 1 if key == "attempts" else 0.0))
+        for phase, seconds in entry.get("phases", {}).items():
+            _add(self.phase_totals, phase, seconds)
+        
+        if entry.get("hedge_requests"):
+            self.hedged += 1
+            self.hedge_wins += bool(entry.get("hedge_won"))
+            _add(self.live_totals, "hedge_cost", entry.get("hedge_cost", 0.0))
+        
+        timing = entry.get("http_timing")
+        if timing:
+            self.http_count += 1
+            self.http_reused += bool(timing.get("reused"))
+            for key in HTTP_TIMING_FIELDS:
+                _add(self.http_totals, key, timing[key])
+        
+        if entry.get("cache_read_tokens"):
+            self.prompt_cache_hit_time.record(entry["response_time"])
+        else:
+            self.prompt_cache_miss_time.record(entry["response_time"])
+    
+    def average(self, key: str) -> float:
+        """전체 항목 평균 (cost/tokens/quality)"""
+        return self.totals.get(key, 0.0) / self.count if self.count else 0.0
+    
+    def live_average(self, key: str) -> float:
+        """실제 호출 평균 (대기 시간/재시도 등)"""
+        return self.live_totals.get(key, 0.0) / self.live if self.live else 0.0
+    
+    def phase_averages(self) -> Dict[str, float]:
+        """실제 호출의 구간별 평균 소요 시간 (초)"""
+        return {phase: total / self.live for phase, total in self.phase_totals.items()} if self.live else {}
+    
+    def http_averages(self) -> Dict[str, float]:
+        """HTTP 전송 구간별 평균 시간 (초)"""
+        return {key: self.http_totals.get(key, 0.0) / self.http_count for key in HTTP_TIMING_FIELDS}
+    
+    def tokens_per_second(self) -> Optional[float]:
+        """평균 출력 토큰/초 (스트리밍 모드가 아니면 None)"""
+        return self.live_totals["tokens_per_second"] / self.rate_count if self.rate_count else None
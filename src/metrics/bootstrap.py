@@ -0,0 +1,219 @@
+"""
+반복 실행 통계 (부트스트랩 신뢰구간과 효과 크기)
+
+--repeat로 같은 (프로바이더, 시나리오)를 여러 번 실행한 표본에서 평균/p95 응답 시간, 비용, 토큰의
+부트스트랩 백분위 신뢰구간을 NumPy로 계산합니다. 재표본 인덱스를 (재표본 수 × 표본 수) 배열로
+한 번에 뽑아 벡터 연산하되, 표본이 많으면 재표본을 나눠 처리해 메모리를 제한합니다.
+프로바이더 쌍 비교에는 평균 차이의 신뢰구간과 효과 크기(Hedges' g, Cliff's delta)를 함께 계산하고,
+차이의 신뢰구간이 0을 포함하지 않으면 통계적으로 의미 있는 차이로 표시합니다.
+"""
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ..utils.config import settings
+from .aggregate import is_live
+
+# 반복 통계를 내는 결과 항목 필드 → 표시 이름
+REPETITION_METRICS = {
+    "response_time": "응답 시간 (초)",
+    "cost": "비용 ($)",
+    "tokens": "토큰"
+}
+
+# NumPy 설치 여부 (없으면 반복 통계 표를 생략)
+NUMPY_AVAILABLE = np is not None
+
+# 재표본 1회분 배열 원소 수 상한 (재표본 수 × 표본 수가 넘으면 나눠서 계산)
+_MAX_RESAMPLE_CELLS = 4_000_000
+
+# Hedges' g를 계산하지 않는 합동 표준편차 상대 허용 오차 (평균 크기 대비)
+_POOLED_STD_TOLERANCE = 1e-12
+
+
+@dataclass
+class ConfidenceInterval:
+    """통계량 추정값과 부트스트랩 신뢰구간"""
+    estimate: float
+    low: float
+    high: float
+    
+    @property
+    def excludes_zero(self) -> bool:
+        """신뢰구간이 0을 포함하지 않는지 (차이의 통계적 유의성)"""
+        return self.low > 0 or self.high < 0
+
+
+@dataclass
+class ProviderComparison:
+    """프로바이더 쌍의 지표 비교 (difference = a 평균 - b 평균)"""
+    metric: str
+    a: str
+    b: str
+    difference: ConfidenceInterval
+    hedges_g: Optional[float]
+    cliffs_delta: float
+    
+    @property
+    def significant(self) -> bool:
+        """평균 차이의 신뢰구간이 0을 포함하지 않는지"""
+        return self.difference.excludes_zero
+
+
+class RepetitionSamples:
+    """프로바이더별/시나리오별 반복 실행 표본 (실제 호출만, 지표별 float 배열)"""
+    
+    def __init__(self):
+        """표본 초기화"""
+        self._provider: Dict[Tuple[str, str], array] = {}
+        self._scenario: Dict[Tuple[str, str], array] = {}
+        self._repetitions: Dict[Tuple[str, str], int] = {}
+    
+    def add(self, api_key: str, scenario: str, entry: Dict[str, Any]):
+        """결과 항목 1개를 표본에 추가합니다 (캐시 적중/병합/배치 응답 제외)"""
+        if not is_live(entry):
+            return
+        for metric in REPETITION_METRICS:
+            self._provider.setdefault((api_key, metric), array("d")).append(float(entry.get(metric) or 0.0))
+        self._scenario.setdefault((api_key, scenario), array("d")).append(entry["response_time"])
+        self._repetitions[(api_key, scenario)] = self._repetitions.get((api_key, scenario), 0) + 1
+    
+    @property
+    def max_repetitions(self) -> int:
+        """(프로바이더, 시나리오)당 최대 표본 수"""
+        return max(self._repetitions.values(), default=0)
+    
+    def scenarios(self) -> List[str]:
+        """표본이 있는 시나리오 키 목록 (처음 나온 순서)"""
+        return list(dict.fromkeys(scenario for _, scenario in self._scenario))
+    
+    def provider(self, api_key: str, metric: str) -> "np.ndarray":
+        """프로바이더의 지표 표본"""
+        return np.frombuffer(self._provider.get((api_key, metric), array("d")), dtype=np.float64)
+    
+    def scenario(self, api_key: str, scenario: str) -> "np.ndarray":
+        """(프로바이더, 시나리오)의 응답 시간 표본"""
+        return np.frombuffer(self._scenario.get((api_key, scenario), array("d")), dtype=np.float64)
+
+
+def _statistic(samples: "np.ndarray", statistic: str) -> "np.ndarray":
+    """마지막 축 기준 통계량 (mean 또는 p95)"""
+    if statistic == "p95":
+        return np.percentile(samples, 95, axis=-1)
+    return samples.mean(axis=-1)
+
+
+def _bootstrap_distribution(samples: "np.ndarray",
+                            statistic: str,
+                            n_resamples: int,
+                            rng: "np.random.Generator") -> "np.ndarray":
+    """복원 추출 재표본의 통계량 분포 (재표본을 나눠 벡터 계산)"""
+    n = len(samples)
+    chunk = max(1, _MAX_RESAMPLE_CELLS // n)
+    distribution = np.empty(n_resamples)
+    for start in range(0, n_resamples, chunk):
+        size = min(chunk, n_resamples - start)
+        distribution[start:start + size] = _statistic(samples[rng.integers(0, n, size=(size, n))], statistic)
+    return distribution
+
+
+def _interval(estimate: float, distribution: "np.ndarray", confidence: float) -> ConfidenceInterval:
+    """백분위 신뢰구간"""
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(distribution, [alpha, 1 - alpha])
+    return ConfidenceInterval(estimate=float(estimate), low=float(low), high=float(high))
+
+
+def bootstrap_ci(samples: "np.ndarray",
+                 statistic: str = "mean",
+                 n_resamples: Optional[int] = None,
+                 confidence: Optional[float] = None,
+                 seed: Optional[int] = None) -> Optional[ConfidenceInterval]:
+    """
+    통계량의 부트스트랩 백분위 신뢰구간
+    
+    Args:
+        samples: 표본 (1차원)
+        statistic: "mean" 또는 "p95"
+        n_resamples: 재표본 수 (None이면 BOOTSTRAP_RESAMPLES)
+        confidence: 신뢰수준 (None이면 BOOTSTRAP_CONFIDENCE)
+        seed: 난수 시드 (None이면 BOOTSTRAP_SEED, 같은 표본이면 같은 구간)
+    
+    Returns:
+        Optional[ConfidenceInterval]: 추정값과 신뢰구간 (표본이 2개 미만이면 None)
+    """
+    if len(samples) < 2:
+        return None
+    rng = np.random.default_rng(settings.bootstrap_seed if seed is None else seed)
+    distribution = _bootstrap_distribution(samples, statistic, n_resamples or settings.bootstrap_resamples, rng)
+    return _interval(_statistic(samples, statistic), distribution, confidence or settings.bootstrap_confidence)
+
+
+def hedges_g(a: "np.ndarray", b: "np.ndarray") -> Optional[float]:
+    """
+    표준화 평균 차이 (a - b, 소표본 보정한 Cohen's d)
+    
+    Returns:
+        Optional[float]: 효과 크기 (합동 표준편차가 평균 크기에 비해 0에 가까우면 정의되지 않으므로 None)
+    """
+    na, nb = len(a), len(b)
+    pooled = np.sqrt(((na - 1) * a.var(ddof=1) + (nb - 1) * b.var(ddof=1)) / (na + nb - 2))
+    # 상수에 가까운 표본은 부동소수점 오차만 남아 g가 터무니없이 커지므로 상대 허용 오차로 판정
+    if pooled <= _POOLED_STD_TOLERANCE * max(abs(a.mean()), abs(b.mean()), 1):
+        return None
+    correction = 1 - 3 / (4 * (na + nb) - 9)
+    return float((a.mean() - b.mean()) / pooled * correction)
+
+
+def cliffs_delta(a: "np.ndarray", b: "np.ndarray") -> float:
+    """Cliff's delta (a > b인 쌍 비율 - a < b인 쌍 비율, 정렬 후 이진 탐색으로 계산)"""
+    sorted_b = np.sort(b)
+    less = np.searchsorted(sorted_b, a, side="left").sum()
+    greater = (len(b) - np.searchsorted(sorted_b, a, side="right")).sum()
+    return float((less - greater) / (len(a) * len(b)))
+
+
+def compare_samples(metric: str,
+                    a_name: str,
+                    a: "np.ndarray",
+                    b_name: str,
+                    b: "np.ndarray",
+                    n_resamples: Optional[int] = None,
+                    confidence: Optional[float] = None,
+                    seed: Optional[int] = None) -> Optional[ProviderComparison]:
+    """
+    두 프로바이더 표본의 평균 차이 신뢰구간과 효과 크기 (두 표본을 독립적으로 재표본)
+    
+    Returns:
+        Optional[ProviderComparison]: 비교 결과 (어느 한쪽 표본이 2개 미만이면 None)
+    """
+    if len(a) < 2 or len(b) < 2:
+        return None
+    n_resamples = n_resamples or settings.bootstrap_resamples
+    rng = np.random.default_rng(settings.bootstrap_seed if seed is None else seed)
+    difference = _bootstrap_distribution(a, "mean", n_resamples, rng) - _bootstrap_distribution(b, "mean", n_resamples, rng)
+    return ProviderComparison(
+        metric=metric,
+        a=a_name,
+        b=b_name,
+        difference=_interval(a.mean() - b.mean(), difference, confidence or settings.bootstrap_confidence),
+        hedges_g=hedges_g(a, b),
+        cliffs_delta=cliffs_delta(a, b)
+    )
+
+
+def effect_size_label(g: float) -> str:
+    """Hedges' g 크기 구분 (Cohen 기준)"""
+    size = abs(g)
+    if size < 0.2:
+        return "무시할 수준"
+    if size < 0.5:
+        return "작음"
+    if size < 0.8:
+        return "중간"
+    return "큼"
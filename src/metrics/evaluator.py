@@ -3,7 +3,7 @@ API 응답 품질 및 성능 평가 시스템
 """
 import re
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
@@ -55,9 +55,15 @@ class ComparisonResult:
 class MetricsEvaluator:
     """메트릭 평가 클래스"""
     
-    def __init__(self):
-        """평가 시스템 초기화"""
+    def __init__(self, results_path: Optional[str] = None):
+        """
+        평가 시스템 초기화
+        
+        Args:
+            results_path: 비교 결과를 메모리 대신 한 줄씩 덧붙일 NDJSON 파일 (None이면 메모리에 보관)
+        """
         self.results: List[ComparisonResult] = []
+        self.results_path = results_path
         
         if not textstat:
             print("⚠️ textstat 패키지가 설치되지 않았습니다. 가독성 평가가 제한됩니다.")
@@ -86,12 +92,13 @@ class MetricsEvaluator:
     def evaluate_report_quality(self, 
                                report: str, 
                                conversation_history: List[Dict],
-                               prompt: str) -> QualityMetrics:
-        """생성된 보고서의 품질을 평가합니다"""
+                               prompt: str,
+                               expected_sections: Optional[List[str]] = None) -> QualityMetrics:
+        """생성된 보고서의 품질을 평가합니다 (expected_sections: 시나리오 카탈로그의 기대 섹션)"""
         conversation_text = " ".join([msg.get('content', '') for msg in conversation_history])
         relevance_score = self._calculate_relevance(report, conversation_text, prompt)
         clarity_score = self._evaluate_report_clarity(report)
-        structure_score = self._evaluate_report_structure(report)
+        structure_score = self._evaluate_report_structure(report, expected_sections)
         readability_score = self._calculate_readability(report)
         keyword_overlap = self._calculate_keyword_overlap(report, conversation_text)
         overall_score = (relevance_score + clarity_score + structure_score) / 3
@@ -141,7 +148,26 @@ class MetricsEvaluator:
             performance_metrics=performance_metrics,
             error=error
         )
-        self.results.append(result)
+        if self.results_path:
+            # 입력/출력 전문을 메모리에 쌓지 않도록 파일에 바로 기록
+            with open(self.results_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(asdict(result), ensure_ascii=False) + "\n")
+        else:
+            self.results.append(result)
+    
+    def iter_results(self) -> Iterator[Dict[str, Any]]:
+        """비교 결과를 1건씩 반환합니다 (results_path가 있으면 파일에서 순서대로 읽음)"""
+        if not self.results_path:
+            for result in self.results:
+                yield asdict(result)
+            return
+        try:
+            with open(self.results_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        except FileNotFoundError:
+            return
     
     def export_results(self, filename: str, format_type: str = "json"):
         """결과를 파일로 내보냅니다"""
@@ -154,41 +180,63 @@ class MetricsEvaluator:
     
     def _export_to_json(self, filename: str):
         """JSON 형식으로 내보내기"""
-        data = [asdict(result) for result in self.results]
+        # 결과를 1건씩 직렬화해 목록 형식으로 기록
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write("[")
+            count = 0
+            for data in self.iter_results():
+                f.write(",\n  " if count else "\n  ")
+                f.write(json.dumps(data, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+                count += 1
+            f.write("\n]" if count else "]")
         print(f"✅ 결과가 {filename}에 저장되었습니다.")
     
     def _export_to_csv(self, filename: str):
         """CSV 형식으로 내보내기"""
-        # 결과를 평탄화
+        # 결과를 평탄화 (1,000건씩 나눠 이어 쓰기)
         flattened_data = []
-        for result in self.results:
+        written = 0
+        for result in self.iter_results():
+            quality = result['quality_metrics']
+            performance = result['performance_metrics']
             row = {
-                'test_id': result.test_id,
-                'timestamp': result.timestamp,
-                'api_provider': result.api_provider,
-                'task_type': result.task_type,
-                'input_text': result.input_text[:200] + "..." if len(result.input_text) > 200 else result.input_text,
-                'output_text': result.output_text[:200] + "..." if len(result.output_text) > 200 else result.output_text,
-                'relevance_score': result.quality_metrics.relevance_score,
-                'clarity_score': result.quality_metrics.clarity_score,
-                'structure_score': result.quality_metrics.structure_score,
-                'readability_score': result.quality_metrics.readability_score,
-                'keyword_overlap': result.quality_metrics.keyword_overlap,
-                'overall_quality_score': result.quality_metrics.overall_score,
-                'response_time': result.performance_metrics.response_time,
-                'tokens_used': result.performance_metrics.tokens_used,
-                'cost': result.performance_metrics.cost,
-                'success_rate': result.performance_metrics.success_rate,
-                'error': result.error
+                'test_id': result['test_id'],
+                'timestamp': result['timestamp'],
+                'api_provider': result['api_provider'],
+                'task_type': result['task_type'],
+                'input_text': result['input_text'][:200] + "..." if len(result['input_text']) > 200 else result['input_text'],
+                'output_text': result['output_text'][:200] + "..." if len(result['output_text']) > 200 else result['output_text'],
+                'relevance_score': quality['relevance_score'],
+                'clarity_score': quality['clarity_score'],
+                'structure_score': quality['structure_score'],
+                'readability_score': quality['readability_score'],
+                'keyword_overlap': quality['keyword_overlap'],
+                'overall_quality_score': quality['overall_score'],
+                'response_time': performance['response_time'],
+                'tokens_used': performance['tokens_used'],
+                'cost': performance['cost'],
+                'success_rate': performance['success_rate'],
+                'error': result['error']
             }
             flattened_data.append(row)
+            if len(flattened_data) >= 1000:
+                self._append_csv_chunk(filename, flattened_data, written)
+                written += len(flattened_data)
+                flattened_data = []
         
-        df = pd.DataFrame(flattened_data)
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        if flattened_data or not written:
+            self._append_csv_chunk(filename, flattened_data, written)
         print(f"✅ 결과가 {filename}에 저장되었습니다.")
     
+    @staticmethod
+    def _append_csv_chunk(filename: str, rows: List[Dict[str, Any]], written: int):
+        """평탄화한 결과 묶음을 CSV에 기록 (첫 묶음만 헤더 포함)"""
+        df = pd.DataFrame(rows)
+        if written:
+            df.to_csv(filename, mode='a', header=False, index=False, encoding='utf-8')
+        else:
+            df.to_csv(filename, index=False, encoding='utf-8-sig')
+    
     def _calculate_relevance(self, text: str, reference: str, context: str = "") -> float:
         """관련성 점수를 계산합니다"""
         reference_words = set(re.findall(r'\b\w+\b', reference.lower()))
@@ -264,9 +312,9 @@ class MetricsEvaluator:
         
         return min(5.0, score)
     
-    def _evaluate_report_structure(self, report: str) -> float:
-        """보고서의 구조를 평가합니다"""
-        sections = ['요약', '주요', '분석', '결론', 'Summary', 'Main', 'Analysis', 'Conclusion']
+    def _evaluate_report_structure(self, report: str, expected_sections: Optional[List[str]] = None) -> float:
+        """보고서의 구조를 평가합니다 (기대 섹션이 없으면 일반 섹션 이름으로 평가)"""
+        sections = expected_sections or ['요약', '주요', '분석', '결론', 'Summary', 'Main', 'Analysis', 'Conclusion']
         section_count = sum(1 for section in sections if section in report)
         
         score = 2.0 + (section_count / len(sections)) * 3.0
@@ -0,0 +1,169 @@
+"""
+HDR 방식 지연 시간 히스토그램
+
+값을 마이크로초 정수로 기록하고, 2의 거듭제곱 구간마다 128개의 선형 하위 버킷을 두는
+로그 버킷 구조로 집계합니다. 상대 오차 1% 미만으로 분위수를 계산하면서
+표본 수와 무관하게 메모리 사용량이 일정합니다.
+"""
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 2의 거듭제곱 구간당 하위 버킷 비트 수 (2^7 = 128개 → 상대 오차 < 1%)
+SUB_BUCKET_BITS = 7
+_SUB_BUCKET_MASK = (1 << SUB_BUCKET_BITS) - 1
+
+# 값 단위 (초 → 마이크로초)
+_UNITS_PER_SECOND = 1_000_000
+
+# 요약에 포함하는 분위수
+SUMMARY_PERCENTILES = (50, 90, 95, 99)
+
+
+def _bucket_index(value: int) -> int:
+    """정수 값의 버킷 인덱스 (작은 값은 정확히, 큰 값은 로그 구간 + 선형 하위 버킷)"""
+    if value < (1 << SUB_BUCKET_BITS):
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+
+def _bucket_range(index: int) -> Tuple[int, int]:
+    """버킷 인덱스의 [하한, 상한) 정수 범위"""
+    shift = index >> SUB_BUCKET_BITS
+    if shift == 0:
+        return index, index + 1
+    lower = (index & _SUB_BUCKET_MASK) << shift
+    return lower, lower + (1 << shift)
+
+
+class LatencyHistogram:
+    """로그 버킷 지연 시간 히스토그램 (초 단위로 기록/조회)"""
+    
+    def __init__(self, values: Optional[Iterable[float]] = None):
+        """
+        히스토그램 초기화
+        
+        Args:
+            values: 초기 기록값 (초)
+        """
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        
+        for value in values or []:
+            self.record(value)
+    
+    def record(self, seconds: float):
+        """값 하나를 기록합니다 (음수는 0으로 기록)"""
+        seconds = max(0.0, seconds)
+        index = _bucket_index(int(round(seconds * _UNITS_PER_SECOND)))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        
+        self.count += 1
+        self.total += seconds
+        self.total_squares += seconds * seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+    
+    def merge(self, other: "LatencyHistogram"):
+        """다른 히스토그램을 합칩니다"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+    
+    @property
+    def mean(self) -> float:
+        """평균 (초)"""
+        return self.total / self.count if self.count else 0.0
+    
+    @property
+    def stddev(self) -> float:
+        """표본 표준편차 (초)"""
+        if self.count < 2:
+            return 0.0
+        variance = (self.total_squares - self.count * self.mean ** 2) / (self.count - 1)
+        return math.sqrt(max(0.0, variance))
+    
+    def percentile(self, q: float) -> float:
+        """
+        분위수를 반환합니다 (버킷 중앙값, 최소/최댓값 범위로 제한)
+        
+        Args:
+            q: 분위 (0~100)
+        
+        Returns:
+            float: 분위수 (초, 기록이 없으면 0.0)
+        """
+        if not self.count:
+            return 0.0
+        
+        target = max(1, math.ceil(self.count * q / 100.0))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                lower, upper = _bucket_range(index)
+                value = (lower + upper - 1) / 2 / _UNITS_PER_SECOND
+                return min(max(value, self.min), self.max)
+        return self.max
+    
+    def summary(self) -> Dict[str, float]:
+        """표본 수, 평균, 표준편차, p50/p90/p95/p99, 최댓값 (기록이 없으면 빈 딕셔너리)"""
+        if not self.count:
+            return {}
+        
+        summary = {"count": self.count, "mean": self.mean, "stddev": self.stddev}
+        for q in SUMMARY_PERCENTILES:
+            summary[f"p{q}"] = self.percentile(q)
+        summary["max"] = self.max
+        return summary
+    
+    def ascii_lines(self, rows: int = 8, width: int = 30) -> List[str]:
+        """
+        간단한 ASCII 히스토그램 (최소~최대 구간을 로그 간격으로 나눔)
+        
+        Args:
+            rows: 최대 행 수
+            width: 막대 최대 길이 (문자)
+        
+        Returns:
+            List[str]: "  1.20s–1.85s │█████ 3" 형식의 행 목록
+        """
+        if not self.count:
+            return []
+        
+        low = max(self.min, 1e-3)
+        high = max(self.max, low)
+        rows = 1 if high <= low * 1.01 else rows
+        edges = [low * (high / low) ** (i / rows) for i in range(rows + 1)]
+        
+        row_counts = [0] * rows
+        for index, count in self.counts.items():
+            lower, upper = _bucket_range(index)
+            value = (lower + upper - 1) / 2 / _UNITS_PER_SECOND
+            row = 0
+            while row < rows - 1 and value >= edges[row + 1]:
+                row += 1
+            row_counts[row] += count
+        
+        peak = max(row_counts)
+        lines = []
+        for row, count in enumerate(row_counts):
+            bar = "█" * (round(count / peak * width) if peak else 0)
+            if count and not bar:
+                bar = "▏"
+            lines.append(f"{edges[row]:7.2f}s–{edges[row + 1]:.2f}s │{bar} {count}")
+        return lines
+
+
+def latency_summary(values: Iterable[float]) -> Dict[str, float]:
+    """값 목록을 히스토그램으로 집계해 요약합니다 (값이 없으면 빈 딕셔너리)"""
+    return LatencyHistogram(values).summary()
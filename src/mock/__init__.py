@@ -0,0 +1,8 @@
+"""
+오프라인 모의 LLM 서버 패키지
+"""
+
+from .latency import LatencyModel
+from .server import EndpointProfile, MockConfig, MockLLMServer
+
+__all__ = ["LatencyModel", "EndpointProfile", "MockConfig", "MockLLMServer"]
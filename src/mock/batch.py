@@ -0,0 +1,186 @@
+"""
+모의 배치 API 저장소
+
+Anthropic Message Batches(/v1/messages/batches)와 OpenAI Files + Batch(/v1/files, /v1/batches)
+형식을 흉내 냅니다. 요청은 제출 시점에 바로 렌더링해 두고, 설정한 처리 시간이 지나면
+종료 상태와 결과 파일을 돌려줍니다.
+"""
+import json
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _iso(timestamp: float) -> str:
+    """RFC 3339 시각 문자열 (Anthropic 배치 객체용)"""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+class MockBatchStore:
+    """모의 배치/파일 저장소 (스레드 안전)"""
+    
+    def __init__(self, delay: float = 2.0):
+        """
+        저장소 초기화
+        
+        Args:
+            delay: 제출부터 처리 완료까지 걸리는 시간 (초)
+        """
+        self.delay = delay
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._batches: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def _ended(self, batch: Dict[str, Any]) -> bool:
+        """처리 시간이 지났는지 여부"""
+        return time.time() - batch["created_at"] >= self.delay
+    
+    def add_file(self, data: bytes, filename: str, purpose: str) -> Dict[str, Any]:
+        """파일을 저장하고 OpenAI 파일 객체를 반환합니다"""
+        file_id = f"file-{uuid.uuid4().hex[:24]}"
+        meta = {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed"
+        }
+        with self._lock:
+            self._files[file_id] = {"meta": meta, "data": data}
+        return meta
+    
+    def file_content(self, file_id: str) -> Optional[bytes]:
+        """파일 내용 (없으면 None)"""
+        with self._lock:
+            stored = self._files.get(file_id)
+        return stored["data"] if stored else None
+    
+    def create_anthropic(self, requests: List[Dict[str, Any]],
+                         render: Callable[[Dict[str, Any]], Dict[str, Any]],
+                         base_url: str) -> Dict[str, Any]:
+        """
+        Message Batch를 생성합니다
+        
+        Args:
+            requests: {"custom_id", "params"} 목록
+            render: 요청 파라미터 → Messages API 응답 본문
+            base_url: results_url에 쓰일 서버 주소
+        """
+        batch_id = f"msgbatch_{uuid.uuid4().hex[:24]}"
+        results = [
+            {"custom_id": item["custom_id"], "result": {"type": "succeeded", "message": render(item["params"])}}
+            for item in requests
+        ]
+        batch = {"id": batch_id, "created_at": time.time(), "results": results}
+        with self._lock:
+            self._batches[batch_id] = batch
+        return self.anthropic_batch(batch_id, base_url)
+    
+    def anthropic_batch(self, batch_id: str, base_url: str) -> Optional[Dict[str, Any]]:
+        """Message Batch 객체 (없으면 None)"""
+        with self._lock:
+            batch = self._batches.get(batch_id)
+        if batch is None or "results" not in batch:
+            return None
+        
+        ended = self._ended(batch)
+        count = len(batch["results"])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else count,
+                "succeeded": count if ended else 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0
+            },
+            "created_at": _iso(batch["created_at"]),
+            "expires_at": _iso(batch["created_at"] + 24 * 3600),
+            "ended_at": _iso(batch["created_at"] + self.delay) if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{base_url}/v1/messages/batches/{batch_id}/results" if ended else None
+        }
+    
+    def anthropic_results(self, batch_id: str) -> Optional[bytes]:
+        """결과 JSONL (없거나 처리 중이면 None)"""
+        with self._lock:
+            batch = self._batches.get(batch_id)
+        if batch is None or "results" not in batch or not self._ended(batch):
+            return None
+        return "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in batch["results"]).encode("utf-8")
+    
+    def create_openai(self, payload: Dict[str, Any],
+                      render: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        입력 파일의 요청을 렌더링해 배치를 생성합니다 (입력 파일이 없으면 None)
+        
+        Args:
+            payload: {"input_file_id", "endpoint", "completion_window"}
+            render: 요청 본문 → chat-completions 응답 본문
+        """
+        data = self.file_content(payload.get("input_file_id", ""))
+        if data is None:
+            return None
+        
+        lines = []
+        for raw in data.decode("utf-8").splitlines():
+            if not raw.strip():
+                continue
+            request = json.loads(raw)
+            lines.append(json.dumps({
+                "id": f"batch_req_{uuid.uuid4().hex[:24]}",
+                "custom_id": request["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "request_id": uuid.uuid4().hex,
+                    "body": render(request.get("body", {}))
+                },
+                "error": None
+            }, ensure_ascii=False))
+        output = self.add_file(("\n".join(lines) + "\n").encode("utf-8"), "batch_output.jsonl", "batch_output")
+        
+        batch_id = f"batch_{uuid.uuid4().hex[:24]}"
+        batch = {
+            "id": batch_id,
+            "created_at": time.time(),
+            "count": len(lines),
+            "output_file_id": output["id"],
+            "request": payload
+        }
+        with self._lock:
+            self._batches[batch_id] = batch
+        return self.openai_batch(batch_id)
+    
+    def openai_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """OpenAI 배치 객체 (없으면 None)"""
+        with self._lock:
+            batch = self._batches.get(batch_id)
+        if batch is None or "request" not in batch:
+            return None
+        
+        ended = self._ended(batch)
+        request = batch["request"]
+        return {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": request.get("endpoint", "/v1/chat/completions"),
+            "input_file_id": request.get("input_file_id"),
+            "completion_window": request.get("completion_window", "24h"),
+            "status": "completed" if ended else "in_progress",
+            "output_file_id": batch["output_file_id"] if ended else None,
+            "error_file_id": None,
+            "created_at": int(batch["created_at"]),
+            "completed_at": int(batch["created_at"] + self.delay) if ended else None,
+            "request_counts": {
+                "total": batch["count"],
+                "completed": batch["count"] if ended else 0,
+                "failed": 0
+            },
+            "errors": None
+        }
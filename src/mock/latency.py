@@ -0,0 +1,99 @@
+"""
+모의 서버 지연 시간 분포
+
+고정값, 로그정규 분포, 기록된 히스토그램 재생 중 하나로 응답 지연(첫 토큰까지 시간)을 뽑습니다.
+"""
+import json
+import math
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class LatencyModel:
+    """지연 시간 분포 (초 단위 샘플 생성)"""
+    
+    def __init__(self,
+                 kind: str = "fixed",
+                 value: float = 0.0,
+                 median: float = 0.0,
+                 sigma: float = 0.0,
+                 buckets: Optional[List[Tuple[float, float]]] = None,
+                 samples: Optional[List[float]] = None):
+        """
+        지연 시간 분포 초기화
+        
+        Args:
+            kind: 분포 종류 ("fixed", "lognormal", "histogram")
+            value: 고정 지연 (초, fixed)
+            median: 중앙값 (초, lognormal)
+            sigma: 로그 공간 표준편차 (lognormal)
+            buckets: [(상한 초, 빈도), ...] 기록된 히스토그램 (histogram)
+            samples: 기록된 개별 지연 값 목록 (histogram, buckets 대신 사용 가능)
+        """
+        if kind not in ("fixed", "lognormal", "histogram"):
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {kind}")
+        if kind == "histogram" and not (buckets or samples):
+            raise ValueError("histogram 분포에는 buckets 또는 samples가 필요합니다.")
+        
+        self.kind = kind
+        self.value = value
+        self.median = median
+        self.sigma = sigma
+        self.buckets = sorted(buckets or [])
+        self.samples = list(samples or [])
+    
+    @classmethod
+    def from_spec(cls, spec: Any) -> "LatencyModel":
+        """
+        설정값에서 분포를 생성합니다
+        
+        Args:
+            spec: 숫자(고정 지연) 또는 {"type": ..., ...} 딕셔너리.
+                  histogram은 "buckets"/"samples"를 직접 넣거나 "file"로 JSON 파일을 지정
+        """
+        if isinstance(spec, (int, float)):
+            return cls(kind="fixed", value=float(spec))
+        
+        spec = dict(spec)
+        if "file" in spec:
+            with open(spec.pop("file"), "r", encoding="utf-8") as f:
+                recorded = json.load(f)
+            # 파일은 샘플 목록 또는 {"buckets": [...]} / {"samples": [...]} 형식
+            spec.update({"samples": recorded} if isinstance(recorded, list) else recorded)
+        
+        return cls(
+            kind=spec.get("type", "fixed"),
+            value=float(spec.get("value", 0.0)),
+            median=float(spec.get("median", 0.0)),
+            sigma=float(spec.get("sigma", 0.0)),
+            buckets=[(float(upper), float(count)) for upper, count in spec.get("buckets", [])],
+            samples=[float(v) for v in spec.get("samples", [])]
+        )
+    
+    def sample(self, rng: random.Random) -> float:
+        """지연 시간 하나를 뽑습니다 (초)"""
+        if self.kind == "fixed":
+            return self.value
+        
+        if self.kind == "lognormal":
+            if self.median <= 0:
+                return 0.0
+            return rng.lognormvariate(math.log(self.median), self.sigma)
+        
+        if self.samples:
+            return rng.choice(self.samples)
+        
+        # 빈도에 비례해 버킷을 고르고 버킷 구간 안에서 균등하게 뽑음
+        uppers = [upper for upper, _ in self.buckets]
+        weights = [count for _, count in self.buckets]
+        index = rng.choices(range(len(uppers)), weights=weights)[0]
+        lower = uppers[index - 1] if index > 0 else 0.0
+        return rng.uniform(lower, uppers[index])
+    
+    def describe(self) -> Dict[str, Any]:
+        """분포 요약 (서버 시작 시 출력용)"""
+        if self.kind == "fixed":
+            return {"type": "fixed", "value": self.value}
+        if self.kind == "lognormal":
+            return {"type": "lognormal", "median": self.median, "sigma": self.sigma}
+        return {"type": "histogram", "buckets": len(self.buckets), "samples": len(self.samples)}
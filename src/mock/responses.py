@@ -0,0 +1,58 @@
+"""
+모의 서버 기본 응답 본문
+
+프롬프트 템플릿이 요구하는 START JSON 형식을 그대로 따르므로 평가기와 보고서 생성 경로가
+실제 응답과 같은 방식으로 동작합니다. (START의 두 번째 "T" 키가 중복되므로 문자열로 보관)
+"""
+
+QUESTION_BODY = """```json
+{
+  "S": {
+    "꼬리질문": "인턴십을 시작했을 때 회사 인스타그램 계정의 팔로워 수와 게시 빈도는 어느 정도였나요?",
+    "실무예시": "입사 당시 팔로워 1,200명, 주 1회 게시로 참여율이 1% 미만인 상황",
+    "기업어필": "현황을 수치로 파악하고 문제를 정의하는 분석력"
+  },
+  "T": {
+    "꼬리질문": "6개월 동안 달성해야 했던 구체적인 목표나 KPI는 무엇이었나요?",
+    "실무예시": "분기 내 팔로워 50% 증가, 게시물 평균 참여율 3% 달성",
+    "기업어필": "목표를 스스로 구체화하고 책임지는 태도"
+  },
+  "A": {
+    "꼬리질문": "목표 달성을 위해 어떤 콘텐츠 전략과 실행 방법을 사용했나요?",
+    "실무예시": "주 3회 정기 게시, 릴스 A/B 테스트, 해시태그 성과 주간 리포트 작성",
+    "기업어필": "가설을 세우고 데이터로 검증하며 실행하는 능력"
+  },
+  "R": {
+    "꼬리질문": "인턴십이 끝났을 때 팔로워와 참여율은 어떻게 바뀌었나요?",
+    "실무예시": "팔로워 1,200명 → 3,400명(183% 증가), 평균 참여율 0.8% → 4.1%",
+    "기업어필": "정량적 성과로 기여도를 증명하는 표현"
+  },
+  "T": {
+    "꼬리질문": "이 경험에서 배운 점을 입사 후 어떤 업무에 활용할 수 있을까요?",
+    "실무예시": "콘텐츠 성과 지표를 주간 단위로 추적하는 습관을 신규 채널 운영에 적용",
+    "기업어필": "경험을 일반화해 다음 업무에 적용하는 학습 능력"
+  }
+}
+```"""
+
+REPORT_BODY = """```json
+{
+  "START_분석": {
+    "S": "5명으로 구성된 팀이 3개월 일정의 프로젝트를 진행하며 역할 분담 문제로 갈등이 발생",
+    "T": "리더로서 갈등을 해소하고 일정 내 결과물을 완성해야 하는 과제",
+    "A": "1:1 면담으로 의견을 수렴하고 주간 회의에서 역할과 마감 기준을 재정의",
+    "R": "일정 지연 없이 프로젝트를 마감하고 팀 평가 최고 점수 획득",
+    "T": "갈등의 원인은 기준의 부재이며, 합의된 규칙이 협업 속도를 높인다는 점을 학습"
+  },
+  "핵심_역량": {
+    "전문_역량": "일정 관리, 역할 분담 설계, 진행 현황 문서화",
+    "소프트_스킬": "경청 기반 갈등 조정, 합의 도출, 동기 부여",
+    "성장_잠재력": "회고를 통한 개선 습관과 리더십 확장 가능성"
+  }
+}
+```"""
+
+
+def pick_body(prompt: str, question_body: str = QUESTION_BODY, report_body: str = REPORT_BODY) -> str:
+    """프롬프트 종류(질문 생성/보고서)에 맞는 응답 본문을 고릅니다"""
+    return report_body if "보고서" in prompt or "핵심_역량" in prompt else question_body
@@ -0,0 +1,610 @@
+"""
+오프라인 모의 LLM 서버
+
+Anthropic Messages(/v1/messages), OpenAI chat-completions(/v1/chat/completions),
+HyperClovaX(/testapp/v1/chat-completions/HCX-003) 전송 형식을 스트리밍 포함으로 흉내 냅니다.
+Anthropic Message Batches와 OpenAI Files + Batch 엔드포인트도 제공해 배치 모드를 오프라인으로 확인할 수 있습니다.
+Anthropic cache_control 마커는 처음 보는 접두부를 캐시 기록, 다시 보는 접두부를 캐시 읽기 토큰으로 보고합니다.
+엔드포인트별로 첫 토큰까지 지연 분포, 토큰 처리량, 오류율, 동시 처리 상한을 설정할 수 있어
+실제 API 비용이나 프로바이더 잡음 없이 하네스 자체를 벤치마크할 수 있습니다.
+"""
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from .batch import MockBatchStore
+from .latency import LatencyModel
+from .responses import QUESTION_BODY, REPORT_BODY, pick_body
+
+# 엔드포인트 이름 (설정 파일의 "endpoints" 키)
+ENDPOINTS = ("anthropic", "openai", "hyperclova")
+
+
+@dataclass
+class EndpointProfile:
+    """엔드포인트별 응답 특성"""
+    latency: LatencyModel = field(default_factory=LatencyModel)  # 첫 토큰까지 지연
+    tokens_per_second: float = 50.0  # 출력 토큰 처리량 (0 이하이면 지연 없이 전송)
+    error_rate: float = 0.0          # 오류 응답 비율 (0~1)
+    error_status: int = 503          # 오류 응답 상태 코드
+    max_concurrency: int = 0         # 동시 처리 상한 (초과 요청은 429, 0 이하이면 제한 없음)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EndpointProfile":
+        """설정 딕셔너리에서 생성"""
+        return cls(
+            latency=LatencyModel.from_spec(data.get("latency", 0.0)),
+            tokens_per_second=float(data.get("tokens_per_second", 50.0)),
+            error_rate=float(data.get("error_rate", 0.0)),
+            error_status=int(data.get("error_status", 503)),
+            max_concurrency=int(data.get("max_concurrency", 0))
+        )
+
+
+@dataclass
+class MockConfig:
+    """모의 서버 설정"""
+    endpoints: Dict[str, EndpointProfile] = field(
+        default_factory=lambda: {name: EndpointProfile() for name in ENDPOINTS}
+    )
+    question_body: str = QUESTION_BODY
+    report_body: str = REPORT_BODY
+    seed: Optional[int] = None
+    batch_delay: float = 2.0  # 배치 제출부터 처리 완료까지 (초)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MockConfig":
+        """
+        설정 딕셔너리에서 생성
+        
+        형식:
+            {"seed": 42,
+             "default": {"latency": {"type": "lognormal", "median": 0.4, "sigma": 0.5},
+                         "tokens_per_second": 80},
+             "endpoints": {"hyperclova": {"latency": {"type": "histogram", "file": "hcx.json"}}},
+             "responses": {"question": "question.txt", "report": "report.txt"},
+             "batch_delay": 5}
+        """
+        default = data.get("default", {})
+        endpoints = {
+            name: EndpointProfile.from_dict({**default, **data.get("endpoints", {}).get(name, {})})
+            for name in ENDPOINTS
+        }
+        
+        responses = data.get("responses", {})
+        return cls(
+            endpoints=endpoints,
+            question_body=_read_text(responses["question"]) if "question" in responses else QUESTION_BODY,
+            report_body=_read_text(responses["report"]) if "report" in responses else REPORT_BODY,
+            seed=data.get("seed"),
+            batch_delay=float(data.get("batch_delay", 2.0))
+        )
+    
+    @classmethod
+    def from_file(cls, path: str) -> "MockConfig":
+        """JSON 설정 파일에서 생성"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def _read_text(path: str) -> str:
+    """응답 본문 파일 읽기"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _tokenize(text: str) -> List[str]:
+    """출력 텍스트를 스트리밍 청크(단어 + 뒤따르는 공백) 단위로 나눕니다"""
+    return re.findall(r"\S+\s*|\s+", text)
+
+
+def _count_input_tokens(prompt: str) -> int:
+    """입력 토큰 수 추정 (한국어 기준 단어당 약 3토큰)"""
+    return max(1, int(len(prompt.split()) * 3.0))
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """모의 프로바이더 요청 처리기 (keep-alive 유지를 위해 HTTP/1.1 + chunked 스트리밍)"""
+    
+    protocol_version = "HTTP/1.1"
+    server: "MockLLMServer"
+    
+    def log_message(self, format: str, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+    
+    def do_GET(self):
+        """상태 확인 (/health)과 배치/파일 조회"""
+        path = self.path.split("?", 1)[0].rstrip("/")
+        batches = self.server.batches
+        if path == "/health":
+            self._send_json(200, {"status": "ok", "requests": dict(self.server.request_counts)})
+            return
+        
+        match = re.fullmatch(r"/v1/messages/batches/([\w-]+)(/results)?", path)
+        if match and match.group(2):
+            self._send_found(batches.anthropic_results(match.group(1)), "application/binary")
+        elif match:
+            self._send_found(batches.anthropic_batch(match.group(1), self._base_url()))
+        elif re.fullmatch(r"/v1/batches/[\w-]+", path):
+            self._send_found(batches.openai_batch(path.rsplit("/", 1)[1]))
+        elif re.fullmatch(r"/v1/files/[\w-]+/content", path):
+            self._send_found(batches.file_content(path.split("/")[3]), "application/octet-stream")
+        else:
+            self._send_json(404, {"error": {"message": f"not found: {self.path}"}})
+    
+    def do_POST(self):
+        """경로에 따라 프로바이더 형식으로 응답"""
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path.endswith("/messages/batches") or path.endswith("/files") or path.endswith("/batches"):
+            self._handle_batch_post(path)
+            return
+        
+        if path.endswith("/messages"):
+            endpoint = "anthropic"
+        elif path.endswith("/chat/completions"):
+            endpoint = "openai"
+        elif path.endswith("/chat-completions/HCX-003"):
+            endpoint = "hyperclova"
+        else:
+            self._send_json(404, {"error": {"message": f"not found: {self.path}"}})
+            return
+        
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": {"message": "invalid JSON body"}})
+            return
+        
+        self.server.count(endpoint)
+        profile = self.server.config.endpoints[endpoint]
+        
+        # 동시 처리 상한 초과 (적응형 동시성 한도 동작 확인용)
+        if not self.server.enter(endpoint, profile.max_concurrency):
+            self._send_json(429, {"error": {"message": "mock concurrency limit exceeded"}})
+            return
+        try:
+            self._handle_completion(endpoint, payload, profile)
+        finally:
+            self.server.leave(endpoint)
+    
+    def _handle_completion(self, endpoint: str, payload: Dict[str, Any], profile: EndpointProfile):
+        """오류 주입 후 엔드포인트 형식으로 응답"""
+        # 오류 주입 (재시도/서킷 브레이커 동작 확인용)
+        if profile.error_rate > 0 and self.server.rng.random() < profile.error_rate:
+            time.sleep(profile.latency.sample(self.server.rng))
+            headers = {"retry-after": "1"} if profile.error_status == 429 else {}
+            self._send_json(profile.error_status, {"error": {"message": "mock injected error"}}, headers)
+            return
+        
+        getattr(self, f"_handle_{endpoint}")(payload, profile)
+    
+    def _prepare(self, prompt: str, max_tokens: Optional[int]):
+        """응답 본문 선택 → (청크 목록, 입력 토큰 수)"""
+        config = self.server.config
+        chunks = _tokenize(pick_body(prompt, config.question_body, config.report_body))
+        if max_tokens:
+            chunks = chunks[:int(max_tokens)]
+        return chunks, _count_input_tokens(prompt)
+    
+    def _prompt_cache_usage(self, messages: List[Dict[str, Any]], input_tokens: int) -> Dict[str, int]:
+        """
+        cache_control 블록까지의 접두부를 서버 캐시와 비교해 Anthropic usage 토큰을 나눕니다
+        
+        처음 보는 접두부는 기록(cache_creation), 이미 본 접두부는 읽기(cache_read)로 집계합니다.
+        """
+        prefix = _cache_control_prefix(messages)
+        cached_tokens = min(_count_input_tokens(prefix), input_tokens - 1) if prefix else 0
+        if cached_tokens <= 0:
+            return {"input_tokens": input_tokens}
+        
+        hit = self.server.remember_prefix(prefix)
+        return {
+            "input_tokens": input_tokens - cached_tokens,
+            "cache_creation_input_tokens": 0 if hit else cached_tokens,
+            "cache_read_input_tokens": cached_tokens if hit else 0
+        }
+    
+    def _handle_anthropic(self, payload: Dict[str, Any], profile: EndpointProfile):
+        """Anthropic Messages API 형식"""
+        prompt = _last_user_text(payload.get("messages", []))
+        chunks, input_tokens = self._prepare(prompt, payload.get("max_tokens"))
+        input_usage = self._prompt_cache_usage(payload.get("messages", []), input_tokens)
+        model = payload.get("model", "mock")
+        message_id = f"msg_{uuid.uuid4().hex[:24]}"
+        
+        if not payload.get("stream"):
+            self._sleep_generation(profile, len(chunks))
+            self._send_json(200, _anthropic_message(payload, chunks, input_usage, message_id))
+            return
+        
+        self._start_stream()
+        self._sse({"type": "message_start", "message": {
+            "id": message_id, "type": "message", "role": "assistant", "model": model,
+            "content": [], "stop_reason": None, "stop_sequence": None,
+            "usage": {**input_usage, "output_tokens": 1}
+        }}, event="message_start")
+        self._sse({"type": "content_block_start", "index": 0,
+                   "content_block": {"type": "text", "text": ""}}, event="content_block_start")
+        for text in self._paced(chunks, profile):
+            self._sse({"type": "content_block_delta", "index": 0,
+                       "delta": {"type": "text_delta", "text": text}}, event="content_block_delta")
+        self._sse({"type": "content_block_stop", "index": 0}, event="content_block_stop")
+        self._sse({"type": "message_delta",
+                   "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                   "usage": {"output_tokens": len(chunks)}}, event="message_delta")
+        self._sse({"type": "message_stop"}, event="message_stop")
+        self._end_stream()
+    
+    def _handle_openai(self, payload: Dict[str, Any], profile: EndpointProfile):
+        """OpenAI chat-completions 형식 (Grok 등 OpenAI 호환 API 공용)"""
+        prompt = _last_user_text(payload.get("messages", []))
+        max_tokens = payload.get("max_completion_tokens") or payload.get("max_tokens")
+        chunks, input_tokens = self._prepare(prompt, max_tokens)
+        usage = {
+            "prompt_tokens": input_tokens,
+            "completion_tokens": len(chunks),
+            "total_tokens": input_tokens + len(chunks)
+        }
+        base = {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "created": int(time.time()),
+            "model": payload.get("model", "mock")
+        }
+        
+        if not payload.get("stream"):
+            self._sleep_generation(profile, len(chunks))
+            self._send_json(200, _openai_completion(base, chunks, usage))
+            return
+        
+        self._start_stream()
+        chunk_base = {**base, "object": "chat.completion.chunk"}
+        for i, text in enumerate(self._paced(chunks, profile)):
+            delta = {"role": "assistant", "content": text} if i == 0 else {"content": text}
+            self._sse({**chunk_base, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]})
+        self._sse({**chunk_base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+        if payload.get("stream_options", {}).get("include_usage"):
+            self._sse({**chunk_base, "choices": [], "usage": usage})
+        self._sse_raw("data: [DONE]\n\n")
+        self._end_stream()
+    
+    def _handle_hyperclova(self, payload: Dict[str, Any], profile: EndpointProfile):
+        """HyperClovaX chat-completions (HCX-003) 형식"""
+        prompt = _last_user_text(payload.get("messages", []))
+        chunks, input_tokens = self._prepare(prompt, payload.get("maxTokens"))
+        content = "".join(chunks)
+        
+        if "text/event-stream" not in self.headers.get("Accept", ""):
+            self._sleep_generation(profile, len(chunks))
+            self._send_json(200, {
+                "status": {"code": "20000", "message": "OK"},
+                "result": {
+                    "message": {"role": "assistant", "content": content},
+                    "inputLength": input_tokens,
+                    "outputLength": len(chunks),
+                    "stopReason": "stop_before"
+                }
+            })
+            return
+        
+        self._start_stream()
+        for i, text in enumerate(self._paced(chunks, profile)):
+            self._sse({
+                "message": {"role": "assistant", "content": text},
+                "index": 0,
+                "inputLength": input_tokens,
+                "outputLength": i + 1,
+                "stopReason": None
+            }, event="token", event_id=str(i))
+        self._sse({
+            "message": {"role": "assistant", "content": content},
+            "index": 0,
+            "inputLength": input_tokens,
+            "outputLength": len(chunks),
+            "stopReason": "stop_before"
+        }, event="result", event_id=str(len(chunks)))
+        self._end_stream()
+    
+    def _handle_batch_post(self, path: str):
+        """배치 생성과 파일 업로드 (지연/오류 주입 없이 즉시 응답)"""
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        batches = self.server.batches
+        
+        if path.endswith("/files"):
+            upload = self._multipart_file(body)
+            if upload is None:
+                self._send_json(400, {"error": {"message": "multipart file field is required"}})
+                return
+            self._send_json(200, batches.add_file(*upload))
+            return
+        
+        try:
+            payload = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": {"message": "invalid JSON body"}})
+            return
+        
+        if path.endswith("/messages/batches"):
+            self.server.count("anthropic")
+            self._send_json(200, batches.create_anthropic(
+                payload.get("requests", []), self._render_anthropic, self._base_url()
+            ))
+        else:
+            self.server.count("openai")
+            self._send_found(batches.create_openai(payload, self._render_openai))
+    
+    def _render_anthropic(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """배치 요청 1건의 Messages API 응답 본문"""
+        messages = params.get("messages", [])
+        chunks, input_tokens = self._prepare(_last_user_text(messages), params.get("max_tokens"))
+        input_usage = self._prompt_cache_usage(messages, input_tokens)
+        return _anthropic_message(params, chunks, input_usage, f"msg_{uuid.uuid4().hex[:24]}")
+    
+    def _render_openai(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """배치 요청 1건의 chat-completions 응답 본문"""
+        max_tokens = body.get("max_completion_tokens") or body.get("max_tokens")
+        chunks, input_tokens = self._prepare(_last_user_text(body.get("messages", [])), max_tokens)
+        base = {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "created": int(time.time()),
+            "model": body.get("model", "mock")
+        }
+        usage = {
+            "prompt_tokens": input_tokens,
+            "completion_tokens": len(chunks),
+            "total_tokens": input_tokens + len(chunks)
+        }
+        return _openai_completion(base, chunks, usage)
+    
+    def _multipart_file(self, body: bytes) -> Optional[Tuple[bytes, str, str]]:
+        """multipart/form-data 업로드에서 (내용, 파일 이름, purpose) 추출"""
+        content_type = self.headers.get("Content-Type", "")
+        message = BytesParser(policy=default_policy).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body
+        )
+        if not message.is_multipart():
+            return None
+        
+        fields = {}
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            fields[name] = (part.get_payload(decode=True) or b"", part.get_filename())
+        if "file" not in fields:
+            return None
+        data, filename = fields["file"]
+        purpose = fields.get("purpose", (b"batch", None))[0].decode("utf-8")
+        return data, filename or "upload.jsonl", purpose
+    
+    def _base_url(self) -> str:
+        """요청한 클라이언트 기준 서버 주소 (배치 results_url용)"""
+        host = self.headers.get("Host")
+        return f"http://{host}" if host else self.server.base_url
+    
+    def _sleep_generation(self, profile: EndpointProfile, output_tokens: int):
+        """비스트리밍 응답: 첫 토큰 지연 + 전체 토큰 생성 시간만큼 대기"""
+        delay = profile.latency.sample(self.server.rng)
+        if profile.tokens_per_second > 0:
+            delay += output_tokens / profile.tokens_per_second
+        time.sleep(delay)
+    
+    def _paced(self, chunks: List[str], profile: EndpointProfile):
+        """스트리밍 응답: 첫 청크 전 지연, 이후 처리량에 맞춰 청크 간격 유지"""
+        time.sleep(profile.latency.sample(self.server.rng))
+        interval = 1.0 / profile.tokens_per_second if profile.tokens_per_second > 0 else 0.0
+        for i, text in enumerate(chunks):
+            if i and interval:
+                time.sleep(interval)
+            yield text
+    
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        """JSON 응답 전송"""
+        self._send_bytes(status, json.dumps(body, ensure_ascii=False).encode("utf-8"), "application/json", headers)
+    
+    def _send_bytes(self, status: int, data: bytes, content_type: str,
+                    headers: Optional[Dict[str, str]] = None):
+        """본문 전송 (Content-Length 지정)"""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _send_found(self, body: Any, content_type: str = "application/json"):
+        """조회 결과 전송 (None이면 404, bytes는 그대로, 그 외는 JSON)"""
+        if body is None:
+            self._send_json(404, {"error": {"message": f"not found: {self.path}"}})
+        elif isinstance(body, bytes):
+            self._send_bytes(200, body, content_type)
+        else:
+            self._send_json(200, body)
+    
+    def _start_stream(self):
+        """SSE 스트림 시작 (chunked 전송)"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+    
+    def _sse(self, data: Dict[str, Any], event: Optional[str] = None, event_id: Optional[str] = None):
+        """SSE 이벤트 하나를 전송"""
+        lines = []
+        if event_id is not None:
+            lines.append(f"id: {event_id}")
+        if event:
+            lines.append(f"event: {event}")
+        lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+        self._sse_raw("\n".join(lines) + "\n\n")
+    
+    def _sse_raw(self, text: str):
+        """chunked 인코딩으로 텍스트 전송 (즉시 flush)"""
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+    
+    def _end_stream(self):
+        """chunked 스트림 종료"""
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def _anthropic_message(payload: Dict[str, Any], chunks: List[str], input_usage: Dict[str, int],
+                       message_id: str) -> Dict[str, Any]:
+    """Anthropic Messages API 비스트리밍 응답 본문 (input_usage: 입력/캐시 토큰 usage 필드)"""
+    return {
+        "id": message_id,
+        "type": "message",
+        "role": "assistant",
+        "model": payload.get("model", "mock"),
+        "content": [{"type": "text", "text": "".join(chunks)}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {**input_usage, "output_tokens": len(chunks)}
+    }
+
+
+def _openai_completion(base: Dict[str, Any], chunks: List[str], usage: Dict[str, int]) -> Dict[str, Any]:
+    """OpenAI chat-completions 비스트리밍 응답 본문"""
+    return {
+        **base,
+        "object": "chat.completion",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": "".join(chunks)},
+            "finish_reason": "stop"
+        }],
+        "usage": usage
+    }
+
+
+def _last_user_text(messages: List[Dict[str, Any]]) -> str:
+    """마지막 user 메시지의 텍스트 (Anthropic 콘텐츠 블록 형식 포함)"""
+    for message in reversed(messages):
+        if message.get("role") != "user":
+            continue
+        content = message.get("content", "")
+        if isinstance(content, list):
+            return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+        return str(content)
+    return ""
+
+
+def _cache_control_prefix(messages: List[Dict[str, Any]]) -> str:
+    """마지막 cache_control 블록까지의 텍스트 (마커가 없으면 빈 문자열)"""
+    texts = []
+    prefix = ""
+    for message in messages:
+        content = message.get("content", "")
+        blocks = content if isinstance(content, list) else [{"text": str(content)}]
+        for block in blocks:
+            if not isinstance(block, dict):
+                continue
+            texts.append(block.get("text", ""))
+            if block.get("cache_control"):
+                prefix = "".join(texts)
+    return prefix
+
+
+class MockLLMServer(ThreadingHTTPServer):
+    """모의 LLM 서버 (요청마다 스레드, keep-alive 지원)"""
+    
+    daemon_threads = True
+    
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 8787,
+                 config: Optional[MockConfig] = None,
+                 verbose: bool = False):
+        """
+        모의 서버 초기화 (port=0이면 빈 포트 자동 할당)
+        
+        Args:
+            host: 바인드 주소
+            port: 포트
+            config: 엔드포인트 설정 (None이면 기본값)
+            verbose: 요청 로그 출력 여부
+        """
+        super().__init__((host, port), MockRequestHandler)
+        self.config = config or MockConfig()
+        self.verbose = verbose
+        self.rng = random.Random(self.config.seed)
+        self.batches = MockBatchStore(delay=self.config.batch_delay)
+        self.request_counts: Dict[str, int] = {name: 0 for name in ENDPOINTS}
+        self.in_flight: Dict[str, int] = {name: 0 for name in ENDPOINTS}
+        self._counts_lock = threading.Lock()
+        self._cached_prefixes: set = set()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        """서버 기본 URL"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def provider_env(self) -> Dict[str, str]:
+        """프로바이더가 이 서버를 바라보도록 하는 환경 변수"""
+        return {
+            "ANTHROPIC_BASE_URL": self.base_url,
+            "OPENAI_BASE_URL": f"{self.base_url}/v1",
+            "GROK_BASE_URL": f"{self.base_url}/v1",
+            "HYPERCLOVA_API_GATEWAY_URL": self.base_url
+        }
+    
+    def count(self, endpoint: str):
+        """엔드포인트별 요청 수 집계"""
+        with self._counts_lock:
+            self.request_counts[endpoint] += 1
+    
+    def enter(self, endpoint: str, limit: int) -> bool:
+        """처리 중 요청 수를 늘립니다 (상한을 넘으면 늘리지 않고 False)"""
+        with self._counts_lock:
+            if 0 < limit <= self.in_flight[endpoint]:
+                return False
+            self.in_flight[endpoint] += 1
+        return True
+    
+    def leave(self, endpoint: str):
+        """처리 중 요청 수를 줄입니다"""
+        with self._counts_lock:
+            self.in_flight[endpoint] -= 1
+    
+    def handle_error(self, request, client_address):
+        """클라이언트가 먼저 끊은 연결(헤지/레이스 취소)은 정상 흐름이므로 로그를 남기지 않음"""
+        error = sys.exc_info()[1]
+        if isinstance(error, (BrokenPipeError, ConnectionResetError)) and not self.verbose:
+            return
+        super().handle_error(request, client_address)
+    
+    def remember_prefix(self, prefix: str) -> bool:
+        """프롬프트 캐시 접두부 기록 (이미 있으면 True)"""
+        with self._counts_lock:
+            hit = prefix in self._cached_prefixes
+            self._cached_prefixes.add(prefix)
+        return hit
+    
+    def start(self) -> "MockLLMServer":
+        """백그라운드 스레드에서 서버 시작 (부하 테스트 등에 내장할 때 사용)"""
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-llm-server", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """서버 중지"""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -3,5 +3,7 @@
 """
 
 from .test_scenarios import TestScenarios
+from .catalog import ScenarioCatalog, scenario_catalog
+from .workload import Workload
 
-__all__ = ["TestScenarios"] 
\ No newline at end of file
+__all__ = ["TestScenarios", "ScenarioCatalog", "scenario_catalog", "Workload"] 
\ No newline at end of file
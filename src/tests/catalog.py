@@ -0,0 +1,151 @@
+"""
+시나리오 카탈로그
+
+시나리오 정의를 데이터 파일(JSONL, .jsonl.gz)에서 한 번만 읽어 id/작업 유형/카테고리/언어/태그/스위트
+색인을 만들어 둡니다. 기본 스위트는 scenarios/*.jsonl(파일 이름이 스위트 이름)이고, SCENARIO_FILES로
+외부 스위트를 더할 수 있습니다. CLI, 부하 생성기, 품질 평가가 같은 카탈로그를 공유하므로
+호출마다 시나리오 목록을 다시 만들지 않고 색인에서 바로 고릅니다.
+
+레코드 형식은 워크로드와 같습니다 (workload.py 참고, language/tags 필드 추가):
+    {"id": "job_prep_01", "name": "...", "user_input": "...", "context": "...",
+     "category": "job_preparation", "language": "ko", "tags": ["start"]}
+"""
+import os
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ..utils.config import settings
+from .workload import WorkloadCase, open_text, record_type, to_case
+
+# 기본 시나리오 데이터 디렉토리
+SCENARIO_DIR = Path(__file__).parent / "scenarios"
+
+# 색인 필드
+_INDEX_FIELDS = ("task_type", "category", "language", "tag", "suite")
+
+
+class ScenarioCatalog:
+    """데이터 파일 기반 시나리오 카탈로그 (처음 조회할 때 한 번 읽어 색인)"""
+    
+    def __init__(self, paths: Optional[Iterable[str]] = None):
+        """
+        카탈로그 초기화 (파일은 처음 조회할 때 읽음)
+        
+        Args:
+            paths: 읽을 데이터 파일 목록 (None이면 기본 스위트 + SCENARIO_FILES)
+        """
+        self.paths = list(paths) if paths is not None else None
+        self._cases: Dict[str, WorkloadCase] = {}
+        # 필드 → 값 → 시나리오 id 목록 (읽은 순서 유지)
+        self._index: Dict[str, Dict[str, List[str]]] = {field: {} for field in _INDEX_FIELDS}
+        self._loaded = False
+    
+    def _default_paths(self) -> List[str]:
+        """기본 스위트 파일과 SCENARIO_FILES의 외부 스위트 파일"""
+        paths = [str(path) for path in sorted(SCENARIO_DIR.glob("*.jsonl"))]
+        paths.extend(path.strip() for path in settings.scenario_files.split(",") if path.strip())
+        return paths
+    
+    def _ensure_loaded(self):
+        """아직 읽지 않았으면 데이터 파일을 읽어 색인합니다"""
+        if self._loaded:
+            return
+        for path in self.paths if self.paths is not None else self._default_paths():
+            self.load(path)
+        self._loaded = True
+    
+    def load(self, path: str, suite: Optional[str] = None) -> int:
+        """
+        데이터 파일 1개를 읽어 카탈로그에 추가합니다
+        
+        Args:
+            path: JSONL(.gz) 파일 경로
+            suite: 스위트 이름 (None이면 파일 이름에서 확장자를 뺀 값)
+        
+        Returns:
+            int: 추가한 시나리오 수
+        
+        Raises:
+            ValueError: 잘못된 JSON 줄이나 이미 있는 id가 있는 경우
+        """
+        suite = suite or os.path.basename(path).split(".")[0]
+        added = 0
+        with open_text(path) as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{line_number} JSON 형식이 아닙니다: {e}")
+                if "id" not in record:
+                    raise ValueError(f"{path}:{line_number} 시나리오 id가 없습니다")
+                self._add(to_case(record, record_type(record)), record_type(record), suite)
+                added += 1
+        return added
+    
+    def _add(self, case: WorkloadCase, task_type: str, suite: str):
+        """시나리오 1개를 색인에 추가합니다"""
+        if case.id in self._cases:
+            raise ValueError(f"중복된 시나리오 id입니다: {case.id} ({suite})")
+        self._cases[case.id] = case
+        keys = {
+            "task_type": [task_type],
+            "category": [case.category],
+            "language": [case.language],
+            "tag": case.tags,
+            "suite": [suite]
+        }
+        for field, values in keys.items():
+            for value in values:
+                self._index[field].setdefault(value, []).append(case.id)
+    
+    def __len__(self) -> int:
+        """시나리오 수"""
+        self._ensure_loaded()
+        return len(self._cases)
+    
+    def get(self, scenario_id: str) -> Optional[WorkloadCase]:
+        """id로 시나리오 1개 조회 (없으면 None)"""
+        self._ensure_loaded()
+        return self._cases.get(scenario_id)
+    
+    def counts(self, field: str) -> Dict[str, int]:
+        """색인 필드(task_type/category/language/tag/suite)의 값별 시나리오 수"""
+        self._ensure_loaded()
+        return {value: len(ids) for value, ids in self._index[field].items()}
+    
+    def query(self,
+              task_type: Optional[str] = None,
+              category: Optional[str] = None,
+              language: Optional[str] = None,
+              tags: Iterable[str] = (),
+              suite: Optional[str] = None) -> List[WorkloadCase]:
+        """
+        조건을 모두 만족하는 시나리오 목록 (색인 교집합, 가장 짧은 색인 목록 순서)
+        
+        Args:
+            task_type: "questions" 또는 "reports"
+            category: 카테고리
+            language: 언어 코드 (예: "ko", "en")
+            tags: 모두 가지고 있어야 하는 태그
+            suite: 스위트 이름 (데이터 파일 이름)
+        
+        Returns:
+            List[WorkloadCase]: 읽은 순서대로의 시나리오 목록 (조건이 없으면 전체)
+        """
+        self._ensure_loaded()
+        conditions = [("task_type", task_type), ("category", category), ("language", language), ("suite", suite)]
+        conditions.extend(("tag", tag) for tag in tags)
+        id_lists = [self._index[field].get(value, []) for field, value in conditions if value is not None]
+        if not id_lists:
+            return list(self._cases.values())
+        
+        id_lists.sort(key=len)
+        others = [set(ids) for ids in id_lists[1:]]
+        return [self._cases[scenario_id] for scenario_id in id_lists[0] if all(scenario_id in ids for ids in others)]
+
+
+# 전역 시나리오 카탈로그 (CLI/부하 생성/품질 평가 공용)
+scenario_catalog = ScenarioCatalog()
@@ -0,0 +1,192 @@
+"""
+JSONL 워크로드 로더
+
+질문/보고서 요청을 한 줄에 하나씩 담은 JSONL(또는 gzip으로 압축한 .jsonl.gz) 파일을
+한 줄씩 읽어 TestCase/ReportTestCase로 변환합니다. 필터, 샘플링, 샤딩을 읽는 도중에 적용하므로
+파일 전체를 메모리에 올리지 않고, 반복할 때마다 파일을 처음부터 다시 읽는 지연 소스라서
+프로바이더별로 같은 워크로드를 따로 순회할 수 있습니다.
+
+레코드 형식:
+    질문: {"id": "q1", "name": "...", "user_input": "...", "context": "...", "category": "..."}
+    보고서: {"id": "r1", "name": "...", "conversation_history": [...], "prompt": "...", "expected_sections": [...]}
+"""
+import gzip
+import json
+import zlib
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from .test_scenarios import ReportTestCase, TestCase
+
+WorkloadCase = Union[TestCase, ReportTestCase]
+
+
+class Workload:
+    """JSONL(.gz) 파일 기반 지연 워크로드"""
+    
+    def __init__(self,
+                 path: str,
+                 task_type: str = "questions",
+                 filters: Optional[Dict[str, str]] = None,
+                 sample: Optional[float] = None,
+                 shard: Optional[Tuple[int, int]] = None,
+                 limit: Optional[int] = None,
+                 seed: int = 0):
+        """
+        워크로드 초기화 (파일은 순회할 때 엽니다)
+        
+        Args:
+            path: JSONL 파일 경로 (.gz이면 gzip으로 읽음)
+            task_type: "questions" 또는 "reports" (다른 종류의 레코드는 건너뜀)
+            filters: 레코드 필드 → 값 (모두 일치하는 레코드만 사용, 예: {"category": "job_preparation"})
+            sample: 레코드를 남길 비율 (0~1, id 해시 기반이라 순회마다 같은 레코드가 선택됨)
+            shard: (샤드 번호, 샤드 수) - 필터/샘플링을 통과한 레코드를 번갈아 나눠 해당 샤드만 사용
+            limit: 최대 레코드 수
+            seed: 샘플링 해시 시드
+        """
+        if task_type not in ("questions", "reports"):
+            raise ValueError(f"지원하지 않는 작업 유형입니다: {task_type}")
+        if sample is not None and not 0 < sample <= 1:
+            raise ValueError(f"샘플 비율은 0 초과 1 이하여야 합니다: {sample}")
+        if shard is not None and not 0 <= shard[0] < shard[1]:
+            raise ValueError(f"샤드 번호는 0 이상 샤드 수 미만이어야 합니다: {shard[0]}/{shard[1]}")
+        
+        self.path = path
+        self.task_type = task_type
+        self.filters = dict(filters or {})
+        self.sample = sample
+        self.shard = shard
+        self.limit = limit
+        self.seed = seed
+        # 마지막 순회에서 건너뛴 잘못된 줄 수
+        self.invalid_lines = 0
+    
+    def describe(self) -> str:
+        """적용된 옵션 설명"""
+        options = [f"{key}={value}" for key, value in self.filters.items()]
+        if self.sample is not None:
+            options.append(f"샘플 {self.sample:.0%}")
+        if self.shard is not None:
+            options.append(f"샤드 {self.shard[0]}/{self.shard[1]}")
+        if self.limit is not None:
+            options.append(f"최대 {self.limit:,}건")
+        return f"{self.path}" + (f" ({', '.join(options)})" if options else "")
+    
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """필터/샘플링/샤딩/개수 제한을 적용한 레코드를 한 줄씩 반환합니다"""
+        self.invalid_lines = 0
+        selected = 0
+        passed = 0
+        with open_text(self.path) as f:
+            for line_number, line in enumerate(f, 1):
+                if self.limit is not None and selected >= self.limit:
+                    return
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    self.invalid_lines += 1
+                    continue
+                if not isinstance(record, dict) or record_type(record) != self.task_type:
+                    continue
+                
+                record.setdefault("id", f"line_{line_number}")
+                if not self._matches(record):
+                    continue
+                
+                # 샤딩은 선택된 레코드에 번갈아 적용 (샘플링 후에도 샤드 크기가 고르게 유지)
+                passed += 1
+                if self.shard is not None and (passed - 1) % self.shard[1] != self.shard[0]:
+                    continue
+                selected += 1
+                yield record
+    
+    def _matches(self, record: Dict[str, Any]) -> bool:
+        """필터와 샘플링 조건을 만족하는지 확인합니다"""
+        for key, value in self.filters.items():
+            if str(record.get(key)) != value:
+                return False
+        if self.sample is not None:
+            digest = zlib.crc32(f"{self.seed}:{record['id']}".encode("utf-8"))
+            return digest / 0x100000000 < self.sample
+        return True
+    
+    def __iter__(self) -> Iterator[WorkloadCase]:
+        """레코드를 TestCase/ReportTestCase로 변환해 반환합니다"""
+        for record in self.records():
+            yield to_case(record, self.task_type)
+    
+    def scenarios(self) -> "WorkloadScenarios":
+        """매트릭스 실행 형식(시나리오 딕셔너리)의 재순회 가능한 뷰"""
+        return WorkloadScenarios(self)
+
+
+class WorkloadScenarios:
+    """워크로드를 매트릭스 실행 시나리오 딕셔너리로 순회하는 뷰 (순회마다 파일을 다시 읽음)"""
+    
+    def __init__(self, workload: Workload):
+        self.workload = workload
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for case in self.workload:
+            yield to_scenario(case)
+
+
+def to_scenario(case: WorkloadCase) -> Dict[str, Any]:
+    """테스트 케이스를 매트릭스 실행 시나리오 딕셔너리로 변환합니다 (보고서는 기대 섹션 포함)"""
+    if isinstance(case, TestCase):
+        return {"id": case.id, "name": case.name, "user_response": case.user_input, "context": case.context}
+    return {
+        "id": case.id,
+        "name": case.name,
+        "user_response": "\n".join(
+            turn["content"] for turn in case.conversation_history if turn["role"] == "user"
+        ),
+        "context": case.prompt,
+        "expected_sections": case.expected_sections
+    }
+
+
+def open_text(path: str):
+    """JSONL 파일을 텍스트 모드로 엽니다 (.gz는 압축을 풀며 스트리밍)"""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def record_type(record: Dict[str, Any]) -> str:
+    """레코드 종류 ("task" 필드가 없으면 대화 기록 유무로 판단)"""
+    task = record.get("task")
+    if task in ("questions", "reports"):
+        return task
+    return "reports" if "conversation_history" in record else "questions"
+
+
+def to_case(record: Dict[str, Any], task_type: str) -> WorkloadCase:
+    """레코드를 테스트 케이스로 변환합니다 (매트릭스 형식 user_response/context 별칭 허용)"""
+    record_id = str(record["id"])
+    name = record.get("name") or record_id
+    category = record.get("category", "general")
+    language = record.get("language", "ko")
+    tags = list(record.get("tags") or [])
+    if task_type == "questions":
+        return TestCase(
+            id=record_id,
+            name=name,
+            user_input=record.get("user_input", record.get("user_response", "")),
+            context=record.get("context", ""),
+            expected_questions=record.get("expected_questions", 5),
+            category=category,
+            language=language,
+            tags=tags
+        )
+    return ReportTestCase(
+        id=record_id,
+        name=name,
+        conversation_history=record.get("conversation_history", []),
+        prompt=record.get("prompt", record.get("context", "")),
+        expected_sections=record.get("expected_sections", []),
+        category=category,
+        language=language,
+        tags=tags
+    )
@@ -2,7 +2,7 @@
 환경 설정 및 API 키 관리 모듈
 """
 import os
-from typing import Optional
+from typing import Any, Optional
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 
@@ -14,6 +14,15 @@ class Settings(BaseSettings):
     
     # Claude API 설정
     anthropic_api_key: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
+    anthropic_base_url: str = os.getenv("ANTHROPIC_BASE_URL", "https://api.anthropic.com")
+    claude_max_concurrency: int = int(os.getenv("CLAUDE_MAX_CONCURRENCY", "8"))
+    claude_rpm_limit: int = int(os.getenv("CLAUDE_RPM_LIMIT", "0"))  # 분당 요청 수 (0: 제한 없음)
+    claude_tpm_limit: int = int(os.getenv("CLAUDE_TPM_LIMIT", "0"))  # 분당 토큰 수 (0: 제한 없음)
+    claude_budget_usd: float = float(os.getenv("CLAUDE_BUDGET_USD", "0"))  # 실행 1회 비용 상한 (0: 제한 없음)
+    claude_haiku_max_concurrency: int = int(os.getenv("CLAUDE_HAIKU_MAX_CONCURRENCY", "8"))
+    claude_haiku_rpm_limit: int = int(os.getenv("CLAUDE_HAIKU_RPM_LIMIT", "0"))  # 분당 요청 수 (0: 제한 없음)
+    claude_haiku_tpm_limit: int = int(os.getenv("CLAUDE_HAIKU_TPM_LIMIT", "0"))  # 분당 토큰 수 (0: 제한 없음)
+    claude_haiku_budget_usd: float = float(os.getenv("CLAUDE_HAIKU_BUDGET_USD", "0"))  # 실행 1회 비용 상한 (0: 제한 없음)
     
     # HyperClovaX API 설정
     hyperclova_api_key: Optional[str] = os.getenv("HYPERCLOVA_API_KEY")
@@ -22,33 +31,145 @@ class Settings(BaseSettings):
         "https://clovastudio.stream.ntruss.com"
     )
     hyperclova_request_id: Optional[str] = os.getenv("HYPERCLOVA_REQUEST_ID")
+    hyperclova_max_concurrency: int = int(os.getenv("HYPERCLOVA_MAX_CONCURRENCY", "4"))
+    hyperclova_rpm_limit: int = int(os.getenv("HYPERCLOVA_RPM_LIMIT", "0"))  # 분당 요청 수 (0: 제한 없음)
+    hyperclova_tpm_limit: int = int(os.getenv("HYPERCLOVA_TPM_LIMIT", "0"))  # 분당 토큰 수 (0: 제한 없음)
+    hyperclova_budget_usd: float = float(os.getenv("HYPERCLOVA_BUDGET_USD", "0"))  # 실행 1회 비용 상한 (0: 제한 없음)
     
     # OpenAI API 설정 (ChatGPT)
     openai_api_key: Optional[str] = os.getenv("OPENAI_API_KEY")
     openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4o")
+    openai_base_url: str = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+    openai_max_concurrency: int = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+    openai_rpm_limit: int = int(os.getenv("OPENAI_RPM_LIMIT", "0"))  # 분당 요청 수 (0: 제한 없음)
+    openai_tpm_limit: int = int(os.getenv("OPENAI_TPM_LIMIT", "0"))  # 분당 토큰 수 (0: 제한 없음)
+    openai_budget_usd: float = float(os.getenv("OPENAI_BUDGET_USD", "0"))  # 실행 1회 비용 상한 (0: 제한 없음)
     
     # Google AI 설정 (Gemini)
     google_api_key: Optional[str] = os.getenv("GOOGLE_API_KEY")
     gemini_model: str = os.getenv("GEMINI_MODEL", "gemini-1.5-pro")
+    gemini_max_concurrency: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+    gemini_rpm_limit: int = int(os.getenv("GEMINI_RPM_LIMIT", "0"))  # 분당 요청 수 (0: 제한 없음)
+    gemini_tpm_limit: int = int(os.getenv("GEMINI_TPM_LIMIT", "0"))  # 분당 토큰 수 (0: 제한 없음)
+    gemini_budget_usd: float = float(os.getenv("GEMINI_BUDGET_USD", "0"))  # 실행 1회 비용 상한 (0: 제한 없음)
     
     # xAI 설정 (Grok) - OpenAI 호환 API 사용
     grok_api_key: Optional[str] = os.getenv("GROK_API_KEY")
     grok_base_url: str = os.getenv("GROK_BASE_URL", "https://api.x.ai/v1")
     grok_model: str = os.getenv("GROK_MODEL", "grok-3")
+    grok_max_concurrency: int = int(os.getenv("GROK_MAX_CONCURRENCY", "8"))
+    grok_rpm_limit: int = int(os.getenv("GROK_RPM_LIMIT", "0"))  # 분당 요청 수 (0: 제한 없음)
+    grok_tpm_limit: int = int(os.getenv("GROK_TPM_LIMIT", "0"))  # 분당 토큰 수 (0: 제한 없음)
+    grok_budget_usd: float = float(os.getenv("GROK_BUDGET_USD", "0"))  # 실행 1회 비용 상한 (0: 제한 없음)
     
     # 테스트 설정
     test_language: str = os.getenv("TEST_LANGUAGE", "ko")
     max_retries: int = int(os.getenv("MAX_RETRIES", "3"))
+    retry_base_delay: float = float(os.getenv("RETRY_BASE_DELAY", "0.5"))  # 첫 백오프 상한 (초)
+    retry_max_delay: float = float(os.getenv("RETRY_MAX_DELAY", "30"))    # 백오프/Retry-After 최대값 (초)
     request_timeout: int = int(os.getenv("REQUEST_TIMEOUT", "60"))
     
+    # 외부 시나리오 스위트 (JSONL/.jsonl.gz 경로 쉼표 구분, 기본 스위트에 더해 카탈로그에 색인)
+    scenario_files: str = os.getenv("SCENARIO_FILES", "")
+    
+    # 실행할 프로바이더 (표시 이름 쉼표 구분, 비어 있으면 등록된 전체)
+    providers: str = os.getenv("PROVIDERS", "")
+    # 추가 프로바이더 등록 ("이름=패키지.모듈:클래스", 쉼표 구분)
+    extra_providers: str = os.getenv("EXTRA_PROVIDERS", "")
+    
+    # 클라이언트 실행 방식 (true: 네이티브 비동기 클라이언트, false: 동기 SDK + 스레드)
+    use_async_clients: bool = os.getenv("USE_ASYNC_CLIENTS", "true").lower() == "true"
+    
+    # HTTP 커넥션 풀 설정 (HyperClovaX, OpenAI 호환 프로바이더 공용)
+    http_pool_size: int = int(os.getenv("HTTP_POOL_SIZE", "20"))
+    http_keepalive_expiry: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    
+    # 디스크 응답 캐시 (TTL 초, 최대 크기 MB)
+    use_response_cache: bool = os.getenv("USE_RESPONSE_CACHE", "true").lower() == "true"
+    cache_dir: str = os.getenv("CACHE_DIR", "./.cache")
+    cache_ttl_seconds: float = float(os.getenv("CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    cache_max_mb: int = int(os.getenv("CACHE_MAX_MB", "200"))
+    
+    # 진행 중 동일 요청 병합 (single-flight)
+    use_single_flight: bool = os.getenv("USE_SINGLE_FLIGHT", "true").lower() == "true"
+    
+    # 프롬프트 접두부 캐시 (Anthropic cache_control 마커, OpenAI는 접두부 고정으로 자동 캐시)
+    use_prompt_cache: bool = os.getenv("USE_PROMPT_CACHE", "true").lower() == "true"
+    
+    # 헤지 요청 (최근 응답 시간 분위수를 넘기면 중복 요청, 표본 수/최대 중복 수/유지 개수)
+    use_hedging: bool = os.getenv("USE_HEDGING", "false").lower() == "true"
+    hedge_percentile: float = float(os.getenv("HEDGE_PERCENTILE", "95"))
+    hedge_min_samples: int = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+    hedge_max_extra: int = int(os.getenv("HEDGE_MAX_EXTRA", "1"))
+    hedge_window: int = int(os.getenv("HEDGE_WINDOW", "200"))
+    
+    # 서킷 브레이커 (최근 호출 중 실패율/느린 호출 비율(%)이 임계값 이상이면 대기 시간 동안 즉시 실패)
+    use_circuit_breaker: bool = os.getenv("USE_CIRCUIT_BREAKER", "true").lower() == "true"
+    circuit_failure_rate: float = float(os.getenv("CIRCUIT_FAILURE_RATE", "50"))
+    circuit_slow_call_rate: float = float(os.getenv("CIRCUIT_SLOW_CALL_RATE", "80"))
+    circuit_slow_call_seconds: float = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "30"))
+    circuit_min_calls: int = int(os.getenv("CIRCUIT_MIN_CALLS", "5"))
+    circuit_window: int = int(os.getenv("CIRCUIT_WINDOW", "20"))
+    circuit_cooldown: float = float(os.getenv("CIRCUIT_COOLDOWN", "30"))
+    circuit_half_open_probes: int = int(os.getenv("CIRCUIT_HALF_OPEN_PROBES", "2"))
+    
+    # 적응형 동시성 한도 (AIMD: 건강하면 가산 증가, 429/타임아웃/지연 급증 시 곱셈 감소)
+    use_adaptive_concurrency: bool = os.getenv("USE_ADAPTIVE_CONCURRENCY", "false").lower() == "true"
+    adaptive_initial_limit: int = int(os.getenv("ADAPTIVE_INITIAL_LIMIT", "4"))
+    adaptive_min_limit: int = int(os.getenv("ADAPTIVE_MIN_LIMIT", "1"))
+    adaptive_max_limit: int = int(os.getenv("ADAPTIVE_MAX_LIMIT", "64"))
+    adaptive_backoff_ratio: float = float(os.getenv("ADAPTIVE_BACKOFF_RATIO", "0.5"))
+    adaptive_latency_tolerance: float = float(os.getenv("ADAPTIVE_LATENCY_TOLERANCE", "3.0"))
+    
+    # 레이스 모드 참가 프로바이더 (쉼표 구분, 유효한 START JSON을 먼저 돌려준 응답 사용)
+    race_providers: str = os.getenv("RACE_PROVIDERS", "Claude Haiku,ChatGPT,Gemini")
+    
+    # 배치 API 모드 (상태 폴링 첫 간격/최대 간격/최대 대기 시간, 초)
+    batch_poll_interval: float = float(os.getenv("BATCH_POLL_INTERVAL", "5"))
+    batch_poll_max_interval: float = float(os.getenv("BATCH_POLL_MAX_INTERVAL", "60"))
+    batch_timeout: float = float(os.getenv("BATCH_TIMEOUT", str(24 * 3600)))
+    
+    # 스트리밍 생성 모드 (TTFT/토큰 간 지연 측정)
+    use_streaming: bool = os.getenv("USE_STREAMING", "false").lower() == "true"
+    
+    # 실행 예산 (질문/보고서 매트릭스 1회의 전체 비용 상한 USD / 마감 시간 초, 0이면 제한 없음)
+    budget_max_usd: float = float(os.getenv("BUDGET_MAX_USD", "0"))
+    budget_deadline_seconds: float = float(os.getenv("BUDGET_DEADLINE_SECONDS", "0"))
+    
+    # 반복 실행 통계 (--repeat, 부트스트랩 재표본 수 / 신뢰수준 / 난수 시드)
+    bootstrap_resamples: int = int(os.getenv("BOOTSTRAP_RESAMPLES", "2000"))
+    bootstrap_confidence: float = float(os.getenv("BOOTSTRAP_CONFIDENCE", "0.95"))
+    bootstrap_seed: int = int(os.getenv("BOOTSTRAP_SEED", "0"))
+    
+    # 동시 실행 설정 (전체 동시 요청 상한, 0 이하이면 제한 없음)
+    max_concurrency: int = int(os.getenv("MAX_CONCURRENCY", "32"))
+    
     # 경로 설정
     results_dir: str = os.getenv("RESULTS_DIR", "./results")
     data_dir: str = os.getenv("DATA_DIR", "./data")
+    # 실행 로그 경로 (완료된 요청을 즉시 기록, --resume으로 이어서 실행)
+    run_log_dir: str = os.getenv("RUN_LOG_DIR", "./results/runs")
+    # 실행 로그 기록 대기 큐 크기 (가득 차면 다음 요청 시작을 늦춤)
+    result_queue_size: int = int(os.getenv("RESULT_QUEUE_SIZE", "256"))
     
     class Config:
         env_file = ".env"
         case_sensitive = False
-
+    
+    def provider_setting(self, provider_key: str, name: str, default: Any = None) -> Any:
+        """
+        프로바이더별 설정값을 조회합니다
+        
+        Args:
+            provider_key: 프로바이더 키 (예: "claude", "hyperclova")
+            name: 설정 이름 (예: "max_concurrency")
+            default: 설정이 없을 때 반환할 값
+        
+        Returns:
+            Any: `{provider_key}_{name}` 설정값
+        """
+        return getattr(self, f"{provider_key}_{name}", default)
+    
     def validate_api_keys(self) -> bool:
         """API 키가 설정되어 있는지 확인"""
         print("🔑 API 키 상태 확인:")
@@ -2,11 +2,15 @@
 프롬프트 로더 유틸리티
 
 프롬프트 파일들을 읽어서 변수를 치환하는 기능을 제공합니다.
+
+템플릿은 요청마다 바뀌지 않는 지시문(정적 접두부)과 사용자 응답/맥락이 들어가는
+동적 접미부로 나뉩니다. 접두부를 바이트 단위로 고정해 두면 프로바이더의 프롬프트
+캐시(Anthropic cache_control, OpenAI 자동 캐시)가 접두부를 재사용할 수 있습니다.
 """
 
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 # 설정 파일 임포트는 런타임에 처리
 try:
@@ -21,6 +25,9 @@ except ImportError:
             test_language = "ko"
         settings = DefaultSettings()
 
+# 요청마다 바뀌는 템플릿 변수 (처음 등장하는 줄부터 동적 접미부)
+DYNAMIC_FIELDS = ("user_response", "context")
+
 
 class PromptLoader:
     """프롬프트 파일 로더 클래스"""
@@ -29,6 +36,7 @@ class PromptLoader:
         """프롬프트 폴더 경로 설정"""
         self.prompt_dir = Path(__file__).parent.parent / "prompts"
         self._cache = {}  # 프롬프트 캐시
+        self._prefixes = set()  # 렌더링된 정적 접두부 (프롬프트 캐시 분리용)
     
     def load_prompt(self, filename: str, **kwargs) -> str:
         """
@@ -37,10 +45,23 @@ class PromptLoader:
         Args:
             filename: 프롬프트 파일명 (확장자 포함)
             **kwargs: 치환할 변수들
-            
+        
         Returns:
             str: 치환된 프롬프트 텍스트
         """
+        return "".join(self.load_prompt_parts(filename, **kwargs))
+    
+    def load_prompt_parts(self, filename: str, **kwargs) -> Tuple[str, str]:
+        """
+        프롬프트 파일을 로드하고 정적 접두부와 동적 접미부로 나누어 변수를 치환합니다
+        
+        Args:
+            filename: 프롬프트 파일명 (확장자 포함)
+            **kwargs: 치환할 변수들
+        
+        Returns:
+            Tuple[str, str]: (정적 접두부, 동적 접미부) - 이어 붙이면 전체 프롬프트
+        """
         # 캐시에서 프롬프트 템플릿을 가져오거나 파일에서 읽기
         if filename not in self._cache:
             prompt_path = self.prompt_dir / filename
@@ -61,11 +82,43 @@ class PromptLoader:
         # 사용자 제공 변수와 기본 변수 병합
         variables = {**default_vars, **kwargs}
         
-        # 변수 치환 수행
+        # 변수 치환 수행 (줄 단위로 나누므로 {{ }} 이스케이프가 양쪽에 걸치지 않음)
+        static_template, dynamic_template = self._split_template(template)
         try:
-            return template.format(**variables)
+            prefix = static_template.format(**variables)
+            suffix = dynamic_template.format(**variables)
         except KeyError as e:
             raise ValueError(f"프롬프트 템플릿에서 필요한 변수를 찾을 수 없습니다: {e}")
+        
+        if prefix and suffix:
+            self._prefixes.add(prefix)
+        return prefix, suffix
+    
+    @staticmethod
+    def _split_template(template: str) -> Tuple[str, str]:
+        """동적 변수가 처음 등장하는 줄의 시작에서 템플릿을 나눕니다"""
+        positions = [template.find("{" + name + "}") for name in DYNAMIC_FIELDS]
+        positions = [position for position in positions if position >= 0]
+        if not positions:
+            return template, ""
+        split_at = template.rfind("\n", 0, min(positions)) + 1
+        return template[:split_at], template[split_at:]
+    
+    def split_cached_prefix(self, prompt: str) -> Tuple[str, str]:
+        """
+        렌더링된 프롬프트를 정적 접두부와 나머지로 나눕니다 (프로바이더의 캐시 마커용)
+        
+        Args:
+            prompt: 렌더링된 프롬프트
+        
+        Returns:
+            Tuple[str, str]: (정적 접두부, 나머지) - 알려진 접두부가 없으면 ("", prompt)
+        """
+        matches = [prefix for prefix in self._prefixes if prompt.startswith(prefix)]
+        if not matches:
+            return "", prompt
+        prefix = max(matches, key=len)
+        return prefix, prompt[len(prefix):]
     
     def get_question_prompt(self, user_response: str, context: str = "", use_start: bool = False, simple: bool = False) -> str:
         """
@@ -76,7 +129,7 @@ class PromptLoader:
             context: 이전 대화 맥락
             use_start: START 기법 사용 여부
             simple: 간단한 프롬프트 사용 여부 (Haiku 등)
-            
+        
         Returns:
             str: 질문 생성 프롬프트
         """
@@ -96,7 +149,7 @@ class PromptLoader:
         Args:
             user_response: 사용자의 응답
             context: 이전 대화 맥락
-            
+        
         Returns:
             str: 보고서 생성 프롬프트
         """
@@ -106,6 +159,22 @@ class PromptLoader:
             context=context
         )
     
+    @staticmethod
+    def estimate_tokens(text: str) -> float:
+        """
+        렌더링된 프롬프트의 토큰 수를 추정합니다
+        
+        한국어는 조사, 어미, 종성 등으로 인해 영어 대비 약 3배 토큰을 사용하므로
+        어절 수 × 3으로 보수적으로 추정합니다 (레이트 리미터 사전 예약용).
+        
+        Args:
+            text: 렌더링된 프롬프트
+        
+        Returns:
+            float: 추정 토큰 수
+        """
+        return len(text.split()) * 3.0
+    
     def list_prompts(self) -> list:
         """
         사용 가능한 프롬프트 파일 목록 반환
@@ -121,6 +190,7 @@ class PromptLoader:
     def clear_cache(self):
         """프롬프트 캐시 클리어"""
         self._cache.clear()
+        self._prefixes.clear()
 
 
 # 전역 프롬프트 로더 인스턴스
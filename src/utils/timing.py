@@ -0,0 +1,105 @@
+"""
+요청 경로 구간별 시간 측정 유틸리티
+
+time.perf_counter_ns로 프롬프트 구성, 대기(실행 슬롯/레이트 리미터/동시성 한도/스레드 풀),
+SDK 호출, 응답 파싱, 평가 구간을 나누어 기록합니다.
+"""
+import time
+import asyncio
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator
+
+# 구간 이름 → 표시 이름 (요청 경로 순서)
+PHASE_LABELS = {
+    "prompt_build": "프롬프트 구성",
+    "cache_lookup": "캐시 조회",
+    "executor_wait": "실행 슬롯 대기",
+    "rate_limit_wait": "레이트 리미터 대기",
+    "concurrency_wait": "동시성 한도 대기",
+    "thread_wait": "스레드 풀 대기",
+    "sdk_call": "SDK 호출",
+    "response_decode": "응답 파싱",
+    "content_decode": "JSON 디코딩",
+    "evaluation": "품질 평가"
+}
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class PhaseTimer:
+    """구간별 누적 시간 기록기 (나노초 정수로 누적, 재시도 시 합산)"""
+    
+    def __init__(self):
+        """구간 기록 초기화"""
+        self.phases_ns: Dict[str, int] = {}
+    
+    def add(self, name: str, elapsed_ns: int):
+        """구간 시간을 더합니다 (나노초)"""
+        self.phases_ns[name] = self.phases_ns.get(name, 0) + max(0, elapsed_ns)
+    
+    def add_seconds(self, name: str, seconds: float):
+        """다른 곳에서 측정한 구간 시간을 더합니다 (초)"""
+        self.add(name, int(seconds * _NS_PER_SECOND))
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """with 블록의 실행 시간을 구간에 기록합니다"""
+        started_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter_ns() - started_ns)
+    
+    async def run_in_thread(self, name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        asyncio.to_thread로 동기 함수를 실행하고, 스레드 풀 대기와 실행 시간을 나누어 기록합니다
+        
+        Args:
+            name: 실행 시간을 기록할 구간 이름
+            func: 실행할 동기 함수
+        
+        Returns:
+            Any: func의 반환값
+        """
+        submitted_ns = time.perf_counter_ns()
+        started = {}
+        
+        def run():
+            started["ns"] = time.perf_counter_ns()
+            return func(*args, **kwargs)
+        
+        try:
+            return await asyncio.to_thread(run)
+        finally:
+            if "ns" in started:
+                self.add("thread_wait", started["ns"] - submitted_ns)
+                self.add(name, time.perf_counter_ns() - started["ns"])
+    
+    def merge(self, other: "PhaseTimer"):
+        """다른 기록기의 구간 시간을 더합니다 (헤지 요청 중 사용한 쪽의 구간 반영)"""
+        for name, elapsed_ns in other.phases_ns.items():
+            self.add(name, elapsed_ns)
+    
+    def seconds(self) -> Dict[str, float]:
+        """구간별 시간 (초, 요청 경로 순서)"""
+        ordered = sorted(self.phases_ns, key=lambda name: list(PHASE_LABELS).index(name)
+                         if name in PHASE_LABELS else len(PHASE_LABELS))
+        return {name: self.phases_ns[name] / _NS_PER_SECOND for name in ordered}
+
+
+def dominant_phases(phase_totals: Dict[str, float], limit: int = 3) -> Dict[str, float]:
+    """
+    비중이 큰 구간을 고릅니다
+    
+    Args:
+        phase_totals: 구간 이름 → 누적 시간 (초)
+        limit: 최대 개수
+    
+    Returns:
+        Dict[str, float]: 구간 이름 → 전체 대비 비율 (큰 순서)
+    """
+    total = sum(phase_totals.values())
+    if total <= 0:
+        return {}
+    ranked = sorted(phase_totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return {name: value / total for name, value in ranked if value > 0}
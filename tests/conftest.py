@@ -0,0 +1,49 @@
+"""
+pytest 공통 설정
+
+저장소 루트를 파이썬 경로에 추가해 테스트에서 src 패키지를 가져올 수 있게 하고,
+프로바이더 경로 테스트가 함께 쓰는 모의 서버 픽스처를 제공합니다.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def mock_server(monkeypatch):
+    """
+    HyperClovaX 엔드포인트를 가리키는 모의 서버 (응답 캐시 꺼짐)
+    
+    테스트마다 asyncio.run으로 이벤트 루프가 바뀌므로, 이전 루프에 묶인 공유 전송 계층의
+    커넥션 풀을 버려 다음 테스트가 닫힌 루프의 연결을 재사용하지 않도록 합니다.
+    프로바이더별 서킷 브레이커/레이트 리미터/동시성 한도도 테스트마다 새로 만듭니다.
+    """
+    pytest.importorskip("httpx")
+    from src.api import circuit_breaker, concurrency_limit, rate_limiter
+    from src.api.response_cache import response_cache
+    from src.api.transport import transport
+    from src.mock.server import MockConfig, MockLLMServer
+    from src.utils.config import settings
+    
+    servers = []
+    
+    def start(hyperclova_profile):
+        server = MockLLMServer(port=0, config=MockConfig.from_dict({"endpoints": {"hyperclova": hyperclova_profile}}))
+        server.start()
+        servers.append(server)
+        monkeypatch.setattr(settings, "hyperclova_api_gateway_url", server.base_url)
+        monkeypatch.setattr(settings, "hyperclova_api_key", "test")
+        monkeypatch.setattr(response_cache, "enabled", False)
+        return server
+    
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", {})
+    monkeypatch.setattr(concurrency_limit, "_concurrency_limiters", {})
+    monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+    monkeypatch.setattr(transport, "_clients", {})
+    monkeypatch.setattr(transport, "_async_clients", {})
+    yield start
+    for server in servers:
+        server.stop()
@@ -0,0 +1,75 @@
+"""
+반복 실행 통계 (부트스트랩 신뢰구간, 효과 크기) 테스트
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.metrics.bootstrap import bootstrap_ci, cliffs_delta, compare_samples, effect_size_label, hedges_g
+
+
+def test_hedges_g_identical_constant_samples():
+    """같은 상수 표본은 효과 크기가 정의되지 않음"""
+    a = np.full(10, 1.5)
+    assert hedges_g(a, a.copy()) is None
+
+
+def test_hedges_g_near_constant_samples():
+    """부동소수점 오차 수준의 분산만 있는 표본도 효과 크기를 계산하지 않음"""
+    a = np.full(10, 0.1) + np.arange(10) * 1e-17
+    b = np.full(10, 0.1 + 1e-16)
+    assert hedges_g(a, b) is None
+    
+    comparison = compare_samples("response_time", "A", a, "B", b, n_resamples=100, seed=0)
+    assert comparison.hedges_g is None
+
+
+def test_hedges_g_sign_and_size():
+    """a 평균이 크면 양수, 분산 대비 차이가 크면 '큼'"""
+    a = np.array([2.0, 2.1, 1.9, 2.2, 1.8])
+    b = np.array([1.0, 1.1, 0.9, 1.2, 0.8])
+    g = hedges_g(a, b)
+    assert g > 0.8
+    assert hedges_g(b, a) == pytest.approx(-g)
+    assert effect_size_label(g) == "큼"
+
+
+def test_cliffs_delta_sign():
+    """a가 모두 크면 +1, 모두 작으면 -1, 같으면 0"""
+    a = np.array([3.0, 4.0, 5.0])
+    b = np.array([0.0, 1.0, 2.0])
+    assert cliffs_delta(a, b) == 1.0
+    assert cliffs_delta(b, a) == -1.0
+    assert cliffs_delta(a, a.copy()) == 0.0
+    # 동점은 어느 쪽에도 세지 않음: (a > b 2쌍 - a < b 1쌍) / 4쌍
+    assert cliffs_delta(np.array([1.0, 3.0]), np.array([1.0, 2.0])) == pytest.approx(0.25)
+
+
+def test_bootstrap_ci_deterministic_with_seed():
+    """같은 시드면 같은 신뢰구간, 구간은 추정값을 감쌈"""
+    samples = np.random.default_rng(1).normal(1.0, 0.2, size=50)
+    first = bootstrap_ci(samples, n_resamples=500, confidence=0.95, seed=42)
+    second = bootstrap_ci(samples, n_resamples=500, confidence=0.95, seed=42)
+    assert first == second
+    assert first.low <= first.estimate <= first.high
+    assert first.estimate == pytest.approx(samples.mean())
+    
+    p95 = bootstrap_ci(samples, statistic="p95", n_resamples=500, confidence=0.95, seed=42)
+    assert p95.estimate == pytest.approx(np.percentile(samples, 95))
+
+
+def test_bootstrap_ci_requires_two_samples():
+    """표본이 2개 미만이면 None"""
+    assert bootstrap_ci(np.array([1.0]), seed=0) is None
+    assert compare_samples("cost", "A", np.array([1.0]), "B", np.array([1.0, 2.0]), seed=0) is None
+
+
+def test_compare_samples_significance():
+    """확실히 다른 두 표본은 차이의 신뢰구간이 0을 포함하지 않음"""
+    rng = np.random.default_rng(7)
+    a = rng.normal(2.0, 0.1, size=30)
+    b = rng.normal(1.0, 0.1, size=30)
+    comparison = compare_samples("response_time", "A", a, "B", b, n_resamples=500, seed=3)
+    assert comparison.significant
+    assert comparison.difference.low > 0
+    assert comparison.cliffs_delta == 1.0
@@ -0,0 +1,112 @@
+"""
+비용/시간 예산 (예약과 정산) 테스트
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.engine.budget import BUDGET_DEADLINE, BUDGET_TOTAL, CostEstimate, RunBudget
+from src.engine.executor import ConcurrentExecutor, ExecutionJob
+
+
+def _estimate(input_cost: float = 0.01, max_output_tokens: int = 100) -> CostEstimate:
+    """비용 상한이 input_cost + 0.01인 예상 비용"""
+    return CostEstimate(
+        input_tokens=10,
+        input_cost=input_cost,
+        output_price=0.0001,
+        max_output_tokens=max_output_tokens
+    )
+
+
+def _response(cost: float, **fields):
+    """예산 정산에 쓰는 필드만 가진 응답"""
+    return SimpleNamespace(**{"cost": cost, "hedge_cost": 0.0, "cached": False, "coalesced": False, **fields})
+
+
+def test_reserve_and_settle_actual_cost():
+    """예약한 상한을 해제하고 실제 비용만 지출로 기록"""
+    async def scenario():
+        budget = RunBudget(max_usd=1.0)
+        estimate = _estimate()
+        assert await budget.reserve("A", estimate) is None
+        assert estimate.reserved == estimate.max_cost
+        assert budget._reserved["A"] == estimate.max_cost
+        
+        await budget.settle("A", estimate, _response(0.005))
+        assert estimate.reserved == 0.0
+        assert budget._reserved["A"] == 0.0
+        assert budget.total_spent == 0.005
+    
+    asyncio.run(scenario())
+
+
+def test_settle_cached_response_is_free():
+    """캐시 적중/병합 응답과 예외(응답 없음)는 지출 0"""
+    async def scenario():
+        budget = RunBudget(max_usd=1.0)
+        for response in (_response(0.5, cached=True), None):
+            estimate = _estimate()
+            await budget.reserve("A", estimate)
+            await budget.settle("A", estimate, response)
+        assert budget.total_spent == 0.0
+    
+    asyncio.run(scenario())
+
+
+def test_total_budget_stops_further_jobs():
+    """실제 지출이 상한에 닿으면 이후 예약은 모두 건너뜀"""
+    async def scenario():
+        budget = RunBudget(max_usd=0.05)
+        estimate = _estimate()
+        await budget.reserve("A", estimate)
+        await budget.settle("A", estimate, _response(0.04))
+        
+        assert await budget.reserve("A", _estimate()) == BUDGET_TOTAL
+        # 한 번 닿은 예산은 더 싼 요청도 건너뜀
+        assert await budget.reserve("B", _estimate(input_cost=0.0, max_output_tokens=1)) == BUDGET_TOTAL
+        assert budget.skipped == {BUDGET_TOTAL: 2}
+    
+    asyncio.run(scenario())
+
+
+def test_reserve_waits_for_in_flight_settlement():
+    """진행 중인 요청의 예약 때문에 넘치면 정산될 때까지 기다렸다가 예약"""
+    async def scenario():
+        budget = RunBudget(max_usd=0.03)
+        first = _estimate()
+        await budget.reserve("A", first)
+        
+        second = _estimate()
+        waiter = asyncio.create_task(budget.reserve("A", second))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        
+        await budget.settle("A", first, _response(0.001))
+        assert await waiter is None
+        assert second.reserved == second.max_cost
+    
+    asyncio.run(scenario())
+
+
+def test_deadline_cancellation_settles_reserved_cost():
+    """마감 시간에 취소된 진행 중 요청은 예약한 비용 상한으로 정산"""
+    async def scenario():
+        budget = RunBudget(deadline=0.1)
+        
+        async def handler(job: ExecutionJob):
+            if job.scenario_index == 0:
+                return _response(0.002)
+            await asyncio.sleep(5)
+        
+        jobs = [ExecutionJob(api_name="A", scenario_index=i, scenario={}) for i in range(2)]
+        outcomes = await ConcurrentExecutor().run(jobs, handler, budget=budget, estimate=lambda job: _estimate())
+        
+        assert outcomes[0].response.cost == 0.002
+        assert outcomes[1].skipped == BUDGET_DEADLINE
+        assert budget.skipped == {BUDGET_DEADLINE: 1}
+        assert budget.total_spent == pytest.approx(0.002 + _estimate().max_cost)
+        assert budget._reserved["A"] == 0.0
+    
+    asyncio.run(scenario())
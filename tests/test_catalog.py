@@ -0,0 +1,105 @@
+"""
+시나리오 카탈로그 (색인 조회, 스위트, 외부 데이터 파일) 테스트
+"""
+import gzip
+import json
+
+import pytest
+
+from src.tests.catalog import ScenarioCatalog
+from src.tests.test_scenarios import TestScenarios
+
+
+def _write(path, records):
+    path.write_text("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """질문 스위트 2개(ko/en, 태그) + 보고서 스위트 1개"""
+    questions = _write(tmp_path / "questions.jsonl", [
+        {"id": "q1", "user_input": "a", "category": "job", "language": "ko", "tags": ["start", "short"]},
+        {"id": "q2", "user_input": "b", "category": "job", "language": "en", "tags": ["start"]},
+        {"id": "q3", "user_input": "c", "category": "career", "language": "ko"}
+    ])
+    extra = _write(tmp_path / "extra.jsonl", [
+        {"id": "x1", "user_input": "d", "category": "job", "language": "ko", "tags": ["short"]}
+    ])
+    reports = _write(tmp_path / "reports.jsonl", [
+        {"id": "r1", "conversation_history": [], "prompt": "p", "expected_sections": ["요약"], "category": "job"}
+    ])
+    return ScenarioCatalog([questions, extra, reports])
+
+
+def _ids(cases):
+    return [case.id for case in cases]
+
+
+def test_query_intersects_indexes_in_read_order(catalog):
+    """조건은 모두 만족해야 하고 결과는 읽은 순서"""
+    assert _ids(catalog.query()) == ["q1", "q2", "q3", "x1", "r1"]
+    assert _ids(catalog.query(category="job")) == ["q1", "q2", "x1", "r1"]
+    assert _ids(catalog.query(category="job", language="ko")) == ["q1", "x1", "r1"]
+    assert _ids(catalog.query(task_type="questions", tags=["short"])) == ["q1", "x1"]
+    assert _ids(catalog.query(tags=["start", "short"])) == ["q1"]
+    assert _ids(catalog.query(suite="questions", category="job")) == ["q1", "q2"]
+    assert catalog.query(category="missing") == []
+
+
+def test_counts_and_get(catalog):
+    """색인 필드별 개수와 id 조회"""
+    assert len(catalog) == 5
+    assert catalog.counts("suite") == {"questions": 3, "extra": 1, "reports": 1}
+    assert catalog.counts("task_type") == {"questions": 4, "reports": 1}
+    assert catalog.counts("tag") == {"start": 2, "short": 2}
+    assert catalog.get("r1").expected_sections == ["요약"]
+    assert catalog.get("missing") is None
+
+
+def test_load_gzip_suite_and_duplicate_id(tmp_path, catalog):
+    """.jsonl.gz 스위트를 더할 수 있고, 이미 있는 id는 거부"""
+    path = tmp_path / "more.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps({"id": "g1", "user_input": "e"}) + "\n")
+    assert catalog.load(str(path)) == 1
+    assert _ids(catalog.query(suite="more")) == ["g1"]
+    
+    duplicate = _write(tmp_path / "dup.jsonl", [{"id": "q1", "user_input": "again"}])
+    with pytest.raises(ValueError, match="q1"):
+        catalog.load(duplicate)
+
+
+def test_invalid_records_are_rejected(tmp_path):
+    """잘못된 JSON이나 id가 없는 레코드는 줄 번호와 함께 오류"""
+    broken = tmp_path / "broken.jsonl"
+    broken.write_text('{"id": "a", "user_input": "x"}\n{oops\n', encoding="utf-8")
+    with pytest.raises(ValueError, match=":2"):
+        ScenarioCatalog([str(broken)]).query()
+    
+    no_id = _write(tmp_path / "no_id.jsonl", [{"user_input": "x"}])
+    with pytest.raises(ValueError, match="id"):
+        ScenarioCatalog([no_id]).query()
+
+
+def test_default_catalog_adds_scenario_files(tmp_path, monkeypatch):
+    """기본 카탈로그는 내장 스위트에 SCENARIO_FILES의 외부 스위트를 더함"""
+    from src.utils.config import settings
+    
+    extra = _write(tmp_path / "custom.jsonl", [{"id": "custom_01", "user_input": "x", "tags": ["custom"]}])
+    monkeypatch.setattr(settings, "scenario_files", f" {extra} ,")
+    catalog = ScenarioCatalog()
+    assert _ids(catalog.query(suite="custom")) == ["custom_01"]
+    assert {"questions", "reports", "performance", "multilingual"} <= set(catalog.counts("suite"))
+
+
+def test_builtin_scenarios_match_test_scenarios():
+    """TestScenarios 조회는 내장 스위트의 카탈로그 조회와 같음"""
+    catalog = ScenarioCatalog()
+    questions = TestScenarios.get_question_generation_scenarios()
+    assert questions and _ids(questions) == _ids(catalog.query(suite="questions"))
+    assert all(case.user_input for case in questions)
+    assert _ids(TestScenarios.get_report_generation_scenarios()) == _ids(catalog.query(suite="reports"))
+    category = questions[0].category
+    assert all(case.category == category for case in TestScenarios.get_scenarios_by_category(category))
+    assert len(TestScenarios.get_performance_test_scenarios()) == len(questions) + len(catalog.query(suite="performance"))
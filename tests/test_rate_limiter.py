@@ -0,0 +1,159 @@
+"""
+프로바이더 레이트 리미터 (RPM/TPM 토큰 버킷) 테스트
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.api import rate_limiter
+from src.api.rate_limiter import ProviderRateLimiter, TokenBucket
+
+
+class FakeClock:
+    """time.monotonic 대신 쓰는 수동 시계"""
+    
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture
+def sleeps(monkeypatch, clock):
+    """asyncio.sleep 대신 대기 시간만 기록하고 시계를 진행"""
+    sleeps = []
+    
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+    
+    monkeypatch.setattr(rate_limiter, "asyncio", SimpleNamespace(sleep=sleep))
+    return sleeps
+
+
+def test_bucket_starts_full_and_goes_into_debt(clock):
+    """용량까지는 바로 통과하고, 넘으면 부채만큼 대기 시간을 돌려줌"""
+    bucket = TokenBucket(capacity=10, refill_per_second=2)
+    assert bucket.reserve(10) == 0.0
+    assert bucket.reserve(4) == pytest.approx(2.0)
+    # 먼저 예약한 요청의 부채 뒤에 줄을 섬
+    assert bucket.reserve(2) == pytest.approx(3.0)
+
+
+def test_bucket_refills_up_to_capacity(clock):
+    """경과 시간만큼 보충하되 용량을 넘지 않음"""
+    bucket = TokenBucket(capacity=10, refill_per_second=2)
+    bucket.reserve(10)
+    clock.now += 3
+    assert bucket.reserve(6) == 0.0
+    clock.now += 100
+    bucket._refill()
+    assert bucket.tokens == 10
+
+
+def test_adjust_refunds_and_charges(clock):
+    """사후 정산은 환불(음수)과 추가 차감을 모두 반영하고 용량을 넘지 않음"""
+    bucket = TokenBucket(capacity=100, refill_per_second=1)
+    bucket.reserve(80)
+    bucket.adjust(-50)
+    assert bucket.tokens == pytest.approx(70)
+    bucket.adjust(30)
+    assert bucket.tokens == pytest.approx(40)
+    bucket.adjust(-1000)
+    assert bucket.tokens == 100
+
+
+def test_disabled_limiter_never_waits(sleeps):
+    """한도가 없으면 대기하지 않음"""
+    limiter = ProviderRateLimiter()
+    assert not limiter.enabled
+    assert asyncio.run(limiter.acquire(10 ** 9)) == 0.0
+    assert sleeps == []
+
+
+def test_rpm_limit_spaces_requests(sleeps):
+    """RPM을 넘는 요청은 보충 속도에 맞춰 대기"""
+    limiter = ProviderRateLimiter(rpm=60)
+    
+    async def scenario():
+        return [await limiter.acquire(0) for _ in range(62)]
+    
+    waits = asyncio.run(scenario())
+    assert waits[:60] == [0.0] * 60
+    assert waits[60] == pytest.approx(1.0)
+    assert waits[61] == pytest.approx(1.0)
+    assert limiter.total_wait == pytest.approx(2.0)
+
+
+def test_tpm_uses_larger_wait_and_reconciles(sleeps):
+    """RPM/TPM 중 긴 대기를 사용하고, 실제 usage로 TPM 예약을 정산"""
+    limiter = ProviderRateLimiter(rpm=600, tpm=6000)
+    
+    async def scenario():
+        first = await limiter.acquire(6000)
+        # 실제로는 1000 토큰만 썼으므로 5000을 환불
+        limiter.reconcile(6000, 1000)
+        second = await limiter.acquire(5000)
+        third = await limiter.acquire(1000)
+        return first, second, third
+    
+    first, second, third = asyncio.run(scenario())
+    assert first == 0.0
+    assert second == 0.0
+    assert third == pytest.approx(10.0)  # 1000 토큰 부채 / 초당 100 토큰
+
+
+def test_limiters_are_shared_per_provider(monkeypatch):
+    """같은 프로바이더 키는 설정값으로 만든 리미터 1개를 공유"""
+    monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+    monkeypatch.setattr(rate_limiter.settings, "claude_rpm_limit", 30)
+    monkeypatch.setattr(rate_limiter.settings, "claude_tpm_limit", 0)
+    limiter = rate_limiter.get_rate_limiter("claude")
+    assert rate_limiter.get_rate_limiter("claude") is limiter
+    assert limiter.request_bucket.capacity == 30
+    assert limiter.token_bucket is None
+
+
+def _provider_limiter(monkeypatch, mock_server, profile):
+    """TPM 한도를 켠 HyperClovaX 프로바이더와 그 레이트 리미터 (보충 없이 정산만 확인)"""
+    from src.api.hyperclova_api import HyperClovaAPI
+    mock_server(profile)
+    monkeypatch.setattr(rate_limiter.settings, "hyperclova_rpm_limit", 0)
+    monkeypatch.setattr(rate_limiter.settings, "hyperclova_tpm_limit", 10 ** 6)
+    api = HyperClovaAPI(use_async=True)
+    return api, api.rate_limiter
+
+
+def test_provider_refunds_cancelled_request(monkeypatch, mock_server, clock):
+    """요청이 취소(CancelledError)돼도 선점한 토큰을 모두 돌려줌"""
+    api, limiter = _provider_limiter(monkeypatch, mock_server, {"latency": 1.0, "tokens_per_second": 0})
+    
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(api.generate_questions("취소", "테스트"), 0.2)
+    
+    asyncio.run(scenario())
+    assert limiter.token_bucket.tokens == pytest.approx(10 ** 6)
+
+
+def test_provider_refunds_cancelled_hedge_duplicate(monkeypatch, mock_server, clock):
+    """헤지에서 진 중복 요청의 예약분은 돌려주고 사용한 응답의 토큰만 차감"""
+    from src.api.hedging import HedgePolicy
+    hedge = HedgePolicy(enabled=True, percentile=50, min_samples=1, max_extra=1)
+    hedge.observe("hyperclova", 0.05)
+    monkeypatch.setattr("src.api.base.hedge_policy", hedge)
+    api, limiter = _provider_limiter(monkeypatch, mock_server, {"latency": 0.3, "tokens_per_second": 0})
+    
+    response = asyncio.run(api.generate_questions("헤지", "테스트"))
+    assert not response.error
+    assert response.hedge_requests == 1
+    assert limiter.token_bucket.tokens == pytest.approx(10 ** 6 - response.tokens_used)
@@ -0,0 +1,120 @@
+"""
+디스크 응답 캐시 (TTL, LRU 퇴출, 비동기 경로) 테스트
+"""
+import time
+import asyncio
+import threading
+
+import pytest
+
+from src.api.base import APIResponse
+from src.api.response_cache import ResponseCache
+
+
+def _response(content: str = "질문", **fields) -> APIResponse:
+    return APIResponse(content=content, tokens_used=10, response_time=1.0, cost=0.001, **fields)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "responses.sqlite3"), ttl_seconds=0, max_bytes=10 ** 6, enabled=True)
+    yield cache
+    cache.close()
+
+
+def test_round_trip_marks_cached(cache):
+    """저장한 응답은 cached=True로 돌려주고 적중/미스를 셈"""
+    key = ResponseCache.make_key("claude", "model", "프롬프트", 1000, 0.7)
+    assert cache.get(key) is None
+    cache.set(key, _response())
+    
+    hit = cache.get(key)
+    assert hit["content"] == "질문"
+    assert hit["cached"] is True
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_key_depends_on_sampling_parameters():
+    """프롬프트/모델/샘플링 파라미터가 다르면 다른 키"""
+    base = ResponseCache.make_key("claude", "model", "p", 1000, 0.7)
+    assert base == ResponseCache.make_key("claude", "model", "p", 1000, 0.7)
+    assert base != ResponseCache.make_key("claude", "model", "p", 1000, 0.0)
+    assert base != ResponseCache.make_key("claude", "model", "p2", 1000, 0.7)
+    assert base != ResponseCache.make_key("openai", "model", "p", 1000, 0.7)
+
+
+def test_key_separates_batch_from_realtime():
+    """배치 응답과 실시간 응답은 같은 요청이라도 다른 키"""
+    base = ResponseCache.make_key("claude", "model", "p", 1000, 0.7)
+    assert base == ResponseCache.make_key("claude", "model", "p", 1000, 0.7, mode="realtime")
+    assert base != ResponseCache.make_key("claude", "model", "p", 1000, 0.7, mode="batch")
+
+
+def test_error_response_is_not_stored(cache):
+    """오류 응답은 저장하지 않음"""
+    cache.set("k", _response(error="timeout"))
+    assert cache.get("k") is None
+
+
+def test_ttl_expiry(cache):
+    """유효 시간이 지난 항목은 미스로 처리하고 삭제"""
+    cache.ttl_seconds = 0.05
+    cache.set("k", _response())
+    assert cache.get("k") is not None
+    time.sleep(0.1)
+    assert cache.get("k") is None
+    assert cache._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 0
+
+
+def test_lru_eviction(cache):
+    """용량을 넘으면 가장 오래 사용되지 않은 항목부터 퇴출"""
+    cache.set("a", _response("a" * 200))
+    size = cache._connection().execute("SELECT size FROM responses").fetchone()[0]
+    cache.max_bytes = size * 2
+    time.sleep(0.01)
+    cache.set("b", _response("b" * 200))
+    time.sleep(0.01)
+    # a를 읽어 최근 사용으로 만들면 다음 저장 때 b가 퇴출됨
+    assert cache.get("a") is not None
+    time.sleep(0.01)
+    cache.set("c", _response("c" * 200))
+    
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.evictions == 1
+
+
+def test_disabled_and_refresh(cache):
+    """꺼져 있으면 읽기/쓰기 모두 생략, refresh면 읽지 않고 덮어씀"""
+    cache.configure(enabled=False)
+    cache.set("k", _response())
+    cache.configure(enabled=True)
+    assert cache.get("k") is None
+    
+    cache.set("k", _response("old"))
+    cache.configure(refresh=True)
+    assert cache.get("k") is None
+    cache.set("k", _response("new"))
+    cache.configure(refresh=False)
+    assert cache.get("k")["content"] == "new"
+
+
+def test_async_path_runs_off_event_loop(cache):
+    """aget/aset은 SQLite 입출력을 이벤트 루프 밖의 스레드에서 실행"""
+    threads = set()
+    connection = cache._connection
+    
+    def tracking_connection():
+        threads.add(threading.get_ident())
+        return connection()
+    
+    cache._connection = tracking_connection
+    
+    async def scenario():
+        await asyncio.gather(*(cache.aset(f"k{i}", _response(f"r{i}")) for i in range(20)))
+        return await asyncio.gather(*(cache.aget(f"k{i}") for i in range(20)))
+    
+    hits = asyncio.run(scenario())
+    assert [hit["content"] for hit in hits] == [f"r{i}" for i in range(20)]
+    assert threading.get_ident() not in threads
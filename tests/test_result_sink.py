@@ -0,0 +1,84 @@
+"""
+스트리밍 결과 싱크 (증분 집계, 기록 작업 실패) 테스트
+"""
+import asyncio
+
+import pytest
+
+from src.engine.result_sink import ResultSink, StoredResults
+from src.engine.run_log import RunLog
+
+
+def _entry(response_time: float, cost: float = 0.01, tokens: int = 100, **fields):
+    """보고서용 결과 항목"""
+    return {"response_time": response_time, "cost": cost, "tokens": tokens, **fields}
+
+
+def test_sink_writes_log_and_aggregates(tmp_path):
+    """큐가 작아도 모든 항목을 기록하고 프로바이더별로 집계"""
+    run_log = RunLog.create("questions", log_dir=str(tmp_path))
+    results = StoredResults(run_log, ["Claude", "ChatGPT"])
+    
+    async def scenario():
+        sink = ResultSink(results, queue_size=2)
+        for i in range(10):
+            await sink.put("Claude", f"s{i}", _entry(1.0 + i))
+        await sink.put("ChatGPT", "s0", _entry(2.0, cost=0.5, cached=True))
+        await sink.close()
+    
+    asyncio.run(scenario())
+    
+    assert len(results) == 11
+    assert ("claude", "s3", 0) in results
+    assert results.counts() == {"claude": 10, "chatgpt": 1}
+    
+    claude = results.aggregate("claude")
+    assert claude.live == 10
+    assert claude.average("cost") == pytest.approx(0.01)
+    assert claude.latency.percentile(50) == pytest.approx(5.5, abs=0.6)
+    # 캐시 적중은 전체 항목에는 세지만 실제 호출 통계에서는 제외
+    chatgpt = results.aggregate("chatgpt")
+    assert (chatgpt.count, chatgpt.cached, chatgpt.live) == (1, 1, 0)
+    
+    # 응답 내용은 바이트 위치로 디스크에서 다시 읽음
+    assert results.entry("claude", "s3")["response_time"] == 4.0
+    assert [key for key, _ in results.iter_entries()][:2] == [("claude", "s0", 0), ("claude", "s1", 0)]
+    run_log.close()
+
+
+def test_duplicate_key_is_counted_once(tmp_path):
+    """같은 (프로바이더, 시나리오, 반복) 키는 한 번만 집계"""
+    run_log = RunLog.create("questions", log_dir=str(tmp_path))
+    results = StoredResults(run_log, ["Claude"])
+    results.add("Claude", "s0", _entry(1.0), offset=0)
+    results.add("Claude", "s0", _entry(9.0), offset=10)
+    results.add("Claude", "s0", _entry(2.0), offset=20, repetition=1)
+    assert results.aggregate("claude").count == 2
+    run_log.close()
+
+
+class _FailingLog(RunLog):
+    """첫 기록에서 실패하는 실행 로그"""
+    
+    def append(self, *args, **kwargs):
+        raise OSError("disk full")
+
+
+def test_dead_writer_does_not_hang(tmp_path):
+    """기록 작업이 죽으면 가득 찬 큐에서 기다리던 put과 close가 그 예외로 끝남"""
+    run_log = _FailingLog(str(tmp_path / "run.jsonl"), "run", "questions")
+    
+    async def fill():
+        sink = ResultSink(StoredResults(run_log, ["Claude"]), queue_size=1)
+        for i in range(5):
+            await sink.put("Claude", f"s{i}", _entry(1.0))
+    
+    async def close():
+        sink = ResultSink(StoredResults(run_log, ["Claude"]), queue_size=1)
+        await sink.put("Claude", "s0", _entry(1.0))
+        await sink.put("Claude", "s1", _entry(1.0))
+        await sink.close()
+    
+    for scenario in (fill, close):
+        with pytest.raises(OSError, match="disk full"):
+            asyncio.run(asyncio.wait_for(scenario(), timeout=5))
@@ -0,0 +1,123 @@
+"""
+재시도 정책 (오류 분류, Retry-After, 백오프) 테스트
+"""
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.retry import ProviderHTTPError, RetryError, RetryPolicy
+
+
+class ReadTimeout(Exception):
+    """httpx.ReadTimeout처럼 이름으로만 분류되는 네트워크 예외"""
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(max_retries=3, base_delay=0.01, max_delay=0.05)
+
+
+@pytest.mark.parametrize("status_code, retryable", [
+    (429, True), (500, True), (503, True), (529, True), (408, True),
+    (400, False), (401, False), (404, False), (422, False)
+])
+def test_status_code_classification(policy, status_code, retryable):
+    """한도 초과/서버 오류만 재시도"""
+    assert policy.is_retryable(ProviderHTTPError(status_code, "body")) is retryable
+
+
+def test_status_code_from_sdk_attributes(policy):
+    """SDK마다 다른 상태 코드 위치(status_code, response.status_code, code)를 모두 읽음"""
+    via_response = Exception()
+    via_response.response = SimpleNamespace(status_code=503)
+    via_code = Exception()
+    via_code.code = 429
+    assert policy.status_code_of(via_response) == 503
+    assert policy.status_code_of(via_code) == 429
+    assert policy.status_code_of(ValueError("x")) is None
+
+
+def test_network_errors_are_retryable(policy):
+    """상태 코드가 없는 타임아웃/연결 오류는 재시도, 그 밖의 예외는 재시도하지 않음"""
+    assert policy.is_retryable(asyncio.TimeoutError())
+    assert policy.is_retryable(ConnectionResetError())
+    assert policy.is_retryable(ReadTimeout())
+    assert not policy.is_retryable(ValueError("bad request body"))
+
+
+def test_retry_after_formats(policy):
+    """retry-after-ms, 초 단위 retry-after, HTTP-date 형식을 모두 해석"""
+    def error(headers):
+        return ProviderHTTPError(429, "slow down", headers)
+    
+    assert policy.retry_after_of(error({"retry-after-ms": "1500"})) == 1.5
+    assert policy.retry_after_of(error({"retry-after": "2"})) == 2.0
+    assert policy.retry_after_of(error({"retry-after": "-3"})) == 0.0
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < policy.retry_after_of(error({"retry-after": retry_at})) <= 30
+    assert policy.retry_after_of(error({"retry-after": "soon"})) is None
+    assert policy.retry_after_of(error({})) is None
+
+
+def test_backoff_respects_retry_after_and_cap(policy):
+    """Retry-After가 있으면 그 값(최대값으로 제한), 없으면 full jitter 구간"""
+    assert policy.backoff_delay(0, retry_after=0.02) == 0.02
+    assert policy.backoff_delay(0, retry_after=60) == policy.max_delay
+    for retry_number in range(6):
+        delay = policy.backoff_delay(retry_number)
+        assert 0 <= delay <= min(policy.max_delay, policy.base_delay * 2 ** retry_number)
+
+
+def test_execute_retries_until_success(policy):
+    """재시도 가능한 오류는 성공할 때까지 재시도하고 재시도 시간을 따로 기록"""
+    calls = []
+    
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ProviderHTTPError(503, "overloaded", {"retry-after-ms": "10"})
+        return "ok"
+    
+    result, stats = asyncio.run(policy.execute(flaky))
+    assert result == "ok"
+    assert stats.attempts == 3
+    assert stats.backoff_time == pytest.approx(0.02)
+    assert stats.retry_time >= stats.backoff_time
+
+
+def test_execute_stops_on_non_retryable(policy):
+    """재시도 불가 오류는 한 번만 시도하고 RetryError로 전달"""
+    async def bad_request():
+        raise ProviderHTTPError(400, "invalid")
+    
+    with pytest.raises(RetryError) as excinfo:
+        asyncio.run(policy.execute(bad_request))
+    assert excinfo.value.stats.attempts == 1
+    assert excinfo.value.last_error.status_code == 400
+
+
+def test_execute_gives_up_after_max_retries(policy):
+    """재시도 횟수를 모두 쓰면 마지막 오류로 실패"""
+    async def always_down():
+        raise ProviderHTTPError(503, "down")
+    
+    with pytest.raises(RetryError) as excinfo:
+        asyncio.run(policy.execute(always_down))
+    assert excinfo.value.stats.attempts == policy.max_retries + 1
+
+
+def test_provider_retries_against_mock_server(monkeypatch, mock_server):
+    """모의 서버의 429(Retry-After) 응답은 재시도 후 오류 응답으로 기록"""
+    server = mock_server({"latency": 0.0, "error_rate": 1.0, "error_status": 429})
+    # 모의 서버의 Retry-After(1초)를 짧게 제한
+    monkeypatch.setattr("src.api.base.retry_policy", RetryPolicy(max_retries=2, base_delay=0.01, max_delay=0.01))
+    
+    from src.api.hyperclova_api import HyperClovaAPI
+    response = asyncio.run(HyperClovaAPI(use_async=True).generate_questions("재시도", "테스트"))
+    assert response.error
+    assert response.attempts == 3
+    assert response.backoff_time == pytest.approx(0.02)
+    assert server.request_counts["hyperclova"] == 3
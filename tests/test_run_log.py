@@ -0,0 +1,103 @@
+"""
+추가 전용 실행 로그 (쓰다 만 줄 복구, --resume 건너뛰기) 테스트
+"""
+import os
+import json
+import asyncio
+
+import pytest
+
+from src.engine.run_log import RunLog
+
+
+def _entry(response_time: float = 1.0):
+    return {"response_time": response_time, "cost": 0.01, "tokens": 100}
+
+
+def test_append_and_read_back(tmp_path):
+    """기록한 결과를 순서대로 읽고, 바이트 위치로 항목 1개를 다시 읽음"""
+    run_log = RunLog.create("questions", log_dir=str(tmp_path))
+    offsets = [run_log.append("Claude", f"s{i}", _entry(i), repetition=i % 2) for i in range(3)]
+    
+    entries = list(run_log.entries())
+    assert [key for key, _, _ in entries] == [("Claude", "s0", 0), ("Claude", "s1", 1), ("Claude", "s2", 0)]
+    assert [offset for _, offset, _ in entries] == offsets
+    assert run_log.read_entry(offsets[1])["response_time"] == 1
+    
+    with open(run_log.path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+    assert header["type"] == "run" and header["task_type"] == "questions"
+    run_log.close()
+
+
+def test_resume_checks_file_and_task_type(tmp_path):
+    """없는 로그나 작업 유형이 다른 로그는 이어서 실행하지 않음"""
+    with pytest.raises(FileNotFoundError):
+        RunLog.resume("missing", "questions", log_dir=str(tmp_path))
+    
+    run_log = RunLog.create("questions", log_dir=str(tmp_path))
+    run_log.close()
+    with pytest.raises(ValueError):
+        RunLog.resume(run_log.run_id, "reports", log_dir=str(tmp_path))
+
+
+def test_torn_last_line_is_recovered(tmp_path):
+    """크래시로 잘린 마지막 줄은 건너뛰고, 이어 쓰는 레코드가 그 줄에 붙지 않음"""
+    run_log = RunLog.create("questions", log_dir=str(tmp_path))
+    run_log.append("Claude", "s0", _entry())
+    run_log.append("Claude", "s1", _entry())
+    run_log.close()
+    
+    # 마지막 레코드를 쓰다가 중단된 상태 (줄바꿈 없이 잘림)
+    size = os.path.getsize(run_log.path)
+    with open(run_log.path, "r+b") as f:
+        f.truncate(size - 20)
+    
+    resumed = RunLog.resume(run_log.run_id, "questions", log_dir=str(tmp_path))
+    assert [key for key, _, _ in resumed.entries()] == [("Claude", "s0", 0)]
+    
+    offset = resumed.append("Claude", "s1", _entry(2.0))
+    assert [key for key, _, _ in resumed.entries()] == [("Claude", "s0", 0), ("Claude", "s1", 0)]
+    assert resumed.read_entry(offset)["response_time"] == 2.0
+    resumed.close()
+
+
+def test_resume_skips_logged_requests(tmp_path, monkeypatch, mock_server):
+    """--resume은 실행 로그에 있는 요청은 보내지 않고 남은 요청만 모의 서버로 보냄"""
+    from src.api.single_flight import single_flight
+    from src.cli.main import STARTTester
+    from src.utils.config import settings
+    
+    server = mock_server({"latency": 0.0, "tokens_per_second": 0})
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "run_log_dir", str(tmp_path / "runs"))
+    monkeypatch.setattr(single_flight, "enabled", False)
+    scenarios = [
+        {"id": f"s{i}", "name": f"시나리오 {i}", "user_response": f"경험 {i}", "context": "테스트"}
+        for i in range(4)
+    ]
+    
+    async def run(resume=None):
+        tester = STARTTester(use_async=True, providers=["HyperClovaX"], resume=resume)
+        try:
+            results = await tester._run_matrix(list(scenarios), "questions")
+        finally:
+            await tester.aclose()
+        return tester.run_log, results
+    
+    run_log, results = asyncio.run(run())
+    assert len(results) == 4
+    assert server.request_counts["hyperclova"] == 4
+    
+    # 마지막 결과를 쓰다가 중단된 것처럼 잘라냄
+    with open(run_log.path, "r+b") as f:
+        f.truncate(os.path.getsize(run_log.path) - 20)
+    
+    _, results = asyncio.run(run(resume=run_log.run_id))
+    assert len(results) == 4
+    assert server.request_counts["hyperclova"] == 5
+    
+    # 모두 기록된 뒤 다시 이어서 실행하면 보내는 요청이 없음
+    _, results = asyncio.run(run(resume=run_log.run_id))
+    assert len(results) == 4
+    assert server.request_counts["hyperclova"] == 5
@@ -0,0 +1,122 @@
+"""
+진행 중 요청 병합 (single-flight) 테스트
+"""
+import asyncio
+
+import pytest
+
+from src.api.single_flight import SingleFlight
+
+
+def _upstream(calls, result="응답", delay=0.05, error=None):
+    """호출 횟수를 세는 업스트림 요청"""
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return result
+    return call
+
+
+def test_concurrent_requests_share_one_call():
+    """같은 키의 동시 요청은 업스트림 호출 1회를 공유"""
+    flight = SingleFlight(enabled=True)
+    calls = []
+    
+    async def scenario():
+        return await asyncio.gather(*(flight.do("k", _upstream(calls)) for _ in range(5)))
+    
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert [result for result, _ in results] == ["응답"] * 5
+    assert [shared for _, shared in results] == [False, True, True, True, True]
+    assert flight.stats() == {"requests": 5, "coalesced": 4, "upstream": 1, "hit_rate": 0.8}
+
+
+def test_different_keys_and_sequential_calls_are_not_merged():
+    """다른 키나 이미 끝난 요청은 병합하지 않음"""
+    flight = SingleFlight(enabled=True)
+    calls = []
+    
+    async def scenario():
+        await asyncio.gather(flight.do("a", _upstream(calls)), flight.do("b", _upstream(calls)))
+        await flight.do("a", _upstream(calls))
+    
+    asyncio.run(scenario())
+    assert len(calls) == 3
+    assert flight.coalesced == 0
+
+
+def test_disabled_runs_every_request():
+    """꺼져 있으면 모든 요청을 그대로 실행"""
+    flight = SingleFlight(enabled=False)
+    calls = []
+    
+    async def scenario():
+        return await asyncio.gather(*(flight.do("k", _upstream(calls)) for _ in range(3)))
+    
+    assert [shared for _, shared in asyncio.run(scenario())] == [False] * 3
+    assert len(calls) == 3
+
+
+def test_leader_error_is_shared():
+    """리더의 예외는 대기자에게도 전달되고, 다음 요청은 새로 실행"""
+    flight = SingleFlight(enabled=True)
+    calls = []
+    
+    async def scenario():
+        results = await asyncio.gather(
+            *(flight.do("k", _upstream(calls, error=RuntimeError("boom"))) for _ in range(3)),
+            return_exceptions=True
+        )
+        retry = await flight.do("k", _upstream(calls))
+        return results, retry
+    
+    results, retry = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert retry == ("응답", False)
+    assert len(calls) == 2
+
+
+def test_cancelled_leader_hands_over_to_waiter():
+    """리더가 취소되면 대기자가 직접 실행하고, 대기자 취소는 리더에 영향 없음"""
+    flight = SingleFlight(enabled=True)
+    calls = []
+    
+    async def scenario():
+        leader = asyncio.create_task(flight.do("k", _upstream(calls, delay=0.2)))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(flight.do("k", _upstream(calls, result="대기자", delay=0.01)))
+        other = asyncio.create_task(flight.do("k", _upstream(calls)))
+        await asyncio.sleep(0.01)
+        
+        other.cancel()
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        with pytest.raises(asyncio.CancelledError):
+            await other
+        return await waiter
+    
+    assert asyncio.run(scenario()) == ("대기자", False)
+    assert len(calls) == 2
+
+
+def test_provider_requests_coalesce_against_mock_server(monkeypatch, mock_server):
+    """모의 서버로 같은 프롬프트를 동시에 보내면 업스트림 요청은 1건이고 나머지는 coalesced"""
+    from src.api.single_flight import single_flight
+    
+    server = mock_server({"latency": 0.1, "tokens_per_second": 0})
+    monkeypatch.setattr(single_flight, "enabled", True)
+    
+    from src.api.hyperclova_api import HyperClovaAPI
+    api = HyperClovaAPI(use_async=True)
+    
+    async def scenario():
+        return await asyncio.gather(*(api.generate_questions("병합", "테스트") for _ in range(4)))
+    
+    responses = asyncio.run(scenario())
+    assert all(response.error is None for response in responses)
+    assert sorted(response.coalesced for response in responses) == [False, True, True, True]
+    assert server.request_counts["hyperclova"] == 1
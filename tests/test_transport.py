@@ -0,0 +1,56 @@
+"""
+공유 HTTP 전송 계층 연결 재사용 통계 테스트
+"""
+import socket
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from src.api.transport import HTTPTransport, HTTPTiming
+
+
+def _closed_port() -> int:
+    """아무도 듣고 있지 않은 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_keepalive_requests_count_as_reused(mock_server):
+    """첫 요청만 새 연결을 열고, 이후 요청은 풀의 연결을 재사용"""
+    server = mock_server({"latency": 0.0})
+    transport = HTTPTransport()
+    client = transport.get_client(server.base_url)
+    timings = []
+    for _ in range(3):
+        timing = HTTPTiming()
+        with transport.measure(timing):
+            client.get(f"{server.base_url}/health")
+        timings.append(timing)
+    
+    stats = transport.stats()[transport._host_key(server.base_url)]
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 1
+    assert stats["reused"] == 2
+    assert stats["failed_connections"] == 0
+    assert stats["reuse_rate"] == pytest.approx(2 / 3)
+    assert [timing.reused for timing in timings] == [False, True, True]
+
+
+def test_failed_connections_are_not_reuse():
+    """연결에 실패한 요청은 재사용으로 세지 않고 연결 실패로 따로 기록"""
+    base_url = f"http://127.0.0.1:{_closed_port()}"
+    transport = HTTPTransport()
+    client = transport.get_client(base_url)
+    timing = HTTPTiming()
+    for _ in range(3):
+        with transport.measure(timing), pytest.raises(httpx.ConnectError):
+            client.get(base_url)
+    
+    stats = transport.stats()[transport._host_key(base_url)]
+    assert stats["requests"] == 3
+    assert stats["reused"] == 0
+    assert stats["failed_connections"] == 3
+    assert stats["reuse_rate"] == 0.0
+    assert timing.reused is None
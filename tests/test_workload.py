@@ -0,0 +1,124 @@
+"""
+JSONL 워크로드 (필터, 샘플링, 샤딩, 지연 순회) 테스트
+"""
+import gzip
+import json
+
+import pytest
+
+from src.tests import test_scenarios
+from src.tests.workload import Workload, record_type, to_scenario
+
+
+def _question(i: int, **fields):
+    record = {"id": f"q{i}", "name": f"질문 {i}", "user_input": f"경험 {i}", "context": "맥락",
+              "category": "job_preparation" if i % 2 else "career_change"}
+    record.update(fields)
+    return record
+
+
+def _report(i: int):
+    return {
+        "id": f"r{i}",
+        "conversation_history": [
+            {"role": "assistant", "content": "어떤 경험인가요?"},
+            {"role": "user", "content": f"답변 {i}"}
+        ],
+        "prompt": "보고서를 작성해 주세요",
+        "expected_sections": ["요약", "강점"]
+    }
+
+
+@pytest.fixture
+def workload_file(tmp_path):
+    """질문 20개 + 보고서 2개 + 잘못된 줄/빈 줄이 섞인 JSONL"""
+    lines = [json.dumps(_question(i), ensure_ascii=False) for i in range(20)]
+    lines.insert(5, "{not json")
+    lines.insert(8, "")
+    lines.extend(json.dumps(_report(i), ensure_ascii=False) for i in range(2))
+    path = tmp_path / "workload.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_reads_only_requested_task_type(workload_file):
+    """작업 유형이 다른 레코드와 잘못된 줄은 건너뛰고 잘못된 줄 수를 셈"""
+    questions = Workload(str(workload_file))
+    cases = list(questions)
+    assert [case.id for case in cases] == [f"q{i}" for i in range(20)]
+    assert all(isinstance(case, test_scenarios.TestCase) for case in cases)
+    assert questions.invalid_lines == 1
+    
+    reports = list(Workload(str(workload_file), task_type="reports"))
+    assert [case.id for case in reports] == ["r0", "r1"]
+    assert reports[0].expected_sections == ["요약", "강점"]
+
+
+def test_filter_and_limit(workload_file):
+    """필터는 모든 조건이 일치하는 레코드만, limit은 최대 개수"""
+    workload = Workload(str(workload_file), filters={"category": "job_preparation"}, limit=3)
+    assert [case.id for case in workload] == ["q1", "q3", "q5"]
+
+
+def test_sample_is_deterministic_per_seed(workload_file):
+    """샘플링은 id 해시 기반이라 순회마다 같고, 시드가 다르면 달라짐"""
+    workload = Workload(str(workload_file), sample=0.5, seed=1)
+    first = [case.id for case in workload]
+    assert first == [case.id for case in workload]
+    assert 0 < len(first) < 20
+    
+    others = [[case.id for case in Workload(str(workload_file), sample=0.5, seed=seed)] for seed in range(2, 6)]
+    assert any(ids != first for ids in others)
+    assert [case.id for case in Workload(str(workload_file), sample=1.0)] == [f"q{i}" for i in range(20)]
+
+
+def test_shards_partition_selected_records(workload_file):
+    """샤드는 필터/샘플링을 통과한 레코드를 겹치지 않고 고르게 나눔"""
+    shards = [
+        [case.id for case in Workload(str(workload_file), sample=0.7, shard=(index, 3))]
+        for index in range(3)
+    ]
+    selected = [case.id for case in Workload(str(workload_file), sample=0.7)]
+    assert sorted(sum(shards, [])) == sorted(selected)
+    assert max(map(len, shards)) - min(map(len, shards)) <= 1
+
+
+def test_gzip_workload(tmp_path):
+    """.gz 파일은 압축을 풀며 읽음"""
+    path = tmp_path / "workload.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for i in range(3):
+            f.write(json.dumps(_question(i), ensure_ascii=False) + "\n")
+    assert [case.id for case in Workload(str(path))] == ["q0", "q1", "q2"]
+
+
+def test_scenarios_view_is_reiterable(workload_file):
+    """매트릭스 시나리오 뷰는 순회할 때마다 파일을 다시 읽음"""
+    scenarios = Workload(str(workload_file), limit=2).scenarios()
+    assert list(scenarios) == list(scenarios)
+    assert list(scenarios)[0] == {"id": "q0", "name": "질문 0", "user_response": "경험 0", "context": "맥락"}
+    
+    report = to_scenario(next(iter(Workload(str(workload_file), task_type="reports"))))
+    assert report["user_response"] == "답변 0"
+    assert report["expected_sections"] == ["요약", "강점"]
+
+
+def test_missing_id_and_record_type(tmp_path):
+    """id가 없으면 줄 번호로, 종류는 task 필드나 대화 기록 유무로 판단"""
+    path = tmp_path / "no_id.jsonl"
+    path.write_text('\n{"user_input": "경험"}\n', encoding="utf-8")
+    assert [case.id for case in Workload(str(path))] == ["line_2"]
+    
+    assert record_type({"task": "reports"}) == "reports"
+    assert record_type({"conversation_history": []}) == "reports"
+    assert record_type({"user_input": "x"}) == "questions"
+
+
+def test_invalid_options():
+    """작업 유형/샘플 비율/샤드 번호를 검증"""
+    with pytest.raises(ValueError):
+        Workload("x.jsonl", task_type="summaries")
+    with pytest.raises(ValueError):
+        Workload("x.jsonl", sample=0)
+    with pytest.raises(ValueError):
+        Workload("x.jsonl", shard=(3, 3))